@@ -0,0 +1,220 @@
+"""
+Benchmarks for reading, querying and serialising synthetic XMI models.
+
+Run from the repository root, e.g.::
+
+    python -m benchmarks.run_benchmarks --sizes 1k 10k
+    python -m benchmarks.run_benchmarks --sizes 1k 10k --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --sizes 1k 10k --compare benchmarks/baseline.json
+
+In comparison mode the process exits with status 1 when any metric is worse
+than the stored baseline by more than the tolerance.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import argparse
+import gc
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from src.xmi.v1.xmi_manager import XmiManager
+from src.xmi.v1.xmi_model import XmiModel
+from src.xmi.v1.entities.xmi_structural_point_connection import XmiStructuralPointConnection
+from src.xmi.v1.entities.xmi_structural_curve_member import XmiStructuralCurveMember
+
+from .xmi_synthetic_model import generate_synthetic_xmi_dict, count_xmi_dict_objects
+
+SIZE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+DEFAULT_SIZES = ("1k", "10k")
+
+RELATIONSHIP_QUERY_SAMPLE = 200
+
+# metrics that are compared against a stored baseline; lower is better for all of them
+COMPARED_METRICS = ("time", "peak_memory", "retained_memory")
+
+
+def parse_size(size: str) -> int:
+    size = size.strip().lower()
+    multiplier = SIZE_SUFFIXES.get(size[-1:], 1)
+    number = size[:-1] if size[-1:] in SIZE_SUFFIXES else size
+    return int(float(number) * multiplier)
+
+
+def _best_time(function, repeat: int) -> tuple[float, object]:
+    best = None
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bench_read_xmi_dict(xmi_dict: dict, xmi_model: XmiModel, repeat: int) -> dict:
+    elapsed, xmi_model_read = _best_time(
+        lambda: XmiManager().read_xmi_dict(xmi_dict), repeat)
+    return {"time": elapsed,
+            "entities": len(xmi_model_read.entities),
+            "relationships": len(xmi_model_read.relationships),
+            "errors": len(xmi_model_read.errors),
+            "objects_per_second": count_xmi_dict_objects(xmi_dict) / elapsed if elapsed else None}
+
+
+def bench_relationship_queries(xmi_dict: dict, xmi_model: XmiModel, repeat: int) -> dict:
+    nodes = [entity for entity in xmi_model.entities if isinstance(
+        entity, XmiStructuralPointConnection)][:RELATIONSHIP_QUERY_SAMPLE]
+    members = [entity for entity in xmi_model.entities if isinstance(
+        entity, XmiStructuralCurveMember)][:RELATIONSHIP_QUERY_SAMPLE]
+
+    def run_queries():
+        found = 0
+        for node in nodes:
+            found += len(xmi_model.find_relationships_by_target(node))
+        for member in members:
+            found += len(xmi_model.find_relationships_by_source(member))
+        return found
+
+    elapsed, found = _best_time(run_queries, repeat)
+    queries = len(nodes) + len(members)
+    return {"time": elapsed,
+            "queries": queries,
+            "relationships_found": found,
+            "time_per_query": elapsed / queries if queries else None}
+
+
+def bench_serialisation(xmi_dict: dict, xmi_model: XmiModel, repeat: int) -> dict:
+    def serialise():
+        xmi_file = io.StringIO()
+        xmi_model.write_xmi_file(xmi_file)
+        return len(xmi_file.getvalue())
+
+    elapsed, json_length = _best_time(serialise, repeat)
+    return {"time": elapsed,
+            "json_characters": json_length,
+            "entities": len(xmi_model.entities)}
+
+
+def bench_memory_footprint(xmi_dict: dict, xmi_model: XmiModel, repeat: int) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start_memory = tracemalloc.get_traced_memory()[0]
+        xmi_model_read = XmiManager().read_xmi_dict(xmi_dict)
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    entity_count = len(xmi_model_read.entities)
+    retained_memory = current_memory - start_memory
+    return {"peak_memory": peak_memory - start_memory,
+            "retained_memory": retained_memory,
+            "bytes_per_entity": retained_memory / entity_count if entity_count else None}
+
+
+BENCHMARKS = {
+    "read_xmi_dict": bench_read_xmi_dict,
+    "relationship_queries": bench_relationship_queries,
+    "serialisation": bench_serialisation,
+    "memory_footprint": bench_memory_footprint,
+}
+
+
+def run_benchmarks(sizes: list[int], benchmark_names: list[str] | None = None, repeat: int = 3, verbose: bool = True) -> dict:
+    benchmark_names = benchmark_names or list(BENCHMARKS.keys())
+    results = {}
+    for size in sizes:
+        # shared model for the benchmarks that operate on an already read model
+        xmi_model = XmiManager().read_xmi_dict(
+            generate_synthetic_xmi_dict(size))
+        for benchmark_name in benchmark_names:
+            key = "{benchmark_name}@{size}".format(
+                benchmark_name=benchmark_name, size=size)
+            # every benchmark gets its own dictionary so no state leaks between them
+            xmi_dict = generate_synthetic_xmi_dict(size)
+            result = BENCHMARKS[benchmark_name](xmi_dict, xmi_model, repeat)
+            result["objects"] = count_xmi_dict_objects(xmi_dict)
+            results[key] = result
+            if verbose:
+                print("{key:<32} {result}".format(
+                    key=key, result=_format_result(result)))
+    return {"python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results}
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a description of every metric that regressed beyond ``tolerance``."""
+    regressions = []
+    baseline_results = baseline.get("results", {})
+    for key, result in results["results"].items():
+        baseline_result = baseline_results.get(key)
+        if baseline_result is None:
+            continue
+        for metric in COMPARED_METRICS:
+            value = result.get(metric)
+            baseline_value = baseline_result.get(metric)
+            if value is None or not baseline_value:
+                continue
+            ratio = value / baseline_value
+            if ratio > 1.0 + tolerance:
+                regressions.append("{key} {metric}: {value:.6g} vs baseline {baseline_value:.6g} ({ratio:.2f}x)".format(
+                    key=key, metric=metric, value=value, baseline_value=baseline_value, ratio=ratio))
+    return regressions
+
+
+def _format_result(result: dict) -> str:
+    return " ".join("{name}={value:.6g}".format(name=name, value=value) if isinstance(value, float)
+                    else "{name}={value}".format(name=name, value=value)
+                    for name, value in result.items())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the xmi package against synthetic grid building models.")
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES),
+                        help="approximate number of XMI objects per model, e.g. 1k 10k 100k 1M")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS.keys()),
+                        help="benchmarks to run, by default all of them")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timed repetitions, the best one is kept")
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    parser.add_argument("--save-baseline",
+                        help="store the results as the baseline at this path")
+    parser.add_argument("--compare", help="compare the results with the baseline at this path")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative regression before failing, by default 0.25")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(size) for size in args.sizes]
+    results = run_benchmarks(sizes, args.benchmarks, repeat=args.repeat)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressions against {path}:".format(path=args.compare))
+            for regression in regressions:
+                print("  " + regression)
+            return 1
+        print("No regressions against {path}".format(path=args.compare))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Import time benchmarks for the xmi package.
+
+Every statement is timed in a fresh interpreter so module caching does not
+hide the cost. Run from the repository root, e.g.::
+
+    python -m benchmarks.run_import_benchmarks
+    python -m benchmarks.run_import_benchmarks --save-baseline benchmarks/import_baseline.json
+    python -m benchmarks.run_import_benchmarks --compare benchmarks/import_baseline.json
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+from .run_benchmarks import compare_with_baseline, _format_result
+
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))), "src")
+
+IMPORT_STATEMENTS = {
+    "import_xmi": "import xmi",
+    "import_xmi_manager": "import xmi; xmi.XmiManager",
+    "import_xmi_star": "from xmi import *",
+    "import_xmi_manager_module": "from xmi.v1.xmi_manager import XmiManager",
+    "import_xmi_model_module": "from xmi.v1.xmi_model import XmiModel",
+}
+
+_TIMING_SCRIPT = """
+import sys, time
+sys.path.insert(0, {source_directory!r})
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, len([name for name in sys.modules if name == 'xmi' or name.startswith('xmi.')]))
+"""
+
+
+def time_import(statement: str) -> tuple[float, int]:
+    script = _TIMING_SCRIPT.format(
+        source_directory=SOURCE_DIRECTORY, statement=statement)
+    output = subprocess.run([sys.executable, "-c", script],
+                            check=True, capture_output=True, text=True).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+def run_import_benchmarks(repeat: int = 10, verbose: bool = True) -> dict:
+    results = {}
+    for key, statement in IMPORT_STATEMENTS.items():
+        timings = []
+        modules_loaded = 0
+        for _ in range(repeat):
+            elapsed, modules_loaded = time_import(statement)
+            timings.append(elapsed)
+        timings.sort()
+        results[key] = {"time": timings[0],
+                        "median_time": timings[len(timings) // 2],
+                        "modules_loaded": modules_loaded}
+        if verbose:
+            print("{key:<32} {result}".format(
+                key=key, result=_format_result(results[key])))
+    return {"python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the import time of the xmi package.")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="number of fresh interpreters per statement, the fastest one is kept")
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    parser.add_argument("--save-baseline",
+                        help="store the results as the baseline at this path")
+    parser.add_argument("--compare", help="compare the results with the baseline at this path")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative regression before failing, by default 0.25")
+    args = parser.parse_args(argv)
+
+    results = run_import_benchmarks(repeat=args.repeat)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressions against {path}:".format(path=args.compare))
+            for regression in regressions:
+                print("  " + regression)
+            return 1
+        print("No regressions against {path}".format(path=args.compare))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""
+Deterministic synthetic XMI models used by the benchmarks.
+
+The generated dictionaries follow the layout of the exports found in
+tests/xmi/v1/test_inputs so they can be fed straight into
+XmiManager.read_xmi_dict. The same arguments always produce the same model.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import math
+
+COLUMN_CROSS_SECTION_PARAMETERS = ("600;600", "500;500", "400;400")
+BEAM_CROSS_SECTION_PARAMETERS = ("300;600", "300;500", "250;450")
+
+
+def _format_axis(axis: tuple[float, float, float]) -> str:
+    return ",".join("{0:g}".format(value) for value in axis)
+
+
+def generate_grid_building(storeys: int = 3,
+                           bays_x: int = 3,
+                           bays_y: int = 3,
+                           bay_width_x: float = 6000.0,
+                           bay_width_y: float = 6000.0,
+                           storey_height: float = 3000.0,
+                           include_beams: bool = True,
+                           include_slabs: bool = True,
+                           include_reinforcement: bool = True,
+                           cross_sections_per_type: int = 3) -> dict:
+    """Generate a regular column/beam/slab grid building as an XMI dictionary.
+
+    Parameters
+    ----------
+    storeys : int, optional
+        Number of suspended levels above the base, by default 3
+    bays_x : int, optional
+        Number of bays along the global X axis, by default 3
+    bays_y : int, optional
+        Number of bays along the global Y axis, by default 3
+    bay_width_x : float, optional
+        Bay width along X in mm, by default 6000.0
+    bay_width_y : float, optional
+        Bay width along Y in mm, by default 6000.0
+    storey_height : float, optional
+        Storey height in mm, by default 3000.0
+    include_beams : bool, optional
+        Generate beams along both grid directions on every level, by default True
+    include_slabs : bool, optional
+        Generate one slab per bay on every level, by default True
+    include_reinforcement : bool, optional
+        Generate one StructuralReinforcement per curve member, by default True
+    cross_sections_per_type : int, optional
+        Number of distinct column and beam cross sections, by default 3
+
+    Returns
+    -------
+    dict
+        XMI dictionary with StructuralModel, StructuralMaterial,
+        StructuralCrossSection, StructuralStorey, StructuralPointConnection,
+        StructuralCurveMember, StructuralSurfaceMember, StructuralUnit and
+        StructuralReinforcement sections.
+    """
+    nodes_x = bays_x + 1
+    nodes_y = bays_y + 1
+
+    structural_model = [{
+        "Name": "Synthetic grid building {storeys}x{bays_x}x{bays_y}".format(storeys=storeys, bays_x=bays_x, bays_y=bays_y),
+        "ISSVersion": "1.0.0",
+        "GlobalCoordinateSystem": "0,0,1",
+        "GlobalReferenceCoordinate": "0,0,0",
+        "Description": "",
+        "ModelAuthoringTool": "xmi benchmarks",
+        "ModelAuthoringToolVersion": "1.0",
+        "AnalyticalTool": None,
+        "AnalyticalToolVersion": None,
+    }]
+
+    structural_materials = [
+        {
+            "Name": "C32/40",
+            "Type": "Concrete",
+            "Grade": 40.0,
+            "UnitWeight": 25.0,
+            "EModulus": 33500.0,
+            "GModulus": 13958.33,
+            "PoissonRatio": 0.2,
+            "ThermalCoefficient": 1e-05,
+            "Description": "C32/40",
+            "ID": "MAT-1",
+            "IFCGUID": None,
+        },
+    ]
+
+    structural_units = [
+        {"Entity": "StructuralPointConnection", "Attribute": "X", "Unit": "mm"},
+        {"Entity": "StructuralPointConnection", "Attribute": "Y", "Unit": "mm"},
+        {"Entity": "StructuralPointConnection", "Attribute": "Z", "Unit": "mm"},
+        {"Entity": "StructuralCurveMember", "Attribute": "Length", "Unit": "mm"},
+        {"Entity": "StructuralSurfaceMember", "Attribute": "Thickness", "Unit": "mm"},
+        {"Entity": "StructuralSurfaceMember", "Attribute": "Area", "Unit": "mm^2"},
+        {"Entity": "StructuralStorey", "Attribute": "StoreyElevation", "Unit": "mm"},
+        {"Entity": "StructuralCrossSection", "Attribute": "Parameters", "Unit": "mm"},
+        {"Entity": "StructuralMaterial", "Attribute": "EModulus", "Unit": "N/mm^2"},
+    ]
+
+    cross_sections_per_type = max(1, min(cross_sections_per_type,
+                                         len(COLUMN_CROSS_SECTION_PARAMETERS)))
+    structural_cross_sections = []
+    column_cross_section_names = []
+    beam_cross_section_names = []
+    for prefix, parameter_options, names in (("COL", COLUMN_CROSS_SECTION_PARAMETERS, column_cross_section_names),
+                                             ("BM", BEAM_CROSS_SECTION_PARAMETERS, beam_cross_section_names)):
+        for parameters in parameter_options[:cross_sections_per_type]:
+            name = "{prefix} {parameters}".format(
+                prefix=prefix, parameters=parameters.replace(";", "x"))
+            names.append(name)
+            structural_cross_sections.append({
+                "Name": name,
+                "Material": "C32/40",
+                "Shape": "Rectangular",
+                "Parameters": parameters,
+                "Description": name,
+                "Area": 0.0,
+                "Ix": 0.0,
+                "Iy": 0.0,
+                "rx": 0.0,
+                "ry": 0.0,
+                "Ex": 0.0,
+                "Ey": 0.0,
+                "Zx": 0.0,
+                "Zy": 0.0,
+                "J": 0.0,
+                "ID": name,
+                "IFCGUID": None,
+            })
+
+    structural_storeys = []
+    for level in range(storeys + 1):
+        structural_storeys.append({
+            "Name": "Level {level}".format(level=level),
+            "StoreyElevation": level * storey_height,
+            "Description": "Level {level}".format(level=level),
+            "ID": "STOREY-{level}".format(level=level),
+            "IFCGUID": None,
+            "StoreyMass": 0.0,
+            "StoreyHorizontalReactionX": None,
+            "StoreyHorizontalReactionY": None,
+            "StoreyVerticalReaction": None,
+        })
+
+    def node_name(level: int, i: int, j: int) -> str:
+        return "N{level}-{i}-{j}".format(level=level, i=i, j=j)
+
+    structural_point_connections = []
+    for level in range(storeys + 1):
+        for j in range(nodes_y):
+            for i in range(nodes_x):
+                name = node_name(level, i, j)
+                structural_point_connections.append({
+                    "Name": name,
+                    "Storey": "Level {level}".format(level=level),
+                    "X": i * bay_width_x,
+                    "Y": j * bay_width_y,
+                    "Z": level * storey_height,
+                    "ID": name,
+                    "Description": "",
+                    "IFCGUID": None,
+                })
+
+    structural_curve_members = []
+
+    def add_curve_member(name: str, member_type: str, cross_section: str, level: int,
+                         begin_node: str, end_node: str, length: float,
+                         local_axis_x, local_axis_y, local_axis_z, system_line: str):
+        structural_curve_members.append({
+            "Name": name,
+            "CrossSection": cross_section,
+            "Storey": "Level {level}".format(level=level),
+            "Type": member_type,
+            "Nodes": "{begin_node};{end_node}".format(begin_node=begin_node, end_node=end_node),
+            "Segments": "Line",
+            "SystemLine": system_line,
+            "BeginNode": begin_node,
+            "EndNode": end_node,
+            "Length": length,
+            "ID": name,
+            "Description": name,
+            "LocalAxisX": _format_axis(local_axis_x),
+            "LocalAxisY": _format_axis(local_axis_y),
+            "LocalAxisZ": _format_axis(local_axis_z),
+            "BeginNodeXOffset": 0.0,
+            "EndNodeXOffset": 0.0,
+            "BeginNodeYOffset": 0.0,
+            "EndNodeYOffset": 0.0,
+            "BeginNodeZOffset": 0.0,
+            "EndNodeZOffset": 0.0,
+            "EndFixityStart": None,
+            "EndFixityEnd": None,
+            "CircularArcCentre": None,
+            "CircularArcRadius": 0.0,
+            "IFCGUID": None,
+        })
+
+    for level in range(1, storeys + 1):
+        column_cross_section = column_cross_section_names[(
+            (level - 1) * len(column_cross_section_names)) // storeys]
+        for j in range(nodes_y):
+            for i in range(nodes_x):
+                add_curve_member("C{level}-{i}-{j}".format(level=level, i=i, j=j), "Column", column_cross_section, level,
+                                 node_name(level - 1, i, j), node_name(level, i, j), storey_height,
+                                 (0, 0, 1), (1, 0, 0), (0, 1, 0), "MiddleMiddle")
+
+        if include_beams:
+            for j in range(nodes_y):
+                for i in range(bays_x):
+                    beam_cross_section = beam_cross_section_names[(
+                        i + j) % len(beam_cross_section_names)]
+                    add_curve_member("BX{level}-{i}-{j}".format(level=level, i=i, j=j), "Beam", beam_cross_section, level,
+                                     node_name(level, i, j), node_name(level, i + 1, j), bay_width_x,
+                                     (1, 0, 0), (0, 1, 0), (0, 0, 1), "TopMiddle")
+            for j in range(bays_y):
+                for i in range(nodes_x):
+                    beam_cross_section = beam_cross_section_names[(
+                        i + j) % len(beam_cross_section_names)]
+                    add_curve_member("BY{level}-{i}-{j}".format(level=level, i=i, j=j), "Beam", beam_cross_section, level,
+                                     node_name(level, i, j), node_name(level, i, j + 1), bay_width_y,
+                                     (0, 1, 0), (-1, 0, 0), (0, 0, 1), "TopMiddle")
+
+    structural_surface_members = []
+    if include_slabs:
+        for level in range(1, storeys + 1):
+            for j in range(bays_y):
+                for i in range(bays_x):
+                    name = "S{level}-{i}-{j}".format(level=level, i=i, j=j)
+                    nodes = (node_name(level, i, j), node_name(level, i + 1, j),
+                             node_name(level, i + 1, j + 1), node_name(level, i, j + 1))
+                    structural_surface_members.append({
+                        "Storey": "Level {level}".format(level=level),
+                        "Name": name,
+                        "Material": "C32/40",
+                        "Type": "Slab",
+                        "SpanType": "TwoWay",
+                        "Thickness": 200.0,
+                        "SystemPlane": "Top",
+                        "Nodes": ";".join(nodes),
+                        "Edges": "Line;Line;Line;Line",
+                        "Area": bay_width_x * bay_width_y,
+                        "ID": name,
+                        "Description": name,
+                        "ZOffset": 0.0,
+                        "LocalAxisX": "1,0,0",
+                        "LocalAxisY": "0,1,0",
+                        "LocalAxisZ": "0,0,1",
+                        "Height": 0.0,
+                        "IFCGUID": None,
+                    })
+
+    structural_reinforcements = []
+    if include_reinforcement:
+        for structural_curve_member in structural_curve_members:
+            is_column = structural_curve_member["Type"] == "Column"
+            structural_reinforcements.append({
+                "Name": "RebarFor{name}".format(name=structural_curve_member["Name"]),
+                "Member": structural_curve_member["Name"],
+                "Cover": "35;35",
+                "Location": "CornerMain;WidthMain;BreadthMain;OuterStirrup;WidthInnerStirrup;BreadthInnerStirrup",
+                "IfSymmetrical": True,
+                "Quantity": "4;2;2;1;;" if is_column else "2;2;;1;;",
+                "RebarType": "H;H;H;H;;" if is_column else "H;H;;H;;",
+                "Spacing": ";;;150;;" if is_column else ";;;200;;",
+                "Size": "20;16;16;10;;" if is_column else "16;16;;10;;",
+                "Material": "500;500;500;500;;" if is_column else "500;500;;500;;",
+                "Shape": "Straight;Straight;Straight;CloseLink;;" if is_column else "Straight;Straight;;CloseLink;;",
+                "AreaProvided": ";;;;;",
+                "AreaRequired": ";;;;;",
+                "Description": ";;;;;",
+                "ID": "RebarFor{name}".format(name=structural_curve_member["Name"]),
+            })
+
+    return {
+        "StructuralModel": structural_model,
+        "StructuralUnit": structural_units,
+        "StructuralMaterial": structural_materials,
+        "StructuralCrossSection": structural_cross_sections,
+        "StructuralStorey": structural_storeys,
+        "StructuralPointConnection": structural_point_connections,
+        "StructuralCurveMember": structural_curve_members,
+        "StructuralSurfaceMember": structural_surface_members,
+        "StructuralReinforcement": structural_reinforcements,
+    }
+
+
+def count_xmi_dict_objects(xmi_dict: dict) -> int:
+    return sum(len(value) for value in xmi_dict.values() if isinstance(value, list))
+
+
+def count_grid_building_objects(storeys: int = 3,
+                                bays_x: int = 3,
+                                bays_y: int = 3,
+                                include_beams: bool = True,
+                                include_slabs: bool = True,
+                                include_reinforcement: bool = True,
+                                cross_sections_per_type: int = 3,
+                                **kwargs) -> int:
+    """Number of XMI objects generate_grid_building returns, without generating them."""
+    nodes_x = bays_x + 1
+    nodes_y = bays_y + 1
+    cross_sections_per_type = max(1, min(cross_sections_per_type,
+                                         len(COLUMN_CROSS_SECTION_PARAMETERS)))
+    curve_members = storeys * nodes_x * nodes_y
+    if include_beams:
+        curve_members += storeys * (nodes_y * bays_x + bays_y * nodes_x)
+    surface_members = storeys * bays_x * bays_y if include_slabs else 0
+    reinforcements = curve_members if include_reinforcement else 0
+    # StructuralModel, StructuralMaterial and the nine StructuralUnit objects
+    return (11 + 2 * cross_sections_per_type + (storeys + 1) + (storeys + 1) * nodes_x * nodes_y
+            + curve_members + surface_members + reinforcements)
+
+
+def generate_synthetic_xmi_dict(target_entities: int, storeys: int = 10, **kwargs) -> dict:
+    """Generate a grid building with roughly ``target_entities`` XMI objects.
+
+    The number of storeys is kept fixed (reduced for very small targets) and
+    the plan grid is grown until the object count would exceed the target.
+    """
+    if target_entities <= 0:
+        raise ValueError("'target_entities' should be larger than 0")
+
+    # every plan node carries a column, two beams, a slab and two reinforcements
+    objects_per_plan_node = 7
+    storeys = max(1, min(storeys, int(math.sqrt(target_entities /
+                                                objects_per_plan_node)) or 1))
+    bays = max(1, int(math.sqrt(target_entities /
+                                (objects_per_plan_node * storeys))))
+
+    while bays > 1 and count_grid_building_objects(storeys, bays, bays, **kwargs) > target_entities:
+        bays -= 1
+    while count_grid_building_objects(storeys, bays + 1, bays + 1, **kwargs) <= target_entities:
+        bays += 1
+
+    # widen the grid by one bay along X when that still fits the target
+    bays_x = bays + 1 if count_grid_building_objects(
+        storeys, bays + 1, bays, **kwargs) <= target_entities else bays
+
+    return generate_grid_building(storeys, bays_x, bays, **kwargs)
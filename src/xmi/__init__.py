@@ -1,29 +1,104 @@
+# Public names are resolved lazily through the module level __getattr__ so that
+# "import xmi" stays cheap; the defining module is only imported on first access.
+from importlib import import_module
+
 from .v1.constants import *
-from .v1.xmi_errors import XmiError, XmiInconsistentDataTypeError, XmiMissingReferenceInstanceError, XmiMissingRequiredAttributeError
-from .v1.xmi_manager import XmiManager, ErrorLog
-from .v1.xmi_base import XmiBaseEntity, XmiBaseRelationship
 from .v1.xmi_utilities import *
-from .v1.xmi_model import XmiModel
-from .v1.entities.xmi_structural_cross_section import XmiStructuralCrossSection
-from .v1.entities.xmi_structural_curve_member import XmiStructuralCurveMember
-from .v1.entities.xmi_structural_material import XmiStructuralMaterial
-from .v1.entities.xmi_structural_point_connection import XmiStructuralPointConnection
-from .v1.entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
-from .v1.entities.xmi_structural_unit import XmiStructuralUnit
-from .v1.entities.xmi_segment import XmiSegment
-from .v1.enums.xmi_enums import XmiEnum, XmiSegmentTypeEnum, XmiUnitEnum
-from .v1.enums.xmi_structural_curve_member_enums import XmiStructuralCurveMemberSystemLineEnum, XmiStructuralCurveMemberTypeEnum
-from .v1.enums.xmi_structural_material_enums import XmiStructuralMaterialTypeEnum
-from .v1.enums.xmi_structural_surface_member_enums import XmiStructuralSurfaceMemberTypeEnum, XmiStructuralSurfaceMemberSpanTypeEnum, XmiStructuralSurfaceMemberSystemPlaneEnum
-from .v1.enums.xmi_shape_enums import XmiShapeEnum
-from .v1.geometries.xmi_arc_3d import XmiArc3D
-from .v1.geometries.xmi_line_3d import XmiLine3D
-from .v1.geometries.xmi_point_3d import XmiPoint3D
-from .v1.geometries.xmi_base_geometry import XmiBaseGeometry
-from .v1.relationships.xmi_has_structural_material import XmiHasStructuralMaterial
-from .v1.relationships.xmi_has_structural_node import XmiHasStructuralNode
-from .v1.relationships.xmi_has_structural_cross_section import XmiHasStructuralCrossSection
-from .v1.relationships.xmi_has_point_3d import XmiHasPoint3D
-from .v1.relationships.xmi_has_segment import XmiHasSegment
-from .v1.relationships.xmi_has_geometry import XmiHasGeometry
-from .v1.shapes.xmi_shape import XmiShape, XmiShapeC, XmiShapeCircle, XmiShapeI, XmiShapeT, XmiShapeL, XmiShapeOthers, XmiShapeRectangle, XmiShapeRectangularHollow, XmiShapeSquareHollow
+
+_LAZY_IMPORTS = {
+    "XmiError": ".v1.xmi_errors",
+    "XmiInconsistentDataTypeError": ".v1.xmi_errors",
+    "XmiMissingReferenceInstanceError": ".v1.xmi_errors",
+    "XmiMissingRequiredAttributeError": ".v1.xmi_errors",
+    "XmiErrorLimitExceededError": ".v1.xmi_errors",
+    "XmiDuplicateEntityError": ".v1.xmi_errors",
+    "XmiManager": ".v1.xmi_manager",
+    "ErrorLog": ".v1.xmi_model",
+    "XmiEntityIndex": ".v1.xmi_entity_index",
+    "XmiStoreyIndex": ".v1.xmi_storey_index",
+    "XmiStoreyAssignment": ".v1.xmi_storey_assignment",
+    "XmiJsonlErrorSink": ".v1.xmi_error_handling",
+    "XmiReferenceRule": ".v1.xmi_validation",
+    "XMI_REFERENCE_RULES": ".v1.xmi_validation",
+    "validate_xmi_references": ".v1.xmi_validation",
+    "check_xmi_geometry": ".v1.xmi_geometry_checks",
+    "XmiInstrumentation": ".v1.xmi_instrumentation",
+    "XmiNullInstrumentation": ".v1.xmi_instrumentation",
+    "XmiBaseEntity": ".v1.xmi_base",
+    "XmiBaseRelationship": ".v1.xmi_base",
+    "XmiModel": ".v1.xmi_model",
+    "XmiDiffRecord": ".v1.xmi_diff",
+    "XmiGeometryMatch": ".v1.xmi_geometry_matching",
+    "XmiStructuralCrossSection": ".v1.entities.xmi_structural_cross_section",
+    "XmiStructuralCurveMember": ".v1.entities.xmi_structural_curve_member",
+    "XmiStructuralMaterial": ".v1.entities.xmi_structural_material",
+    "XmiStructuralPointConnection": ".v1.entities.xmi_structural_point_connection",
+    "XmiStructuralSurfaceMember": ".v1.entities.xmi_structural_surface_member",
+    "XmiStructuralUnit": ".v1.entities.xmi_structural_unit",
+    "XmiStructuralStorey": ".v1.entities.xmi_structural_storey",
+    "XmiStructuralReinforcement": ".v1.entities.xmi_structural_reinforcement",
+    "XmiStructuralPointSupport": ".v1.entities.xmi_structural_point_support",
+    "XmiStructuralLineSupport": ".v1.entities.xmi_structural_line_support",
+    "XmiStructuralAreaSupport": ".v1.entities.xmi_structural_area_support",
+    "XmiSupportTable": ".v1.xmi_support_table",
+    "XmiUnitConversion": ".v1.xmi_units",
+    "XmiTransformation": ".v1.xmi_transform",
+    "XmiProbe": ".v1.xmi_header",
+    "XmiMemberAxes": ".v1.xmi_member_axis",
+    "XmiMesh": ".v1.xmi_mesh",
+    "XmiSurfaceMesh": ".v1.xmi_surface_mesh",
+    "XmiReinforcementTable": ".v1.xmi_reinforcement",
+    "XmiRebarTakeoff": ".v1.xmi_reinforcement",
+    "XmiSegment": ".v1.entities.xmi_segment",
+    "XmiEnum": ".v1.enums.xmi_enums",
+    "XmiSegmentTypeEnum": ".v1.enums.xmi_enums",
+    "XmiUnitEnum": ".v1.enums.xmi_enums",
+    "XmiStructuralCurveMemberSystemLineEnum": ".v1.enums.xmi_structural_curve_member_enums",
+    "XmiStructuralCurveMemberTypeEnum": ".v1.enums.xmi_structural_curve_member_enums",
+    "XmiStructuralMaterialTypeEnum": ".v1.enums.xmi_structural_material_enums",
+    "XmiStructuralSurfaceMemberTypeEnum": ".v1.enums.xmi_structural_surface_member_enums",
+    "XmiStructuralSurfaceMemberSpanTypeEnum": ".v1.enums.xmi_structural_surface_member_enums",
+    "XmiStructuralSurfaceMemberSystemPlaneEnum": ".v1.enums.xmi_structural_surface_member_enums",
+    "XmiShapeEnum": ".v1.enums.xmi_shape_enums",
+    "XmiArc3D": ".v1.geometries.xmi_arc_3d",
+    "XmiLine3D": ".v1.geometries.xmi_line_3d",
+    "XmiPoint3D": ".v1.geometries.xmi_point_3d",
+    "XmiBaseGeometry": ".v1.geometries.xmi_base_geometry",
+    "XmiHasStructuralMaterial": ".v1.relationships.xmi_has_structural_material",
+    "XmiHasStructuralNode": ".v1.relationships.xmi_has_structural_node",
+    "XmiHasStructuralCrossSection": ".v1.relationships.xmi_has_structural_cross_section",
+    "XmiHasPoint3D": ".v1.relationships.xmi_has_point_3d",
+    "XmiHasSegment": ".v1.relationships.xmi_has_segment",
+    "XmiHasGeometry": ".v1.relationships.xmi_has_geometry",
+    "XmiHasStructuralStorey": ".v1.relationships.xmi_has_structural_storey",
+    "XmiHasStructuralMember": ".v1.relationships.xmi_has_structural_member",
+    "XmiShape": ".v1.shapes.xmi_shape",
+    "XmiShapeC": ".v1.shapes.xmi_shape",
+    "XmiShapeCircle": ".v1.shapes.xmi_shape",
+    "XmiShapeI": ".v1.shapes.xmi_shape",
+    "XmiShapeT": ".v1.shapes.xmi_shape",
+    "XmiShapeL": ".v1.shapes.xmi_shape",
+    "XmiShapeOthers": ".v1.shapes.xmi_shape",
+    "XmiShapeRectangle": ".v1.shapes.xmi_shape",
+    "XmiShapeRectangularHollow": ".v1.shapes.xmi_shape",
+    "XmiShapeSquareHollow": ".v1.shapes.xmi_shape",
+}
+
+__all__ = ["TOLERANCE", "GRAVITY", "is_empty_or_whitespace"] + \
+    list(_LAZY_IMPORTS.keys())
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(
+            "module {module!r} has no attribute {name!r}".format(module=__name__, name=name))
+
+    value = getattr(import_module(module_name, __name__), name)
+    # cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(_LAZY_IMPORTS.keys()))
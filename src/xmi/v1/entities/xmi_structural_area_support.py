@@ -0,0 +1,49 @@
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from ..xmi_errors import XmiInconsistentDataTypeError
+from .xmi_structural_support import XmiStructuralSupport
+from .xmi_structural_surface_member import XmiStructuralSurfaceMember
+
+
+class XmiStructuralAreaSupport(XmiStructuralSupport):
+    """Support over a surface member, exports only give its translational stiffnesses."""
+    __slots__ = XmiStructuralSupport.__slots__ + ('_surface_member',)
+
+    def __init__(self,
+                 surface_member: XmiStructuralSurfaceMember,
+                 fixed=None,
+                 stiffnesses=None,
+                 id: str = None,
+                 name: str = None,
+                 description: str = None,
+                 ifcguid: str = None,
+                 **kwargs
+                 ):
+        entity_type = "XmiStructuralAreaSupport"
+        # Ensure surface_member is provided
+        if surface_member is None:
+            raise ValueError(
+                "The 'surface_member' parameter is compulsory and must be provided.")
+
+        super().__init__(fixed=fixed,
+                         stiffnesses=stiffnesses,
+                         id=id,
+                         name=name,
+                         ifcguid=ifcguid,
+                         description=description,
+                         entity_type=entity_type
+                         )
+
+        self.surface_member = surface_member
+
+    @property
+    def surface_member(self):
+        return self._surface_member
+
+    @surface_member.setter
+    def surface_member(self, value):
+        if not isinstance(value, XmiStructuralSurfaceMember):
+            raise XmiInconsistentDataTypeError(
+                "surface_member should be an XmiStructuralSurfaceMember")
+        self._surface_member = value
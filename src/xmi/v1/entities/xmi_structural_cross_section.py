@@ -7,6 +7,7 @@ from ..enums.xmi_shape_enums import XmiShapeEnum
 from ..xmi_errors import *
 from ..xmi_base import XmiBaseEntity
 from .xmi_structural_material import XmiStructuralMaterial
+from ..xmi_schema import XMI_KEY_MAPPINGS, create_key_translator, fill_missing_attributes
 
 from ..xmi_utilities import is_empty_or_whitespace
 
@@ -46,6 +47,9 @@ class XmiStructuralCrossSection(XmiBaseEntity):
     _attributes_needed = [slot[1:] if slot.startswith(
         '_') else slot for slot in __slots__ if slot != "_entity_type"]
 
+    _translate_xmi_dict_obj = staticmethod(create_key_translator(
+        XMI_KEY_MAPPINGS["XmiStructuralCrossSection"]))
+
     def __init__(self,
                  material: XmiStructuralMaterial,
                  shape: XmiShapeEnum,
@@ -339,33 +343,36 @@ class XmiStructuralCrossSection(XmiBaseEntity):
     #     return not input_string or not input_string.strip()
 
     @classmethod
-    def convert_parameter_string_to_tuple(self, parameter_str: str) -> tuple[int, float]:
+    def convert_parameter_string_to_tuple(self, parameter_str: str | tuple) -> tuple[int, float]:
+        # parameters already converted in bulk by parse_float_column are passed through
+        if isinstance(parameter_str, tuple):
+            return parameter_str
+
         parameter_list: list[str] = parameter_str.split(';')
+        parameter_values: list[float] = []
         for param in parameter_list:
             if is_empty_or_whitespace(param):
                 raise XmiInconsistentDataTypeError(
                     f"The individual parameter [{param}] within the XmiStructuralCrossSection 'parameters' attribute should not be empty string or empty space")
             try:
-                float_value = float(param)
+                parameter_values.append(float(param))
             except ValueError:
                 raise XmiInconsistentDataTypeError(
                     f"The parameter [{param}] within the XmiStructuralCrossSection 'parameters' attribute should be convertible to float")
 
-        parameter_tuple = tuple([float(param) for param in parameter_list])
-
-        return parameter_tuple
+        return tuple(parameter_values)
 
     # from_dict class method is used to do data conversion
     @classmethod
     def from_dict(cls, obj: dict) -> XmiStructuralCrossSection:
-        instance: XmiStructuralCrossSection | None = None
-        error_logs = []
-        processed_data = obj.copy()
+        return cls._from_processed_data(obj.copy())
 
-        for attr in cls._attributes_needed:
-            if attr not in processed_data:
-                error_logs.append(Exception(f"Missing attribute: {attr}"))
-                processed_data[attr] = None
+    # fills, converts and instantiates in place, processed_data is not copied
+    @classmethod
+    def _from_processed_data(cls, processed_data: dict) -> XmiStructuralCrossSection:
+        instance: XmiStructuralCrossSection | None = None
+        error_logs = fill_missing_attributes(
+            processed_data, cls._attributes_needed)
 
         # for type conversion when reading dictionary
         try:
@@ -422,46 +429,22 @@ class XmiStructuralCrossSection(XmiBaseEntity):
                 **processed_data)
         except Exception as e:
             error_logs.append(
-                Exception(f"Error instantiating XmiStructuralCrossSection: {obj}"))
+                XmiError(f"Error instantiating XmiStructuralCrossSection: {e}", problem_data=processed_data))
 
         return instance, error_logs
 
     # additional parameters are used to inject reference elements
     @classmethod
     def from_xmi_dict_obj(cls, xmi_dict_obj: dict,
-                          material: XmiStructuralMaterial = None) -> XmiStructuralCrossSection:
-        # Define a mapping from snake_case keys to custom keys
-        KEY_MAPPING = {
-            "Name": "name",
-            "Material": "material",
-            "Parameters": "parameters",
-            "Shape": "shape",
-            "Ix": "second_moment_of_area_x_axis",
-            "Iy": "second_moment_of_area_y_axis",
-            "rx": "radius_of_gyration_x_axis",
-            "ry": "radius_of_gyration_y_axis",
-            "Ex": "elastic_modulus_x_axis",
-            "Ey": "elastic_modulus_y_axis",
-            "Zx": "plastic_modulus_x_axis",
-            "Zy": "plastic_modulus_y_axis",
-            "J": "torsional_constant",
-            "Area": "area",
-            "Description": "description",
-            "ID": "id",
-            "IFCGUID": "ifcguid",
-        }
-
-        instance: XmiStructuralCrossSection | None = None
-        error_logs: list[Exception] = []
-        processed_data: dict = {KEY_MAPPING.get(
-            key, key): value for key, value in xmi_dict_obj.items()}
+                          material: XmiStructuralMaterial = None,
+                          parameters: tuple[float] = None) -> XmiStructuralCrossSection:
+        processed_data = cls._translate_xmi_dict_obj(xmi_dict_obj)
 
         if 'material' in processed_data.keys() and material is not None:
             processed_data['material'] = material
 
-        instance, error_logs_found = cls.from_dict(
-            processed_data)
+        # parameters already converted in bulk by parse_float_column
+        if parameters is not None:
+            processed_data['parameters'] = parameters
 
-        error_logs.extend(error_logs_found)
-
-        return instance, error_logs
+        return cls._from_processed_data(processed_data)
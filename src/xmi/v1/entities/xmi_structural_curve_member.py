@@ -6,6 +6,8 @@ from ..entities.xmi_structural_cross_section import XmiStructuralCrossSection
 
 from .xmi_structural_point_connection import XmiStructuralPointConnection
 from ..xmi_base import XmiBaseEntity
+from .xmi_structural_storey import XmiStructuralStorey
+from ..xmi_schema import XMI_KEY_MAPPINGS, create_key_translator, fill_missing_attributes
 from ..enums.xmi_structural_curve_member_enums import *
 from ..geometries.xmi_base_geometry import XmiBaseGeometry
 
@@ -39,6 +41,9 @@ class XmiStructuralCurveMember(XmiBaseEntity):
     _attributes_needed = [slot[1:] if slot.startswith(
         '_') else slot for slot in __slots__ if slot != "_entity_type"]
 
+    _translate_xmi_dict_obj = staticmethod(create_key_translator(
+        XMI_KEY_MAPPINGS["XmiStructuralCurveMember"]))
+
     def __init__(self,
                  cross_section: XmiStructuralCrossSection,
                  curve_member_type: XmiStructuralCurveMemberTypeEnum,
@@ -203,8 +208,9 @@ class XmiStructuralCurveMember(XmiBaseEntity):
 
     @storey.setter
     def storey(self, value):
-        if not isinstance(value, str):
-            raise TypeError("storey attribute should be an str")
+        # the storey name until the manager resolves it to its XmiStructuralStorey, None when the export has none
+        if value is not None and not isinstance(value, (str, XmiStructuralStorey)):
+            raise TypeError("storey attribute should be an str, XmiStructuralStorey or None")
         self._storey = value
 
     @property
@@ -432,35 +438,39 @@ class XmiStructuralCurveMember(XmiBaseEntity):
         return not input_string or not input_string.strip()
 
     @classmethod
-    def convert_local_axis_string_to_tuple(cls, axis_direction, local_axis_str: str) -> tuple:
+    def convert_local_axis_string_to_tuple(cls, axis_direction, local_axis_str: str | tuple) -> tuple:
+        # local axes already converted in bulk by parse_float_column are passed through
+        if isinstance(local_axis_str, tuple):
+            return local_axis_str
+
         local_axis_list: list[str] = local_axis_str.split(',')
         if len(local_axis_list) != 3:
             raise XmiMissingRequiredAttributeError(
                 f"The XmiStructuralCurveMember 'local_axis_{axis_direction}' attribute should have 3 parameters")
 
+        local_axis_values: list[float] = []
         for local_axis_value in local_axis_list:
             if cls.is_empty_or_whitespace(local_axis_value):
                 raise XmiInconsistentDataTypeError(
                     f"The individual parameter [{local_axis_value}] within the XmiStructuralCurveMember 'local_axis_{axis_direction}' attribute should not be empty string or empty space")
             try:
-                float_value = float(local_axis_value)
+                local_axis_values.append(float(local_axis_value))
             except ValueError:
                 raise XmiInconsistentDataTypeError(
                     f"The parameter [{local_axis_value}] within the XmiStructuralCurveMember 'local_axis_{axis_direction}' attribute should be convertible to float")
 
-        parameter_tuple = tuple([float(param) for param in local_axis_list])
-        return parameter_tuple
+        return tuple(local_axis_values)
 
     @classmethod
     def from_dict(cls, obj: dict) -> XmiStructuralCurveMember:
-        instance = None
-        exceptions = []
-        processed_data = obj.copy()
+        return cls._from_processed_data(obj.copy())
 
-        for attr in cls._attributes_needed:
-            if attr not in processed_data:
-                exceptions.append(Exception(f"Missing attribute: {attr}"))
-                processed_data[attr] = None
+    # fills, converts and instantiates in place, processed_data is not copied
+    @classmethod
+    def _from_processed_data(cls, processed_data: dict) -> XmiStructuralCurveMember:
+        instance = None
+        exceptions = fill_missing_attributes(
+            processed_data, cls._attributes_needed)
 
         # for type conversion when reading dictionary
         try:
@@ -616,7 +626,7 @@ class XmiStructuralCurveMember(XmiBaseEntity):
                 ** processed_data)
         except Exception as e:
             exceptions.append(
-                Exception(f"Error instantiating XmiStructuralCurveMember: {obj}"))
+                XmiError(f"Error instantiating XmiStructuralCurveMember: {e}", problem_data=processed_data))
 
         return instance, exceptions
 
@@ -626,69 +636,11 @@ class XmiStructuralCurveMember(XmiBaseEntity):
                           cross_section: XmiStructuralCrossSection = None,
                           nodes: list[XmiStructuralPointConnection] = None,
                           segments: list[XmiBaseEntity] = None,
+                          local_axis_x: tuple[float, float, float] = None,
+                          local_axis_y: tuple[float, float, float] = None,
+                          local_axis_z: tuple[float, float, float] = None,
                           ) -> XmiStructuralCurveMember:
-        # Define a mapping from snake_case keys to custom keys
-        KEY_MAPPING = {
-            "CrossSection": "cross_section",
-            "Storey": "storey",
-            "Type": "curve_member_type",
-            "Nodes": "nodes",
-            "Segments": "segments",
-            "SystemLine": "system_line",
-            "BeginNode": "begin_node",
-            "EndNode": "end_node",
-            "Length": "length",
-            "LocalAxisX": "local_axis_x",
-            "LocalAxisY": "local_axis_y",
-            "LocalAxisZ": "local_axis_z",
-            "BeginNodeXOffset": "begin_node_x_offset",
-            "EndNodeXOffset": "end_node_x_offset",
-            "BeginNodeYOffset": "begin_node_y_offset",
-            "EndNodeYOffset": "end_node_y_offset",
-            "BeginNodeZOffset": "begin_node_z_offset",
-            "EndNodeZOffset": "end_node_z_offset",
-            "EndFixityStart": "end_fixity_start",
-            "EndFixityEnd": "end_fixity_end",
-            "Name": "name",
-            "Description": "description",
-            "ID": "id",
-            "IFCGUID": "ifcguid",
-            # "CircularArcCentre": "circular_arc_centre", # NOT IN USE
-            # "CircularArcRadius": "circular_arc_radius", # NOT IN USE
-            # "StiffnessModifierArea": "stiffness_modifier_area",
-            # "StiffnessModifierAsy": "stiffness_modifier_shear_local_y_axis",
-            # "StiffnessModifierAsz": "stiffness_modifier_shear_local_z_axis",
-            # "StiffnessModifierTorsion": "stiffness_modifier_shear_torsion",
-            # "StiffnessModifierIyy": "stiffness_modifier_moment_local_y_axis",
-            # "StiffnessModifierIzz": "stiffness_modifier_moment_local_z_axis",
-            # "StiffnessModifierMass": "stiffness_modifier_moment_mass",
-            # "StiffnessModifierWeight": "stiffness_modifier_moment_weight",
-            # "EndFixityAxialStart": "end_fixity_axial_start",
-            # "EndFixityShearMajorStart": "end_fixity_shear_major_start",
-            # "EndFixityShearMinorStart": "end_fixity_shear_minor_start",
-            # "EndFixityTorsionStart": "end_fixity_torsion_start",
-            # "EndFixityMomentMajorStart": "end_fixity_moment_major_start",
-            # "EndFixityMomentMinorStart": "end_fixity_moment_minor_start",
-            # "EndFixityAxialEnd": "end_fixity_axial_end",
-            # "EndFixityShearMajorEnd": "end_fixity_shear_major_end",
-            # "EndFixityShearMinorEnd": "end_fixity_shear_minor_end",
-            # "EndFixityTorsionEnd": "end_fixity_torsion_end/",
-            # "EndFixityMomentMajorEnd": "begin_node_y_offset",
-            # "EndFixityMomentMinorEnd": "end_node_y_offset",
-            # "LateralRestrain": "begin_node",
-            # "LateralRestrainLocation": "end_node",
-            # "LengthEffectiveMajor": "length",
-            # "LengthEffectiveMinor": "local_axis_x",
-            # "SwayInMajor": "local_axis_y",
-            # "SwayInMinor": "local_axis_z",
-            # "BracedAbtMajor": "begin_node_y_offset",
-            # "BracedAbtMinor": "end_node_y_offset",
-        }
-
-        instance: XmiStructuralCurveMember | None = None
-        exceptions: list[Exception] = []
-        processed_data: dict = {KEY_MAPPING.get(
-            key, key): value for key, value in xmi_dict_obj.items()}
+        processed_data = cls._translate_xmi_dict_obj(xmi_dict_obj)
 
         if cross_section is not None:
             processed_data['cross_section'] = cross_section
@@ -699,12 +651,12 @@ class XmiStructuralCurveMember(XmiBaseEntity):
         if segments is not None:
             processed_data['segments'] = segments
 
+        # local axes already converted in bulk by parse_float_column
+        for attr, local_axis in (('local_axis_x', local_axis_x), ('local_axis_y', local_axis_y), ('local_axis_z', local_axis_z)):
+            if local_axis is not None:
+                processed_data[attr] = local_axis
+
         # if segment_types is not None:
         #     processed_data['segment_types'] = segment_types
 
-        instance, exceptions_found = cls.from_dict(
-            processed_data)
-
-        exceptions.extend(exceptions_found)
-
-        return instance, exceptions
+        return cls._from_processed_data(processed_data)
@@ -0,0 +1,50 @@
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from ..xmi_errors import XmiInconsistentDataTypeError
+from .xmi_structural_support import XmiStructuralSupport
+from .xmi_structural_curve_member import XmiStructuralCurveMember
+from .xmi_structural_surface_member import XmiStructuralSurfaceMember
+
+
+class XmiStructuralLineSupport(XmiStructuralSupport):
+    """Support along a curve member, or along the base of a surface member such as a wall."""
+    __slots__ = XmiStructuralSupport.__slots__ + ('_member',)
+
+    def __init__(self,
+                 member: XmiStructuralCurveMember | XmiStructuralSurfaceMember,
+                 fixed=None,
+                 stiffnesses=None,
+                 id: str = None,
+                 name: str = None,
+                 description: str = None,
+                 ifcguid: str = None,
+                 **kwargs
+                 ):
+        entity_type = "XmiStructuralLineSupport"
+        # Ensure member is provided
+        if member is None:
+            raise ValueError(
+                "The 'member' parameter is compulsory and must be provided.")
+
+        super().__init__(fixed=fixed,
+                         stiffnesses=stiffnesses,
+                         id=id,
+                         name=name,
+                         ifcguid=ifcguid,
+                         description=description,
+                         entity_type=entity_type
+                         )
+
+        self.member = member
+
+    @property
+    def member(self):
+        return self._member
+
+    @member.setter
+    def member(self, value):
+        if not isinstance(value, (XmiStructuralCurveMember, XmiStructuralSurfaceMember)):
+            raise XmiInconsistentDataTypeError(
+                "member should be an XmiStructuralCurveMember or XmiStructuralSurfaceMember")
+        self._member = value
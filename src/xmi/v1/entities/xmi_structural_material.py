@@ -3,6 +3,9 @@ from __future__ import annotations
 
 from ..enums.xmi_structural_material_enums import XmiStructuralMaterialTypeEnum
 from ..xmi_base import XmiBaseEntity
+from ..xmi_errors import XmiError
+from ..xmi_schema import (XMI_KEY_MAPPINGS, create_key_translator, fill_missing_attributes,
+                          transpose_xmi_dict_objs, check_number_column, convert_enum_column)
 
 
 class XmiStructuralMaterial(XmiBaseEntity):
@@ -17,6 +20,9 @@ class XmiStructuralMaterial(XmiBaseEntity):
     _attributes_needed = [slot[1:] if slot.startswith(
         '_') else slot for slot in __slots__ if slot != "_entity_type"]
 
+    _translate_xmi_dict_obj = staticmethod(create_key_translator(
+        XMI_KEY_MAPPINGS["XmiStructuralMaterial"]))
+
     def __init__(self,
                  material_type: XmiStructuralMaterialTypeEnum,
                  grade: float = None,
@@ -149,14 +155,14 @@ class XmiStructuralMaterial(XmiBaseEntity):
 
     @classmethod
     def from_dict(cls, obj: dict) -> XmiStructuralMaterial:
-        instance = None
-        error_logs: list[Exception] = []
-        processed_data: dict = obj.copy()
+        return cls._from_processed_data(obj.copy())
 
-        for attr in cls._attributes_needed:
-            if attr not in processed_data:
-                error_logs.append(Exception(f"Missing attribute: {attr}"))
-                processed_data[attr] = None
+    # fills, converts and instantiates in place, processed_data is not copied
+    @classmethod
+    def _from_processed_data(cls, processed_data: dict) -> XmiStructuralMaterial:
+        error_logs = fill_missing_attributes(
+            processed_data, cls._attributes_needed)
+        instance = None
 
         # for type conversion when reading dictionary
         try:
@@ -165,7 +171,7 @@ class XmiStructuralMaterial(XmiBaseEntity):
 
             if material_type_found is None:
                 error_logs.append(Exception(
-                    "Cannot Identify XmiStructuralMaterialTypeEnum: {data_value}".format(data_value=obj['material_type'])))
+                    "Cannot Identify XmiStructuralMaterialTypeEnum: {data_value}".format(data_value=processed_data['material_type'])))
                 return None, error_logs
         except KeyError as e:
             error_logs.append(e)
@@ -178,35 +184,64 @@ class XmiStructuralMaterial(XmiBaseEntity):
                 material_type=material_type_found, **processed_data)
         except Exception as e:
             error_logs.append(
-                Exception(f"Error instantiating StructuralMaterial: {obj}"))
+                XmiError(f"Error instantiating StructuralMaterial: {e}", problem_data=processed_data))
 
         return instance, error_logs
 
     @classmethod
     def from_xmi_dict_obj(cls, xmi_dict_obj: dict) -> XmiStructuralMaterial:
-        # Define a mapping from snake_case keys to custom keys
-        KEY_MAPPING = {
-            "Name": "name",
-            "Type": "material_type",
-            "Grade": "grade",
-            "UnitWeight": "unit_weight",
-            "EModulus": "e_modulus",
-            "GModulus": "g_modulus",
-            "PoissonRatio": "poisson_ratio",
-            "Description": "description",
-            "ID": "id",
-            "IFCGUID": "ifcguid",
-            "ThermalCoefficient": "thermal_coefficient"
-        }
+        processed_data = cls._translate_xmi_dict_obj(xmi_dict_obj)
 
-        instance = None
-        error_logs = []
-        processed_data = {KEY_MAPPING.get(
-            key, key): value for key, value in xmi_dict_obj.items()}
+        return cls._from_processed_data(processed_data)
 
-        instance, error_logs_found = cls.from_dict(
-            processed_data)
-
-        error_logs.extend(error_logs_found)
-
-        return instance, error_logs
+    @classmethod
+    def bulk_from_xmi_dicts(cls, xmi_dict_objs: list[dict]) -> tuple[list[XmiStructuralMaterial | None], list[list[Exception]]]:
+        """Build the materials of a whole StructuralMaterial section at once.
+
+        The section is transposed into one column per attribute, every column
+        is checked and converted in a single pass and the instances are then
+        created without going through the property setters again.
+
+        Parameters
+        ----------
+        xmi_dict_objs : list[dict]
+            The StructuralMaterial objects as found in the XMI dictionary.
+
+        Returns
+        -------
+        tuple[list[XmiStructuralMaterial | None], list[list[Exception]]]
+            The instances and the error logs, both aligned with xmi_dict_objs.
+            The instance is None for every object that could not be converted.
+        """
+        columns, error_logs = transpose_xmi_dict_objs(
+            xmi_dict_objs, XMI_KEY_MAPPINGS["XmiStructuralMaterial"], cls._attributes_needed)
+        failed: set[int] = set()
+
+        material_types = convert_enum_column(
+            columns['material_type'], XmiStructuralMaterialTypeEnum, failed, error_logs)
+        for attr in ('grade', 'unit_weight', 'e_modulus', 'g_modulus', 'poisson_ratio', 'thermal_coefficient'):
+            check_number_column(columns[attr], attr, failed, error_logs)
+        cls._convert_base_columns(columns, failed, error_logs)
+
+        instances: list[XmiStructuralMaterial | None] = []
+        new_unchecked = cls._new_unchecked
+        for index, (material_type, grade, unit_weight, e_modulus, g_modulus, poisson_ratio, thermal_coefficient,
+                    id, name, ifcguid, description) in enumerate(zip(
+                        material_types, columns['grade'], columns['unit_weight'], columns['e_modulus'],
+                        columns['g_modulus'], columns['poisson_ratio'], columns['thermal_coefficient'],
+                        columns['id'], columns['name'], columns['ifcguid'], columns['description'])):
+            if index in failed:
+                instances.append(None)
+                continue
+            instance = new_unchecked(
+                "XmiStructuralMaterial", id, name, ifcguid, description)
+            instance._material_type = material_type
+            instance._grade = grade
+            instance._unit_weight = unit_weight
+            instance._e_modulus = e_modulus
+            instance._g_modulus = g_modulus
+            instance._poisson_ratio = poisson_ratio
+            instance._thermal_coefficient = thermal_coefficient
+            instances.append(instance)
+
+        return instances, error_logs
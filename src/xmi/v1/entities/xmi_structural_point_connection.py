@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 from ..xmi_base import XmiBaseEntity
+from .xmi_structural_storey import XmiStructuralStorey
 from ..geometries.xmi_point_3d import XmiPoint3D
+from ..xmi_errors import XmiError, XmiInconsistentDataTypeError, XmiMissingReferenceInstanceError
+from ..xmi_schema import (XMI_KEY_MAPPINGS, create_key_translator, fill_missing_attributes,
+                          transpose_xmi_dict_objs, check_str_column)
 
 
 class XmiStructuralPointConnection(XmiBaseEntity):
@@ -12,6 +16,9 @@ class XmiStructuralPointConnection(XmiBaseEntity):
     _attributes_needed = [slot[1:] if slot.startswith(
         '_') else slot for slot in __slots__ if slot != "_entity_type"]
 
+    _translate_xmi_dict_obj = staticmethod(create_key_translator(
+        XMI_KEY_MAPPINGS["XmiStructuralPointConnection"]))
+
     def __init__(self,
                  point: XmiPoint3D,
                  storey: str = None,
@@ -74,50 +81,90 @@ class XmiStructuralPointConnection(XmiBaseEntity):
 
     @storey.setter
     def storey(self, value):
-        if not isinstance(value, str):
-            raise TypeError("Storey should be an str")
+        # the storey name until the manager resolves it to its XmiStructuralStorey, None when the export has none
+        if value is not None and not isinstance(value, (str, XmiStructuralStorey)):
+            raise TypeError("Storey should be an str, XmiStructuralStorey or None")
         self._storey = value
 
     @classmethod
     def from_dict(cls, obj: dict) -> XmiStructuralPointConnection:
-        error_logs = []
-        processed_data = obj.copy()
-
-        for attr in cls._attributes_needed:
-            if attr not in obj:
-                error_logs.append(Exception(f"Missing attribute: {attr}"))
-                processed_data[attr] = None
+        return cls._from_processed_data(obj.copy())
 
+    # fills, converts and instantiates in place, processed_data is not copied
+    @classmethod
+    def _from_processed_data(cls, processed_data: dict) -> XmiStructuralPointConnection:
+        error_logs = fill_missing_attributes(
+            processed_data, cls._attributes_needed)
+        instance = None
         try:
             instance = cls(
                 **processed_data)
         except Exception as e:
             error_logs.append(
-                Exception(f"Error instantiating StructuralPointConnection: {obj}"))
+                XmiError(f"Error instantiating StructuralPointConnection: {e}", problem_data=processed_data))
 
         return instance, error_logs
 
+    # additional parameters are used to inject reference elements
     @classmethod
-    def from_xmi_dict_obj(cls, xmi_dict_obj: dict):
-        # Define a mapping from snake_case keys to custom keys
-        KEY_MAPPING = {
-            "Name": "name",
-            # "X": "x",
-            # "Y": "y",
-            # "Z": "z",
-            "Storey": "storey",
-            "Description": "description",
-            "ID": "id",
-            "IFCGUID": "ifcguid"
-        }
-        instance = None
-        error_logs = []
-        processed_data = {KEY_MAPPING.get(
-            key, key): value for key, value in xmi_dict_obj.items()}
+    def from_xmi_dict_obj(cls, xmi_dict_obj: dict,
+                          point: XmiPoint3D = None):
+        processed_data = cls._translate_xmi_dict_obj(xmi_dict_obj)
 
-        instance, error_logs_found = cls.from_dict(
-            processed_data)
+        if point is not None:
+            processed_data['point'] = point
 
-        error_logs.extend(error_logs_found)
+        return cls._from_processed_data(processed_data)
 
-        return instance, error_logs
+    # additional parameters are used to inject reference elements
+    @classmethod
+    def bulk_from_xmi_dicts(cls, xmi_dict_objs: list[dict],
+                            points: list[XmiPoint3D | None] = None
+                            ) -> tuple[list[XmiStructuralPointConnection | None], list[list[Exception]]]:
+        """Build the point connections of a whole StructuralPointConnection section at once.
+
+        See XmiStructuralMaterial.bulk_from_xmi_dicts, the instances and error
+        logs are aligned with xmi_dict_objs.
+
+        Parameters
+        ----------
+        xmi_dict_objs : list[dict]
+            The StructuralPointConnection objects as found in the XMI dictionary.
+        points : list[XmiPoint3D | None], optional
+            The point of every object, aligned with xmi_dict_objs, usually
+            from XmiPoint3D.bulk_from_xmi_dicts.
+        """
+        columns, error_logs = transpose_xmi_dict_objs(
+            xmi_dict_objs, XMI_KEY_MAPPINGS["XmiStructuralPointConnection"], cls._attributes_needed)
+        failed: set[int] = set()
+
+        if points is None:
+            points = [None] * len(xmi_dict_objs)
+        for index, point in enumerate(points):
+            if point is None:
+                failed.add(index)
+                error_logs[index].append(XmiMissingReferenceInstanceError(
+                    "Please provide point value of type XmiPoint3D"))
+            elif not isinstance(point, XmiPoint3D):
+                failed.add(index)
+                error_logs[index].append(XmiInconsistentDataTypeError(
+                    "point provided need to be of instance XmiPoint3D"))
+        check_str_column(columns['storey'], 'storey',
+                         failed, error_logs)
+        cls._convert_base_columns(columns, failed, error_logs)
+
+        instances: list[XmiStructuralPointConnection | None] = []
+        new_unchecked = cls._new_unchecked
+        for index, (point, storey, id, name, ifcguid, description) in enumerate(zip(
+                points, columns['storey'],
+                columns['id'], columns['name'], columns['ifcguid'], columns['description'])):
+            if index in failed:
+                instances.append(None)
+                continue
+            instance = new_unchecked(
+                "XmiStructuralPointConnection", id, name, ifcguid, description)
+            instance._point = point
+            instance._storey = storey
+            instances.append(instance)
+
+        return instances, error_logs
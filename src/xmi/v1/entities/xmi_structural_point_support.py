@@ -0,0 +1,48 @@
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from ..xmi_errors import XmiInconsistentDataTypeError
+from .xmi_structural_support import XmiStructuralSupport
+from .xmi_structural_point_connection import XmiStructuralPointConnection
+
+
+class XmiStructuralPointSupport(XmiStructuralSupport):
+    __slots__ = XmiStructuralSupport.__slots__ + ('_node',)
+
+    def __init__(self,
+                 node: XmiStructuralPointConnection,
+                 fixed=None,
+                 stiffnesses=None,
+                 id: str = None,
+                 name: str = None,
+                 description: str = None,
+                 ifcguid: str = None,
+                 **kwargs
+                 ):
+        entity_type = "XmiStructuralPointSupport"
+        # Ensure node is provided
+        if node is None:
+            raise ValueError(
+                "The 'node' parameter is compulsory and must be provided.")
+
+        super().__init__(fixed=fixed,
+                         stiffnesses=stiffnesses,
+                         id=id,
+                         name=name,
+                         ifcguid=ifcguid,
+                         description=description,
+                         entity_type=entity_type
+                         )
+
+        self.node = node
+
+    @property
+    def node(self):
+        return self._node
+
+    @node.setter
+    def node(self, value):
+        if not isinstance(value, XmiStructuralPointConnection):
+            raise XmiInconsistentDataTypeError(
+                "node should be an XmiStructuralPointConnection")
+        self._node = value
@@ -0,0 +1,120 @@
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..xmi_base import XmiBaseEntity
+from ..xmi_errors import XmiError, XmiInconsistentDataTypeError
+from ..xmi_schema import fill_missing_attributes
+from .xmi_structural_curve_member import XmiStructuralCurveMember
+from .xmi_structural_surface_member import XmiStructuralSurfaceMember
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class XmiStructuralReinforcement(XmiBaseEntity):
+    """The reinforcement of one curve or surface member.
+
+    The per location values of the export (``Location``, ``Quantity``,
+    ``Size``, ...) are not kept as strings but as ``layers``, a view of the
+    rows of the member in the XmiReinforcementTable of the model, with one
+    row per location.
+    """
+    __slots__ = XmiBaseEntity.__slots__ + ('_member',
+                                           '_cover',
+                                           '_if_symmetrical',
+                                           '_layers')
+
+    _attributes_needed = [slot[1:] if slot.startswith(
+        '_') else slot for slot in __slots__ if slot != "_entity_type"]
+
+    def __init__(self,
+                 member: XmiStructuralCurveMember | XmiStructuralSurfaceMember,
+                 cover: tuple[float] | None = None,
+                 if_symmetrical: bool | None = None,
+                 layers: np.ndarray | None = None,
+                 id: str = None,
+                 name: str = None,
+                 description: str = None,
+                 ifcguid: str = None,
+                 **kwargs
+                 ):
+        entity_type = "XmiStructuralReinforcement"
+        # Ensure member is provided
+        if member is None:
+            raise ValueError(
+                "The 'member' parameter is compulsory and must be provided.")
+
+        # Initialize parent class
+        super().__init__(id=id,
+                         name=name,
+                         ifcguid=ifcguid,
+                         description=description,
+                         entity_type=entity_type
+                         )
+
+        self.member = member
+        self.cover = cover
+        self.if_symmetrical = if_symmetrical
+        self.layers = layers
+
+    @property
+    def member(self):
+        return self._member
+
+    @member.setter
+    def member(self, value):
+        if not isinstance(value, (XmiStructuralCurveMember, XmiStructuralSurfaceMember)):
+            raise XmiInconsistentDataTypeError(
+                "member should be an XmiStructuralCurveMember or XmiStructuralSurfaceMember")
+        self._member = value
+
+    @property
+    def cover(self):
+        return self._cover
+
+    @cover.setter
+    def cover(self, value):
+        if value is not None and not isinstance(value, tuple):
+            raise TypeError("Cover should be a tuple of float or None")
+        self._cover = value
+
+    @property
+    def if_symmetrical(self):
+        return self._if_symmetrical
+
+    @if_symmetrical.setter
+    def if_symmetrical(self, value):
+        if value is not None and not isinstance(value, bool):
+            raise TypeError("IfSymmetrical should be a bool or None")
+        self._if_symmetrical = value
+
+    @property
+    def layers(self):
+        return self._layers
+
+    @layers.setter
+    def layers(self, value):
+        # NumPy is imported once layers are set, XmiManager imports this module
+        import numpy as np
+
+        if value is not None and not isinstance(value, np.ndarray):
+            raise TypeError(
+                "layers should be a structured numpy array or None")
+        self._layers = value
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> XmiStructuralReinforcement:
+        processed_data = obj.copy()
+        error_logs = fill_missing_attributes(
+            processed_data, cls._attributes_needed)
+        instance = None
+
+        try:
+            instance = cls(**processed_data)
+        except Exception as e:
+            error_logs.append(
+                XmiError(f"Error instantiating StructuralReinforcement: {e}", problem_data=processed_data))
+
+        return instance, error_logs
@@ -0,0 +1,197 @@
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from ..xmi_base import XmiBaseEntity
+from ..xmi_errors import XmiError
+from ..xmi_schema import (XMI_KEY_MAPPINGS, create_key_translator, fill_missing_attributes,
+                          transpose_xmi_dict_objs, check_number_column)
+
+
+class XmiStructuralStorey(XmiBaseEntity):
+    __slots__ = XmiBaseEntity.__slots__ + ('_storey_elevation',
+                                           '_storey_mass',
+                                           '_storey_horizontal_reaction_x',
+                                           '_storey_horizontal_reaction_y',
+                                           '_storey_vertical_reaction')
+
+    _attributes_needed = [slot[1:] if slot.startswith(
+        '_') else slot for slot in __slots__ if slot != "_entity_type"]
+
+    # only analysis exports carry the mass and reactions, BIM exports leave the keys out
+    _optional_attributes = ('storey_mass', 'storey_horizontal_reaction_x', 'storey_horizontal_reaction_y',
+                            'storey_vertical_reaction')
+
+    _translate_xmi_dict_obj = staticmethod(create_key_translator(
+        XMI_KEY_MAPPINGS["XmiStructuralStorey"]))
+
+    def __init__(self,
+                 storey_elevation: float,
+                 storey_mass: float = None,
+                 storey_horizontal_reaction_x: float = None,
+                 storey_horizontal_reaction_y: float = None,
+                 storey_vertical_reaction: float = None,
+                 id: str = None,
+                 name: str = None,
+                 description: str = None,
+                 ifcguid: str = None,
+                 **kwargs
+                 ):
+        entity_type = "XmiStructuralStorey"
+        # Ensure storey_elevation is provided
+        if storey_elevation is None:
+            raise ValueError(
+                "The 'storey_elevation' parameter is compulsory and must be provided.")
+
+        # Initialize parent class
+        super().__init__(id=id,
+                         name=name,
+                         ifcguid=ifcguid,
+                         description=description,
+                         entity_type=entity_type
+                         )
+
+        # Initialize attributes
+        self.set_attributes(storey_elevation, storey_mass, storey_horizontal_reaction_x,
+                            storey_horizontal_reaction_y, storey_vertical_reaction, **kwargs)
+
+    def set_attributes(self, storey_elevation, storey_mass, storey_horizontal_reaction_x,
+                       storey_horizontal_reaction_y, storey_vertical_reaction, **kwargs):
+        attributes = [
+            ('storey_elevation', storey_elevation),
+            ('storey_mass', storey_mass),
+            ('storey_horizontal_reaction_x', storey_horizontal_reaction_x),
+            ('storey_horizontal_reaction_y', storey_horizontal_reaction_y),
+            ('storey_vertical_reaction', storey_vertical_reaction)
+        ]
+
+        for attr_name, attr_value in attributes:
+            value = kwargs.get(attr_name, attr_value)
+            try:
+                setattr(self, attr_name, value)
+            except AttributeError as e:
+                print(
+                    f"Caught an AttributeError while setting {attr_name}: {e}")
+                setattr(self, attr_name, None)
+
+    @property
+    def storey_elevation(self):
+        return self._storey_elevation
+
+    @storey_elevation.setter
+    def storey_elevation(self, value):
+        if not isinstance(value, (float, int)):
+            raise TypeError(
+                "StoreyElevation should be of type float or integer")
+        self._storey_elevation = value
+
+    @property
+    def storey_mass(self):
+        return self._storey_mass
+
+    @storey_mass.setter
+    def storey_mass(self, value):
+        if value is not None and not isinstance(value, (float, int)):
+            raise TypeError(
+                "StoreyMass should be of type float, integer, or None")
+        self._storey_mass = value
+
+    @property
+    def storey_horizontal_reaction_x(self):
+        return self._storey_horizontal_reaction_x
+
+    @storey_horizontal_reaction_x.setter
+    def storey_horizontal_reaction_x(self, value):
+        if value is not None and not isinstance(value, (float, int)):
+            raise TypeError(
+                "StoreyHorizontalReactionX should be of type float, integer, or None")
+        self._storey_horizontal_reaction_x = value
+
+    @property
+    def storey_horizontal_reaction_y(self):
+        return self._storey_horizontal_reaction_y
+
+    @storey_horizontal_reaction_y.setter
+    def storey_horizontal_reaction_y(self, value):
+        if value is not None and not isinstance(value, (float, int)):
+            raise TypeError(
+                "StoreyHorizontalReactionY should be of type float, integer, or None")
+        self._storey_horizontal_reaction_y = value
+
+    @property
+    def storey_vertical_reaction(self):
+        return self._storey_vertical_reaction
+
+    @storey_vertical_reaction.setter
+    def storey_vertical_reaction(self, value):
+        if value is not None and not isinstance(value, (float, int)):
+            raise TypeError(
+                "StoreyVerticalReaction should be of type float, integer, or None")
+        self._storey_vertical_reaction = value
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> XmiStructuralStorey:
+        return cls._from_processed_data(obj.copy())
+
+    # fills, converts and instantiates in place, processed_data is not copied
+    @classmethod
+    def _from_processed_data(cls, processed_data: dict) -> XmiStructuralStorey:
+        error_logs = fill_missing_attributes(
+            processed_data, [attr for attr in cls._attributes_needed if attr not in cls._optional_attributes])
+        instance = None
+
+        try:
+            instance = cls(**processed_data)
+        except Exception as e:
+            error_logs.append(
+                XmiError(f"Error instantiating StructuralStorey: {e}", problem_data=processed_data))
+
+        return instance, error_logs
+
+    @classmethod
+    def from_xmi_dict_obj(cls, xmi_dict_obj: dict) -> XmiStructuralStorey:
+        processed_data = cls._translate_xmi_dict_obj(xmi_dict_obj)
+
+        return cls._from_processed_data(processed_data)
+
+    @classmethod
+    def bulk_from_xmi_dicts(cls, xmi_dict_objs: list[dict]) -> tuple[list[XmiStructuralStorey | None], list[list[Exception]]]:
+        """Build the storeys of a whole StructuralStorey section at once.
+
+        See XmiStructuralMaterial.bulk_from_xmi_dicts, the instances and error
+        logs are aligned with xmi_dict_objs.
+        """
+        key_mapping = XMI_KEY_MAPPINGS["XmiStructuralStorey"]
+        columns, error_logs = transpose_xmi_dict_objs(
+            xmi_dict_objs, key_mapping, [attr for attr in cls._attributes_needed if attr not in cls._optional_attributes])
+        failed: set[int] = set()
+
+        check_number_column(columns['storey_elevation'], 'storey_elevation',
+                            failed, error_logs, optional=False)
+        attribute_keys = {attr: key for key, attr in key_mapping.items()}
+        for attr in cls._optional_attributes:
+            columns[attr] = [xmi_dict_obj.get(attribute_keys[attr])
+                             for xmi_dict_obj in xmi_dict_objs]
+            check_number_column(columns[attr], attr, failed, error_logs)
+        cls._convert_base_columns(columns, failed, error_logs)
+
+        instances: list[XmiStructuralStorey | None] = []
+        new_unchecked = cls._new_unchecked
+        for index, (storey_elevation, storey_mass, storey_horizontal_reaction_x, storey_horizontal_reaction_y,
+                    storey_vertical_reaction, id, name, ifcguid, description) in enumerate(zip(
+                        columns['storey_elevation'], columns['storey_mass'],
+                        columns['storey_horizontal_reaction_x'], columns['storey_horizontal_reaction_y'],
+                        columns['storey_vertical_reaction'],
+                        columns['id'], columns['name'], columns['ifcguid'], columns['description'])):
+            if index in failed:
+                instances.append(None)
+                continue
+            instance = new_unchecked(
+                "XmiStructuralStorey", id, name, ifcguid, description)
+            instance._storey_elevation = storey_elevation
+            instance._storey_mass = storey_mass
+            instance._storey_horizontal_reaction_x = storey_horizontal_reaction_x
+            instance._storey_horizontal_reaction_y = storey_horizontal_reaction_y
+            instance._storey_vertical_reaction = storey_vertical_reaction
+            instances.append(instance)
+
+        return instances, error_logs
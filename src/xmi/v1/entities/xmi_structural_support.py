@@ -0,0 +1,76 @@
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from ..xmi_base import XmiBaseEntity
+
+# degrees of freedom of a support, in the column order of its fixed and stiffnesses arrays
+XMI_SUPPORT_DOFS = ("ux", "uy", "uz", "fix", "fiy", "fiz")
+
+
+class XmiStructuralSupport(XmiBaseEntity):
+    """Base of the point, line and area supports.
+
+    ``fixed`` and ``stiffnesses`` hold one value per degree of freedom of
+    XMI_SUPPORT_DOFS. Once a model is read they are views of the rows of
+    XmiModel.support_table, so changes show up in its arrays. Stiffnesses
+    an export does not give, e.g. the rotations of an area support, are NaN.
+    """
+    __slots__ = XmiBaseEntity.__slots__ + ('_fixed',
+                                           '_stiffnesses')
+
+    def __init__(self,
+                 fixed=None,
+                 stiffnesses=None,
+                 id: str = None,
+                 name: str = None,
+                 description: str = None,
+                 ifcguid: str = None,
+                 entity_type: str = None
+                 ):
+        # Initialize parent class
+        super().__init__(id=id,
+                         name=name,
+                         ifcguid=ifcguid,
+                         description=description,
+                         entity_type=entity_type
+                         )
+
+        # NumPy is imported once a support is made, XmiManager imports this module
+        import numpy as np
+
+        self.fixed = fixed if fixed is not None else np.zeros(
+            len(XMI_SUPPORT_DOFS), dtype=bool)
+        self.stiffnesses = stiffnesses if stiffnesses is not None else np.full(
+            len(XMI_SUPPORT_DOFS), np.nan)
+
+    @property
+    def fixed(self):
+        return self._fixed
+
+    @fixed.setter
+    def fixed(self, value):
+        import numpy as np
+
+        value = np.asarray(value)
+        if value.shape != (len(XMI_SUPPORT_DOFS),) or value.dtype != bool:
+            raise TypeError(
+                "fixed should hold one bool per degree of freedom")
+        self._fixed = value
+
+    @property
+    def stiffnesses(self):
+        return self._stiffnesses
+
+    @stiffnesses.setter
+    def stiffnesses(self, value):
+        import numpy as np
+
+        try:
+            value = np.asarray(value, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise TypeError(
+                "stiffnesses should hold one float per degree of freedom")
+        if value.shape != (len(XMI_SUPPORT_DOFS),):
+            raise TypeError(
+                "stiffnesses should hold one float per degree of freedom")
+        self._stiffnesses = value
@@ -10,6 +10,8 @@ from ..enums.xmi_structural_surface_member_enums import *
 
 
 from ..xmi_base import XmiBaseEntity
+from .xmi_structural_storey import XmiStructuralStorey
+from ..xmi_schema import XMI_KEY_MAPPINGS, create_key_translator, fill_missing_attributes
 from ..xmi_errors import *
 
 # Temporarily disabled span_type attribute as there isnt seem to be any export for this.
@@ -38,6 +40,9 @@ class XmiStructuralSurfaceMember(XmiBaseEntity):
     _attributes_needed = [slot[1:] if slot.startswith(
         '_') else slot for slot in __slots__ if slot != "_entity_type"]
 
+    _translate_xmi_dict_obj = staticmethod(create_key_translator(
+        XMI_KEY_MAPPINGS["XmiStructuralSurfaceMember"]))
+
     def __init__(self,
                  material: XmiStructuralMaterial,
                  surface_member_type: XmiStructuralSurfaceMemberTypeEnum,
@@ -302,45 +307,48 @@ class XmiStructuralSurfaceMember(XmiBaseEntity):
 
     @storey.setter
     def storey(self, value):
-        if not isinstance(value, str):
-            raise TypeError("Storey should be an str")
+        # the storey name until the manager resolves it to its XmiStructuralStorey, None when the export has none
+        if value is not None and not isinstance(value, (str, XmiStructuralStorey)):
+            raise TypeError("Storey should be an str, XmiStructuralStorey or None")
         self._storey = value
 
     def is_empty_or_whitespace(input_string: str) -> bool:
         return not input_string or not input_string.strip()
 
     @classmethod
-    def convert_local_axis_string_to_tuple(cls, axis_direction, local_axis_str: str) -> tuple:
+    def convert_local_axis_string_to_tuple(cls, axis_direction, local_axis_str: str | tuple) -> tuple:
+        # local axes already converted in bulk by parse_float_column are passed through
+        if isinstance(local_axis_str, tuple):
+            return local_axis_str
+
         local_axis_list: list[str] = local_axis_str.split(',')
         if len(local_axis_list) != 3:
             raise XmiMissingRequiredAttributeError(
                 f"The XmiStructuralCurveMember 'local_axis_{axis_direction}' attribute should have 3 parameters")
 
+        local_axis_values: list[float] = []
         for local_axis_value in local_axis_list:
             if cls.is_empty_or_whitespace(local_axis_value):
                 raise XmiInconsistentDataTypeError(
                     f"The individual parameter [{local_axis_value}] within the XmiStructuralCurveMember 'local_axis_{axis_direction}' attribute should not be empty string or empty space")
             try:
-                float_value = float(local_axis_value)
+                local_axis_values.append(float(local_axis_value))
             except ValueError:
                 raise XmiInconsistentDataTypeError(
                     f"The parameter [{local_axis_value}] within the XmiStructuralCurveMember 'local_axis_{axis_direction}' attribute should be convertible to float")
 
-        parameter_tuple = tuple([float(param) for param in local_axis_list])
-        return parameter_tuple
+        return tuple(local_axis_values)
 
     @classmethod
-    def from_dict(cls,
-                  obj: dict
-                  ) -> XmiStructuralSurfaceMember:
-        instance = None
-        exceptions = []
-        processed_data = obj.copy()
+    def from_dict(cls, obj: dict) -> XmiStructuralSurfaceMember:
+        return cls._from_processed_data(obj.copy())
 
-        for attr in cls._attributes_needed:
-            if attr not in processed_data:
-                exceptions.append(Exception(f"Missing attribute: {attr}"))
-                processed_data[attr] = None
+    # fills, converts and instantiates in place, processed_data is not copied
+    @classmethod
+    def _from_processed_data(cls, processed_data: dict) -> XmiStructuralSurfaceMember:
+        instance = None
+        exceptions = fill_missing_attributes(
+            processed_data, cls._attributes_needed)
 
         # for type conversion when reading dictionary
         try:
@@ -473,7 +481,7 @@ class XmiStructuralSurfaceMember(XmiBaseEntity):
                 ** processed_data)
         except Exception as e:
             exceptions.append(
-                Exception(f"Error instantiating XmiStructuralSurfaceMember: {obj}"))
+                XmiError(f"Error instantiating XmiStructuralSurfaceMember: {e}", problem_data=processed_data))
 
         return instance, exceptions
 
@@ -483,42 +491,11 @@ class XmiStructuralSurfaceMember(XmiBaseEntity):
                           material: XmiStructuralMaterial = None,
                           nodes: list[XmiStructuralPointConnection] = None,
                           segments: list[XmiBaseEntity] = None,
+                          local_axis_x: tuple[float, float, float] = None,
+                          local_axis_y: tuple[float, float, float] = None,
+                          local_axis_z: tuple[float, float, float] = None,
                           ) -> XmiStructuralSurfaceMember:
-        # Define a mapping from snake_case keys to custom keys
-        KEY_MAPPING = {
-            "Material": "material",
-            "Storey": "storey",
-            "Type": "surface_member_type",
-            "Thickness": "thickness",
-            "Edges": "edges",
-            "Nodes": "nodes",
-            "SystemPlane": "system_plane",
-            "Area": "area",
-            "LocalAxisX": "local_axis_x",
-            "LocalAxisY": "local_axis_y",
-            "LocalAxisZ": "local_axis_z",
-            "ZOffset": "z_offset",
-            "Height": "height",
-            "Name": "name",
-            "Description": "description",
-            "ID": "id",
-            "IFCGUID": "ifcguid",
-            # "StiffnessModifierFxx": "circular_arc_centre", # NOT IN USE
-            # "StiffnessModifierFyy": "circular_arc_radius", # NOT IN USE
-            # "StiffnessModifierFxy": "stiffness_modifier_area",
-            # "StiffnessModifierMxx": "stiffness_modifier_shear_local_y_axis",
-            # "StiffnessModifierMyy": "stiffness_modifier_shear_local_z_axis",
-            # "StiffnessModifierMxy": "stiffness_modifier_shear_torsion",
-            # "StiffnessModifierVxz": "stiffness_modifier_moment_local_y_axis",
-            # "StiffnessModifierVyz": "stiffness_modifier_moment_local_z_axis",
-            # "StiffnessModifierMass": "stiffness_modifier_moment_mass",
-            # "StiffnessModifierWeight": "stiffness_modifier_moment_weight",
-        }
-
-        instance: XmiStructuralSurfaceMember | None = None
-        exceptions: list[Exception] = []
-        processed_data: dict = {KEY_MAPPING.get(
-            key, key): value for key, value in xmi_dict_obj.items()}
+        processed_data = cls._translate_xmi_dict_obj(xmi_dict_obj)
 
         if material is not None:
             processed_data['material'] = material
@@ -529,12 +506,12 @@ class XmiStructuralSurfaceMember(XmiBaseEntity):
         if segments is not None:
             processed_data['segments'] = segments
 
+        # local axes already converted in bulk by parse_float_column
+        for attr, local_axis in (('local_axis_x', local_axis_x), ('local_axis_y', local_axis_y), ('local_axis_z', local_axis_z)):
+            if local_axis is not None:
+                processed_data[attr] = local_axis
+
         # if segment_types is not None:
         #     processed_data['segment_types'] = segment_types
 
-        instance, exceptions_found = cls.from_dict(
-            processed_data)
-
-        exceptions.extend(exceptions_found)
-
-        return instance, exceptions
+        return cls._from_processed_data(processed_data)
@@ -23,7 +23,7 @@ class XmiStructuralUnit(XmiBaseEntity):
         entity_type = "XmiStructuralUnit"
 
         uuid_value = uuid.uuid4()
-        id = id if id else uuid_value
+        id = id if id else str(uuid_value)
         name = name if name else "{class_name}_{uuid_value}".format(
             class_name=type(self).__name__, uuid_value=uuid_value)
 
@@ -65,6 +65,7 @@ class XmiStructuralUnit(XmiBaseEntity):
 
     @Unit.setter
     def Unit(self, value):
-        if not isinstance(value, XmiUnitEnum):
-            raise TypeError("Unit should be an int or float")
+        # exports use units XmiUnitEnum does not list, e.g. "kN/m", which are kept as str
+        if not isinstance(value, (XmiUnitEnum, str)):
+            raise TypeError("Unit should be an XmiUnitEnum or str")
         self._Unit = value
@@ -1,6 +1,4 @@
 from enum import Enum, unique
-from ..geometries.xmi_line_3d import XmiLine3D
-from ..geometries.xmi_arc_3d import XmiArc3D
 
 
 @unique
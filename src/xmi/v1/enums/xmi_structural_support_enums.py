@@ -0,0 +1,8 @@
+from .xmi_enums import XmiEnum
+from enum import unique
+
+
+@unique
+class XmiSupportConditionEnum(XmiEnum):
+    FIXED = "Fixed"
+    FREE = "Free"
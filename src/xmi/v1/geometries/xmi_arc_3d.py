@@ -2,21 +2,26 @@
 from __future__ import annotations
 
 from ..xmi_base import XmiBaseEntity
+from ..xmi_errors import XmiError
 from .xmi_point_3d import XmiPoint3D
 from .xmi_base_geometry import XmiBaseGeometry
 
 
 class XmiArc3D(XmiBaseGeometry):
-    __slots__ = ('_start_point', '_end_point')
+    # _geometry_cache holds the derived properties with the coordinates they were computed from
+    # _plane_normal is only used by arcs of half a turn, whose points do not give their plane
+    __slots__ = ('_start_point', '_end_point',
+                 '_center_point', '_plane_normal', '_geometry_cache')
 
     _attributes_needed = [slot[1:] if slot.startswith(
-        '_') else slot for slot in __slots__ if slot != "_entity_type"]
+        '_') else slot for slot in __slots__ if slot not in ("_entity_type", "_plane_normal", "_geometry_cache")]
 
     def __init__(self,
                  start_point: XmiPoint3D,
                  end_point: XmiPoint3D,
                  center_point: XmiPoint3D,
                  radius: float = None,
+                 plane_normal: tuple[float, float, float] = None,
                  id: str = None,
                  name: str = None,
                  description: str = None,
@@ -49,6 +54,7 @@ class XmiArc3D(XmiBaseGeometry):
 
         # Initialize attributes
         self.set_attributes(start_point, end_point, center_point, **kwargs)
+        self.plane_normal = plane_normal
 
     def set_attributes(self, start_point, end_point, center_point, **kwargs):
         attributes = [
@@ -96,8 +102,110 @@ class XmiArc3D(XmiBaseGeometry):
             raise TypeError("center_point should be an XmiPoint3D")
         self._center_point = value
 
+    @property
+    def plane_normal(self) -> tuple[float, float, float] | None:
+        """Normal of the plane of the arc when start, end and center point are collinear, e.g. a member local axis."""
+        return self._plane_normal
+
+    @plane_normal.setter
+    def plane_normal(self, value):
+        if value is not None:
+            value = tuple(float(component) for component in value)
+            if len(value) != 3:
+                raise ValueError("plane_normal should have 3 components")
+        self._plane_normal = value
+
+    def _arrays(self) -> tuple:
+        # the kernel imports NumPy, XmiManager only needs it once geometry is asked for
+        from . import xmi_geometry_kernel as kernel
+
+        starts, ends, centres = kernel.arcs_to_arrays([self])
+        normals = None if self._plane_normal is None else kernel.arc_normals(
+            starts, ends, centres, [self._plane_normal])
+        return starts, ends, centres, normals
+
+    def _geometry(self) -> dict:
+        start_point, end_point, center_point = self._start_point, self._end_point, self._center_point
+        coordinates = (start_point.x, start_point.y, start_point.z,
+                       end_point.x, end_point.y, end_point.z,
+                       center_point.x, center_point.y, center_point.z, self._plane_normal)
+        cache = getattr(self, '_geometry_cache', None)
+        if cache is None or cache[0] != coordinates:
+            from . import xmi_geometry_kernel as kernel
+
+            starts, ends, centres, normals = self._arrays()
+            _, _, normals, sweeps = kernel.arc_frames(
+                starts, ends, centres, normals)
+            radius = float(kernel.arc_radii(starts, centres)[0])
+            bounding_box = kernel.arc_bounding_boxes(
+                starts, ends, centres, normals)[0]
+            cache = (coordinates, {
+                'radius': radius,
+                'normal': tuple(normals[0].tolist()),
+                'sweep_angle': float(sweeps[0]),
+                'length': radius * float(sweeps[0]),
+                'midpoint': tuple(kernel.arc_midpoints(starts, ends, centres, normals)[0].tolist()),
+                'bounding_box': (tuple(bounding_box[0].tolist()), tuple(bounding_box[1].tolist())),
+            })
+            self._geometry_cache = cache
+        return cache[1]
+
+    @property
+    def radius(self) -> float:
+        """Distance from the center to the start point."""
+        return self._geometry()['radius']
+
+    @property
+    def normal(self) -> tuple[float, float, float]:
+        """Unit normal of the plane of the arc, the arc turns counterclockwise about it."""
+        return self._geometry()['normal']
+
+    @property
+    def sweep_angle(self) -> float:
+        """Angle swept from start to end point in radians, at most half a turn."""
+        return self._geometry()['sweep_angle']
+
+    @property
+    def length(self) -> float:
+        return self._geometry()['length']
+
+    @property
+    def midpoint(self) -> tuple[float, float, float]:
+        return self._geometry()['midpoint']
+
+    @property
+    def bounding_box(self) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+        """Minimum and maximum corner of the arc, including its bulge."""
+        return self._geometry()['bounding_box']
+
+    def point_at_parameter(self, parameter: float) -> tuple[float, float, float]:
+        """Point at parameter t, 0 at the start and 1 at the end point."""
+        from . import xmi_geometry_kernel as kernel
+
+        starts, ends, centres, normals = self._arrays()
+        return tuple(kernel.arc_points_at_parameters(starts, ends, centres, [parameter], normals)[0].tolist())
+
+    def parameter_at_point(self, point: XmiPoint3D | tuple[float, float, float]) -> float:
+        """Parameter of the projection of ``point`` on the circle of the arc, beyond 1 past the end point."""
+        coordinates = (point.x, point.y, point.z) if isinstance(
+            point, XmiPoint3D) else tuple(point)
+        from . import xmi_geometry_kernel as kernel
+
+        starts, ends, centres, normals = self._arrays()
+        return float(kernel.arc_parameters_at_points(
+            starts, ends, centres, [coordinates], normals)[0])
+
+    def tessellate(self, segments: int = 16) -> list[tuple[float, float, float]]:
+        """Return ``segments + 1`` evenly spaced points from start to end point."""
+        from . import xmi_geometry_kernel as kernel
+
+        starts, ends, centres, normals = self._arrays()
+        return [tuple(vertex) for vertex in kernel.arc_tessellations(
+            starts, ends, centres, segments, normals)[0].tolist()]
+
     @classmethod
     def from_dict(cls, obj: dict) -> XmiPoint3D:
+        instance = None
         error_logs = []
         processed_data = obj.copy()
 
@@ -118,9 +226,10 @@ class XmiArc3D(XmiBaseGeometry):
             instance = cls(
                 start_point=start_point_found,
                 end_point=end_point_found,
+                center_point=center_point_found,
                 **processed_data)
         except Exception as e:
             error_logs.append(
-                Exception(f"Error instantiating XmiLine3D: {obj}"))
+                XmiError(f"Error instantiating XmiArc3D: {e}", problem_data=obj))
 
         return instance, error_logs
@@ -0,0 +1,283 @@
+"""
+Batch geometry of line and circular arc segments.
+
+Every function takes (n, 3) arrays with one segment per row and returns one
+result per row, so a whole model is processed in a few NumPy calls. The
+methods of XmiLine3D and XmiArc3D call the same functions with n = 1.
+
+Arcs are defined by their start, end and centre points. Without an explicit
+normal the arc is the one sweeping less than half a turn from start to end;
+passing normals selects the direction of rotation, which also allows arcs of
+more than half a turn. An arc of exactly half a turn has its start, end and
+centre on one line, so only a normal from elsewhere, see arc_normals, gives
+its plane.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import numpy as np
+
+from .xmi_point_3d import XmiPoint3D
+from ..xmi_string_parsing import XmiRaggedArray
+
+
+def points_to_array(points: list[XmiPoint3D]) -> np.ndarray:
+    """Coordinates of a list of points as an (n, 3) array."""
+    return np.array([(point.x, point.y, point.z) for point in points], dtype=np.float64).reshape(-1, 3)
+
+
+def lines_to_arrays(lines: list) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end points of a list of XmiLine3D as two (n, 3) arrays."""
+    return (points_to_array([line.start_point for line in lines]),
+            points_to_array([line.end_point for line in lines]))
+
+
+def arcs_to_arrays(arcs: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Start, end and center points of a list of XmiArc3D as three (n, 3) arrays."""
+    return (points_to_array([arc.start_point for arc in arcs]),
+            points_to_array([arc.end_point for arc in arcs]),
+            points_to_array([arc.center_point for arc in arcs]))
+
+
+def arcs_to_normals(arcs: list) -> np.ndarray:
+    """Normals of a list of XmiArc3D as an (n, 3) array, taking their plane_normal for half turns."""
+    plane_normals = np.array([arc.plane_normal if arc.plane_normal is not None else (np.nan,) * 3
+                              for arc in arcs], dtype=np.float64).reshape(-1, 3)
+    return arc_normals(*arcs_to_arrays(arcs), plane_normals)
+
+
+def _row_dot(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.einsum('ij,ij->i', a, b)
+
+
+def normalize_vectors(vectors: np.ndarray) -> np.ndarray:
+    """Unit vectors along the last axis, NaN for zero vectors, so (n, 3) and (g, k, 3) arrays both work."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(norms > 0, vectors / norms, np.nan)
+
+
+# lines
+
+
+def line_lengths(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    return np.linalg.norm(ends - starts, axis=1)
+
+
+def line_directions(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Unit vectors from start to end, NaN for zero length lines."""
+    return normalize_vectors(ends - starts)
+
+
+def line_midpoints(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    return (starts + ends) / 2.0
+
+
+def line_bounding_boxes(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """(n, 2, 3) array of the minimum and maximum corner of every line."""
+    return np.stack([np.minimum(starts, ends), np.maximum(starts, ends)], axis=1)
+
+
+def line_points_at_parameters(starts: np.ndarray, ends: np.ndarray, parameters: np.ndarray) -> np.ndarray:
+    """Points at parameter t of every line, 0 at the start and 1 at the end."""
+    return starts + (ends - starts) * np.asarray(parameters, dtype=np.float64).reshape(-1, 1)
+
+
+def line_parameters_at_points(starts: np.ndarray, ends: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Parameter of the projection of every point on its line, not clipped to [0, 1]."""
+    vectors = ends - starts
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _row_dot(points - starts, vectors) / _row_dot(vectors, vectors)
+
+
+def line_tessellations(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """(n, 2, 3) array of the vertices of every line."""
+    return np.stack([starts, ends], axis=1)
+
+
+# arcs
+
+# sine of the angle between the start and end direction below which an arc is a half turn
+COLLINEAR_TOLERANCE = 1e-12
+
+
+def arc_radii(starts: np.ndarray, centres: np.ndarray) -> np.ndarray:
+    return np.linalg.norm(starts - centres, axis=1)
+
+
+def arc_normals(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray,
+                plane_normals: np.ndarray | None = None) -> np.ndarray:
+    """Unit normals of the arcs sweeping less than half a turn from start to end.
+
+    Arcs whose start, end and centre are collinear, like a half turn, take
+    the row of ``plane_normals`` instead, made perpendicular to the start
+    direction. They are NaN without it, as are arcs whose start or end
+    coincides with the centre.
+    """
+    start_vectors = starts - centres
+    end_vectors = ends - centres
+    crosses = np.cross(start_vectors, end_vectors)
+    normals = normalize_vectors(crosses)
+    if plane_normals is None:
+        return normals
+    u = normalize_vectors(start_vectors)
+    plane_normals = np.asarray(plane_normals, dtype=np.float64)
+    plane_normals = normalize_vectors(
+        plane_normals - _row_dot(plane_normals, u)[:, None] * u)
+    # the sine of the angle between start and end, the cross product alone scales with the radius
+    collinear = np.linalg.norm(crosses, axis=1) <= COLLINEAR_TOLERANCE * \
+        np.linalg.norm(start_vectors, axis=1) * np.linalg.norm(end_vectors, axis=1)
+    return np.where(collinear[:, None], plane_normals, normals)
+
+
+def arc_frames(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray,
+               normals: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the plane of every arc as (u, v, normal, sweep).
+
+    ``u`` points from the centre to the start, ``v`` is ``normal x u`` and
+    the arc runs from angle 0 to ``sweep`` in the (u, v) basis.
+    """
+    start_vectors = starts - centres
+    end_vectors = ends - centres
+    u = normalize_vectors(start_vectors)
+    if normals is None:
+        normals = arc_normals(starts, ends, centres)
+    else:
+        normals = normalize_vectors(np.asarray(normals, dtype=np.float64))
+    v = np.cross(normals, u)
+    sweeps = np.arctan2(_row_dot(end_vectors, v), _row_dot(end_vectors, u))
+    # a full turn for coinciding start and end points is left to the caller
+    sweeps = np.where(sweeps < 0, sweeps + 2.0 * np.pi, sweeps)
+    return u, v, normals, sweeps
+
+
+def arc_sweeps(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray,
+               normals: np.ndarray | None = None) -> np.ndarray:
+    """Swept angle of every arc in radians."""
+    return arc_frames(starts, ends, centres, normals)[3]
+
+
+def arc_lengths(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray,
+                normals: np.ndarray | None = None) -> np.ndarray:
+    return arc_radii(starts, centres) * arc_sweeps(starts, ends, centres, normals)
+
+
+def arc_points_at_parameters(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray,
+                             parameters: np.ndarray, normals: np.ndarray | None = None) -> np.ndarray:
+    """Points at parameter t of every arc, 0 at the start and 1 at the end.
+
+    ``parameters`` holds one value per arc, or an (n, m) array of m values
+    per arc, giving an (n, m, 3) result.
+    """
+    u, v, _, sweeps = arc_frames(starts, ends, centres, normals)
+    radii = arc_radii(starts, centres)
+    parameters = np.asarray(parameters, dtype=np.float64)
+    per_arc = parameters.ndim == 1
+    parameters = parameters.reshape(len(starts), -1)
+    angles = parameters * sweeps[:, None]
+    points = centres[:, None, :] + radii[:, None, None] * (
+        np.cos(angles)[:, :, None] * u[:, None, :] + np.sin(angles)[:, :, None] * v[:, None, :])
+    return points[:, 0, :] if per_arc else points
+
+
+def arc_midpoints(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray,
+                  normals: np.ndarray | None = None) -> np.ndarray:
+    return arc_points_at_parameters(starts, ends, centres, np.full(len(starts), 0.5), normals)
+
+
+def arc_parameters_at_points(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray, points: np.ndarray,
+                             normals: np.ndarray | None = None) -> np.ndarray:
+    """Parameter of the projection of every point on the circle of its arc.
+
+    Values outside [0, 1] are angles beyond the end of the arc.
+    """
+    u, v, _, sweeps = arc_frames(starts, ends, centres, normals)
+    vectors = points - centres
+    angles = np.arctan2(_row_dot(vectors, v), _row_dot(vectors, u))
+    angles = np.where(angles < 0, angles + 2.0 * np.pi, angles)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return angles / sweeps
+
+
+def arc_bounding_boxes(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray,
+                       normals: np.ndarray | None = None) -> np.ndarray:
+    """Exact (n, 2, 3) axis aligned bounding boxes of every arc.
+
+    Besides the end points, a coordinate can only be extreme where its
+    derivative is zero, at angle atan2(v_k, u_k) and half a turn later.
+    """
+    u, v, _, sweeps = arc_frames(starts, ends, centres, normals)
+    radii = arc_radii(starts, centres)
+    minimums = np.minimum(starts, ends)
+    maximums = np.maximum(starts, ends)
+    base_angles = np.arctan2(v, u)
+    for turn in (0.0, np.pi):
+        angles = np.mod(base_angles + turn, 2.0 * np.pi)
+        extremes = centres + radii[:, None] * \
+            (np.cos(angles) * u + np.sin(angles) * v)
+        on_arc = angles <= sweeps[:, None]
+        minimums = np.where(on_arc, np.minimum(minimums, extremes), minimums)
+        maximums = np.where(on_arc, np.maximum(maximums, extremes), maximums)
+    return np.stack([minimums, maximums], axis=1)
+
+
+def arc_tessellations(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray, segments: int = 16,
+                      normals: np.ndarray | None = None) -> np.ndarray:
+    """(n, segments + 1, 3) array of evenly spaced vertices along every arc."""
+    parameters = np.broadcast_to(np.linspace(
+        0.0, 1.0, segments + 1), (len(starts), segments + 1))
+    vertices = arc_points_at_parameters(
+        starts, ends, centres, parameters, normals)
+    # the end points are kept exact
+    vertices[:, 0] = starts
+    vertices[:, -1] = ends
+    return vertices
+
+
+def arc_segment_counts(radii: np.ndarray, sweeps: np.ndarray, chord_tolerance: float,
+                       max_segments: int = 256) -> np.ndarray:
+    """Number of chords keeping every arc within ``chord_tolerance`` of its polyline.
+
+    A chord spanning angle a deviates r (1 - cos(a / 2)) from its arc, so
+    each arc needs ceil(sweep / (2 acos(1 - tolerance / r))) chords, at
+    least one and at most ``max_segments``.
+    """
+    if chord_tolerance <= 0:
+        raise ValueError("'chord_tolerance' should be positive")
+    with np.errstate(invalid='ignore', divide='ignore'):
+        max_angles = 2.0 * \
+            np.arccos(np.clip(1.0 - chord_tolerance / radii, -1.0, 1.0))
+        counts = np.ceil(sweeps / max_angles)
+    counts = np.where(np.isfinite(counts), counts, 1)
+    return np.clip(counts, 1, max_segments).astype(np.intp)
+
+
+def arc_tessellations_by_tolerance(starts: np.ndarray, ends: np.ndarray, centres: np.ndarray,
+                                   chord_tolerance: float, normals: np.ndarray | None = None,
+                                   max_segments: int = 256) -> XmiRaggedArray:
+    """Tessellate every arc with as few chords as ``chord_tolerance`` allows.
+
+    Returns
+    -------
+    XmiRaggedArray
+        The vertices of arc ``i`` are ``result[i]``, an (m_i, 3) array
+        running from its start to its end point.
+    """
+    u, v, _, sweeps = arc_frames(starts, ends, centres, normals)
+    radii = arc_radii(starts, centres)
+    vertex_counts = arc_segment_counts(
+        radii, sweeps, chord_tolerance, max_segments) + 1
+
+    offsets = np.zeros(len(starts) + 1, dtype=np.intp)
+    np.cumsum(vertex_counts, out=offsets[1:])
+    arc_indices = np.repeat(np.arange(len(starts)), vertex_counts)
+    positions = np.arange(offsets[-1]) - offsets[arc_indices]
+    angles = positions / (vertex_counts[arc_indices] - 1) * sweeps[arc_indices]
+
+    vertices = centres[arc_indices] + radii[arc_indices, None] * (
+        np.cos(angles)[:, None] * u[arc_indices] + np.sin(angles)[:, None] * v[arc_indices])
+    # the end points are kept exact
+    vertices[offsets[:-1]] = starts
+    vertices[offsets[1:] - 1] = ends
+    return XmiRaggedArray(offsets, vertices)
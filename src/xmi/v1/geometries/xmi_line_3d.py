@@ -3,13 +3,15 @@ from __future__ import annotations
 
 from .xmi_point_3d import XmiPoint3D
 from .xmi_base_geometry import XmiBaseGeometry
+from ..xmi_errors import XmiError
 
 
 class XmiLine3D(XmiBaseGeometry):
-    __slots__ = ('_start_point', '_end_point')
+    # _geometry_cache holds the derived properties with the coordinates they were computed from
+    __slots__ = ('_start_point', '_end_point', '_geometry_cache')
 
     _attributes_needed = [slot[1:] if slot.startswith(
-        '_') else slot for slot in __slots__ if slot != "_entity_type"]
+        '_') else slot for slot in __slots__ if slot not in ("_entity_type", "_geometry_cache")]
 
     def __init__(self,
                  start_point: XmiPoint3D,
@@ -76,8 +78,67 @@ class XmiLine3D(XmiBaseGeometry):
             raise TypeError("end_point should be an XmiPoint3D")
         self._end_point = value
 
+    def _geometry(self) -> dict:
+        start_point, end_point = self._start_point, self._end_point
+        coordinates = (start_point.x, start_point.y, start_point.z,
+                       end_point.x, end_point.y, end_point.z)
+        cache = getattr(self, '_geometry_cache', None)
+        if cache is None or cache[0] != coordinates:
+            # the kernel imports NumPy, XmiManager only needs it once geometry is asked for
+            from . import xmi_geometry_kernel as kernel
+
+            starts, ends = kernel.lines_to_arrays([self])
+            bounding_box = kernel.line_bounding_boxes(starts, ends)[0]
+            cache = (coordinates, {
+                'length': float(kernel.line_lengths(starts, ends)[0]),
+                'direction': tuple(kernel.line_directions(starts, ends)[0].tolist()),
+                'midpoint': tuple(kernel.line_midpoints(starts, ends)[0].tolist()),
+                'bounding_box': (tuple(bounding_box[0].tolist()), tuple(bounding_box[1].tolist())),
+            })
+            self._geometry_cache = cache
+        return cache[1]
+
+    @property
+    def length(self) -> float:
+        return self._geometry()['length']
+
+    @property
+    def direction(self) -> tuple[float, float, float]:
+        """Unit vector from start to end point, NaN for a zero length line."""
+        return self._geometry()['direction']
+
+    @property
+    def midpoint(self) -> tuple[float, float, float]:
+        return self._geometry()['midpoint']
+
+    @property
+    def bounding_box(self) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+        """Minimum and maximum corner of the line."""
+        return self._geometry()['bounding_box']
+
+    def point_at_parameter(self, parameter: float) -> tuple[float, float, float]:
+        """Point at parameter t, 0 at the start and 1 at the end point."""
+        from . import xmi_geometry_kernel as kernel
+
+        starts, ends = kernel.lines_to_arrays([self])
+        return tuple(kernel.line_points_at_parameters(starts, ends, [parameter])[0].tolist())
+
+    def parameter_at_point(self, point: XmiPoint3D | tuple[float, float, float]) -> float:
+        """Parameter of the projection of ``point`` on the line, not clipped to [0, 1]."""
+        from . import xmi_geometry_kernel as kernel
+
+        coordinates = (point.x, point.y, point.z) if isinstance(
+            point, XmiPoint3D) else tuple(point)
+        starts, ends = kernel.lines_to_arrays([self])
+        return float(kernel.line_parameters_at_points(starts, ends, [coordinates])[0])
+
+    def tessellate(self) -> list[tuple[float, float, float]]:
+        start_point, end_point = self._start_point, self._end_point
+        return [(start_point.x, start_point.y, start_point.z), (end_point.x, end_point.y, end_point.z)]
+
     @classmethod
     def from_dict(cls, obj: dict) -> XmiPoint3D:
+        instance = None
         error_logs = []
         processed_data = obj.copy()
 
@@ -99,6 +160,6 @@ class XmiLine3D(XmiBaseGeometry):
                 **processed_data)
         except Exception as e:
             error_logs.append(
-                Exception(f"Error instantiating XmiLine3D: {obj}"))
+                XmiError(f"Error instantiating XmiLine3D: {e}", problem_data=obj))
 
         return instance, error_logs
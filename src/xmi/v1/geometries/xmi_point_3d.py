@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 from ..xmi_base import XmiBaseEntity
+from ..xmi_errors import XmiError
 from .xmi_base_geometry import XmiBaseGeometry
+from ..xmi_schema import (XMI_KEY_MAPPINGS, create_key_translator, fill_missing_attributes,
+                          transpose_xmi_dict_objs, check_number_column)
 
 
 class XmiPoint3D(XmiBaseGeometry):
@@ -12,6 +15,9 @@ class XmiPoint3D(XmiBaseGeometry):
     _attributes_needed = [slot[1:] if slot.startswith(
         '_') else slot for slot in __slots__ if slot != "_entity_type"]
 
+    _translate_xmi_dict_obj = staticmethod(create_key_translator(
+        XMI_KEY_MAPPINGS["XmiPoint3D"], mapped_keys_only=True))
+
     def __init__(self,
                  x: float,
                  y: float,
@@ -105,14 +111,14 @@ class XmiPoint3D(XmiBaseGeometry):
 
     @classmethod
     def from_dict(cls, obj: dict) -> XmiPoint3D:
-        error_logs = []
-        processed_data = obj.copy()
-
-        for attr in cls._attributes_needed:
-            if attr not in obj:
-                error_logs.append(Exception(f"Missing attribute: {attr}"))
-                processed_data[attr] = None
+        return cls._from_processed_data(obj.copy())
 
+    # fills, converts and instantiates in place, processed_data is not copied
+    @classmethod
+    def _from_processed_data(cls, processed_data: dict) -> XmiPoint3D:
+        error_logs = fill_missing_attributes(
+            processed_data, cls._attributes_needed)
+        instance = None
         x_found = processed_data['x']
         y_found = processed_data['y']
         z_found = processed_data['z']
@@ -129,32 +135,44 @@ class XmiPoint3D(XmiBaseGeometry):
                 **processed_data)
         except Exception as e:
             error_logs.append(
-                Exception(f"Error instantiating XmiPoint3D: {obj}"))
+                XmiError(f"Error instantiating XmiPoint3D: {e}", problem_data=processed_data))
 
         return instance, error_logs
 
     @classmethod
     def from_xmi_dict_obj(cls, xmi_dict_obj: dict):
-        # currently xmi_file doesnt support xmi id for reference, will assume structural_point_connection's id and name
-
-        # Define a mapping from snake_case keys to custom keys
-        KEY_MAPPING = {
-            "Name": "name",
-            "X": "x",
-            "Y": "y",
-            "Z": "z",
-            "Description": "description",
-            "ID": "id",
-            "IFCGUID": "ifcguid",
-        }
-        instance = None
-        error_logs = []
-        processed_data = {KEY_MAPPING.get(
-            key, key): value for key, value in xmi_dict_obj.items() if key in KEY_MAPPING}
-
-        instance, error_logs_found = cls.from_dict(
-            processed_data)
+        processed_data = cls._translate_xmi_dict_obj(xmi_dict_obj)
 
-        error_logs.extend(error_logs_found)
+        return cls._from_processed_data(processed_data)
 
-        return instance, error_logs
+    @classmethod
+    def bulk_from_xmi_dicts(cls, xmi_dict_objs: list[dict]) -> tuple[list[XmiPoint3D | None], list[list[Exception]]]:
+        """Build the points of a whole StructuralPointConnection section at once.
+
+        See XmiStructuralMaterial.bulk_from_xmi_dicts, the instances and error
+        logs are aligned with xmi_dict_objs.
+        """
+        columns, error_logs = transpose_xmi_dict_objs(
+            xmi_dict_objs, XMI_KEY_MAPPINGS["XmiPoint3D"], cls._attributes_needed)
+        failed: set[int] = set()
+
+        for attr in ('x', 'y', 'z'):
+            check_number_column(columns[attr], attr, failed,
+                                error_logs, optional=False)
+        cls._convert_base_columns(columns, failed, error_logs)
+
+        instances: list[XmiPoint3D | None] = []
+        new_unchecked = cls._new_unchecked
+        for index, (x, y, z, id, name, ifcguid, description) in enumerate(zip(
+                columns['x'], columns['y'], columns['z'],
+                columns['id'], columns['name'], columns['ifcguid'], columns['description'])):
+            if index in failed:
+                instances.append(None)
+                continue
+            instance = new_unchecked("XmiPoint3D", id, name, ifcguid, description)
+            instance._x = x
+            instance._y = y
+            instance._z = z
+            instances.append(instance)
+
+        return instances, error_logs
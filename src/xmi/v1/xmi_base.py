@@ -83,7 +83,37 @@ class XmiBaseEntity():
         self._description = value
 
     def to_dict(self):
-        return {slot.lstrip('_'): getattr(self, slot) for slot in self.__slots__}
+        return {slot.lstrip('_'): getattr(self, slot, None) for slot in self.__slots__}
+
+    # used by the bulk constructors, applies the defaults and checks of __init__ to whole columns
+    @staticmethod
+    def _convert_base_columns(columns: dict[str, list], failed: set[int], error_logs: list[list[Exception]]):
+        ids = [id if id else str(uuid.uuid4()) for id in columns['id']]
+        columns['id'] = ids
+        columns['name'] = [name if name else id for name,
+                           id in zip(columns['name'], ids)]
+        columns['ifcguid'] = [
+            ifcguid if ifcguid else None for ifcguid in columns['ifcguid']]
+        columns['description'] = [
+            description if description else None for description in columns['description']]
+
+        for attr in ('id', 'name', 'ifcguid', 'description'):
+            for index, value in enumerate(columns[attr]):
+                if value is not None and not isinstance(value, str):
+                    failed.add(index)
+                    error_logs[index].append(
+                        TypeError(f"'{attr}' should be a str or None"))
+
+    # used by the bulk constructors, values must already be converted and checked
+    @classmethod
+    def _new_unchecked(cls, entity_type: str, id: str, name: str, ifcguid: str, description: str):
+        instance = cls.__new__(cls)
+        instance._id = id
+        instance._name = name
+        instance._ifcguid = ifcguid
+        instance._description = description
+        instance._entity_type = entity_type
+        return instance
 
 
 class XmiBaseRelationship():
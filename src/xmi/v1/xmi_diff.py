@@ -0,0 +1,187 @@
+"""
+Entity level comparison of two XmiModels, e.g. the BIM and the analysis
+export of the same building.
+
+Entities are matched per type through a hash index on their ID, name or
+quantized geometry, then compared field by field on the values the XMI
+writer would emit.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+from .xmi_base import XmiBaseEntity
+from .xmi_writer import XMI_WRITER_SECTIONS, entity_to_field_values
+from .entities.xmi_structural_point_connection import XmiStructuralPointConnection
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+
+XMI_DIFF_KEYS = ("id", "name", "geometry")
+
+# absolute tolerance of numeric fields without an entry in ``tolerances``
+DEFAULT_DIFF_TOLERANCE = 1e-9
+
+
+class XmiDiffRecord():
+    """One added, removed or modified entity.
+
+    Parameters
+    ----------
+    change : str
+        "added", "removed" or "modified".
+    section : str
+        XMI section of the entity, e.g. "StructuralCurveMember".
+    key
+        The ID, name or geometry key the entities were matched on.
+    entity : XmiBaseEntity | None
+        The entity of the model ``diff`` was called on, None when added.
+    other_entity : XmiBaseEntity | None
+        The entity of the other model, None when removed.
+    deltas : dict[str, tuple]
+        For modified entities, (value, other value) per differing XMI field.
+    """
+    __slots__ = ('change', 'section', 'key',
+                 'entity', 'other_entity', 'deltas')
+
+    def __init__(self, change: str, section: str, key, entity: XmiBaseEntity | None,
+                 other_entity: XmiBaseEntity | None, deltas: dict[str, tuple] = None):
+        self.change: str = change
+        self.section: str = section
+        self.key = key
+        self.entity: XmiBaseEntity | None = entity
+        self.other_entity: XmiBaseEntity | None = other_entity
+        self.deltas: dict[str, tuple] = deltas if deltas is not None else {}
+
+    def __str__(self) -> str:
+        if self.change != "modified":
+            return f"{self.section} {self.change}: {self.key}"
+        fields = ", ".join(f"{field}: {value} -> {other_value}"
+                           for field, (value, other_value) in self.deltas.items())
+        return f"{self.section} modified: {self.key} ({fields})"
+
+
+def _quantize(point, geometry_tolerance: float) -> tuple[int, int, int] | None:
+    if point is None:
+        return None
+    return (round(point.x / geometry_tolerance),
+            round(point.y / geometry_tolerance),
+            round(point.z / geometry_tolerance))
+
+
+def _geometry_key(entity: XmiBaseEntity, geometry_tolerance: float):
+    """Quantized coordinates of an entity's nodes, its name for entities without geometry."""
+    if isinstance(entity, XmiStructuralPointConnection):
+        return _quantize(entity.point, geometry_tolerance)
+    if isinstance(entity, XmiStructuralCurveMember):
+        # independent of the direction the member is drawn in
+        return tuple(sorted(_quantize(node.point, geometry_tolerance)
+                            for node in (entity.begin_node, entity.end_node)))
+    if isinstance(entity, XmiStructuralSurfaceMember):
+        # independent of the first node and the winding of the outline
+        return tuple(sorted(set(_quantize(node.point, geometry_tolerance) for node in entity.nodes)))
+    return entity.name
+
+
+def _values_equal(value, other_value, tolerance: float) -> bool:
+    if isinstance(value, (int, float)) and isinstance(other_value, (int, float)) \
+            and not isinstance(value, bool) and not isinstance(other_value, bool):
+        return abs(value - other_value) <= tolerance
+    if isinstance(value, tuple) and isinstance(other_value, tuple):
+        return len(value) == len(other_value) and all(
+            _values_equal(item, other_item, tolerance) for item, other_item in zip(value, other_value))
+    return value == other_value
+
+
+def _diff_rows(rows: list[tuple], other_rows: list[tuple], tolerances: dict[str, float],
+               default_tolerance: float) -> list[tuple]:
+    """Match (key, fields) rows on key and return (change, key, position, other_position, deltas) tuples.
+
+    Entities sharing a key are paired in order of appearance, the surplus of
+    either side is removed or added.
+    """
+    other_positions: dict = {}
+    for other_position, (key, _) in enumerate(other_rows):
+        other_positions.setdefault(key, []).append(other_position)
+
+    changes = []
+    matched = [False] * len(other_rows)
+    taken: dict = {}
+    for position, (key, fields) in enumerate(rows):
+        candidates = other_positions.get(key)
+        candidate_index = taken.get(key, 0)
+        if candidates is None or candidate_index >= len(candidates):
+            changes.append(("removed", key, position, None, None))
+            continue
+        taken[key] = candidate_index + 1
+        other_position = candidates[candidate_index]
+        matched[other_position] = True
+
+        other_fields = other_rows[other_position][1]
+        deltas = {}
+        for field, value in fields.items():
+            other_value = other_fields.get(field)
+            if not _values_equal(value, other_value, tolerances.get(field, default_tolerance)):
+                deltas[field] = (value, other_value)
+        if deltas:
+            changes.append(("modified", key, position, other_position, deltas))
+
+    for other_position, (key, _) in enumerate(other_rows):
+        if not matched[other_position]:
+            changes.append(("added", key, None, other_position, None))
+
+    return changes
+
+
+def diff_xmi_entities(entities: list[XmiBaseEntity], other_entities: list[XmiBaseEntity], key: str = "id",
+                      tolerances: dict[str, float] | None = None,
+                      default_tolerance: float = DEFAULT_DIFF_TOLERANCE,
+                      geometry_tolerance: float = 1.0,
+                      processes: int | None = None) -> list[XmiDiffRecord]:
+    """Compare the section entities of two models, see XmiModel.diff."""
+    if key not in XMI_DIFF_KEYS:
+        raise ValueError(
+            f"'key' should be one of {XMI_DIFF_KEYS}, found {key}")
+    if geometry_tolerance <= 0:
+        raise ValueError("'geometry_tolerance' should be positive")
+    tolerances = tolerances if tolerances is not None else {}
+
+    if key == "id":
+        def get_key(entity): return entity.id
+    elif key == "name":
+        def get_key(entity): return entity.name
+    else:
+        def get_key(entity): return _geometry_key(entity, geometry_tolerance)
+
+    sections = []
+    for section, entity_class in XMI_WRITER_SECTIONS:
+        section_entities = [
+            entity for entity in entities if type(entity) is entity_class]
+        other_section_entities = [
+            entity for entity in other_entities if type(entity) is entity_class]
+        rows = [(get_key(entity), entity_to_field_values(entity))
+                for entity in section_entities]
+        other_rows = [(get_key(entity), entity_to_field_values(entity))
+                      for entity in other_section_entities]
+        sections.append((section, section_entities,
+                        other_section_entities, rows, other_rows))
+
+    if not processes or processes <= 1:
+        section_changes = [_diff_rows(rows, other_rows, tolerances, default_tolerance)
+                           for _, _, _, rows, other_rows in sections]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_diff_rows, rows, other_rows, tolerances, default_tolerance)
+                       for _, _, _, rows, other_rows in sections]
+            section_changes = [future.result() for future in futures]
+
+    records = []
+    for (section, section_entities, other_section_entities, _, _), changes in zip(sections, section_changes):
+        for change, entity_key, position, other_position, deltas in changes:
+            records.append(XmiDiffRecord(
+                change, section, entity_key,
+                section_entities[position] if position is not None else None,
+                other_section_entities[other_position] if other_position is not None else None,
+                deltas))
+    return records
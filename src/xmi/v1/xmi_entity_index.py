@@ -0,0 +1,96 @@
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from .xmi_base import XmiBaseEntity
+from .xmi_errors import XmiDuplicateEntityError
+
+XMI_REFERENCE_RESOLUTIONS = ("name", "id")
+
+
+class XmiEntityIndex():
+    """Hashed lookup of entities by name and by ID, per entity type.
+
+    Every ``add`` is a constant time dictionary insert, so indexing and
+    duplicate detection over a whole model are linear in the number of
+    entities. The first entity with a given name or ID keeps it, later
+    entities repeating it are reported as collisions.
+
+    Parameters
+    ----------
+    resolve_by : str, optional
+        Key that ``find`` matches references against, "name" or "id". By
+        default "name", which is how XMI exports refer to other objects.
+    """
+    __slots__ = ('_resolve_by', '_by_name', '_by_id', '_id_owners', 'shared_ids')
+
+    def __init__(self, resolve_by: str = "name"):
+        self.resolve_by = resolve_by
+        self._by_name: dict[type, dict[str, XmiBaseEntity]] = {}
+        self._by_id: dict[type, dict[str, XmiBaseEntity]] = {}
+        # first entity of any type holding an ID, to find IDs shared across types
+        self._id_owners: dict[str, XmiBaseEntity] = {}
+        # (entity, earlier entity of another type with the same ID)
+        self.shared_ids: list[tuple[XmiBaseEntity, XmiBaseEntity]] = []
+
+    @property
+    def resolve_by(self) -> str:
+        return self._resolve_by
+
+    @resolve_by.setter
+    def resolve_by(self, value: str):
+        if value not in XMI_REFERENCE_RESOLUTIONS:
+            raise ValueError(
+                f"'resolve_by' should be one of {XMI_REFERENCE_RESOLUTIONS}, found {value}")
+        self._resolve_by = value
+
+    def add(self, entity: XmiBaseEntity) -> list[XmiDuplicateEntityError]:
+        """Index ``entity`` and return the collisions with earlier entities of its type.
+
+        An ID shared with an entity of another type is not an error, since
+        references are always resolved within one type, and is only recorded
+        in ``shared_ids``.
+        """
+        entity_class = type(entity)
+        errors = []
+
+        by_name = self._by_name.get(entity_class)
+        if by_name is None:
+            by_name = self._by_name[entity_class] = {}
+            self._by_id[entity_class] = {}
+        by_id = self._by_id[entity_class]
+
+        name = entity.name
+        if name is not None:
+            existing = by_name.setdefault(name, entity)
+            if existing is not entity:
+                errors.append(XmiDuplicateEntityError(
+                    f"Duplicate {entity_class.__name__} name, '{name}' is already used by ID '{existing.id}'",
+                    error_code="DuplicateName"))
+
+        id = entity.id
+        if id is not None:
+            existing = by_id.setdefault(id, entity)
+            if existing is not entity:
+                errors.append(XmiDuplicateEntityError(
+                    f"Duplicate {entity_class.__name__} ID, '{id}' is already used by '{existing.name}'",
+                    error_code="DuplicateId"))
+            else:
+                owner = self._id_owners.setdefault(id, entity)
+                if owner is not entity:
+                    self.shared_ids.append((entity, owner))
+
+        return errors
+
+    def find(self, entity_class: type[XmiBaseEntity], reference: str) -> XmiBaseEntity | None:
+        """Resolve a reference to an entity of ``entity_class`` by the configured key."""
+        index = self._by_name if self._resolve_by == "name" else self._by_id
+        entities = index.get(entity_class)
+        return entities.get(reference) if entities is not None else None
+
+    def find_by_name(self, entity_class: type[XmiBaseEntity], name: str) -> XmiBaseEntity | None:
+        entities = self._by_name.get(entity_class)
+        return entities.get(name) if entities is not None else None
+
+    def find_by_id(self, entity_class: type[XmiBaseEntity], id: str) -> XmiBaseEntity | None:
+        entities = self._by_id.get(entity_class)
+        return entities.get(id) if entities is not None else None
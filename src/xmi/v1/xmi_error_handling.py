@@ -0,0 +1,118 @@
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import json
+
+from .xmi_errors import XmiErrorLimitExceededError
+from .xmi_model import ErrorLog
+
+
+class XmiJsonlErrorSink():
+    """Writes every error to a JSON Lines file as soon as it is reported.
+
+    Pass it to ``XmiManager.read_xmi_dict`` or ``read_xmi_file``::
+
+        with XmiJsonlErrorSink("errors.jsonl") as error_sink:
+            xmi_model = xmi_manager.read_xmi_file(file_path, error_sink=error_sink)
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the JSON Lines file, it is overwritten.
+    include_obj : bool, optional
+        Write the offending XMI object along with every error, by default False.
+    """
+
+    def __init__(self, file_path: str, include_obj: bool = False):
+        self.file_path: str = file_path
+        self.include_obj: bool = include_obj
+        self.count: int = 0
+        self._file = open(file_path, 'w')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def write(self, error_log: ErrorLog):
+        self._file.write(json.dumps(error_log.to_dict(
+            include_obj=self.include_obj), default=str))
+        self._file.write('\n')
+        self.count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class XmiErrorCollector():
+    """Routes the errors of one read to the model, an optional sink and the error limit.
+
+    Parameters
+    ----------
+    errors : list[ErrorLog]
+        The list the errors are kept in, usually ``XmiModel.errors``.
+    max_errors : int | None, optional
+        Number of errors kept in ``errors``, the rest are only counted and
+        sent to the sink. Warnings are always kept and are neither counted
+        nor limited. By default None, which keeps every error.
+    fail_fast : bool, optional
+        Raise XmiErrorLimitExceededError once ``max_errors`` errors are
+        reported, or at the first error if ``max_errors`` is None. Warnings
+        never stop reading. By default False.
+    error_sink : optional
+        Object with a ``write(error_log)`` method receiving every error, e.g.
+        XmiJsonlErrorSink. By default None.
+    """
+
+    def __init__(self, errors: list[ErrorLog], max_errors: int | None = None, fail_fast: bool = False,
+                 error_sink=None):
+        if max_errors is not None and max_errors < 0:
+            raise ValueError("'max_errors' should not be negative")
+        self.errors: list[ErrorLog] = errors
+        self.max_errors: int | None = max_errors
+        self.fail_fast: bool = fail_fast
+        self.error_sink = error_sink
+        # errors reported and kept, warnings are counted apart
+        self.count: int = 0
+        self.kept: int = 0
+        self.warning_count: int = 0
+        self.xmi_model = None
+
+    @property
+    def dropped(self) -> int:
+        return self.count - self.kept
+
+    def add(self, section: str, index: int, exception: Exception = None, message: str = None, obj=None):
+        self.report(ErrorLog(section, index, message=message,
+                             obj=obj, exception=exception))
+
+    def warn(self, section: str, index: int, message: str, obj=None, error_code: str = None):
+        """Report an object that was read with a fallback, which counts towards neither ``max_errors`` nor ``fail_fast``."""
+        self.report(ErrorLog(section, index, message=message, obj=obj,
+                             error_code=error_code, severity="warning"))
+
+    def report(self, error_log: ErrorLog):
+        if error_log.severity != "error":
+            self.warning_count += 1
+            self.errors.append(error_log)
+            if self.error_sink is not None:
+                self.error_sink.write(error_log)
+            return
+
+        self.count += 1
+        if self.max_errors is None or self.kept < self.max_errors:
+            self.errors.append(error_log)
+            self.kept += 1
+        if self.error_sink is not None:
+            self.error_sink.write(error_log)
+
+        if self.fail_fast and self.count >= (self.max_errors or 1):
+            raise XmiErrorLimitExceededError(
+                f"Reading stopped after {self.count} errors", xmi_model=self.xmi_model)
+
+    def extend(self, section: str, index: int, exceptions: list[Exception]):
+        for exception in exceptions:
+            self.add(section, index, exception=exception)
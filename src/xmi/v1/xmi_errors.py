@@ -35,3 +35,17 @@ class XmiMissingReferenceInstanceError(XmiError):
 class XmiMissingRequiredAttributeError(XmiError):
     # Error is flagged when error found during preparation of instance prior to instantation for required attributes
     pass
+
+
+class XmiErrorLimitExceededError(XmiError):
+    # Error is raised by XmiManager.read_xmi_dict in fail fast mode once the error limit is reached.
+    # The partially read model is available through the xmi_model attribute
+    def __init__(self, message: str, xmi_model=None, error_code: str = None, problem_data: dict = None):
+        super().__init__(message, error_code=error_code, problem_data=problem_data)
+        self.xmi_model = xmi_model
+
+
+class XmiDuplicateEntityError(XmiError):
+    # Error is flagged when an entity repeats the name or ID of an earlier entity of the same type.
+    # The earlier entity keeps the name or ID, references resolve to it
+    pass
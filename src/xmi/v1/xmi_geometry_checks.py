@@ -0,0 +1,225 @@
+"""
+Checks the stated Length, LocalAxisX/Y/Z and Area of the members of a model
+against their node geometry.
+
+The coordinates of all members of a type are gathered into arrays once and
+every check is a NumPy expression over the whole batch.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+
+from .xmi_base import XmiBaseEntity
+from .xmi_model import ErrorLog
+from .geometries.xmi_line_3d import XmiLine3D
+from .geometries.xmi_geometry_kernel import normalize_vectors
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+
+
+def _coordinates(point) -> tuple[float, float, float]:
+    if point is None:
+        return (np.nan, np.nan, np.nan)
+    return (point.x, point.y, point.z)
+
+
+def _optional_floats(values: list) -> np.ndarray:
+    return np.array([value if value is not None else np.nan for value in values], dtype=np.float64)
+
+
+def _local_axes(members: list) -> np.ndarray:
+    """LocalAxisX/Y/Z of every member as an (n, 3, 3) array, NaN where missing."""
+    axes = np.full((len(members), 3, 3), np.nan)
+    for index, member in enumerate(members):
+        for axis_index, axis in enumerate((member.local_axis_x, member.local_axis_y, member.local_axis_z)):
+            if axis is not None and len(axis) == 3:
+                axes[index, axis_index] = axis
+    return axes
+
+
+def _check_local_axes(section: str, axes: np.ndarray, axis_tolerance: float,
+                      problems: list[tuple[str, int, str, str]]):
+    norms = np.linalg.norm(axes, axis=2)
+    for index, axis_index in zip(*np.nonzero(np.abs(norms - 1.0) > axis_tolerance)):
+        problems.append((section, int(index), "LocalAxisNotUnit",
+                         f"LocalAxis{'XYZ'[axis_index]} has length {norms[index, axis_index]:.6g}"))
+
+    unit_axes = normalize_vectors(axes)
+    for first, second in ((0, 1), (1, 2), (2, 0)):
+        dots = np.einsum('ij,ij->i', unit_axes[:, first], unit_axes[:, second])
+        for index in np.flatnonzero(np.abs(dots) > axis_tolerance):
+            problems.append((section, int(index), "LocalAxesNotOrthogonal",
+                             f"LocalAxis{'XYZ'[first]} and LocalAxis{'XYZ'[second]} are not orthogonal, cosine {dots[index]:.6g}"))
+
+    # a right handed system has z = x cross y
+    handedness = np.einsum('ij,ij->i', np.cross(
+        unit_axes[:, 0], unit_axes[:, 1]), unit_axes[:, 2])
+    for index in np.flatnonzero(handedness < 1.0 - axis_tolerance):
+        if not np.isnan(handedness[index]):
+            problems.append((section, int(index), "LocalAxesNotRightHanded",
+                             f"LocalAxisX x LocalAxisY . LocalAxisZ is {handedness[index]:.6g}, expected 1"))
+
+
+def _check_curve_members(curve_members: list[XmiStructuralCurveMember], length_tolerance: float,
+                         axis_tolerance: float, problems: list[tuple[str, int, str, str]]):
+    section = "StructuralCurveMember"
+    count = len(curve_members)
+
+    # one row per segment, lengths of segments other than lines are unknown
+    segment_members = []
+    segment_endpoints = []
+    endpoints = np.full((count, 2, 3), np.nan)
+    for index, curve_member in enumerate(curve_members):
+        for segment in curve_member.segments:
+            geometry = segment.geometry
+            segment_members.append(index)
+            if isinstance(geometry, XmiLine3D):
+                segment_endpoints.append((_coordinates(geometry.start_point),
+                                          _coordinates(geometry.end_point)))
+            else:
+                segment_endpoints.append(((np.nan,) * 3, (np.nan,) * 3))
+        begin_node, end_node = curve_member.begin_node, curve_member.end_node
+        if begin_node is not None and end_node is not None:
+            endpoints[index] = (_coordinates(begin_node.point),
+                                _coordinates(end_node.point))
+
+    segment_members = np.array(segment_members, dtype=np.intp)
+    segment_endpoints = np.array(
+        segment_endpoints, dtype=np.float64).reshape(-1, 2, 3)
+    segment_lengths = np.linalg.norm(
+        segment_endpoints[:, 1] - segment_endpoints[:, 0], axis=1)
+    measured_lengths = np.bincount(
+        segment_members, weights=segment_lengths, minlength=count)
+    measured_lengths[np.bincount(segment_members, minlength=count) == 0] = np.nan
+
+    stated_lengths = _optional_floats(
+        [curve_member.length for curve_member in curve_members])
+    with np.errstate(invalid='ignore'):
+        length_deviations = np.abs(measured_lengths - stated_lengths)
+    for index in np.flatnonzero(length_deviations > length_tolerance):
+        problems.append((section, int(index), "LengthMismatch",
+                         f"Length is {stated_lengths[index]:.6g} but the segments measure {measured_lengths[index]:.6g}"))
+
+    axes = _local_axes(curve_members)
+    _check_local_axes(section, axes, axis_tolerance, problems)
+
+    directions = normalize_vectors(endpoints[:, 1] - endpoints[:, 0])
+    alignments = np.abs(np.einsum(
+        'ij,ij->i', normalize_vectors(axes[:, 0]), directions))
+    for index in np.flatnonzero(alignments < 1.0 - axis_tolerance):
+        problems.append((section, int(index), "LocalAxisXNotAlongMember",
+                         f"LocalAxisX deviates from the member direction, cosine {alignments[index]:.6g}"))
+
+
+def _check_surface_members(surface_members: list[XmiStructuralSurfaceMember], area_factor: float,
+                           area_tolerance: float, planarity_tolerance: float, axis_tolerance: float,
+                           problems: list[tuple[str, int, str, str]]):
+    section = "StructuralSurfaceMember"
+    count = len(surface_members)
+    vertex_counts = np.array([len(surface_member.nodes)
+                             for surface_member in surface_members], dtype=np.intp)
+    max_vertices = int(vertex_counts.max(initial=0))
+
+    # outlines padded with NaN up to the largest vertex count
+    vertices = np.full((count, max_vertices, 3), np.nan)
+    for index, surface_member in enumerate(surface_members):
+        for position, node in enumerate(surface_member.nodes):
+            vertices[index, position] = _coordinates(
+                node.point if node is not None else None)
+
+    # Newell's method, the vector area of every outline in one batch
+    next_positions = (np.arange(max_vertices)[None, :] + 1) % np.maximum(vertex_counts, 1)[:, None]
+    next_vertices = np.take_along_axis(
+        vertices, next_positions[:, :, None], axis=1)
+    vector_areas = np.nansum(np.cross(vertices, next_vertices), axis=1) / 2.0
+    measured_areas = np.linalg.norm(vector_areas, axis=1) * area_factor
+    measured_areas[vertex_counts < 3] = np.nan
+    normals = normalize_vectors(vector_areas)
+
+    stated_areas = _optional_floats(
+        [surface_member.area for surface_member in surface_members])
+    with np.errstate(invalid='ignore'):
+        area_deviations = np.abs(
+            measured_areas - stated_areas) / np.maximum(np.abs(stated_areas), np.finfo(np.float64).tiny)
+    for index in np.flatnonzero(area_deviations > area_tolerance):
+        problems.append((section, int(index), "AreaMismatch",
+                         f"Area is {stated_areas[index]:.6g} but the outline measures {measured_areas[index]:.6g}"))
+
+    with warnings.catch_warnings():
+        # rows padded with NaN are all-NaN slices
+        warnings.simplefilter('ignore', RuntimeWarning)
+        centroids = np.nanmean(vertices, axis=1)
+        plane_distances = np.nanmax(np.abs(np.einsum(
+            'ijk,ik->ij', vertices - centroids[:, None, :], normals)), axis=1)
+    for index in np.flatnonzero(plane_distances > planarity_tolerance):
+        problems.append((section, int(index), "NonPlanarSurface",
+                         f"A node lies {plane_distances[index]:.6g} away from the plane of the outline"))
+
+    axes = _local_axes(surface_members)
+    _check_local_axes(section, axes, axis_tolerance, problems)
+
+    alignments = np.abs(np.einsum(
+        'ij,ij->i', normalize_vectors(axes[:, 2]), normals))
+    for index in np.flatnonzero(alignments < 1.0 - axis_tolerance):
+        problems.append((section, int(index), "LocalAxisZNotNormal",
+                         f"LocalAxisZ deviates from the surface normal, cosine {alignments[index]:.6g}"))
+
+
+def check_xmi_geometry(entities: list[XmiBaseEntity], length_tolerance: float = 1.0,
+                       axis_tolerance: float = 1e-3, area_factor: float = 1.0, area_tolerance: float = 1e-3,
+                       planarity_tolerance: float = 1.0,
+                       section_indices: dict[XmiBaseEntity, int] | None = None) -> list[ErrorLog]:
+    """Check the stated Length, local axes and Area of the members of an entity list against their nodes.
+
+    Parameters
+    ----------
+    entities : list[XmiBaseEntity]
+        The entities, e.g. ``XmiModel.entities``; only curve and surface
+        members are checked.
+    length_tolerance : float, optional
+        Largest difference between Length and the node distance, by default 1.0.
+    axis_tolerance : float, optional
+        Largest deviation of the local axes from unit length, orthogonality
+        and the member geometry, by default 1e-3.
+    area_factor : float, optional
+        Factor from the squared coordinate unit to the unit of Area, by default 1.0.
+    area_tolerance : float, optional
+        Largest relative difference between Area and the outline, by default 1e-3.
+    planarity_tolerance : float, optional
+        Largest distance of a node from the plane of its outline, by default 1.0.
+    section_indices : dict[XmiBaseEntity, int] | None, optional
+        Index of each member within its XMI section, e.g.
+        ``XmiModel.section_indices``. By default None, which indexes the
+        members by their position among the members of ``entities``.
+
+    Returns
+    -------
+    list[ErrorLog]
+        One error per problem, by section and index.
+    """
+    problems: list[tuple[str, int, str, str]] = []
+
+    curve_members = [entity for entity in entities if isinstance(
+        entity, XmiStructuralCurveMember)]
+    if curve_members:
+        _check_curve_members(curve_members, length_tolerance,
+                             axis_tolerance, problems)
+
+    surface_members = [entity for entity in entities if isinstance(
+        entity, XmiStructuralSurfaceMember)]
+    if surface_members:
+        _check_surface_members(surface_members, area_factor, area_tolerance,
+                               planarity_tolerance, axis_tolerance, problems)
+
+    members = {"StructuralCurveMember": curve_members,
+               "StructuralSurfaceMember": surface_members}
+    section_indices = section_indices or {}
+    error_logs = [ErrorLog(section, section_indices.get(members[section][index], index), message=message,
+                           obj=members[section][index], error_code=error_code)
+                  for section, index, error_code, message in problems]
+    error_logs.sort(key=lambda error_log: (error_log.section, error_log.index))
+    return error_logs
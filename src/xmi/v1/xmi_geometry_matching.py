@@ -0,0 +1,205 @@
+"""
+Pairs the curve and surface members of two models by geometric proximity,
+for exports whose names and IDs do not correspond, e.g. a BIM and an
+analysis model of the same building.
+
+Members are placed in a spatial hash on their midpoint or centroid with a
+cell size equal to the tolerance, so every member is only compared with the
+members of the 27 surrounding cells instead of the whole other model.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+
+from .xmi_base import XmiBaseEntity
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+
+# large primes spreading the cells of the spatial hash over int64, see Teschner et al. 2003
+_HASH_PRIMES = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+_NEIGHBOUR_OFFSETS = np.array([(x, y, z) for x in (-1, 0, 1)
+                               for y in (-1, 0, 1) for z in (-1, 0, 1)], dtype=np.int64)
+
+
+class XmiGeometryMatch():
+    """A pair of members found at the same place in two models.
+
+    Parameters
+    ----------
+    entity : XmiBaseEntity
+        The member of the model ``match_geometry`` was called on.
+    other_entity : XmiBaseEntity
+        The corresponding member of the other model.
+    distance : float
+        The largest distance between corresponding nodes of the two members.
+    confidence : float
+        1.0 for coinciding members, falling linearly to 0.0 at ``tolerance``.
+    """
+    __slots__ = ('entity', 'other_entity', 'distance', 'confidence')
+
+    def __init__(self, entity: XmiBaseEntity, other_entity: XmiBaseEntity, distance: float, confidence: float):
+        self.entity: XmiBaseEntity = entity
+        self.other_entity: XmiBaseEntity = other_entity
+        self.distance: float = distance
+        self.confidence: float = confidence
+
+    def __str__(self) -> str:
+        return f"{self.entity.name} -> {self.other_entity.name} ({self.confidence:.3f})"
+
+
+def _hash_cells(cells: np.ndarray) -> np.ndarray:
+    # int64 overflow wraps around, which only adds candidates rejected by the distance check
+    with np.errstate(over='ignore'):
+        hashed = cells * _HASH_PRIMES
+    return hashed[:, 0] ^ hashed[:, 1] ^ hashed[:, 2]
+
+
+def _candidate_pairs(centres: np.ndarray, other_centres: np.ndarray,
+                     tolerance: float) -> tuple[np.ndarray, np.ndarray]:
+    """Return the index pairs whose centres lie in neighbouring cells of size ``tolerance``."""
+    if len(centres) == 0 or len(other_centres) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    other_keys = _hash_cells(
+        np.floor(other_centres / tolerance).astype(np.int64))
+    order = np.argsort(other_keys, kind='stable')
+    sorted_keys = other_keys[order]
+    cells = np.floor(centres / tolerance).astype(np.int64)
+
+    indices, other_indices = [], []
+    for offset in _NEIGHBOUR_OFFSETS:
+        keys = _hash_cells(cells + offset)
+        starts = np.searchsorted(sorted_keys, keys, side='left')
+        counts = np.searchsorted(sorted_keys, keys, side='right') - starts
+        found = np.flatnonzero(counts)
+        if len(found) == 0:
+            continue
+        found_counts = counts[found]
+        pair_indices = np.repeat(found, found_counts)
+        # position of every pair within the run of its query
+        run_positions = np.arange(
+            len(pair_indices)) - np.repeat(np.cumsum(found_counts) - found_counts, found_counts)
+        indices.append(pair_indices)
+        other_indices.append(
+            order[np.repeat(starts[found], found_counts) + run_positions])
+
+    if not indices:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    indices = np.concatenate(indices)
+    other_indices = np.concatenate(other_indices)
+    # hash collisions of different cells can repeat a pair
+    pairs = np.unique(np.stack([indices, other_indices], axis=1), axis=0)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _curve_member_endpoints(curve_members: list[XmiStructuralCurveMember]) -> np.ndarray:
+    endpoints = np.empty((len(curve_members), 2, 3))
+    for index, curve_member in enumerate(curve_members):
+        begin_point = curve_member.begin_node.point
+        end_point = curve_member.end_node.point
+        endpoints[index, 0] = (begin_point.x, begin_point.y, begin_point.z)
+        endpoints[index, 1] = (end_point.x, end_point.y, end_point.z)
+    return endpoints
+
+
+def _surface_member_vertices(surface_members: list[XmiStructuralSurfaceMember]) -> np.ndarray:
+    """Vertices of every outline as an (n, max vertices, 3) array padded with NaN."""
+    max_vertices = max((len(surface_member.nodes)
+                       for surface_member in surface_members), default=0)
+    vertices = np.full((len(surface_members), max_vertices, 3), np.nan)
+    for index, surface_member in enumerate(surface_members):
+        for position, node in enumerate(surface_member.nodes):
+            point = node.point
+            vertices[index, position] = (point.x, point.y, point.z)
+    return vertices
+
+
+def _curve_member_distances(endpoints: np.ndarray, other_endpoints: np.ndarray) -> np.ndarray:
+    # members drawn in opposite directions are the same member
+    same = np.maximum(np.linalg.norm(endpoints[:, 0] - other_endpoints[:, 0], axis=1),
+                      np.linalg.norm(endpoints[:, 1] - other_endpoints[:, 1], axis=1))
+    flipped = np.maximum(np.linalg.norm(endpoints[:, 0] - other_endpoints[:, 1], axis=1),
+                         np.linalg.norm(endpoints[:, 1] - other_endpoints[:, 0], axis=1))
+    return np.minimum(same, flipped)
+
+
+def _surface_member_distances(vertices: np.ndarray, other_vertices: np.ndarray) -> np.ndarray:
+    # Hausdorff distance between the vertex sets, independent of start vertex and winding
+    distances = np.linalg.norm(
+        vertices[:, :, None, :] - other_vertices[:, None, :, :], axis=3)
+    with warnings.catch_warnings():
+        # rows padded with NaN are all-NaN slices
+        warnings.simplefilter('ignore', RuntimeWarning)
+        forward = np.nanmax(np.nanmin(distances, axis=2), axis=1)
+        backward = np.nanmax(np.nanmin(distances, axis=1), axis=1)
+    return np.fmax(forward, backward)
+
+
+def _assign(indices: np.ndarray, other_indices: np.ndarray, distances: np.ndarray,
+            tolerance: float) -> list[tuple[int, int, float]]:
+    """Pair every member with at most one other member, closest pairs first."""
+    within = distances <= tolerance
+    indices, other_indices, distances = indices[within], other_indices[within], distances[within]
+    order = np.argsort(distances, kind='stable')
+
+    assigned, other_assigned = set(), set()
+    pairs = []
+    for index, other_index, distance in zip(indices[order].tolist(), other_indices[order].tolist(),
+                                            distances[order].tolist()):
+        if index in assigned or other_index in other_assigned:
+            continue
+        assigned.add(index)
+        other_assigned.add(other_index)
+        pairs.append((index, other_index, distance))
+    pairs.sort()
+    return pairs
+
+
+def match_xmi_geometry(entities: list[XmiBaseEntity], other_entities: list[XmiBaseEntity],
+                       tolerance: float = 1.0, min_confidence: float = 0.0) -> list[XmiGeometryMatch]:
+    """Pair the curve and surface members of two entity lists, see XmiModel.match_geometry."""
+    if tolerance <= 0:
+        raise ValueError("'tolerance' should be positive")
+
+    matches = []
+    for entity_class in (XmiStructuralCurveMember, XmiStructuralSurfaceMember):
+        members = [entity for entity in entities if type(
+            entity) is entity_class]
+        other_members = [entity for entity in other_entities if type(
+            entity) is entity_class]
+        if not members or not other_members:
+            continue
+
+        if entity_class is XmiStructuralCurveMember:
+            geometry = _curve_member_endpoints(members)
+            other_geometry = _curve_member_endpoints(other_members)
+            centres = geometry.mean(axis=1)
+            other_centres = other_geometry.mean(axis=1)
+        else:
+            geometry = _surface_member_vertices(members)
+            other_geometry = _surface_member_vertices(other_members)
+            centres = np.nanmean(geometry, axis=1)
+            other_centres = np.nanmean(other_geometry, axis=1)
+
+        indices, other_indices = _candidate_pairs(
+            centres, other_centres, tolerance)
+        if entity_class is XmiStructuralCurveMember:
+            distances = _curve_member_distances(
+                geometry[indices], other_geometry[other_indices])
+        else:
+            distances = _surface_member_distances(
+                geometry[indices], other_geometry[other_indices])
+
+        for index, other_index, distance in _assign(indices, other_indices, distances, tolerance):
+            confidence = 1.0 - distance / tolerance
+            if confidence >= min_confidence:
+                matches.append(XmiGeometryMatch(
+                    members[index], other_members[other_index], distance, confidence))
+
+    return matches
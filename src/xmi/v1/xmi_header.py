@@ -0,0 +1,100 @@
+"""
+The StructuralModel header of an XMI export, which names the model, the
+ISS schema version and the tool that wrote it, and the probe reading
+only the header and the size of every section.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+XMI_HEADER_SECTION = "StructuralModel"
+
+# BIM exports name their authoring tool, analysis exports their analytical tool
+XMI_HEADER_APPLICATION_KEYS: tuple[tuple[str, str]] = (
+    ("ModelAuthoringTool", "ModelAuthoringToolVersion"),
+    ("AnalyticalTool", "AnalyticalToolVersion"),
+)
+
+
+def read_xmi_header(xmi_dict: dict) -> dict | None:
+    """The StructuralModel object of an export, None if it has none.
+
+    Exports write the section as a list holding one object, a bare object
+    is accepted too.
+    """
+    header = xmi_dict.get(XMI_HEADER_SECTION)
+    if isinstance(header, list):
+        header = header[0] if header else None
+    return header if isinstance(header, dict) else None
+
+
+def header_application_keys(header: dict) -> tuple[str, str]:
+    """The keys of the tool an export was written with, the analytical tool when no authoring tool is given."""
+    for application_keys in XMI_HEADER_APPLICATION_KEYS:
+        if header.get(application_keys[0]):
+            return application_keys
+    return XMI_HEADER_APPLICATION_KEYS[0]
+
+
+def _header_str(header: dict, key: str) -> str | None:
+    # versions are sometimes written as numbers
+    value = header.get(key)
+    return str(value) if value is not None else None
+
+
+def header_model_attributes(header: dict) -> dict[str, str | None]:
+    """The name, xmi_version, application_name and application_version of XmiModel held by ``header``."""
+    application_key, application_version_key = header_application_keys(header)
+    return {
+        "name": _header_str(header, "Name"),
+        "xmi_version": _header_str(header, "ISSVersion"),
+        "application_name": _header_str(header, application_key),
+        "application_version": _header_str(header, application_version_key),
+    }
+
+
+class XmiProbe():
+    """The header and section sizes of an XMI file, see XmiManager.probe.
+
+    Parameters
+    ----------
+    path : str
+        The file probed.
+    header : dict | None
+        The StructuralModel object, None if the file has none.
+    section_counts : dict[str, int]
+        Number of objects of every section, in file order. Sections
+        written as null count as 0.
+    """
+    __slots__ = ('path', 'header', 'section_counts', 'name', 'xmi_version',
+                 'application_name', 'application_version')
+
+    def __init__(self, path: str, header: dict | None, section_counts: dict[str, int]):
+        self.path: str = path
+        self.header: dict | None = header
+        self.section_counts: dict[str, int] = section_counts
+        attributes = header_model_attributes(header or {})
+        self.name: str | None = attributes["name"]
+        self.xmi_version: str | None = attributes["xmi_version"]
+        self.application_name: str | None = attributes["application_name"]
+        self.application_version: str | None = attributes["application_version"]
+
+    @classmethod
+    def from_xmi_dict(cls, path: str, xmi_dict: dict) -> XmiProbe:
+        section_counts = {section: len(value) if isinstance(value, list) else int(value is not None)
+                          for section, value in xmi_dict.items()}
+        return cls(path, read_xmi_header(xmi_dict), section_counts)
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "name": self.name,
+            "xmi_version": self.xmi_version,
+            "application_name": self.application_name,
+            "application_version": self.application_version,
+            "section_counts": dict(self.section_counts),
+        }
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.name} ({self.application_name} {self.application_version}), " \
+            f"{sum(self.section_counts.values())} objects"
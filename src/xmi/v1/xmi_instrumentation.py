@@ -0,0 +1,196 @@
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+
+class XmiPhaseRecord():
+    __slots__ = ('calls', 'time', 'peak_memory')
+
+    def __init__(self):
+        self.calls: int = 0
+        self.time: float = 0.0
+        self.peak_memory: int = 0
+
+    def to_dict(self) -> dict:
+        return {'calls': self.calls,
+                'time': self.time,
+                'peak_memory': self.peak_memory}
+
+
+class _XmiNullScope():
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_XMI_NULL_SCOPE = _XmiNullScope()
+
+
+class XmiNullInstrumentation():
+    """Instrumentation used when profiling is disabled.
+
+    Every scope is the same shared no-op context manager, so an instrumented
+    call site only pays for one method call and an empty ``with`` block.
+    """
+    enabled = False
+
+    def section(self, section: str) -> _XmiNullScope:
+        return _XMI_NULL_SCOPE
+
+    def phase(self, section: str, phase: str) -> _XmiNullScope:
+        return _XMI_NULL_SCOPE
+
+    def report(self) -> dict:
+        return {}
+
+
+class _XmiScope():
+    __slots__ = ('_instrumentation', '_section', '_phase',
+                 '_start_time', '_start_memory', '_max_memory')
+
+    def __init__(self, instrumentation: XmiInstrumentation, section: str, phase: str | None):
+        self._instrumentation = instrumentation
+        self._section = section
+        self._phase = phase
+
+    def __enter__(self):
+        instrumentation = self._instrumentation
+        if instrumentation.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # hand the peak reached so far to the enclosing scope before resetting it
+            if instrumentation._stack:
+                parent = instrumentation._stack[-1]
+                parent._max_memory = max(parent._max_memory, peak)
+            tracemalloc.reset_peak()
+            self._start_memory = current
+            self._max_memory = current
+        instrumentation._stack.append(self)
+        self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self._start_time
+        instrumentation = self._instrumentation
+        instrumentation._stack.pop()
+
+        record = instrumentation._record(self._section, self._phase)
+        record.calls += 1
+        record.time += elapsed
+
+        if instrumentation.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            self._max_memory = max(self._max_memory, peak)
+            record.peak_memory = max(
+                record.peak_memory, self._max_memory - self._start_memory)
+            if instrumentation._stack:
+                parent = instrumentation._stack[-1]
+                parent._max_memory = max(parent._max_memory, self._max_memory)
+            tracemalloc.reset_peak()
+        return False
+
+
+class XmiInstrumentation():
+    """Collects wall time, call counts and tracemalloc peaks while reading a model.
+
+    Records are kept per section (e.g. ``StructuralMaterial``) and per phase
+    within a section (e.g. ``reference_lookup``). Use it through
+    ``XmiManager.instrument()``::
+
+        with xmi_manager.instrument(trace_memory=True) as instrumentation:
+            xmi_manager.read_xmi_dict(xmi_dict)
+        report = instrumentation.report()
+
+    Parameters
+    ----------
+    trace_memory : bool, optional
+        Record ``tracemalloc`` peaks as well as timings, by default False.
+        Tracing memory slows the read down considerably.
+    """
+    enabled = True
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory: bool = trace_memory
+        self.sections: dict[str, XmiPhaseRecord] = {}
+        self.phases: dict[str, dict[str, XmiPhaseRecord]] = {}
+        self.total_time: float = 0.0
+        self._stack: list[_XmiScope] = []
+        self._started_tracemalloc: bool = False
+        self._start_time: float | None = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._start_time = time.perf_counter()
+
+    def stop(self):
+        if self._start_time is not None:
+            self.total_time += time.perf_counter() - self._start_time
+            self._start_time = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def section(self, section: str) -> _XmiScope:
+        return _XmiScope(self, section, None)
+
+    def phase(self, section: str, phase: str) -> _XmiScope:
+        return _XmiScope(self, section, phase)
+
+    def _record(self, section: str, phase: str | None) -> XmiPhaseRecord:
+        if phase is None:
+            records = self.sections
+            key = section
+        else:
+            records = self.phases.setdefault(section, {})
+            key = phase
+        record = records.get(key)
+        if record is None:
+            record = records[key] = XmiPhaseRecord()
+        return record
+
+    def report(self) -> dict:
+        """Return the collected measurements as plain dictionaries.
+
+        The ``phases`` entry aggregates every phase across all sections, while
+        each entry of ``sections`` holds the section's own totals and its
+        per-phase breakdown.
+        """
+        phase_totals: dict[str, XmiPhaseRecord] = {}
+        for section_phases in self.phases.values():
+            for phase_name, record in section_phases.items():
+                total = phase_totals.setdefault(phase_name, XmiPhaseRecord())
+                total.calls += record.calls
+                total.time += record.time
+                total.peak_memory = max(
+                    total.peak_memory, record.peak_memory)
+
+        section_names = list(self.sections.keys()) + \
+            [name for name in self.phases.keys() if name not in self.sections]
+
+        sections = {}
+        for section_name in section_names:
+            section_record = self.sections.get(section_name, XmiPhaseRecord())
+            section_report = section_record.to_dict()
+            section_report['phases'] = {phase_name: record.to_dict()
+                                        for phase_name, record in self.phases.get(section_name, {}).items()}
+            sections[section_name] = section_report
+
+        return {'total_time': self.total_time,
+                'trace_memory': self.trace_memory,
+                'sections': sections,
+                'phases': {phase_name: record.to_dict() for phase_name, record in phase_totals.items()}}
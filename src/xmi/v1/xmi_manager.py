@@ -1,6 +1,10 @@
 # Optional, for forward declarations in Python 3.7+
 from __future__ import annotations
 
+import json
+import math
+from contextlib import contextmanager
+
 
 from .entities.xmi_segment import XmiSegment
 
@@ -9,8 +13,15 @@ from .entities.xmi_structural_point_connection import XmiStructuralPointConnecti
 from .entities.xmi_structural_material import XmiStructuralMaterial
 from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
 from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
-
-from .xmi_model import XmiModel, ErrorLog
+from .entities.xmi_structural_storey import XmiStructuralStorey
+from .entities.xmi_structural_unit import XmiStructuralUnit
+from .entities.xmi_structural_reinforcement import XmiStructuralReinforcement
+from .entities.xmi_structural_support import XmiStructuralSupport
+from .entities.xmi_structural_point_support import XmiStructuralPointSupport
+from .entities.xmi_structural_line_support import XmiStructuralLineSupport
+from .entities.xmi_structural_area_support import XmiStructuralAreaSupport
+
+from .xmi_model import XmiModel
 from .geometries.xmi_point_3d import XmiPoint3D
 from .geometries.xmi_line_3d import XmiLine3D
 from .geometries.xmi_arc_3d import XmiArc3D
@@ -21,29 +32,94 @@ from .relationships.xmi_has_structural_node import XmiHasStructuralNode
 from .relationships.xmi_has_structural_cross_section import XmiHasStructuralCrossSection
 from .relationships.xmi_has_segment import XmiHasSegment
 from .relationships.xmi_has_geometry import XmiHasGeometry
+from .relationships.xmi_has_structural_storey import XmiHasStructuralStorey
+from .relationships.xmi_has_structural_member import XmiHasStructuralMember
 
 from .xmi_errors import *
 from .xmi_base import XmiBaseEntity
-from .enums.xmi_enums import XmiSegmentTypeEnum
+from .xmi_instrumentation import XmiInstrumentation, XmiNullInstrumentation
+from .xmi_error_handling import XmiErrorCollector
+from .xmi_header import XmiProbe, read_xmi_header, header_model_attributes
+from .xmi_writer import unmodelled_fields, unmodelled_sections
+from .enums.xmi_enums import XmiSegmentTypeEnum, XmiUnitEnum
 
 SEGMENT_TYPE_MAPPING = {
     XmiSegmentTypeEnum.LINE: XmiLine3D,
     XmiSegmentTypeEnum.CIRCULAR_ARC: XmiArc3D
 }
 
+# some exports write booleans as "True"/"False"
+XMI_BOOLEAN_STRINGS = {"true": True, "false": False}
+
+# support sections with their entity, the key of the supported entity, the types it may be and the relationship to it
+XMI_SUPPORT_SECTIONS = {
+    "StructuralPointSupport": (XmiStructuralPointSupport, "Node", (XmiStructuralPointConnection,), XmiHasStructuralNode),
+    "StructuralLineSupport": (XmiStructuralLineSupport, "Line", (XmiStructuralCurveMember, XmiStructuralSurfaceMember), XmiHasStructuralMember),
+    "StructuralAreaSupport": (XmiStructuralAreaSupport, "Area", (XmiStructuralSurfaceMember,), XmiHasStructuralMember),
+}
+
 
 class XmiManager():
 
     def __init__(self):
         self.models = []
+        self.instrumentation: XmiInstrumentation | XmiNullInstrumentation = XmiNullInstrumentation()
+
+    @contextmanager
+    def instrument(self, trace_memory: bool = False):
+        """Record per-section and per-phase timings of the reads inside the block.
+
+        Yields the XmiInstrumentation collecting the measurements; call its
+        ``report()`` for the results. Outside of the block the manager uses a
+        no-op instrumentation.
+
+        Parameters
+        ----------
+        trace_memory : bool, optional
+            Also record tracemalloc peaks, by default False
+        """
+        instrumentation = XmiInstrumentation(trace_memory=trace_memory)
+        previous_instrumentation = self.instrumentation
+        self.instrumentation = instrumentation
+        instrumentation.start()
+        try:
+            yield instrumentation
+        finally:
+            instrumentation.stop()
+            self.instrumentation = previous_instrumentation
+
+    def read_xmi_file(self, file_path: str, **kwargs) -> XmiModel:
+        with self.instrumentation.phase("XmiFile", "json_decode"):
+            with open(file_path, 'r') as f:
+                xmi_dict = json.load(f)
+
+        return self.read_xmi_dict(xmi_dict, **kwargs)
+
+    def probe(self, file_path: str) -> XmiProbe:
+        """Read the StructuralModel header and the number of objects per section of an XMI file.
+
+        No entity is constructed, so a probe costs about the JSON decoding
+        of the file, a fraction of read_xmi_file. Suitable for indexing
+        many files.
+        """
+        with self.instrumentation.phase("XmiFile", "json_decode"):
+            with open(file_path, 'r') as f:
+                xmi_dict = json.load(f)
+
+        return XmiProbe.from_xmi_dict(file_path, xmi_dict)
 
     def _rearrange_xmi_dict(self, xmi_dict: dict) -> dict:
         # Define the desired key order
         desired_order = ['StructuralMaterial',
+                         'StructuralStorey',
                          'StructuralPointConnection',
                          'StructuralCrossSection',
                          'StructuralCurveMember',
-                         'StructuralSurfaceMember'
+                         'StructuralSurfaceMember',
+                         'StructuralReinforcement',
+                         'StructuralPointSupport',
+                         'StructuralLineSupport',
+                         'StructuralAreaSupport'
                          ]
         # Create a new dictionary with rearranged keys
         rearranged_xmi_dict = {key: xmi_dict[key]
@@ -55,99 +131,339 @@ class XmiManager():
 
         return rearranged_xmi_dict
 
-    def read_xmi_dict(self, xmi_dict: dict) -> XmiModel:
+    def read_xmi_dict(self, xmi_dict: dict, max_errors: int | None = None, fail_fast: bool = False,
+                      error_sink=None, validate_references: bool = False,
+                      resolve_references_by: str = "name", assign_storeys: bool = False) -> XmiModel:
+        """Read an XMI dictionary into a new XmiModel.
+
+        Parameters
+        ----------
+        xmi_dict : dict
+            The XMI export, keyed by section.
+        max_errors : int | None, optional
+            Number of errors kept in ``XmiModel.errors``, further errors are
+            only counted in ``XmiModel.error_count``. By default None, which
+            keeps every error.
+        fail_fast : bool, optional
+            Stop reading with XmiErrorLimitExceededError once ``max_errors``
+            errors are found, or at the first error if ``max_errors`` is None.
+            By default False.
+        error_sink : optional
+            Object with a ``write(error_log)`` method receiving every error as
+            it is found, e.g. XmiJsonlErrorSink. By default None.
+        validate_references : bool, optional
+            Check every reference of ``xmi_dict`` with validate_xmi_references
+            before any entity is constructed and report the problems as
+            errors. Together with ``fail_fast`` this rejects a dictionary with
+            broken references before paying for construction. By default
+            False.
+        resolve_references_by : str, optional
+            Match references such as ``Material`` or ``Nodes`` against the
+            "name" or the "id" of the referenced entities. Entities repeating
+            the name or ID of an earlier entity of the same type are reported
+            as XmiDuplicateEntityError and references resolve to the earlier
+            one. By default "name".
+        assign_storeys : bool, optional
+            Run XmiModel.assign_storeys after reading, which gives entities
+            with an empty or unknown Storey the storey of their node
+            elevations. By default False.
+        """
+        instrumentation = self.instrumentation
         xmi_model = XmiModel()
+        xmi_model.entity_index.resolve_by = resolve_references_by
+        errors = XmiErrorCollector(xmi_model.errors, max_errors=max_errors,
+                                   fail_fast=fail_fast, error_sink=error_sink)
+        errors.xmi_model = xmi_model
+
+        header = read_xmi_header(xmi_dict)
+        if header is not None:
+            xmi_model.header = header
+            try:
+                for attr, value in header_model_attributes(header).items():
+                    setattr(xmi_model, attr, value)
+            except Exception as e:
+                errors.add("StructuralModel", 0, exception=e, obj=header)
+
+        if validate_references:
+            from .xmi_validation import validate_xmi_references
+
+            with instrumentation.section("ReferenceValidation"):
+                try:
+                    for error_log in validate_xmi_references(xmi_dict, resolve_by=resolve_references_by):
+                        errors.report(error_log)
+                finally:
+                    xmi_model.error_count = errors.count
+                    xmi_model.warning_count = errors.warning_count
 
         # 1. rearrange the dictionary first
         rearranged_xmi_dict = self._rearrange_xmi_dict(xmi_dict)
+        xmi_model.unmodelled_sections = unmodelled_sections(xmi_dict)
 
         # 2. iterate through all the keys to generate entities
         for xmi_dict_key, xmi_dict_value in rearranged_xmi_dict.items():
-            if xmi_dict_key == "StructuralMaterial":
-                for index, xmi_structural_material_obj in enumerate(xmi_dict_value):
-                    try:
-                        xmi_structural_material, error_logs = XmiStructuralMaterial.from_xmi_dict_obj(
-                            xmi_structural_material_obj)
-                        if xmi_structural_material:
-                            xmi_model.entities.append(xmi_structural_material)
-                        xmi_model.errors.extend(error_logs)
-                    except Exception as e:
-                        xmi_model.errors.append(
-                            ErrorLog(xmi_dict_key, index, str(e)))
-                # check for duplicates after all xmi_structural_material_objs have been instantiated
-
-            if xmi_dict_key == "StructuralPointConnection":
-                for index, xmi_structural_point_connection_obj in enumerate(xmi_dict_value):
-                    try:
-                        xmi_point_3d, error_logs = XmiPoint3D.from_xmi_dict_obj(
-                            xmi_structural_point_connection_obj)
-                        xmi_structural_point_connection_obj['point'] = xmi_point_3d
-                        xmi_structural_point_connection, error_logs = XmiStructuralPointConnection.from_xmi_dict_obj(
-                            xmi_structural_point_connection_obj)
-
-                        if xmi_structural_point_connection:
-                            xmi_model.entities.append(
-                                xmi_structural_point_connection)
-                            xmi_model.entities.append(xmi_point_3d)
-                            xmi_model.create_relationship(
-                                XmiHasGeometry, xmi_structural_point_connection, xmi_point_3d)
-
-                        xmi_model.errors.extend(error_logs)
-                    except Exception as e:
-                        xmi_model.errors.append(
-                            ErrorLog(xmi_dict_key, index, str(e)))
-                # check for duplicate names and id after all xmi_structural_point_connection_objs have been instantiated
+            with instrumentation.section(xmi_dict_key):
+                try:
+                    self._read_xmi_dict_section(
+                        xmi_model, xmi_dict_key, xmi_dict_value, errors, xmi_dict=rearranged_xmi_dict)
+                finally:
+                    xmi_model.error_count = errors.count
+                    xmi_model.warning_count = errors.warning_count
+
+        if assign_storeys:
+            with instrumentation.section("StoreyAssignment"):
+                xmi_model.assign_storeys()
+
+        # the indices and tables import NumPy, which importing XmiManager leaves out
+        from .xmi_storey_index import XmiStoreyIndex
+        from .xmi_support_table import XmiSupportTable
+
+        with instrumentation.section("StoreyIndex"):
+            xmi_model.storey_index = XmiStoreyIndex.from_entities(
+                xmi_model.entities)
+
+        with instrumentation.section("SupportTable"):
+            xmi_model.support_table = XmiSupportTable.from_supports(
+                [entity for entity in xmi_model.entities if isinstance(entity, XmiStructuralSupport)])
 
-            if xmi_dict_key == "StructuralCrossSection":
-                for index, xmi_structural_cross_section_obj in enumerate(xmi_dict_value):
-                    try:
-                        xmi_structural_material_found_in_xmi_manager = None
+        self.models.append(xmi_model)
 
-                        if 'Material' not in xmi_structural_cross_section_obj:
-                            raise XmiMissingReferenceInstanceError(
-                                "Material Attribute in xmi_dict is missing")
+        return xmi_model
 
+    # add an entity read from an XMI section, reporting names and IDs it repeats
+    def _add_indexed_entity(self, xmi_model: XmiModel, entity: XmiBaseEntity, xmi_dict_key: str, index: int,
+                            errors: XmiErrorCollector, xmi_dict_obj: dict | None = None):
+        xmi_model.entities.append(entity)
+        xmi_model.section_indices[entity] = index
+        if xmi_dict_obj:
+            # keys the entity does not model are written back as they were read
+            fields = unmodelled_fields(entity, xmi_dict_obj)
+            if fields:
+                xmi_model.unmodelled_fields[entity] = fields
+        for duplicate_error in xmi_model.entity_index.add(entity):
+            errors.add(xmi_dict_key, index, exception=duplicate_error)
+
+    # replace the storey name of an entity by the XmiStructuralStorey it refers to, names without one are kept
+    def _resolve_storey(self, xmi_model: XmiModel, entity: XmiBaseEntity):
+        storey_name = entity.storey
+        if not isinstance(storey_name, str):
+            return
+        xmi_structural_storey = xmi_model.entity_index.find(
+            XmiStructuralStorey, storey_name)
+        if xmi_structural_storey is None:
+            return
+        entity.storey = xmi_structural_storey
+        xmi_model.create_relationship(
+            XmiHasStructuralStorey, entity, xmi_structural_storey)
+
+    def _read_support_section(self, xmi_model: XmiModel, xmi_dict_key: str, xmi_dict_value: list,
+                              errors: XmiErrorCollector):
+        instrumentation = self.instrumentation
+        entity_index = xmi_model.entity_index
+        support_class, reference_key, reference_classes, relationship_class = XMI_SUPPORT_SECTIONS[
+            xmi_dict_key]
+
+        from .xmi_support_table import parse_support_columns
+
+        with instrumentation.phase(xmi_dict_key, "string_parsing"):
+            fixed, stiffnesses, error_logs = parse_support_columns(
+                xmi_dict_value)
+
+        for index, xmi_support_obj in enumerate(xmi_dict_value):
+            try:
+                errors.extend(xmi_dict_key, index, error_logs[index])
+
+                if reference_key not in xmi_support_obj:
+                    raise XmiMissingReferenceInstanceError(
+                        f"{reference_key} Attribute in xmi_dict is missing")
+
+                with instrumentation.phase(xmi_dict_key, "reference_lookup"):
+                    reference_name = xmi_support_obj[reference_key]
+                    supported_entity = None
+                    matched_by_name = False
+                    for reference_class in reference_classes:
+                        supported_entity = entity_index.find(
+                            reference_class, reference_name)
+                        if supported_entity is not None:
+                            break
+                    # BIM exports point Area at an analytical surface they do not export
+                    # and name the support after its surface member
+                    if supported_entity is None and support_class is XmiStructuralAreaSupport:
+                        supported_entity = entity_index.find(
+                            XmiStructuralSurfaceMember, xmi_support_obj.get('Name'))
+                        matched_by_name = supported_entity is not None
+                if supported_entity is None:
+                    raise XmiMissingReferenceInstanceError(
+                        f"{reference_key} of the support is not found", problem_data=reference_name)
+
+                with instrumentation.phase(xmi_dict_key, "entity_construction"):
+                    xmi_support = support_class(supported_entity,
+                                                fixed=fixed[index],
+                                                stiffnesses=stiffnesses[index],
+                                                id=xmi_support_obj.get('ID'),
+                                                name=xmi_support_obj.get('Name'),
+                                                description=xmi_support_obj.get(
+                                                    'Description'),
+                                                ifcguid=xmi_support_obj.get('IFCGUID'))
+                self._add_indexed_entity(
+                    xmi_model, xmi_support, xmi_dict_key, index, errors,
+                    xmi_dict_obj=xmi_dict_value[index])
+                if matched_by_name:
+                    # the writer keeps the Area of the export rather than the name of the surface member
+                    xmi_model.unmodelled_fields.setdefault(
+                        xmi_support, {})[reference_key] = reference_name
+                    errors.warn(xmi_dict_key, index,
+                                f"{reference_key} {reference_name} of the support is not found, "
+                                f"it supports the StructuralSurfaceMember of the same name",
+                                obj=xmi_support_obj, error_code="SupportMatchedByName")
+
+                with instrumentation.phase(xmi_dict_key, "relationship_creation"):
+                    xmi_model.create_relationship(
+                        relationship_class, xmi_support, supported_entity)
+
+            except XmiErrorLimitExceededError:
+                raise
+            except Exception as e:
+                errors.add(xmi_dict_key, index,
+                           exception=e, obj=xmi_support_obj)
+
+    # the XMI section and index of every object of sections by reference, which tells
+    # references to entities that failed to build from references to nothing
+    def _reference_rows(self, xmi_model: XmiModel, xmi_dict: dict, sections: tuple[str]) -> dict[str, tuple[str, int]]:
+        reference_key = 'ID' if xmi_model.entity_index.resolve_by == "id" else 'Name'
+        reference_rows = {}
+        for section in sections:
+            for index, xmi_dict_obj in enumerate(xmi_dict.get(section) or []):
+                reference_rows.setdefault(
+                    xmi_dict_obj.get(reference_key), (section, index))
+        return reference_rows
+
+    def _read_xmi_dict_section(self, xmi_model: XmiModel, xmi_dict_key: str, xmi_dict_value: list,
+                               errors: XmiErrorCollector, xmi_dict: dict | None = None):
+        # the string columns are parsed with NumPy, which importing XmiManager leaves out
+        from .xmi_string_parsing import parse_float_column, split_string_column, row_as_tuple
+
+        instrumentation = self.instrumentation
+        entity_index = xmi_model.entity_index
+
+        if xmi_dict_key == "StructuralMaterial":
+            with instrumentation.phase(xmi_dict_key, "entity_construction"):
+                xmi_structural_materials, error_logs_found = XmiStructuralMaterial.bulk_from_xmi_dicts(
+                    xmi_dict_value)
+            for index, (xmi_structural_material, error_logs) in enumerate(zip(xmi_structural_materials, error_logs_found)):
+                if xmi_structural_material:
+                    self._add_indexed_entity(
+                        xmi_model, xmi_structural_material, xmi_dict_key, index, errors,
+                        xmi_dict_obj=xmi_dict_value[index])
+                errors.extend(xmi_dict_key, index, error_logs)
+
+        if xmi_dict_key == "StructuralStorey":
+            with instrumentation.phase(xmi_dict_key, "entity_construction"):
+                xmi_structural_storeys, error_logs_found = XmiStructuralStorey.bulk_from_xmi_dicts(
+                    xmi_dict_value)
+            for index, (xmi_structural_storey, error_logs) in enumerate(zip(xmi_structural_storeys, error_logs_found)):
+                if xmi_structural_storey:
+                    self._add_indexed_entity(
+                        xmi_model, xmi_structural_storey, xmi_dict_key, index, errors,
+                        xmi_dict_obj=xmi_dict_value[index])
+                errors.extend(xmi_dict_key, index, error_logs)
+
+        if xmi_dict_key == "StructuralPointConnection":
+            with instrumentation.phase(xmi_dict_key, "entity_construction"):
+                xmi_point_3ds, _ = XmiPoint3D.bulk_from_xmi_dicts(
+                    xmi_dict_value)
+                xmi_structural_point_connections, error_logs_found = XmiStructuralPointConnection.bulk_from_xmi_dicts(
+                    xmi_dict_value, points=xmi_point_3ds)
+
+            with instrumentation.phase(xmi_dict_key, "relationship_creation"):
+                for index, (xmi_structural_point_connection, xmi_point_3d, error_logs) in enumerate(zip(
+                        xmi_structural_point_connections, xmi_point_3ds, error_logs_found)):
+                    if xmi_structural_point_connection:
+                        self._add_indexed_entity(
+                            xmi_model, xmi_structural_point_connection, xmi_dict_key, index, errors,
+                            xmi_dict_obj=xmi_dict_value[index])
+                        xmi_model.entities.append(xmi_point_3d)
+                        xmi_model.create_relationship(
+                            XmiHasGeometry, xmi_structural_point_connection, xmi_point_3d)
+                        self._resolve_storey(
+                            xmi_model, xmi_structural_point_connection)
+                    errors.extend(xmi_dict_key, index, error_logs)
+
+        if xmi_dict_key == "StructuralCrossSection":
+            # rows that fail to parse are left to the per entity conversion, which reports the error
+            with instrumentation.phase(xmi_dict_key, "string_parsing"):
+                parameters_column, parameters_errors = parse_float_column(
+                    [obj.get('Parameters') for obj in xmi_dict_value], ';', 'parameters')
+
+            for index, xmi_structural_cross_section_obj in enumerate(xmi_dict_value):
+                try:
+                    xmi_structural_material_found_in_xmi_manager = None
+
+                    if 'Material' not in xmi_structural_cross_section_obj:
+                        raise XmiMissingReferenceInstanceError(
+                            "Material Attribute in xmi_dict is missing")
+
+                    with instrumentation.phase(xmi_dict_key, "reference_lookup"):
                         xmi_structural_material_name_to_find: str = xmi_structural_cross_section_obj[
                             'Material']
-                        xmi_structural_material_found_in_xmi_manager = next(
-                            (inst for inst in xmi_model.entities
-                                if inst.name == xmi_structural_material_name_to_find
-                                and isinstance(inst, XmiStructuralMaterial)),
-                            None
-                        )
+                        xmi_structural_material_found_in_xmi_manager = entity_index.find(
+                            XmiStructuralMaterial, xmi_structural_material_name_to_find)
 
+                    with instrumentation.phase(xmi_dict_key, "entity_construction"):
                         xmi_structural_cross_section, error_logs = XmiStructuralCrossSection.from_xmi_dict_obj(
                             xmi_structural_cross_section_obj,
-                            material=xmi_structural_material_found_in_xmi_manager
+                            material=xmi_structural_material_found_in_xmi_manager,
+                            parameters=row_as_tuple(
+                                parameters_column, parameters_errors, index)
                         )
-                        xmi_model.errors.extend(error_logs)
-                        if xmi_structural_cross_section and isinstance(xmi_structural_cross_section, XmiStructuralCrossSection):
-                            xmi_model.entities.append(
-                                xmi_structural_cross_section)
+                    errors.extend(xmi_dict_key, index, error_logs)
+                    if xmi_structural_cross_section and isinstance(xmi_structural_cross_section, XmiStructuralCrossSection):
+                        self._add_indexed_entity(
+                            xmi_model, xmi_structural_cross_section, xmi_dict_key, index, errors,
+                            xmi_dict_obj=xmi_dict_value[index])
+                        with instrumentation.phase(xmi_dict_key, "relationship_creation"):
                             xmi_model.create_relationship(
                                 XmiHasStructuralMaterial, xmi_structural_cross_section, xmi_structural_cross_section.material)
 
-                    except Exception as e:
-                        xmi_model.errors.append(
-                            ErrorLog(xmi_dict_key, index, str(e)))
-
-            if xmi_dict_key == "StructuralCurveMember":
-                for index, xmi_structural_curve_member_obj in enumerate(xmi_dict_value):
-                    try:
-                        xmi_structural_cross_section_found_in_xmi_manager = None
-
-                        # find referenced cross section
-                        if 'CrossSection' not in xmi_structural_curve_member_obj:
-                            raise XmiMissingReferenceInstanceError(
-                                "CrossSection Attribute in xmi_dict is missing")
-
+                except XmiErrorLimitExceededError:
+                    raise
+                except Exception as e:
+                    errors.add(xmi_dict_key, index, exception=e)
+
+        if xmi_dict_key == "StructuralCurveMember":
+            # rows that fail to parse are left to the per entity conversion, which reports the error
+            with instrumentation.phase(xmi_dict_key, "string_parsing"):
+                nodes_column, nodes_errors = split_string_column(
+                    [obj.get('Nodes') for obj in xmi_dict_value], ';', 'nodes')
+                segments_column, segments_errors = split_string_column(
+                    [obj.get('Segments') for obj in xmi_dict_value], ';', 'segments')
+                local_axis_columns = [parse_float_column([obj.get(local_axis_key) for obj in xmi_dict_value], ',', local_axis_key, size=3)
+                                      for local_axis_key in ('LocalAxisX', 'LocalAxisY', 'LocalAxisZ')]
+                # only read for arc segments, the exports leave it empty for lines
+                arc_centre_column, arc_centre_errors = parse_float_column(
+                    [obj.get('CircularArcCentre') for obj in xmi_dict_value], ',', 'CircularArcCentre', size=3)
+
+            for index, xmi_structural_curve_member_obj in enumerate(xmi_dict_value):
+                try:
+                    local_axis_x, local_axis_y, local_axis_z = [row_as_tuple(local_axis_column, local_axis_errors, index)
+                                                                for local_axis_column, local_axis_errors in local_axis_columns]
+                    xmi_structural_point_connections_name_list_to_find: list[str] = nodes_column[
+                        index] if index not in nodes_errors else None
+                    xmi_segments_list_to_find: list[str] = segments_column[
+                        index] if index not in segments_errors else None
+
+                    xmi_structural_cross_section_found_in_xmi_manager = None
+
+                    # find referenced cross section
+                    if 'CrossSection' not in xmi_structural_curve_member_obj:
+                        raise XmiMissingReferenceInstanceError(
+                            "CrossSection Attribute in xmi_dict is missing")
+
+                    with instrumentation.phase(xmi_dict_key, "reference_lookup"):
                         xmi_structural_cross_section_name_to_find: str = xmi_structural_curve_member_obj[
                             'CrossSection']
 
-                        xmi_structural_cross_section_found_in_xmi_manager = next(
-                            (inst for inst in xmi_model.entities
-                                if inst.name == xmi_structural_cross_section_name_to_find
-                                and isinstance(inst, XmiStructuralCrossSection)), None)
+                        xmi_structural_cross_section_found_in_xmi_manager = entity_index.find(
+                            XmiStructuralCrossSection, xmi_structural_cross_section_name_to_find)
 
                         # find referenced structural_point_connections
                         xmi_structural_point_connections_name_str_to_find: str = xmi_structural_curve_member_obj[
@@ -155,91 +471,123 @@ class XmiManager():
 
                         xmi_structural_point_connections_found_in_xmi_manager = []
 
-                        xmi_structural_point_connections_name_list_to_find: list[str] = xmi_structural_point_connections_name_str_to_find.split(
-                            ";")
+                        if xmi_structural_point_connections_name_list_to_find is None:
+                            xmi_structural_point_connections_name_list_to_find = xmi_structural_point_connections_name_str_to_find.split(
+                                ";")
 
                         for xmi_structural_point_connection_name in xmi_structural_point_connections_name_list_to_find:
                             xmi_structural_point_connection_found_in_xmi_manager = None
-                            xmi_structural_point_connection_found_in_xmi_manager = next(
-                                (inst for inst in xmi_model.entities
-                                    if inst.name == xmi_structural_point_connection_name
-                                    and isinstance(inst, XmiStructuralPointConnection)), None)
+                            xmi_structural_point_connection_found_in_xmi_manager = entity_index.find(
+                                XmiStructuralPointConnection, xmi_structural_point_connection_name)
                             xmi_structural_point_connections_found_in_xmi_manager.append(
                                 xmi_structural_point_connection_found_in_xmi_manager)
 
-                        # find segments within structural_curve_member
-                        xmi_segments_str_to_find: str = xmi_structural_curve_member_obj['Segments']
-                        xmi_segments_list_to_find: list[str] = xmi_segments_str_to_find.split(
+                    # find segments within structural_curve_member
+                    xmi_segments_str_to_find: str = xmi_structural_curve_member_obj['Segments']
+                    if xmi_segments_list_to_find is None:
+                        xmi_segments_list_to_find = xmi_segments_str_to_find.split(
                             ";")
-                        # check segments validity, need to rectify. can accept multiple segments
-                        if len(xmi_segments_list_to_find) > 1:
-                            exception_found = ValueError(
-                                "Segments Key should only have 1 segment for {xmi_structural_curve_member_obj}".format(xmi_structural_curve_member_obj=str(xmi_structural_curve_member_obj)))
-                            xmi_model.errors.append(
-                                ErrorLog(xmi_dict_key, index, str(exception_found)))
-                            pass
-
-                        xmi_segments_found_in_xmi_manager: list[XmiSegment] = [
-                        ]
-                        for index, xmi_segment_name_to_find in enumerate(xmi_segments_list_to_find):
-
-                            xmi_geometry_class_found: XmiBaseEntity | None = None
-
-                            # find segment_type
-                            xmi_segment_type_found: XmiSegmentTypeEnum = XmiSegmentTypeEnum.from_attribute_get_enum(
-                                xmi_segment_name_to_find)
-                            # if segment type exist. find and create geometry_element
-                            xmi_geometry_class_found = SEGMENT_TYPE_MAPPING[xmi_segment_type_found] if xmi_segment_type_found in SEGMENT_TYPE_MAPPING.keys(
-                            ) else None
-
-                            begin_node_found: XmiStructuralPointConnection = xmi_structural_point_connections_found_in_xmi_manager[
-                                index]
-                            end_node_found: XmiStructuralPointConnection = xmi_structural_point_connections_found_in_xmi_manager[
-                                index + 1]
-
-                            try:
-
-                                geometry_found: XmiBaseGeometry = xmi_geometry_class_found(start_point=begin_node_found.point,
-                                                                                           end_point=end_node_found.point)
+                    # check segments validity, need to rectify. can accept multiple segments
+                    if len(xmi_segments_list_to_find) > 1:
+                        errors.add(xmi_dict_key, index,
+                                   exception=ValueError("Segments Key should only have 1 segment"), obj=xmi_structural_curve_member_obj)
+
+                    xmi_segments_found_in_xmi_manager: list[XmiSegment] = [
+                    ]
+                    for segment_index, xmi_segment_name_to_find in enumerate(xmi_segments_list_to_find):
+
+                        xmi_geometry_class_found: XmiBaseEntity | None = None
+
+                        # find segment_type
+                        xmi_segment_type_found: XmiSegmentTypeEnum = XmiSegmentTypeEnum.from_attribute_get_enum(
+                            xmi_segment_name_to_find)
+                        # if segment type exist. find and create geometry_element
+                        xmi_geometry_class_found = SEGMENT_TYPE_MAPPING[xmi_segment_type_found] if xmi_segment_type_found in SEGMENT_TYPE_MAPPING.keys(
+                        ) else None
+
+                        begin_node_found: XmiStructuralPointConnection = xmi_structural_point_connections_found_in_xmi_manager[
+                            segment_index]
+                        end_node_found: XmiStructuralPointConnection = xmi_structural_point_connections_found_in_xmi_manager[
+                            segment_index + 1]
+
+                        try:
+                            with instrumentation.phase(xmi_dict_key, "geometry_construction"):
+                                arc_centre_point: XmiPoint3D | None = None
+                                if xmi_geometry_class_found is XmiArc3D:
+                                    arc_centre = row_as_tuple(
+                                        arc_centre_column, arc_centre_errors, index)
+                                    if arc_centre is None:
+                                        raise XmiMissingRequiredAttributeError(
+                                            "'CircularArcCentre' should be 'x,y,z' for Circular Arc segments",
+                                            problem_data=xmi_structural_curve_member_obj.get('CircularArcCentre'))
+                                    arc_centre_point = XmiPoint3D(*arc_centre)
+                                    # a half turn has start, end and centre on one line, the local axes give its plane
+                                    geometry_found: XmiBaseGeometry = XmiArc3D(start_point=begin_node_found.point,
+                                                                               end_point=end_node_found.point,
+                                                                               center_point=arc_centre_point,
+                                                                               plane_normal=local_axis_z)
+                                    if math.isnan(geometry_found.normal[0]) and local_axis_y is not None:
+                                        geometry_found.plane_normal = local_axis_y
+                                    if math.isnan(geometry_found.normal[0]):
+                                        raise XmiError(
+                                            "Circular Arc segment has no plane, its start, end and 'CircularArcCentre' lie on one line and neither 'LocalAxisZ' nor 'LocalAxisY' is perpendicular to it",
+                                            problem_data=xmi_structural_curve_member_obj.get('CircularArcCentre'))
+                                else:
+                                    geometry_found: XmiBaseGeometry = xmi_geometry_class_found(start_point=begin_node_found.point,
+                                                                                               end_point=end_node_found.point)
 
                                 xmi_segment_found = XmiSegment(geometry=geometry_found,
-                                                               position=index + 1,
+                                                               position=segment_index + 1,
                                                                begin_node=begin_node_found,
                                                                end_node=end_node_found,
                                                                segment_type=xmi_segment_type_found,
                                                                )
-                                if xmi_segment_found is not None:
-                                    xmi_segments_found_in_xmi_manager.append(
-                                        xmi_segment_found)
-                                    xmi_model.entities.append(
-                                        xmi_segment_found.geometry)
-                                    xmi_model.entities.append(
-                                        xmi_segment_found)
+                            if xmi_segment_found is not None:
+                                xmi_segments_found_in_xmi_manager.append(
+                                    xmi_segment_found)
+                                xmi_model.entities.append(
+                                    xmi_segment_found.geometry)
+                                xmi_model.entities.append(
+                                    xmi_segment_found)
+                                with instrumentation.phase(xmi_dict_key, "relationship_creation"):
                                     xmi_model.create_relationship(
                                         XmiHasGeometry, geometry_found, geometry_found.start_point, is_begin=True)
                                     xmi_model.create_relationship(
                                         XmiHasGeometry, geometry_found, geometry_found.end_point, is_end=True)
+                                    if arc_centre_point is not None:
+                                        xmi_model.entities.append(
+                                            arc_centre_point)
+                                        xmi_model.create_relationship(
+                                            XmiHasGeometry, geometry_found, arc_centre_point)
 
-                            except Exception as e:
-                                xmi_model.errors.append(
-                                    ErrorLog(xmi_dict_key, index, str(e)))
-                                pass
+                        except XmiErrorLimitExceededError:
+                            raise
+                        except Exception as e:
+                            errors.add(xmi_dict_key, index, exception=e)
 
-                        # create_segment
+                    # create_segment
 
+                    with instrumentation.phase(xmi_dict_key, "entity_construction"):
                         xmi_structural_curve_member, error_logs = XmiStructuralCurveMember.from_xmi_dict_obj(
                             xmi_structural_curve_member_obj,
                             cross_section=xmi_structural_cross_section_found_in_xmi_manager,
                             nodes=xmi_structural_point_connections_found_in_xmi_manager,
                             segments=xmi_segments_found_in_xmi_manager,
+                            local_axis_x=local_axis_x,
+                            local_axis_y=local_axis_y,
+                            local_axis_z=local_axis_z,
                         )
 
-                        xmi_model.errors.extend(error_logs)
-                        if xmi_structural_curve_member:
-                            xmi_model.entities.append(
-                                xmi_structural_curve_member)
+                    errors.extend(xmi_dict_key, index, error_logs)
+                    if xmi_structural_curve_member:
+                        self._add_indexed_entity(
+                            xmi_model, xmi_structural_curve_member, xmi_dict_key, index, errors,
+                            xmi_dict_obj=xmi_dict_value[index])
+                        with instrumentation.phase(xmi_dict_key, "relationship_creation"):
                             xmi_model.create_relationship(
                                 XmiHasStructuralCrossSection, xmi_structural_curve_member, xmi_structural_curve_member.cross_section)
+                            self._resolve_storey(
+                                xmi_model, xmi_structural_curve_member)
                             for segment in xmi_structural_curve_member.segments:
                                 xmi_model.create_relationship(
                                     XmiHasSegment, xmi_structural_curve_member, segment)
@@ -254,28 +602,45 @@ class XmiManager():
                                 xmi_model.create_relationship(
                                     XmiHasStructuralNode, xmi_structural_curve_member, spc)
 
-                    except Exception as e:
-                        xmi_model.errors.append(
-                            ErrorLog(xmi_dict_key, index, str(e), obj=xmi_structural_curve_member_obj))
-
-            if xmi_dict_key == "StructuralSurfaceMember":
-                for index, xmi_structural_surface_member_obj in enumerate(xmi_dict_value):
-                    try:
-                        # find referenced structural_material
-                        xmi_structural_material_found_in_xmi_manager = None
-
-                        # find referenced cross section
-                        if 'Material' not in xmi_structural_surface_member_obj:
-                            raise XmiMissingReferenceInstanceError(
-                                "Material Attribute in xmi_dict is missing")
-
+                except XmiErrorLimitExceededError:
+                    raise
+                except Exception as e:
+                    errors.add(xmi_dict_key, index,
+                               exception=e, obj=xmi_structural_curve_member_obj)
+
+        if xmi_dict_key == "StructuralSurfaceMember":
+            # rows that fail to parse are left to the per entity conversion, which reports the error
+            with instrumentation.phase(xmi_dict_key, "string_parsing"):
+                nodes_column, nodes_errors = split_string_column(
+                    [obj.get('Nodes') for obj in xmi_dict_value], ';', 'nodes')
+                segments_column, segments_errors = split_string_column(
+                    [obj.get('Edges') for obj in xmi_dict_value], ';', 'edges')
+                local_axis_columns = [parse_float_column([obj.get(local_axis_key) for obj in xmi_dict_value], ',', local_axis_key, size=3)
+                                      for local_axis_key in ('LocalAxisX', 'LocalAxisY', 'LocalAxisZ')]
+
+            for index, xmi_structural_surface_member_obj in enumerate(xmi_dict_value):
+                try:
+                    local_axis_x, local_axis_y, local_axis_z = [row_as_tuple(local_axis_column, local_axis_errors, index)
+                                                                for local_axis_column, local_axis_errors in local_axis_columns]
+                    xmi_structural_point_connections_name_list_to_find: list[str] = nodes_column[
+                        index] if index not in nodes_errors else None
+                    xmi_segments_list_to_find: list[str] = segments_column[
+                        index] if index not in segments_errors else None
+
+                    # find referenced structural_material
+                    xmi_structural_material_found_in_xmi_manager = None
+
+                    # find referenced cross section
+                    if 'Material' not in xmi_structural_surface_member_obj:
+                        raise XmiMissingReferenceInstanceError(
+                            "Material Attribute in xmi_dict is missing")
+
+                    with instrumentation.phase(xmi_dict_key, "reference_lookup"):
                         xmi_structural_material_name_to_find: str = xmi_structural_surface_member_obj[
                             'Material']
 
-                        xmi_structural_material_found_in_xmi_manager = next(
-                            (inst for inst in xmi_model.entities
-                                if inst.name == xmi_structural_material_name_to_find
-                                and isinstance(inst, XmiStructuralMaterial)), None)
+                        xmi_structural_material_found_in_xmi_manager = entity_index.find(
+                            XmiStructuralMaterial, xmi_structural_material_name_to_find)
 
                         # find referenced structural_point_connections
                         xmi_structural_point_connections_name_str_to_find: str = xmi_structural_surface_member_obj[
@@ -283,95 +648,101 @@ class XmiManager():
 
                         xmi_structural_point_connections_found_in_xmi_manager = []
 
-                        xmi_structural_point_connections_name_list_to_find: list[str] = xmi_structural_point_connections_name_str_to_find.split(
-                            ";")
+                        if xmi_structural_point_connections_name_list_to_find is None:
+                            xmi_structural_point_connections_name_list_to_find = xmi_structural_point_connections_name_str_to_find.split(
+                                ";")
 
                         for xmi_structural_point_connection_name in xmi_structural_point_connections_name_list_to_find:
                             xmi_structural_point_connection_found_in_xmi_manager = None
-                            xmi_structural_point_connection_found_in_xmi_manager = next(
-                                (inst for inst in xmi_model.entities
-                                    if inst.name == xmi_structural_point_connection_name
-                                    and isinstance(inst, XmiStructuralPointConnection)), None)
+                            xmi_structural_point_connection_found_in_xmi_manager = entity_index.find(
+                                XmiStructuralPointConnection, xmi_structural_point_connection_name)
                             xmi_structural_point_connections_found_in_xmi_manager.append(
                                 xmi_structural_point_connection_found_in_xmi_manager)
 
-                        # find segments within structural_curve_member
-                        xmi_segments_str_to_find: str = xmi_structural_surface_member_obj[
-                            'Edges']
-                        xmi_segments_list_to_find: list[str] = xmi_segments_str_to_find.split(
+                    # find segments within structural_curve_member
+                    xmi_segments_str_to_find: str = xmi_structural_surface_member_obj['Edges']
+                    if xmi_segments_list_to_find is None:
+                        xmi_segments_list_to_find = xmi_segments_str_to_find.split(
                             ";")
-                        # check segments validity
-                        if len(xmi_segments_list_to_find) < 3:
-                            exception_found = ValueError(
-                                "Segments Key should at least have 3 segment for {xmi_structural_surface_member_obj}".format(xmi_structural_surface_member_obj=str(xmi_structural_surface_member_obj)))
-                            xmi_model.errors.append(
-                                ErrorLog(xmi_dict_key, index, str(exception_found)))
-                            pass
-
-                        xmi_segments_found_in_xmi_manager: list[XmiSegment] = [
-                        ]
-                        for index, xmi_segment_name_to_find in enumerate(xmi_segments_list_to_find):
-                            # find segment_type
-                            xmi_segment_type_found: XmiSegmentTypeEnum = XmiSegmentTypeEnum.from_attribute_get_enum(
-                                xmi_segment_name_to_find)
-                            # if segment type exist. find and create geometry_element
-                            xmi_geometry_class_found = SEGMENT_TYPE_MAPPING[xmi_segment_type_found] if xmi_segment_type_found in SEGMENT_TYPE_MAPPING.keys(
-                            ) else None
-
-                            # if segment type exist. find and create geometry_element
-                            begin_node_found = xmi_structural_point_connections_found_in_xmi_manager[
-                                index]
-                            end_node_found = None
-
-                            # current implementation assumes the last node found is also the first node to create a closed surface.
-                            if index < (len(xmi_segments_list_to_find) - 1):
-                                end_node_found = xmi_structural_point_connections_found_in_xmi_manager[
-                                    index + 1]
-                            else:
-                                end_node_found = xmi_structural_point_connections_found_in_xmi_manager[
-                                    0]
-
-                            try:
+                    # check segments validity
+                    if len(xmi_segments_list_to_find) < 3:
+                        errors.add(xmi_dict_key, index,
+                                   exception=ValueError("Segments Key should at least have 3 segment"), obj=xmi_structural_surface_member_obj)
+
+                    xmi_segments_found_in_xmi_manager: list[XmiSegment] = [
+                    ]
+                    for segment_index, xmi_segment_name_to_find in enumerate(xmi_segments_list_to_find):
+                        # find segment_type
+                        xmi_segment_type_found: XmiSegmentTypeEnum = XmiSegmentTypeEnum.from_attribute_get_enum(
+                            xmi_segment_name_to_find)
+                        # if segment type exist. find and create geometry_element
+                        xmi_geometry_class_found = SEGMENT_TYPE_MAPPING[xmi_segment_type_found] if xmi_segment_type_found in SEGMENT_TYPE_MAPPING.keys(
+                        ) else None
+
+                        # if segment type exist. find and create geometry_element
+                        begin_node_found = xmi_structural_point_connections_found_in_xmi_manager[
+                            segment_index]
+                        end_node_found = None
+
+                        # current implementation assumes the last node found is also the first node to create a closed surface.
+                        if segment_index < (len(xmi_segments_list_to_find) - 1):
+                            end_node_found = xmi_structural_point_connections_found_in_xmi_manager[
+                                segment_index + 1]
+                        else:
+                            end_node_found = xmi_structural_point_connections_found_in_xmi_manager[
+                                0]
+
+                        try:
+                            with instrumentation.phase(xmi_dict_key, "geometry_construction"):
                                 geometry_found = xmi_geometry_class_found(start_point=begin_node_found.point,
                                                                           end_point=end_node_found.point)
                                 xmi_segment_found = XmiSegment(geometry=geometry_found,
-                                                               position=index + 1,
+                                                               position=segment_index + 1,
                                                                begin_node=begin_node_found,
                                                                end_node=end_node_found,
                                                                segment_type=xmi_segment_type_found,
                                                                )
-                                if xmi_segment_found is not None:
-                                    xmi_segments_found_in_xmi_manager.append(
-                                        xmi_segment_found)
-                                    xmi_model.entities.append(
-                                        xmi_segment_found)
-                                    xmi_model.entities.append(
-                                        xmi_segment_found.geometry)
+                            if xmi_segment_found is not None:
+                                xmi_segments_found_in_xmi_manager.append(
+                                    xmi_segment_found)
+                                xmi_model.entities.append(
+                                    xmi_segment_found)
+                                xmi_model.entities.append(
+                                    xmi_segment_found.geometry)
+                                with instrumentation.phase(xmi_dict_key, "relationship_creation"):
                                     xmi_model.create_relationship(
                                         XmiHasGeometry, geometry_found, geometry_found.start_point, is_begin=True)
                                     xmi_model.create_relationship(
                                         XmiHasGeometry, geometry_found, geometry_found.end_point, is_end=True)
                                     xmi_model.create_relationship(
-                                        XmiHasGeometry, segment, segment.geometry)
+                                        XmiHasGeometry, xmi_segment_found, geometry_found)
 
-                            except Exception as e:
-                                xmi_model.errors.append(
-                                    ErrorLog(xmi_dict_key, index, str(e)))
-                                pass
+                        except XmiErrorLimitExceededError:
+                            raise
+                        except Exception as e:
+                            errors.add(xmi_dict_key, index, exception=e)
 
+                    with instrumentation.phase(xmi_dict_key, "entity_construction"):
                         xmi_structural_surface_member, error_logs = XmiStructuralSurfaceMember.from_xmi_dict_obj(
                             xmi_dict_obj=xmi_structural_surface_member_obj,
                             material=xmi_structural_material_found_in_xmi_manager,
                             nodes=xmi_structural_point_connections_found_in_xmi_manager,
-                            segments=xmi_segments_found_in_xmi_manager
+                            segments=xmi_segments_found_in_xmi_manager,
+                            local_axis_x=local_axis_x,
+                            local_axis_y=local_axis_y,
+                            local_axis_z=local_axis_z,
                         )
 
-                        xmi_model.errors.extend(error_logs)
-                        if xmi_structural_surface_member:
-                            xmi_model.entities.append(
-                                xmi_structural_surface_member)
+                    errors.extend(xmi_dict_key, index, error_logs)
+                    if xmi_structural_surface_member:
+                        self._add_indexed_entity(
+                            xmi_model, xmi_structural_surface_member, xmi_dict_key, index, errors,
+                            xmi_dict_obj=xmi_dict_value[index])
+                        with instrumentation.phase(xmi_dict_key, "relationship_creation"):
                             xmi_model.create_relationship(
                                 XmiHasStructuralMaterial, xmi_structural_surface_member, xmi_structural_surface_member.material)
+                            self._resolve_storey(
+                                xmi_model, xmi_structural_surface_member)
                             for segment in xmi_structural_surface_member.segments:
                                 xmi_model.create_relationship(
                                     XmiHasSegment, xmi_structural_surface_member, segment)
@@ -384,10 +755,106 @@ class XmiManager():
                                 xmi_model.create_relationship(
                                     XmiHasStructuralNode, xmi_structural_surface_member, spc)
 
-                    except Exception as e:
-                        xmi_model.errors.append(
-                            ErrorLog(xmi_dict_key, index, str(e), obj=xmi_structural_surface_member_obj))
-
-        self.models.append(xmi_model)
-
-        return xmi_model
+                except XmiErrorLimitExceededError:
+                    raise
+                except Exception as e:
+                    errors.add(xmi_dict_key, index,
+                               exception=e, obj=xmi_structural_surface_member_obj)
+
+        if xmi_dict_key == "StructuralReinforcement":
+            from .xmi_reinforcement import XmiReinforcementTable
+
+            with instrumentation.phase(xmi_dict_key, "string_parsing"):
+                cover_column, cover_errors = parse_float_column(
+                    [obj.get('Cover') for obj in xmi_dict_value], ';', 'cover')
+                layer_offsets, layers, layer_errors = XmiReinforcementTable.parse_layers(
+                    xmi_dict_value)
+
+            xmi_structural_reinforcements: list[XmiStructuralReinforcement] = []
+            # built on the first member that is not found
+            member_rows: dict[str, tuple[str, int]] | None = None
+            reinforcement_rows: list[int] = []
+            for index, xmi_structural_reinforcement_obj in enumerate(xmi_dict_value):
+                try:
+                    errors.extend(xmi_dict_key, index,
+                                  layer_errors.get(index, []))
+                    if index in cover_errors and xmi_structural_reinforcement_obj.get('Cover'):
+                        errors.add(xmi_dict_key, index,
+                                   exception=cover_errors[index])
+
+                    if 'Member' not in xmi_structural_reinforcement_obj:
+                        raise XmiMissingReferenceInstanceError(
+                            "Member Attribute in xmi_dict is missing")
+
+                    with instrumentation.phase(xmi_dict_key, "reference_lookup"):
+                        xmi_member_name_to_find: str = xmi_structural_reinforcement_obj['Member']
+                        xmi_member_found_in_xmi_manager = entity_index.find(
+                            XmiStructuralCurveMember, xmi_member_name_to_find) or entity_index.find(
+                            XmiStructuralSurfaceMember, xmi_member_name_to_find)
+                    if xmi_member_found_in_xmi_manager is None:
+                        if member_rows is None:
+                            member_rows = self._reference_rows(
+                                xmi_model, xmi_dict or {}, ("StructuralCurveMember", "StructuralSurfaceMember"))
+                        unbuilt_member = member_rows.get(
+                            xmi_member_name_to_find)
+                        if unbuilt_member is not None:
+                            raise XmiMissingReferenceInstanceError(
+                                "Member {section}[{index}] is not constructed, see its error".format(
+                                    section=unbuilt_member[0], index=unbuilt_member[1]),
+                                error_code="ReferenceNotConstructed", problem_data=xmi_member_name_to_find)
+                        raise XmiMissingReferenceInstanceError(
+                            "Member should be a StructuralCurveMember or StructuralSurfaceMember",
+                            problem_data=xmi_member_name_to_find)
+
+                    if_symmetrical = xmi_structural_reinforcement_obj.get(
+                        'IfSymmetrical')
+                    if isinstance(if_symmetrical, str):
+                        if_symmetrical = XMI_BOOLEAN_STRINGS.get(
+                            if_symmetrical.lower())
+
+                    # the per location Description is kept in the layers
+                    with instrumentation.phase(xmi_dict_key, "entity_construction"):
+                        xmi_structural_reinforcement = XmiStructuralReinforcement(
+                            member=xmi_member_found_in_xmi_manager,
+                            cover=row_as_tuple(
+                                cover_column, cover_errors, index),
+                            if_symmetrical=if_symmetrical,
+                            id=xmi_structural_reinforcement_obj.get('ID'),
+                            name=xmi_structural_reinforcement_obj.get('Name'),
+                            ifcguid=xmi_structural_reinforcement_obj.get('IFCGUID'))
+                    self._add_indexed_entity(
+                        xmi_model, xmi_structural_reinforcement, xmi_dict_key, index, errors,
+                        xmi_dict_obj=xmi_dict_value[index])
+                    xmi_structural_reinforcements.append(
+                        xmi_structural_reinforcement)
+                    reinforcement_rows.append(index)
+
+                except XmiErrorLimitExceededError:
+                    raise
+                except Exception as e:
+                    errors.add(xmi_dict_key, index,
+                               exception=e, obj=xmi_structural_reinforcement_obj)
+
+            with instrumentation.phase(xmi_dict_key, "entity_construction"):
+                xmi_model.reinforcement_table = XmiReinforcementTable.from_reinforcements(
+                    xmi_structural_reinforcements, reinforcement_rows, layer_offsets, layers)
+
+        if xmi_dict_key == "StructuralUnit":
+            # the unit table describes the model and is kept apart from its entities
+            for index, xmi_structural_unit_obj in enumerate(xmi_dict_value or []):
+                try:
+                    unit = xmi_structural_unit_obj.get('Unit')
+                    xmi_model.units.append(XmiStructuralUnit(
+                        entity=xmi_structural_unit_obj.get('Entity'),
+                        attribute=xmi_structural_unit_obj.get('Attribute'),
+                        unit=XmiUnitEnum.from_attribute_get_enum(unit) or unit))
+                except XmiErrorLimitExceededError:
+                    raise
+                except Exception as e:
+                    errors.add(xmi_dict_key, index,
+                               exception=e, obj=xmi_structural_unit_obj)
+
+        if xmi_dict_key in XMI_SUPPORT_SECTIONS:
+            # analysis exports write sections without supports as null
+            self._read_support_section(
+                xmi_model, xmi_dict_key, xmi_dict_value or [], errors)
@@ -0,0 +1,228 @@
+"""
+Physical axes of curve members, from their analytical nodes, SystemLine,
+node offsets, local axes and cross section.
+
+The nodes of a curve member lie on its system line, a point of the section
+outline such as TopMiddle. The physical axis is found by moving the
+offset nodes from the system line to the section centroid. All members
+are processed as (n, 3) arrays, and the dimensions of every distinct cross
+section are read once.
+
+Sections are placed with their depth along LocalAxisZ and their width along
+LocalAxisY. Top is the side of LocalAxisZ pointing up, as exports differ on
+whether LocalAxisZ points up or down. Left is on the left when looking
+along LocalAxisX with Top up.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+
+from .enums.xmi_structural_curve_member_enums import XmiStructuralCurveMemberSystemLineEnum
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_cross_section import XmiStructuralCrossSection
+from .enums.xmi_shape_enums import XmiShapeEnum
+from .geometries.xmi_geometry_kernel import normalize_vectors
+
+# index of the depth and width in the parameters of every shape
+XMI_SHAPE_DIMENSION_PARAMETERS: dict[XmiShapeEnum, tuple[int, int]] = {
+    XmiShapeEnum.RECTANGULAR: (0, 1),
+    XmiShapeEnum.CIRCULAR: (0, 0),
+    XmiShapeEnum.L_SHAPE: (0, 1),
+    XmiShapeEnum.T_SHAPE: (0, 1),
+    XmiShapeEnum.C_SHAPE: (0, 1),
+    XmiShapeEnum.I_SHAPE: (0, 1),
+    XmiShapeEnum.SQUARE_HOLLOW: (0, 0),
+    XmiShapeEnum.RECTANGULAR_HOLLOW: (0, 1),
+}
+
+# position of the system line in the section, up and left, in half depths and half widths
+XMI_SYSTEM_LINE_POSITIONS: dict[XmiStructuralCurveMemberSystemLineEnum, tuple[float, float]] = {
+    system_line: ({"Top": 1.0, "Middle": 0.0, "Bottom": -1.0}[vertical],
+                  {"Left": 1.0, "Middle": 0.0, "Right": -1.0}[horizontal])
+    for system_line in XmiStructuralCurveMemberSystemLineEnum
+    for vertical, horizontal in [re.fullmatch(r"(Top|Middle|Bottom)(Left|Middle|Right)", system_line.value).groups()]
+}
+
+
+def _coordinates(node) -> tuple[float, float, float]:
+    point = node.point if node is not None else None
+    if point is None:
+        return (np.nan, np.nan, np.nan)
+    return (point.x, point.y, point.z)
+
+
+def _axis(axis) -> tuple[float, float, float]:
+    if axis is None or len(axis) != 3:
+        return (np.nan, np.nan, np.nan)
+    return axis
+
+
+def _offsets(values: list) -> np.ndarray:
+    return np.array([value if value is not None else 0.0 for value in values], dtype=np.float64)
+
+
+def section_dimensions(cross_sections: list[XmiStructuralCrossSection]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Depth, width and centroid height of every cross section.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        The depths, widths and the heights of the centroid above the middle
+        of the section. The centroid only leaves the middle for T shapes
+        and for C shapes with unequal flanges, the schema does not give the
+        side of the legs of L shapes nor the side of the web of C shapes.
+        Sections with shape Others or without parameters have zero
+        dimensions.
+    """
+    count = len(cross_sections)
+    parameters = np.full((count, 5), np.nan)
+    dimension_indices = np.zeros((count, 2), dtype=np.intp)
+    known = np.zeros(count, dtype=bool)
+    is_t = np.zeros(count, dtype=bool)
+    is_c = np.zeros(count, dtype=bool)
+    for index, cross_section in enumerate(cross_sections):
+        indices = XMI_SHAPE_DIMENSION_PARAMETERS.get(cross_section.shape)
+        values = cross_section.parameters or ()
+        if indices is None or len(values) <= max(indices):
+            continue
+        parameters[index, :len(values)] = values
+        dimension_indices[index] = indices
+        known[index] = True
+        is_t[index] = cross_section.shape == XmiShapeEnum.T_SHAPE
+        is_c[index] = cross_section.shape == XmiShapeEnum.C_SHAPE
+
+    rows = np.arange(count)
+    depths = np.where(known, parameters[rows, dimension_indices[:, 0]], 0.0)
+    widths = np.where(known, parameters[rows, dimension_indices[:, 1]], 0.0)
+
+    # centroid below the top edge, T: H, B, T, t with the flange on top and C: H, B, T1, T2, t
+    h, b = parameters[:, 0], parameters[:, 1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t_web = (h - parameters[:, 2]) * parameters[:, 3]
+        t_depths = (b * parameters[:, 2] ** 2 / 2.0 + t_web * (parameters[:, 2] + (h - parameters[:, 2]) / 2.0)) \
+            / (b * parameters[:, 2] + t_web)
+        c_web_depths = h - parameters[:, 2] - parameters[:, 3]
+        c_web = c_web_depths * parameters[:, 4]
+        c_depths = (b * parameters[:, 2] ** 2 / 2.0 + c_web * (parameters[:, 2] + c_web_depths / 2.0)
+                    + b * parameters[:, 3] * (h - parameters[:, 3] / 2.0)) \
+            / (b * (parameters[:, 2] + parameters[:, 3]) + c_web)
+    centroid_heights = np.zeros(count)
+    centroid_heights = np.where(is_t, h / 2.0 - t_depths, centroid_heights)
+    centroid_heights = np.where(is_c, h / 2.0 - c_depths, centroid_heights)
+    centroid_heights = np.nan_to_num(centroid_heights, nan=0.0)
+
+    return depths, widths, centroid_heights
+
+
+class XmiMemberAxes():
+    """The physical axes of a list of curve members, one row per member.
+
+    Parameters
+    ----------
+    members : list[XmiStructuralCurveMember]
+        The members, row i holds ``members[i]``.
+    begins, ends : np.ndarray
+        (n, 3) centroids of the section at the begin and end node.
+    ups, lefts : np.ndarray
+        (n, 3) unit vectors along the depth and width of the section, see
+        the module docstring.
+    depths, widths : np.ndarray
+        (n,) dimensions of the section of every member.
+    bounding_boxes : np.ndarray
+        (n, 2, 3) minimum and maximum corner of the box enclosing the
+        rectangle of depth by width swept from begin to end. Curved
+        members are taken straight from node to node.
+    """
+    __slots__ = ('members', 'begins', 'ends', 'ups',
+                 'lefts', 'depths', 'widths', 'bounding_boxes')
+
+    def __init__(self, members: list[XmiStructuralCurveMember], begins: np.ndarray, ends: np.ndarray,
+                 ups: np.ndarray, lefts: np.ndarray, depths: np.ndarray, widths: np.ndarray,
+                 bounding_boxes: np.ndarray):
+        self.members: list[XmiStructuralCurveMember] = members
+        self.begins: np.ndarray = begins
+        self.ends: np.ndarray = ends
+        self.ups: np.ndarray = ups
+        self.lefts: np.ndarray = lefts
+        self.depths: np.ndarray = depths
+        self.widths: np.ndarray = widths
+        self.bounding_boxes: np.ndarray = bounding_boxes
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.linalg.norm(self.ends - self.begins, axis=1)
+
+    @property
+    def directions(self) -> np.ndarray:
+        """Unit vectors from begin to end, NaN for zero length axes."""
+        return normalize_vectors(self.ends - self.begins)
+
+
+def member_axes(members: list[XmiStructuralCurveMember]) -> XmiMemberAxes:
+    """Compute the physical axis and bounding box of every curve member in one batch.
+
+    The nodes are moved by BeginNodeX/Y/ZOffset and EndNodeX/Y/ZOffset,
+    read in global coordinates, then from the system line to the centroid
+    of the section. Members without a system line are placed as
+    MiddleMiddle. Missing nodes or local axes give NaN rows.
+    """
+    count = len(members)
+    node_points = np.array([(_coordinates(member.begin_node), _coordinates(member.end_node))
+                            for member in members], dtype=np.float64).reshape(count, 2, 3)
+    node_points[:, 0] += np.stack([_offsets([member.begin_node_x_offset for member in members]),
+                                   _offsets([member.begin_node_y_offset for member in members]),
+                                   _offsets([member.begin_node_z_offset for member in members])], axis=1)
+    node_points[:, 1] += np.stack([_offsets([member.end_node_x_offset for member in members]),
+                                   _offsets([member.end_node_y_offset for member in members]),
+                                   _offsets([member.end_node_z_offset for member in members])], axis=1)
+
+    local_x = normalize_vectors(np.array([_axis(member.local_axis_x) for member in members],
+                                     dtype=np.float64).reshape(count, 3))
+    local_z = normalize_vectors(np.array([_axis(member.local_axis_z) for member in members],
+                                     dtype=np.float64).reshape(count, 3))
+    ups = np.where(local_z[:, 2:3] < 0.0, -local_z, local_z)
+    lefts = np.cross(ups, local_x)
+
+    # the dimensions of each distinct cross section are computed once
+    section_rows: dict[int, int] = {}
+    cross_sections: list[XmiStructuralCrossSection] = []
+    member_sections = np.full(count, -1, dtype=np.intp)
+    for index, member in enumerate(members):
+        cross_section = member.cross_section
+        if cross_section is None:
+            continue
+        row = section_rows.get(id(cross_section))
+        if row is None:
+            row = section_rows[id(cross_section)] = len(cross_sections)
+            cross_sections.append(cross_section)
+        member_sections[index] = row
+    section_depths, section_widths, section_centroid_heights = section_dimensions(cross_sections)
+    has_section = member_sections >= 0
+    depths = np.where(has_section, np.append(section_depths, 0.0)[member_sections], 0.0)
+    widths = np.where(has_section, np.append(section_widths, 0.0)[member_sections], 0.0)
+    centroid_heights = np.where(has_section, np.append(
+        section_centroid_heights, 0.0)[member_sections], 0.0)
+
+    positions = np.array([XMI_SYSTEM_LINE_POSITIONS.get(member.system_line, (0.0, 0.0)) for member in members],
+                         dtype=np.float64).reshape(count, 2)
+    vertical, horizontal = positions[:, 0], positions[:, 1]
+
+    # from the system line to the middle of the section, then up to the centroid
+    shifts = ups * (centroid_heights - vertical * depths / 2.0)[:, None] \
+        - lefts * (horizontal * widths / 2.0)[:, None]
+    middles = node_points + shifts[:, None, :]
+    begins, ends = middles[:, 0], middles[:, 1]
+
+    half_extents = np.abs(ups) * (depths / 2.0)[:, None] + np.abs(lefts) * (widths / 2.0)[:, None]
+    middle_begins, middle_ends = begins - ups * centroid_heights[:, None], ends - ups * centroid_heights[:, None]
+    bounding_boxes = np.stack([np.minimum(middle_begins, middle_ends) - half_extents,
+                               np.maximum(middle_begins, middle_ends) + half_extents], axis=1)
+
+    return XmiMemberAxes(members, begins, ends, ups, lefts, depths, widths, bounding_boxes)
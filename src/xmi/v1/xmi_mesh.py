@@ -0,0 +1,430 @@
+"""
+Indexed triangle meshes of the solids of a model, for visual checks.
+
+Curve members are their section profile swept along the physical axis
+computed by member_axes, and surface members are their outline extruded
+by their thickness. Every distinct cross section gets one profile with a
+triangle template. All members sharing a profile and a number of path
+vertices are then built in one batch, by broadcasting the profile over
+their paths and offsetting the template. The mesh is written to binary STL
+or binary glTF straight from its arrays.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import json
+import struct
+
+import numpy as np
+
+from .xmi_base import XmiBaseEntity
+from .xmi_member_axis import member_axes, section_dimensions
+from .enums.xmi_shape_enums import XmiShapeEnum
+from .enums.xmi_structural_surface_member_enums import XmiStructuralSurfaceMemberSystemPlaneEnum
+from .geometries.xmi_arc_3d import XmiArc3D
+from .geometries import xmi_geometry_kernel
+from .entities.xmi_structural_cross_section import XmiStructuralCrossSection
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+from .xmi_surface_mesh import polygon_normals, convex_polygons, triangulate_polygon, fan_triangles
+
+XMI_MESH_CIRCLE_SEGMENTS = 16
+
+# extent of a surface member through its thickness, in thicknesses along the upward normal
+XMI_SYSTEM_PLANE_EXTENTS: dict[XmiStructuralSurfaceMemberSystemPlaneEnum, tuple[float, float]] = {
+    XmiStructuralSurfaceMemberSystemPlaneEnum.TOP: (-1.0, 0.0),
+    XmiStructuralSurfaceMemberSystemPlaneEnum.MIDDLE: (-0.5, 0.5),
+    XmiStructuralSurfaceMemberSystemPlaneEnum.BOTTOM: (0.0, 1.0),
+    XmiStructuralSurfaceMemberSystemPlaneEnum.LEFT: (-1.0, 0.0),
+    XmiStructuralSurfaceMemberSystemPlaneEnum.RIGHT: (0.0, 1.0),
+}
+
+# Z up to the Y up of glTF, column major
+GLTF_Z_UP_MATRIX = (1.0, 0.0, 0.0, 0.0,
+                    0.0, 0.0, -1.0, 0.0,
+                    0.0, 1.0, 0.0, 0.0,
+                    0.0, 0.0, 0.0, 1.0)
+GLTF_ARRAY_BUFFER = 34962
+GLTF_ELEMENT_ARRAY_BUFFER = 34963
+GLTF_FLOAT = 5126
+GLTF_UNSIGNED_INT = 5125
+
+STL_TRIANGLE_DTYPE = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)),
+                               ('attribute', '<u2')])
+
+
+class XmiSectionProfile():
+    """The outline of a cross section with the triangles of its end caps.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        (m, 2) vertices, across the width (positive to the left) and the
+        depth (positive up) from the middle of the section.
+    edges : np.ndarray
+        (e, 2) indices of the outline edges, outer loops counterclockwise
+        and holes clockwise.
+    caps : np.ndarray
+        (c, 3) counterclockwise triangles covering the section.
+    """
+    __slots__ = ('vertices', 'edges', 'caps')
+
+    def __init__(self, vertices: np.ndarray, edges: np.ndarray, caps: np.ndarray):
+        self.vertices: np.ndarray = vertices
+        self.edges: np.ndarray = edges
+        self.caps: np.ndarray = caps
+
+
+def _loop_edges(start: int, count: int) -> list[tuple[int, int]]:
+    return [(start + index, start + (index + 1) % count) for index in range(count)]
+
+
+def _polygon_profile(vertices: list[tuple[float, float]], parts: list[list[int]]) -> XmiSectionProfile:
+    # every part is convex and fanned from its first vertex
+    caps = [(part[0], part[index], part[index + 1])
+            for part in parts for index in range(1, len(part) - 1)]
+    return XmiSectionProfile(np.array(vertices, dtype=np.float64), np.array(_loop_edges(0, len(vertices))),
+                             np.array(caps, dtype=np.intp))
+
+
+def _hollow_profile(depth: float, width: float, thickness: float) -> XmiSectionProfile:
+    h, w = depth / 2.0, width / 2.0
+    hi, wi = h - thickness, w - thickness
+    outer = [(-w, -h), (w, -h), (w, h), (-w, h)]
+    inner = [(-wi, -hi), (wi, -hi), (wi, hi), (-wi, hi)]
+    # the hole is stored clockwise, inner[k] at index 4 + (4 - k) % 4
+    vertices = outer + [inner[0], inner[3], inner[2], inner[1]]
+    inner_indices = [4, 7, 6, 5]
+    caps = []
+    for k in range(4):
+        caps += [(k, (k + 1) % 4, inner_indices[(k + 1) % 4]),
+                 (k, inner_indices[(k + 1) % 4], inner_indices[k])]
+    return XmiSectionProfile(np.array(vertices, dtype=np.float64),
+                             np.array(_loop_edges(0, 4) + _loop_edges(4, 4)), np.array(caps, dtype=np.intp))
+
+
+def section_profile(cross_section: XmiStructuralCrossSection,
+                    circle_segments: int = XMI_MESH_CIRCLE_SEGMENTS) -> XmiSectionProfile | None:
+    """The profile of a cross section, None for Others or missing parameters.
+
+    The parameters follow the XmiShape classes. The flanges of I and T
+    shapes are the ``T`` parameter and their webs ``t``. L shapes have
+    their horizontal leg, of thickness ``T``, at the bottom and their
+    vertical leg, of thickness ``t``, on the left. C shapes have their web
+    on the left and open to the right. The root radius of I shapes is not
+    modelled.
+    """
+    shape, parameters = cross_section.shape, cross_section.parameters or ()
+    try:
+        if shape == XmiShapeEnum.RECTANGULAR:
+            h, w = parameters[0] / 2.0, parameters[1] / 2.0
+            return _polygon_profile([(-w, -h), (w, -h), (w, h), (-w, h)], [[0, 1, 2, 3]])
+        if shape == XmiShapeEnum.CIRCULAR:
+            angles = np.linspace(0.0, 2.0 * np.pi, circle_segments, endpoint=False)
+            vertices = np.stack([np.cos(angles), np.sin(angles)], axis=1) * parameters[0] / 2.0
+            return _polygon_profile(vertices.tolist(), [list(range(circle_segments))])
+        if shape == XmiShapeEnum.I_SHAPE:
+            d, b, flange, web = parameters[:4]
+            h, w, tw = d / 2.0, b / 2.0, web / 2.0
+            return _polygon_profile(
+                [(-w, -h), (w, -h), (w, -h + flange), (tw, -h + flange), (tw, h - flange), (w, h - flange),
+                 (w, h), (-w, h), (-w, h - flange), (-tw, h - flange), (-tw, -h + flange), (-w, -h + flange)],
+                [[0, 1, 2, 3, 10, 11], [10, 3, 4, 9], [6, 7, 8, 9, 4, 5]])
+        if shape == XmiShapeEnum.T_SHAPE:
+            d, b, flange, web = parameters[:4]
+            h, w, tw = d / 2.0, b / 2.0, web / 2.0
+            return _polygon_profile(
+                [(-tw, -h), (tw, -h), (tw, h - flange), (w, h - flange),
+                 (w, h), (-w, h), (-w, h - flange), (-tw, h - flange)],
+                [[0, 1, 2, 7], [4, 5, 6, 7, 2, 3]])
+        if shape == XmiShapeEnum.L_SHAPE:
+            d, b, flange, web = parameters[:4]
+            h, w = d / 2.0, b / 2.0
+            return _polygon_profile(
+                [(-w, -h), (w, -h), (w, -h + flange), (-w + web, -h + flange), (-w + web, h), (-w, h)],
+                [[0, 1, 2, 3], [0, 3, 4, 5]])
+        if shape == XmiShapeEnum.C_SHAPE:
+            d, b, top_flange, bottom_flange, web = parameters[:5]
+            h, w = d / 2.0, b / 2.0
+            return _polygon_profile(
+                [(-w, -h), (w, -h), (w, -h + bottom_flange), (-w + web, -h + bottom_flange),
+                 (-w + web, h - top_flange), (w, h - top_flange), (w, h), (-w, h)],
+                [[0, 1, 2, 3], [0, 3, 4, 7], [7, 4, 5, 6]])
+        if shape == XmiShapeEnum.SQUARE_HOLLOW:
+            return _hollow_profile(parameters[0], parameters[0], parameters[1])
+        if shape == XmiShapeEnum.RECTANGULAR_HOLLOW:
+            return _hollow_profile(parameters[0], parameters[1], parameters[2])
+    except (IndexError, ValueError):
+        return None
+    return None
+
+
+def sweep_template(profile: XmiSectionProfile, path_count: int) -> np.ndarray:
+    """Triangles of a profile swept through ``path_count`` rings, indices into the (path_count * m) ring vertices."""
+    vertex_count = len(profile.vertices)
+    rings = np.arange(path_count - 1)[:, None, None] * vertex_count
+    a, b = profile.edges[:, 0], profile.edges[:, 1]
+    sides = np.concatenate([
+        np.stack([a, b, b + vertex_count], axis=1)[None] + rings,
+        np.stack([a, b + vertex_count, a + vertex_count], axis=1)[None] + rings], axis=1).reshape(-1, 3)
+    # the begin cap faces back along the path
+    return np.concatenate([profile.caps[:, ::-1], sides,
+                           profile.caps + (path_count - 1) * vertex_count]).astype(np.intp)
+
+
+def _sweep(paths: np.ndarray, ups: np.ndarray, fallback_lefts: np.ndarray, centroid_heights: np.ndarray,
+           profile: XmiSectionProfile, vertex_offset: int) -> tuple[np.ndarray, np.ndarray]:
+    """Vertices and triangles of a profile swept along (g, k, 3) paths of centroids."""
+    count, path_count, _ = paths.shape
+    tangents = np.empty_like(paths)
+    tangents[:, 1:-1] = paths[:, 2:] - paths[:, :-2]
+    tangents[:, 0] = paths[:, 1] - paths[:, 0]
+    tangents[:, -1] = paths[:, -1] - paths[:, -2]
+    tangents = xmi_geometry_kernel.normalize_vectors(tangents)
+    lefts = xmi_geometry_kernel.normalize_vectors(np.cross(ups[:, None, :], tangents))
+    lefts = np.where(np.isnan(lefts), fallback_lefts[:, None, :], lefts)
+    frame_ups = np.cross(tangents, lefts)
+
+    across, up = profile.vertices[:, 0], profile.vertices[:, 1]
+    vertices = paths[:, :, None, :] + lefts[:, :, None, :] * across[:, None] \
+        + frame_ups[:, :, None, :] * (up[None, None, :, None] - centroid_heights[:, None, None, None])
+    ring_vertex_count = path_count * len(across)
+    template = sweep_template(profile, path_count)
+    triangles = template[None] + (vertex_offset + np.arange(count) * ring_vertex_count)[:, None, None]
+    return vertices.reshape(-1, 3), triangles.reshape(-1, 3)
+
+
+class XmiMesh():
+    """An indexed triangle mesh of entities.
+
+    Parameters
+    ----------
+    entities : list[XmiBaseEntity]
+        The entities meshed.
+    vertices : np.ndarray
+        (v, 3) vertex coordinates, in model units.
+    triangles : np.ndarray
+        (t, 3) vertex indices of every triangle, counterclockwise seen from
+        outside the solid.
+    triangle_entities : np.ndarray
+        (t,) index in ``entities`` of the entity of every triangle.
+    """
+    __slots__ = ('entities', 'vertices', 'triangles', 'triangle_entities')
+
+    def __init__(self, entities: list[XmiBaseEntity], vertices: np.ndarray, triangles: np.ndarray,
+                 triangle_entities: np.ndarray):
+        self.entities: list[XmiBaseEntity] = entities
+        self.vertices: np.ndarray = vertices
+        self.triangles: np.ndarray = triangles
+        self.triangle_entities: np.ndarray = triangle_entities
+
+    def __len__(self) -> int:
+        return len(self.triangles)
+
+    @property
+    def triangle_normals(self) -> np.ndarray:
+        """(t, 3) unit normals, NaN for degenerate triangles."""
+        corners = self.vertices[self.triangles]
+        return xmi_geometry_kernel.normalize_vectors(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]))
+
+    def write_stl(self, file_path: str, scale: float = 1.0):
+        """Write the mesh as binary STL, with coordinates multiplied by ``scale``."""
+        records = np.zeros(len(self.triangles), dtype=STL_TRIANGLE_DTYPE)
+        records['normal'] = np.nan_to_num(self.triangle_normals)
+        records['vertices'] = self.vertices[self.triangles] * scale
+        with open(file_path, 'wb') as f:
+            f.write(b"xmi mesh".ljust(80, b" "))
+            f.write(struct.pack('<I', len(records)))
+            f.write(records.tobytes())
+
+    def write_glb(self, file_path: str, scale: float = 1.0):
+        """Write the mesh as binary glTF 2.0, with coordinates multiplied by ``scale``.
+
+        The model Z axis becomes the glTF Y axis. glTF is in metres, so
+        models in millimetres are written with ``scale=0.001``.
+        """
+        positions = (self.vertices * scale).astype('<f4')
+        indices = self.triangles.astype('<u4')
+        positions_bytes = positions.tobytes()
+        indices_bytes = indices.tobytes()
+        gltf = {
+            "asset": {"version": "2.0", "generator": "xmi"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [{"mesh": 0, "matrix": list(GLTF_Z_UP_MATRIX)}],
+            "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1, "mode": 4}]}],
+            "buffers": [{"byteLength": len(positions_bytes) + len(indices_bytes)}],
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": len(positions_bytes),
+                 "target": GLTF_ARRAY_BUFFER},
+                {"buffer": 0, "byteOffset": len(positions_bytes), "byteLength": len(indices_bytes),
+                 "target": GLTF_ELEMENT_ARRAY_BUFFER},
+            ],
+            "accessors": [
+                {"bufferView": 0, "componentType": GLTF_FLOAT, "count": len(positions), "type": "VEC3",
+                 "min": positions.min(axis=0).tolist() if len(positions) else [0.0] * 3,
+                 "max": positions.max(axis=0).tolist() if len(positions) else [0.0] * 3},
+                {"bufferView": 1, "componentType": GLTF_UNSIGNED_INT, "count": indices.size, "type": "SCALAR"},
+            ],
+        }
+        json_bytes = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
+        json_bytes += b" " * (-len(json_bytes) % 4)
+        binary_bytes = positions_bytes + indices_bytes
+        binary_bytes += b"\0" * (-len(binary_bytes) % 4)
+        with open(file_path, 'wb') as f:
+            f.write(struct.pack('<4sII', b"glTF", 2, 12 + 8 + len(json_bytes) + 8 + len(binary_bytes)))
+            f.write(struct.pack('<I4s', len(json_bytes), b"JSON"))
+            f.write(json_bytes)
+            f.write(struct.pack('<I4s', len(binary_bytes), b"BIN\0"))
+            f.write(binary_bytes)
+
+
+def _member_paths(members: list[XmiStructuralCurveMember], begins: np.ndarray, ends: np.ndarray,
+                  chord_tolerance: float) -> list[np.ndarray]:
+    """Centroid paths of the members, straight unless a segment is an arc."""
+    paths = [None] * len(members)
+    curved = [index for index, member in enumerate(members)
+              if any(isinstance(segment.geometry, XmiArc3D) for segment in member.segments or [])]
+    arcs = [segment.geometry for index in curved for segment in members[index].segments
+            if isinstance(segment.geometry, XmiArc3D)]
+    tessellations = xmi_geometry_kernel.arc_tessellations_by_tolerance(
+        *xmi_geometry_kernel.arcs_to_arrays(arcs), chord_tolerance,
+        xmi_geometry_kernel.arcs_to_normals(arcs)) if arcs else None
+
+    arc_index = 0
+    for index in curved:
+        vertices = []
+        for segment in members[index].segments:
+            geometry = segment.geometry
+            if isinstance(geometry, XmiArc3D):
+                vertices.extend(tessellations[arc_index][:-1])
+                arc_index += 1
+            else:
+                vertices.append(xmi_geometry_kernel.points_to_array([geometry.start_point])[0])
+        vertices.append(xmi_geometry_kernel.points_to_array([members[index].segments[-1].geometry.end_point])[0])
+        vertices = np.array(vertices)
+        # the offsets and system line shift are blended from the begin to the end
+        lengths = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(vertices, axis=0), axis=1))])
+        parameters = lengths / lengths[-1] if lengths[-1] > 0 else np.linspace(0.0, 1.0, len(vertices))
+        begin_shift, end_shift = begins[index] - vertices[0], ends[index] - vertices[-1]
+        paths[index] = vertices + begin_shift + parameters[:, None] * (end_shift - begin_shift)
+
+    for index, path in enumerate(paths):
+        if path is None:
+            paths[index] = np.stack([begins[index], ends[index]])
+    return paths
+
+
+def _surface_member_solids(surface_members: list[XmiStructuralSurfaceMember], entity_offset: int,
+                           vertex_offset: int) -> tuple[list[np.ndarray], list[np.ndarray], list[np.ndarray]]:
+    vertex_batches, triangle_batches, entity_batches = [], [], []
+    outlines: dict[int, list[int]] = {}
+    for index, surface_member in enumerate(surface_members):
+        nodes = surface_member.nodes or []
+        if len(nodes) >= 3 and all(node is not None and node.point is not None for node in nodes) \
+                and surface_member.thickness:
+            outlines.setdefault(len(nodes), []).append(index)
+
+    for node_count, indices in outlines.items():
+        members = [surface_members[index] for index in indices]
+        points = np.array([[(node.point.x, node.point.y, node.point.z) for node in member.nodes]
+                           for member in members], dtype=np.float64)
+        # Newell normals orient the outlines, the local Z axes pointed up give the thickness direction
+        newell = polygon_normals(points)
+        valid = ~np.isnan(newell).any(axis=1)
+        members = [member for member, is_valid in zip(members, valid) if is_valid]
+        points, newell, indices = points[valid], newell[valid], np.array(indices)[valid]
+        local_z = xmi_geometry_kernel.normalize_vectors(np.array([member.local_axis_z if member.local_axis_z is not None
+                                                           and len(member.local_axis_z) == 3 else (np.nan,) * 3
+                                                           for member in members], dtype=np.float64))
+        normals = np.where(np.isnan(local_z), newell, local_z)
+        normals = np.where(normals[:, 2:3] < 0.0, -normals, normals)
+        reversed_outlines = np.einsum('ij,ij->i', newell, normals) < 0.0
+        points[reversed_outlines] = points[reversed_outlines, ::-1]
+
+        extents = np.array([XMI_SYSTEM_PLANE_EXTENTS.get(member.system_plane, (-0.5, 0.5)) for member in members])
+        thicknesses = np.array([member.thickness for member in members], dtype=np.float64)
+        z_offsets = np.array([member.z_offset or 0.0 for member in members], dtype=np.float64)
+        levels = extents * thicknesses[:, None] + z_offsets[:, None]
+        rings = points[:, None, :, :] + normals[:, None, None, :] * levels[:, :, None, None]
+
+        # convex outlines share a fanned cap, concave ones are ear clipped
+        caps = np.repeat(fan_triangles(node_count)[None], len(members), axis=0)
+        for position in np.flatnonzero(~convex_polygons(points, normals)):
+            caps[position] = triangulate_polygon(points[position])
+        sides = sweep_template(XmiSectionProfile(np.zeros((node_count, 2)), np.array(_loop_edges(0, node_count)),
+                                                 np.zeros((0, 3), dtype=np.intp)), 2)
+        templates = np.concatenate([caps[:, :, ::-1], np.repeat(sides[None], len(members), axis=0),
+                                    caps + node_count], axis=1)
+        triangles = templates + (vertex_offset + np.arange(len(members)) * 2 * node_count)[:, None, None]
+        vertex_offset += len(members) * 2 * node_count
+
+        vertex_batches.append(rings.reshape(-1, 3))
+        triangle_batches.append(triangles.reshape(-1, 3))
+        entity_batches.append(np.repeat(indices + entity_offset, templates.shape[1]))
+    return vertex_batches, triangle_batches, entity_batches
+
+
+def mesh_xmi_entities(entities: list[XmiBaseEntity], circle_segments: int = XMI_MESH_CIRCLE_SEGMENTS,
+                      chord_tolerance: float = 10.0) -> XmiMesh:
+    """Mesh the curve and surface members of ``entities`` as closed solids.
+
+    Curve members are swept along their physical axes, with arcs
+    tessellated within ``chord_tolerance`` model units and circular
+    sections with ``circle_segments`` sides. Members whose section has no
+    profile, such as Others, are left out. Surface members are their
+    outline, taken straight between nodes, extruded by their thickness from
+    their system plane, on the upward side of LocalAxisZ. Their caps are
+    triangulated by triangulate_polygon when concave.
+
+    Returns
+    -------
+    XmiMesh
+        The mesh of the meshed entities, curve members first.
+    """
+    curve_members = [entity for entity in entities if isinstance(entity, XmiStructuralCurveMember)]
+    surface_members = [entity for entity in entities if isinstance(entity, XmiStructuralSurfaceMember)]
+    axes = member_axes(curve_members)
+    paths = _member_paths(curve_members, axes.begins, axes.ends, chord_tolerance)
+
+    # one profile per distinct shape and parameters
+    profile_keys: dict[tuple, int] = {}
+    profiles: list[XmiSectionProfile | None] = []
+    profile_sections: list[XmiStructuralCrossSection] = []
+    batches: dict[tuple[int, int], list[int]] = {}
+    for index, member in enumerate(curve_members):
+        cross_section = member.cross_section
+        if cross_section is None:
+            continue
+        key = (cross_section.shape, cross_section.parameters)
+        profile_index = profile_keys.get(key)
+        if profile_index is None:
+            profile_index = profile_keys[key] = len(profiles)
+            profiles.append(section_profile(cross_section, circle_segments=circle_segments))
+            profile_sections.append(cross_section)
+        if profiles[profile_index] is not None and not np.isnan(paths[index]).any():
+            batches.setdefault((profile_index, len(paths[index])), []).append(index)
+    _, _, centroid_heights = section_dimensions(profile_sections)
+
+    vertex_batches, triangle_batches, entity_batches = [], [], []
+    vertex_offset = 0
+    for (profile_index, _), indices in batches.items():
+        profile = profiles[profile_index]
+        vertices, triangles = _sweep(np.stack([paths[index] for index in indices]), axes.ups[indices],
+                                     axes.lefts[indices], np.full(len(indices), centroid_heights[profile_index]),
+                                     profile, vertex_offset)
+        vertex_offset += len(vertices)
+        vertex_batches.append(vertices)
+        triangle_batches.append(triangles)
+        entity_batches.append(np.repeat(indices, len(triangles) // len(indices)))
+
+    surface_batches = _surface_member_solids(surface_members, len(curve_members), vertex_offset)
+    vertex_batches += surface_batches[0]
+    triangle_batches += surface_batches[1]
+    entity_batches += surface_batches[2]
+
+    return XmiMesh(curve_members + surface_members,
+                   np.concatenate(vertex_batches) if vertex_batches else np.zeros((0, 3)),
+                   np.concatenate(triangle_batches) if triangle_batches else np.zeros((0, 3), dtype=np.intp),
+                   np.concatenate(entity_batches) if entity_batches else np.zeros(0, dtype=np.intp))
@@ -1,15 +1,106 @@
 # Optional, for forward declarations in Python 3.7+
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, TextIO
+
 from .xmi_base import XmiBaseEntity, XmiBaseRelationship
+from .xmi_entity_index import XmiEntityIndex
+from .entities.xmi_structural_storey import XmiStructuralStorey
+from .relationships.xmi_has_structural_storey import XmiHasStructuralStorey
+from .xmi_header import header_application_keys
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+from .entities.xmi_structural_unit import XmiStructuralUnit
+from .enums.xmi_enums import XmiUnitEnum
+from .geometries.xmi_arc_3d import XmiArc3D
+
+# the analysis modules are imported by the methods using them, which keeps importing the model cheap
+if TYPE_CHECKING:
+    from .xmi_storey_index import XmiStoreyIndex
+    from .xmi_storey_assignment import XmiStoreyAssignment
+    from .xmi_support_table import XmiSupportTable
+    from .xmi_member_axis import XmiMemberAxes
+    from .xmi_mesh import XmiMesh
+    from .xmi_surface_mesh import XmiSurfaceMesh
+    from .xmi_transform import XmiTransformation
+    from .xmi_units import XmiUnitConversion
+    from .xmi_reinforcement import XmiReinforcementTable, XmiRebarTakeoff
+    from .xmi_diff import XmiDiffRecord
+    from .xmi_geometry_matching import XmiGeometryMatch
+    from .xmi_string_parsing import XmiRaggedArray
 
 
 class ErrorLog():
-    def __init__(self, entity_type: str, index: int, message: str, obj: str = None):
+    """An error found while reading one object of an XMI section.
+
+    The exception and the offending object are kept by reference, the text is
+    only rendered when ``message`` or ``obj`` is read.
+
+    Parameters
+    ----------
+    entity_type : str
+        The XMI section the object belongs to, e.g. "StructuralCurveMember".
+    index : int
+        Index of the object within its section.
+    message : str, optional
+        Text of the error, by default rendered from ``exception``.
+    obj : optional
+        The offending object, by default None.
+    exception : Exception, optional
+        The exception raised or reported for the object, by default None.
+    error_code : str, optional
+        By default the error_code of an XmiError, else the exception class name.
+    severity : str, optional
+        "error", or "warning" for an object that was read with a fallback.
+        By default "error".
+    """
+    __slots__ = ('entity_type', 'index', 'exception',
+                 '_message', '_obj', '_error_code', 'severity')
+
+    def __init__(self, entity_type: str, index: int, message: str = None, obj=None,
+                 exception: Exception = None, error_code: str = None, severity: str = "error"):
         self.entity_type: str = entity_type
         self.index: int = index
-        self.message: str = message
-        self.obj: str = str(obj)
+        self.exception: Exception | None = exception
+        self._message: str | None = message
+        self._obj = obj
+        self._error_code: str | None = error_code
+        self.severity: str = severity
+
+    @property
+    def section(self) -> str:
+        return self.entity_type
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            return str(self.exception)
+        return self._message
+
+    @property
+    def obj(self) -> str:
+        return str(self._obj)
+
+    @property
+    def error_code(self) -> str | None:
+        if self._error_code is not None:
+            return self._error_code
+        if self.exception is None:
+            return None
+        return getattr(self.exception, 'error_code', None) or type(self.exception).__name__
+
+    def to_dict(self, include_obj: bool = False) -> dict:
+        error_dict = {'section': self.entity_type,
+                      'index': self.index,
+                      'error_code': self.error_code,
+                      'severity': self.severity,
+                      'message': self.message}
+        if include_obj:
+            error_dict['obj'] = self._obj
+        return error_dict
+
+    def __str__(self) -> str:
+        return f"{self.entity_type}[{self.index}]: {self.message}"
 
 
 class XmiModel():
@@ -24,6 +115,28 @@ class XmiModel():
         self.relationships: list[XmiBaseRelationship] = []
         self.histories = []
         self.errors: list[ErrorLog] = []
+        # number of errors found while reading, including those beyond the max_errors kept in errors
+        self.error_count: int = 0
+        # number of warnings in errors, which max_errors does not limit
+        self.warning_count: int = 0
+        # hashed name and ID lookup of the entities read from the XMI sections
+        self.entity_index: XmiEntityIndex = XmiEntityIndex()
+        # storeys by elevation and the entities on each, built by the manager or on first use
+        self.storey_index: XmiStoreyIndex | None = None
+        # locations of the StructuralReinforcement section, one row each
+        self.reinforcement_table: XmiReinforcementTable | None = None
+        # fixities and stiffnesses of the point, line and area supports, one row each
+        self.support_table: XmiSupportTable | None = None
+        # the StructuralUnit table, which describes the values rather than being entities
+        self.units: list[XmiStructuralUnit] = []
+        # the StructuralModel object of the export, e.g. its GlobalReferenceCoordinate
+        self.header: dict | None = None
+        # index of every entity read from an XMI section within that section
+        self.section_indices: dict[XmiBaseEntity, int] = {}
+        # keys of the XMI objects the entities do not model, written back as they were read
+        self.unmodelled_fields: dict[XmiBaseEntity, dict] = {}
+        # sections of the export that are not read into entities, e.g. the load cases and results
+        self.unmodelled_sections: dict[str, list | None] = {}
         self.name = name
         self.xmi_version = xmi_version
         self.application_name = application_name
@@ -94,3 +207,375 @@ class XmiModel():
 
     def find_relationships_by_source(self, source: XmiBaseEntity) -> list[XmiBaseRelationship]:
         return [rel for rel in self.relationships if rel.source == source]
+
+    def header_xmi_dict_obj(self) -> dict | None:
+        """The StructuralModel object of the model, ``header`` updated with the name, version and application.
+
+        None for a model without a header or a name.
+        """
+        if self.header is None and self.name is None:
+            return None
+        header = dict(self.header or {})
+        application_key, application_version_key = header_application_keys(header)
+        header.update({"Name": self.name,
+                       "ISSVersion": self.xmi_version,
+                       application_key: self.application_name,
+                       application_version_key: self.application_version})
+        return header
+
+    def to_xmi_dict(self) -> dict[str, list[dict]]:
+        """Return the entities as an XMI dictionary, keyed by PascalCase section.
+
+        The unmodelled keys and sections read from the export are included
+        unchanged.
+        """
+        from .xmi_writer import iter_xmi_sections
+        return {section: list(xmi_dict_objs) for section, xmi_dict_objs
+                in iter_xmi_sections(self.entities + self.units, header=self.header_xmi_dict_obj(),
+                                     unmodelled=self.unmodelled_fields, sections=self.unmodelled_sections)}
+
+    def write_xmi_file(self, file: str | TextIO, indent: int | None = None):
+        """Write the entities to an XMI JSON file, one object at a time.
+
+        Unlike ``json.dump(self.to_xmi_dict(), f)`` the whole dictionary is
+        never built, so large models are written with flat memory use.
+
+        Parameters
+        ----------
+        file : str | TextIO
+            Path of the file, or an open text file the JSON is written to.
+        indent : int | None, optional
+            Indentation of the sections, by default None which writes one line.
+        """
+        if hasattr(file, 'write'):
+            self._write_xmi_sections(file, indent)
+            return
+        with open(file, 'w') as f:
+            self._write_xmi_sections(f, indent)
+
+    def _write_xmi_sections(self, file: TextIO, indent: int | None):
+        from .xmi_writer import write_xmi_sections
+        write_xmi_sections(self.entities + self.units, file, indent=indent,
+                           header=self.header_xmi_dict_obj(), unmodelled=self.unmodelled_fields,
+                           sections=self.unmodelled_sections)
+
+    def diff(self, other: XmiModel, key: str = "id", tolerances: dict[str, float] | None = None,
+             default_tolerance: float | None = None, geometry_tolerance: float = 1.0,
+             processes: int | None = None) -> list[XmiDiffRecord]:
+        """Compare the entities read from the XMI sections with those of ``other``.
+
+        Parameters
+        ----------
+        other : XmiModel
+            The model compared against, its entities are reported as added.
+        key : str, optional
+            Match entities of the same type on their "id", "name" or
+            "geometry". Geometry matches point connections on their
+            coordinates and members on the coordinates of their nodes, both
+            quantized to ``geometry_tolerance``; materials and cross sections
+            fall back to their name. By default "id".
+        tolerances : dict[str, float] | None, optional
+            Absolute tolerance per numeric XMI field, e.g. {"Z": 1.0}.
+        default_tolerance : float | None, optional
+            Absolute tolerance of the numeric fields not in ``tolerances``,
+            by default DEFAULT_DIFF_TOLERANCE.
+        geometry_tolerance : float, optional
+            Grid size coordinates are quantized to for ``key="geometry"``,
+            by default 1.0.
+        processes : int | None, optional
+            Compare the entity types in that many worker processes. By
+            default None, which compares them in the calling process.
+
+        Returns
+        -------
+        list[XmiDiffRecord]
+            The removed, modified and added entities, per section.
+        """
+        from .xmi_diff import diff_xmi_entities, DEFAULT_DIFF_TOLERANCE
+
+        if default_tolerance is None:
+            default_tolerance = DEFAULT_DIFF_TOLERANCE
+        return diff_xmi_entities(self.entities, other.entities, key=key, tolerances=tolerances,
+                                 default_tolerance=default_tolerance, geometry_tolerance=geometry_tolerance,
+                                 processes=processes)
+
+    def match_geometry(self, other: XmiModel, tolerance: float = 1.0,
+                       min_confidence: float = 0.0) -> list[XmiGeometryMatch]:
+        """Pair the curve and surface members of this model with those of ``other`` by position.
+
+        Curve members match when both end nodes, in either direction, are
+        within ``tolerance`` of each other; surface members when every node
+        of each outline is within ``tolerance`` of a node of the other.
+        Every member is paired at most once, closest pairs first.
+
+        Parameters
+        ----------
+        other : XmiModel
+            The model compared against, e.g. the analysis export of a BIM model.
+        tolerance : float, optional
+            Largest node distance of a match, in model units, by default 1.0.
+        min_confidence : float, optional
+            Drop matches with a lower confidence, by default 0.0.
+
+        Returns
+        -------
+        list[XmiGeometryMatch]
+            The matched pairs with their distance and confidence, curve
+            members first, in the order of this model.
+        """
+        from .xmi_geometry_matching import match_xmi_geometry
+
+        return match_xmi_geometry(self.entities, other.entities, tolerance=tolerance,
+                                  min_confidence=min_confidence)
+
+    def member_axes(self) -> XmiMemberAxes:
+        """Compute the physical axis and bounding box of every curve member in one batch.
+
+        See member_axes for how the system line, offsets and cross section
+        place the section. Rows follow the order of the members in entities.
+        """
+        from .xmi_member_axis import member_axes
+
+        return member_axes([entity for entity in self.entities if isinstance(entity, XmiStructuralCurveMember)])
+
+    def mesh(self, circle_segments: int | None = None, chord_tolerance: float = 10.0) -> XmiMesh:
+        """Mesh the curve and surface members of the model as closed solids, see mesh_xmi_entities.
+
+        The returned XmiMesh writes itself with write_stl or write_glb.
+        ``circle_segments`` is by default XMI_MESH_CIRCLE_SEGMENTS.
+        """
+        from .xmi_mesh import mesh_xmi_entities, XMI_MESH_CIRCLE_SEGMENTS
+
+        if circle_segments is None:
+            circle_segments = XMI_MESH_CIRCLE_SEGMENTS
+        return mesh_xmi_entities(self.entities, circle_segments=circle_segments,
+                                 chord_tolerance=chord_tolerance)
+
+    def surface_mesh(self, element_size: float | None = None) -> XmiSurfaceMesh:
+        """Mesh the planes of all surface members in one batch.
+
+        Without ``element_size`` every outline is triangulated on its
+        nodes. With it, every four node outline is divided into
+        quadrilaterals no longer than ``element_size``, the other surface
+        members are listed in ``skipped``.
+        """
+        from .xmi_surface_mesh import triangulate_surface_members, quad_mesh_surface_members
+
+        surface_members = [entity for entity in self.entities if isinstance(entity, XmiStructuralSurfaceMember)]
+        if element_size is None:
+            return triangulate_surface_members(surface_members)
+        return quad_mesh_surface_members(surface_members, element_size)
+
+    def tessellate_arcs(self, chord_tolerance: float, max_segments: int = 256) -> tuple[list[XmiArc3D], XmiRaggedArray]:
+        """Tessellate every XmiArc3D of the model in one batch.
+
+        Each arc gets the fewest chords that stay within ``chord_tolerance``
+        of it, in model units.
+
+        Returns
+        -------
+        tuple[list[XmiArc3D], XmiRaggedArray]
+            The arcs and their vertices, those of ``arcs[i]`` are the (m, 3)
+            array ``vertices[i]``.
+        """
+        from .geometries import xmi_geometry_kernel
+
+        arcs = [entity for entity in self.entities if isinstance(entity, XmiArc3D)]
+        starts, ends, centres = xmi_geometry_kernel.arcs_to_arrays(arcs)
+        return arcs, xmi_geometry_kernel.arc_tessellations_by_tolerance(
+            starts, ends, centres, chord_tolerance, xmi_geometry_kernel.arcs_to_normals(arcs),
+            max_segments=max_segments)
+
+    def storey_view(self, storey: str | XmiStructuralStorey | None = None,
+                    elevation_range: tuple[float, float] | None = None) -> list[XmiBaseEntity]:
+        """Return the entities on one storey, or on every storey within an elevation range.
+
+        Only point connections and members whose storey resolved to an
+        XmiStructuralStorey are returned. The lookup goes through
+        ``storey_index``, which is built once; call ``XmiStoreyIndex.from_entities``
+        again after adding entities to the model.
+
+        Parameters
+        ----------
+        storey : str | XmiStructuralStorey | None, optional
+            The storey or its name.
+        elevation_range : tuple[float, float] | None, optional
+            Inclusive (lower, upper) StoreyElevation bounds, in model units.
+
+        Returns
+        -------
+        list[XmiBaseEntity]
+            The entities in model order, storey by storey in ascending
+            elevation for a range.
+        """
+        if (storey is None) == (elevation_range is None):
+            raise ValueError(
+                "Please provide either 'storey' or 'elevation_range'")
+        if self.storey_index is None:
+            from .xmi_storey_index import XmiStoreyIndex
+
+            self.storey_index = XmiStoreyIndex.from_entities(self.entities)
+
+        if elevation_range is not None:
+            lower, upper = elevation_range
+            return [entity for found in self.storey_index.storeys_between(lower, upper)
+                    for entity in self.storey_index.entities(found)]
+
+        if isinstance(storey, str):
+            storey_found = self.storey_index.find(storey)
+            if storey_found is None:
+                raise ValueError(f"No StructuralStorey named {storey}")
+            storey = storey_found
+        return self.storey_index.entities(storey)
+
+    def assign_storeys(self, elevation_tolerance: float = 1.0, cluster_tolerance: float = 100.0,
+                       min_storey_nodes: int = 1, overwrite: bool = False) -> list[XmiStoreyAssignment]:
+        """Give point connections and members a storey from their node elevations.
+
+        The storeys are the XmiStructuralStorey entities of the model. A
+        model without any gets one storey per cluster of node Z values, which
+        is added to the entities. Nodes get the highest storey at or below
+        them and members the storey of their highest node.
+
+        Parameters
+        ----------
+        elevation_tolerance : float, optional
+            Nodes this far below a StoreyElevation still belong to that
+            storey, by default 1.0.
+        cluster_tolerance : float, optional
+            Largest Z gap within one inferred storey, by default 100.0.
+        min_storey_nodes : int, optional
+            Fewest nodes of an inferred storey, smaller clusters such as
+            brace intersections join the storey below. By default 1, which
+            makes every cluster a storey.
+        overwrite : bool, optional
+            Also replace resolved storeys that disagree with the geometry.
+            By default False, which only assigns entities whose storey is
+            missing or names no storey of the model.
+
+        Returns
+        -------
+        list[XmiStoreyAssignment]
+            One record per entity whose storey changed.
+        """
+        from .xmi_storey_assignment import assign_xmi_storeys
+
+        inferred_storeys, assignments = assign_xmi_storeys(
+            self.entities, elevation_tolerance=elevation_tolerance, cluster_tolerance=cluster_tolerance,
+            min_storey_nodes=min_storey_nodes, overwrite=overwrite)
+        self.entities.extend(inferred_storeys)
+
+        reassigned = {id(assignment.entity) for assignment in assignments
+                      if isinstance(assignment.previous_storey, XmiStructuralStorey)}
+        if reassigned:
+            self.relationships = [relationship for relationship in self.relationships
+                                  if not (isinstance(relationship, XmiHasStructuralStorey)
+                                          and id(relationship.source) in reassigned)]
+        for assignment in assignments:
+            self.create_relationship(
+                XmiHasStructuralStorey, assignment.entity, assignment.storey)
+
+        self.storey_index = None
+        return assignments
+
+    def rebar_takeoff(self, by: str = "member",
+                      steel_density: float | None = None) -> list[XmiRebarTakeoff]:
+        """Sum the bar area, length and weight of the reinforcement per "member", "storey" or bar "size".
+
+        See reinforcement_takeoff for how the bar lengths are derived from
+        the members. ``steel_density`` is by default DEFAULT_STEEL_DENSITY.
+        Returns an empty list for a model without reinforcement.
+        """
+        from .xmi_reinforcement import reinforcement_takeoff, DEFAULT_STEEL_DENSITY
+
+        if self.reinforcement_table is None:
+            return []
+        if steel_density is None:
+            steel_density = DEFAULT_STEEL_DENSITY
+        return reinforcement_takeoff(self.reinforcement_table, by=by, steel_density=steel_density)
+
+    def convert_units(self, target_system: str) -> list[XmiUnitConversion]:
+        """Convert the values of the model to another unit system, following its unit table.
+
+        The factor of every attribute is worked out once from ``units`` and
+        applied to all entities holding it in one array operation:
+        coordinates, lengths and offsets, section parameters and
+        properties, thicknesses, material moduli and unit weights, support
+        stiffnesses and reinforcement. ``units`` is updated to the new units.
+
+        Attributes whose unit cannot be parsed, e.g. "mm^2 or mm^2/m", are
+        left as they are. Lengths that BIM exports leave out of the table,
+        such as the coordinates, are taken to be in the most common length
+        unit of the table.
+
+        Parameters
+        ----------
+        target_system : str
+            One of XMI_UNIT_SYSTEMS, "m-kN", "m-N", "mm-kN" or "mm-N".
+
+        Returns
+        -------
+        list[XmiUnitConversion]
+            The conversion of every attribute, with its factor.
+        """
+        from .xmi_units import plan_xmi_unit_conversion, apply_xmi_unit_conversions
+
+        conversions = plan_xmi_unit_conversion(self.units, target_system)
+        apply_xmi_unit_conversions(conversions, self.entities, support_table=self.support_table,
+                                   reinforcement_table=self.reinforcement_table)
+
+        for conversion in conversions:
+            target_unit = XmiUnitEnum.from_attribute_get_enum(
+                conversion.target_unit) or conversion.target_unit
+            if conversion.unit is None:
+                conversion.unit = XmiStructuralUnit(
+                    conversion.section, conversion.attribute, target_unit)
+                self.units.append(conversion.unit)
+            else:
+                conversion.unit.Unit = target_unit
+
+        # the elevations of the storey index are out of date
+        self.storey_index = None
+        return conversions
+
+    def transform(self, matrix) -> XmiTransformation:
+        """Move, turn or mirror the whole model with a 4x4 homogeneous matrix.
+
+        Every XmiPoint3D, which includes the nodes, segment end points and
+        arc centres, is transformed with one matrix product, and the local
+        axes of the members with another. Storey elevations follow a Z
+        translation when the matrix keeps Z vertical. The transformation is
+        recorded in ``histories`` and can be reverted with undo_transform.
+
+        Parameters
+        ----------
+        matrix
+            (4, 4) array-like with (0, 0, 0, 1) as last row, applied to
+            column vectors.
+
+        Returns
+        -------
+        XmiTransformation
+            The transformation, with the values it replaced.
+        """
+        from .xmi_transform import transform_xmi_entities
+
+        transformation = transform_xmi_entities(self.entities, matrix)
+        self.histories.append(transformation)
+        # the elevations of the storey index may be out of date
+        self.storey_index = None
+        return transformation
+
+    def undo_transform(self) -> XmiTransformation | None:
+        """Revert the last transform that is not undone yet, None if there is none."""
+        from .xmi_transform import XmiTransformation
+
+        for position in range(len(self.histories) - 1, -1, -1):
+            transformation = self.histories[position]
+            if isinstance(transformation, XmiTransformation):
+                del self.histories[position]
+                transformation.undo()
+                self.storey_index = None
+                return transformation
+        return None
+
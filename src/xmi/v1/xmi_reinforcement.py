@@ -0,0 +1,386 @@
+"""
+Reinforcement of a model as one table with a row per reinforcement
+location, e.g. the "CornerMain" bars or the "OuterStirrup" links of a
+column.
+
+A StructuralReinforcement object of an export holds its locations as
+parallel ";" separated strings. They are parsed a whole section at a time
+into a NumPy structured array, so takeoffs are array expressions over all
+the bars of a model.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import numpy as np
+
+from .xmi_base import XmiBaseEntity
+from .xmi_errors import XmiInconsistentDataTypeError
+from .xmi_string_parsing import XmiRaggedArray, parse_float_column, split_string_column
+from .enums.xmi_shape_enums import XmiShapeEnum
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+from .entities.xmi_structural_reinforcement import XmiStructuralReinforcement
+
+# per location keys of a StructuralReinforcement object, with their field in the table
+XMI_REINFORCEMENT_TEXT_FIELDS: dict[str, str] = {
+    "RebarType": "rebar_type",
+    "Material": "material",
+    "Shape": "shape",
+    "Description": "description",
+}
+XMI_REINFORCEMENT_NUMBER_FIELDS: dict[str, str] = {
+    "Quantity": "quantity",
+    "Size": "size",
+    "AreaProvided": "area_provided",
+    "AreaRequired": "area_required",
+}
+
+XMI_TAKEOFF_GROUPS = ("member", "storey", "size")
+
+# kg per cubic millimetre, for models in millimetres
+DEFAULT_STEEL_DENSITY = 7.85e-6
+
+
+class XmiRebarTakeoff():
+    """Reinforcement quantities of one member, storey or bar size.
+
+    Parameters
+    ----------
+    key
+        The member, the storey or the bar size the quantities are summed over.
+    bar_area : float
+        Cross section area of the longitudinal bars, summed over members.
+    length : float
+        Total length of all bars and links.
+    weight : float
+        ``length`` times bar area times the steel density.
+    """
+    __slots__ = ('key', 'bar_area', 'length', 'weight')
+
+    def __init__(self, key, bar_area: float, length: float, weight: float):
+        self.key = key
+        self.bar_area: float = bar_area
+        self.length: float = length
+        self.weight: float = weight
+
+    def __str__(self) -> str:
+        key = self.key.name if isinstance(self.key, XmiBaseEntity) else self.key
+        return f"{key}: {self.weight:.6g} ({self.length:.6g} long, {self.bar_area:.6g} bar area)"
+
+
+def _align(ragged: XmiRaggedArray, offsets: np.ndarray, fill) -> tuple[np.ndarray, np.ndarray]:
+    """Gather the values of ``ragged`` into the rows of ``offsets``.
+
+    Rows of ``ragged`` with more values than locations are cut, rows with
+    fewer are filled with ``fill``. Also returns the rows whose count
+    differs, except single empty strings, which exports use for a column
+    left blank.
+    """
+    counts = np.diff(offsets)
+    rows = np.repeat(np.arange(len(counts)), counts)
+    positions = np.arange(offsets[-1]) - offsets[rows]
+    value_counts = ragged.counts
+    present = positions < value_counts[rows]
+    sources = ragged.offsets[rows] + positions
+
+    values = np.asarray(ragged.values)
+    aligned = np.full(len(rows), fill, dtype=values.dtype if len(values) else object)
+    aligned[present] = values[sources[present]]
+
+    mismatched = np.flatnonzero(value_counts != counts)
+    if len(mismatched) and values.dtype.kind in 'OU':
+        # a single empty value stands for an empty column
+        single = value_counts[mismatched] == 1
+        empty = np.array([values[ragged.offsets[row]] == '' for row in mismatched[single]], dtype=bool)
+        blank = np.zeros(len(mismatched), dtype=bool)
+        blank[np.flatnonzero(single)[empty]] = True
+        mismatched = mismatched[~blank]
+    elif len(mismatched):
+        single = value_counts[mismatched] == 1
+        blank = np.zeros(len(mismatched), dtype=bool)
+        blank[single] = np.isnan(values[ragged.offsets[mismatched[single]]])
+        mismatched = mismatched[~blank]
+    return aligned, mismatched
+
+
+class XmiReinforcementTable():
+    """All reinforcement locations of a model, as one structured array.
+
+    Parameters
+    ----------
+    reinforcements : list[XmiStructuralReinforcement]
+        The reinforcement entities, in section order.
+    offsets : np.ndarray
+        The rows of ``reinforcements[i]`` are ``layers[offsets[i]:offsets[i + 1]]``.
+    layers : np.ndarray
+        Structured array with the fields ``reinforcement`` (index into
+        ``reinforcements``), ``location``, ``quantity``, ``rebar_type``,
+        ``spacing``, ``secondary_spacing``, ``size``, ``material``,
+        ``shape``, ``area_provided``, ``area_required`` and
+        ``description``. Empty numbers are NaN, empty texts "".
+    """
+    __slots__ = ('reinforcements', 'offsets', 'layers')
+
+    def __init__(self, reinforcements: list[XmiStructuralReinforcement], offsets: np.ndarray, layers: np.ndarray):
+        self.reinforcements: list[XmiStructuralReinforcement] = reinforcements
+        self.offsets: np.ndarray = offsets
+        self.layers: np.ndarray = layers
+
+    def __len__(self) -> int:
+        return len(self.reinforcements)
+
+    @staticmethod
+    def parse_layers(xmi_dict_objs: list[dict]) -> tuple[np.ndarray, np.ndarray, dict[int, list[Exception]]]:
+        """Parse the per location strings of a StructuralReinforcement section.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, dict[int, list[Exception]]]
+            The offsets and the structured layers of every object, with
+            ``reinforcement`` holding the index of the object, and the
+            errors keyed by object index. Objects without a ``Location`` get
+            no rows.
+        """
+        errors: dict[int, list[Exception]] = {}
+
+        def report(index: int, error: Exception):
+            errors.setdefault(index, []).append(error)
+
+        locations, location_errors = split_string_column(
+            [obj.get('Location') for obj in xmi_dict_objs], ';', 'location')
+        for index, error in location_errors.items():
+            report(index, error)
+        offsets = locations.offsets
+        count = int(offsets[-1])
+
+        columns: dict[str, np.ndarray] = {
+            'reinforcement': np.repeat(np.arange(len(xmi_dict_objs)), np.diff(offsets)),
+            'location': np.array(locations.values, dtype=str) if count else np.empty(0, dtype='U1'),
+        }
+
+        def check_counts(mismatched: np.ndarray, key: str):
+            for index in mismatched.tolist():
+                if index not in location_errors:
+                    report(index, XmiInconsistentDataTypeError(
+                        f"'{key}' should have one value per Location", problem_data=xmi_dict_objs[index].get(key)))
+
+        for key, field in XMI_REINFORCEMENT_NUMBER_FIELDS.items():
+            values, value_errors = parse_float_column(
+                [obj.get(key) or '' for obj in xmi_dict_objs], ';', field, allow_empty=True)
+            for index, error in value_errors.items():
+                report(index, error)
+            columns[field], mismatched = _align(values, offsets, np.nan)
+            check_counts(mismatched, key)
+
+        for key, field in XMI_REINFORCEMENT_TEXT_FIELDS.items():
+            values, value_errors = split_string_column(
+                [obj.get(key) or '' for obj in xmi_dict_objs], ';', field)
+            for index, error in value_errors.items():
+                report(index, error)
+            aligned, mismatched = _align(values, offsets, '')
+            columns[field] = aligned.astype(str) if count else np.empty(0, dtype='U1')
+            check_counts(mismatched, key)
+
+        # links of surfaces are spaced in two directions, e.g. "300,300"
+        spacings, spacing_errors = split_string_column(
+            [obj.get('Spacing') or '' for obj in xmi_dict_objs], ';', 'spacing')
+        for index, error in spacing_errors.items():
+            report(index, error)
+        spacing_texts, mismatched = _align(spacings, offsets, '')
+        check_counts(mismatched, 'Spacing')
+        first_spacings, second_spacings = [], []
+        for text in spacing_texts.tolist():
+            first, _, second = text.partition(',')
+            first_spacings.append(first)
+            second_spacings.append(second)
+        for field, texts in (('spacing', first_spacings), ('secondary_spacing', second_spacings)):
+            columns[field] = np.full(count, np.nan)
+            if not count:
+                continue
+            # one value per layer, errors are keyed by layer position
+            values, value_errors = parse_float_column(
+                texts, ';', field, allow_empty=True)
+            columns[field] = values.values
+            for position, error in value_errors.items():
+                report(int(columns['reinforcement'][position]), error)
+
+        dtype = [(field, columns[field].dtype) for field in (
+            'reinforcement', 'location', 'quantity', 'rebar_type', 'spacing', 'secondary_spacing', 'size',
+            'material', 'shape', 'area_provided', 'area_required', 'description')]
+        layers = np.empty(count, dtype=dtype)
+        for field, _ in dtype:
+            layers[field] = columns[field]
+        return offsets, layers, errors
+
+    @classmethod
+    def from_reinforcements(cls, reinforcements: list[XmiStructuralReinforcement],
+                            rows: list[int], offsets: np.ndarray, layers: np.ndarray) -> XmiReinforcementTable:
+        """Keep the layers of the objects ``rows`` of a parsed section.
+
+        ``reinforcements[i]`` is the entity of object ``rows[i]``, its
+        ``layers`` are set to a view of the compacted table.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        counts = np.diff(offsets)[rows]
+        table_offsets = np.zeros(len(rows) + 1, dtype=np.intp)
+        np.cumsum(counts, out=table_offsets[1:])
+        kept = np.repeat(offsets[:-1][rows], counts) + \
+            np.arange(table_offsets[-1]) - np.repeat(table_offsets[:-1], counts)
+        table_layers = layers[kept]
+        table_layers['reinforcement'] = np.repeat(np.arange(len(rows)), counts)
+
+        for index, reinforcement in enumerate(reinforcements):
+            reinforcement.layers = table_layers[table_offsets[index]:table_offsets[index + 1]]
+        return cls(reinforcements, table_offsets, table_layers)
+
+
+def _link_lengths(curve_member: XmiStructuralCurveMember, cover: float) -> tuple[float, float]:
+    """Length of a closed link around the section of a curve member and of a link across its depth.
+
+    Both are inset by ``cover`` and NaN for shapes other than rectangles and circles.
+    """
+    cross_section = curve_member.cross_section
+    parameters = getattr(cross_section, 'parameters', None) or ()
+    shape = getattr(cross_section, 'shape', None)
+    if shape == XmiShapeEnum.RECTANGULAR and len(parameters) >= 2:
+        height, width = parameters[0] - 2.0 * cover, parameters[1] - 2.0 * cover
+        return 2.0 * (height + width), max(height, width)
+    if shape == XmiShapeEnum.CIRCULAR and len(parameters) >= 1:
+        diameter = parameters[0] - 2.0 * cover
+        return np.pi * diameter, diameter
+    return np.nan, np.nan
+
+
+def _curve_member_length(curve_member: XmiStructuralCurveMember) -> float:
+    if isinstance(curve_member.length, (int, float)) and curve_member.length > 0:
+        return float(curve_member.length)
+    begin_point, end_point = curve_member.begin_node.point, curve_member.end_node.point
+    return float(np.linalg.norm((end_point.x - begin_point.x, end_point.y - begin_point.y, end_point.z - begin_point.z)))
+
+
+def _surface_member_area(surface_member: XmiStructuralSurfaceMember) -> float:
+    # Newell's method on the node outline, in model units unlike the stated Area of some exports
+    vertices = np.array([(node.point.x, node.point.y, node.point.z)
+                         for node in surface_member.nodes], dtype=np.float64).reshape(-1, 3)
+    if len(vertices) < 3:
+        return np.nan
+    return float(np.linalg.norm(np.cross(vertices, np.roll(vertices, -1, axis=0)).sum(axis=0)) / 2.0)
+
+
+def _host_quantities(reinforcements: list[XmiStructuralReinforcement]) -> dict[str, np.ndarray]:
+    """Extent and section of the member of every reinforcement, NaN where not applicable."""
+    count = len(reinforcements)
+    hosts = {name: np.full(count, np.nan) for name in (
+        'length', 'area', 'closed_link', 'open_link', 'through_link')}
+    for index, reinforcement in enumerate(reinforcements):
+        member = reinforcement.member
+        cover = reinforcement.cover[0] if reinforcement.cover else 0.0
+        if isinstance(member, XmiStructuralCurveMember):
+            hosts['length'][index] = _curve_member_length(member)
+            hosts['closed_link'][index], hosts['open_link'][index] = _link_lengths(
+                member, cover)
+        else:
+            hosts['area'][index] = _surface_member_area(member)
+            if isinstance(member.thickness, (int, float)):
+                hosts['through_link'][index] = member.thickness - 2.0 * cover
+    return hosts
+
+
+def reinforcement_takeoff(table: XmiReinforcementTable, by: str = "member",
+                          steel_density: float = DEFAULT_STEEL_DENSITY) -> list[XmiRebarTakeoff]:
+    """Sum the bar area, length and weight of a reinforcement table per member, storey or bar size.
+
+    Lengths follow from the member of every reinforcement:
+
+    - longitudinal bars of a curve member, without spacing, run along the
+      whole member;
+    - links of a curve member are repeated at their spacing, closed links
+      around the section inset by the cover, other links across its depth;
+    - bars of a surface member at a spacing cover its whole outline area;
+      links spaced in two directions are repeated over the area and cross
+      its thickness.
+
+    Layers without a quantity, size or applicable member geometry count
+    as nothing. Lengths are in model units and bar sizes in the same unit,
+    the default density is for millimetres.
+
+    Parameters
+    ----------
+    table : XmiReinforcementTable
+        The reinforcement of a model, see XmiModel.reinforcement_table.
+    by : str, optional
+        Group on "member", "storey" or bar "size", by default "member".
+    steel_density : float, optional
+        Weight per volume, by default 7.85e-6 kg/mm³.
+
+    Returns
+    -------
+    list[XmiRebarTakeoff]
+        One record per group, in order of first appearance in the table.
+    """
+    if by not in XMI_TAKEOFF_GROUPS:
+        raise ValueError(
+            f"'by' should be one of {XMI_TAKEOFF_GROUPS}, found {by}")
+
+    layers = table.layers
+    reinforcement_indices = layers['reinforcement']
+    hosts = {name: values[reinforcement_indices]
+             for name, values in _host_quantities(table.reinforcements).items()}
+
+    quantity = np.nan_to_num(layers['quantity'])
+    bar_areas = np.pi / 4.0 * np.nan_to_num(layers['size']) ** 2
+    spacing = layers['spacing']
+    secondary_spacing = layers['secondary_spacing']
+    spaced = spacing > 0
+    on_curve = ~np.isnan(hosts['length'])
+    on_surface = ~np.isnan(hosts['area'])
+    closed = np.char.find(np.char.lower(layers['shape']), 'close') >= 0
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        link_counts = np.floor(hosts['length'] / spacing) + 1.0
+        link_lengths = np.where(
+            closed, hosts['closed_link'], hosts['open_link'])
+        two_way = secondary_spacing > 0
+        lengths = np.select(
+            [on_curve & ~spaced,
+             on_curve & spaced,
+             on_surface & spaced & two_way,
+             on_surface & spaced],
+            [quantity * hosts['length'],
+             quantity * link_counts * link_lengths,
+             quantity * hosts['area'] /
+             (spacing * secondary_spacing) * hosts['through_link'],
+             quantity * hosts['area'] / spacing],
+            default=0.0)
+    lengths = np.nan_to_num(lengths)
+    longitudinal_areas = np.where(on_curve & ~spaced, quantity * bar_areas, 0.0)
+    weights = lengths * bar_areas * steel_density
+
+    if by == "member":
+        keys = [reinforcement.member for reinforcement in table.reinforcements]
+        layer_keys = [keys[index] for index in reinforcement_indices.tolist()]
+    elif by == "storey":
+        keys = [reinforcement.member.storey for reinforcement in table.reinforcements]
+        layer_keys = [keys[index] for index in reinforcement_indices.tolist()]
+    else:
+        layer_keys = layers['size'].tolist()
+
+    # groups keyed by identity for entities, by value for sizes
+    group_positions: dict = {}
+    group_keys = []
+    groups = np.empty(len(layer_keys), dtype=np.intp)
+    for position, key in enumerate(layer_keys):
+        if by == "size" and key != key:
+            key = None
+        lookup = id(key) if isinstance(key, XmiBaseEntity) else key
+        group = group_positions.get(lookup)
+        if group is None:
+            group = group_positions[lookup] = len(group_keys)
+            group_keys.append(key)
+        groups[position] = group
+
+    sums = [np.bincount(groups, weights=values, minlength=len(group_keys))
+            for values in (longitudinal_areas, lengths, weights)]
+    return [XmiRebarTakeoff(key, float(bar_area), float(length), float(weight))
+            for key, bar_area, length, weight in zip(group_keys, *sums)]
@@ -0,0 +1,328 @@
+"""
+Single source for the mapping between the PascalCase keys of an XMI export
+and the snake_case constructor arguments of the xmi classes.
+
+The key translators used by every from_xmi_dict_obj are built once from this
+table when the entity modules are imported.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from .enums.xmi_enums import XmiEnum
+from .xmi_errors import XmiInconsistentDataTypeError
+
+XMI_KEY_MAPPINGS: dict[str, dict[str, str]] = {
+    "XmiStructuralMaterial": {
+        "Name": "name",
+        "Type": "material_type",
+        "Grade": "grade",
+        "UnitWeight": "unit_weight",
+        "EModulus": "e_modulus",
+        "GModulus": "g_modulus",
+        "PoissonRatio": "poisson_ratio",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+        "ThermalCoefficient": "thermal_coefficient",
+    },
+    "XmiStructuralUnit": {
+        "Entity": "Entity",
+        "Attribute": "Attribute",
+        "Unit": "Unit",
+    },
+    "XmiStructuralStorey": {
+        "Name": "name",
+        "StoreyElevation": "storey_elevation",
+        "StoreyMass": "storey_mass",
+        "StoreyHorizontalReactionX": "storey_horizontal_reaction_x",
+        "StoreyHorizontalReactionY": "storey_horizontal_reaction_y",
+        "StoreyVerticalReaction": "storey_vertical_reaction",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+    },
+    # the Location, Quantity, ... and Description keys hold one value per
+    # location and are read into XmiReinforcementTable instead
+    "XmiStructuralReinforcement": {
+        "Name": "name",
+        "Member": "member",
+        "Cover": "cover",
+        "IfSymmetrical": "if_symmetrical",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+    },
+    # the ux ... fiz conditions and stiffnesses of supports are kept in XmiSupportTable
+    "XmiStructuralPointSupport": {
+        "Name": "name",
+        "Node": "node",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+    },
+    "XmiStructuralLineSupport": {
+        "Name": "name",
+        "Line": "member",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+    },
+    "XmiStructuralAreaSupport": {
+        "Name": "name",
+        "Area": "surface_member",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+    },
+    "XmiStructuralPointConnection": {
+        "Name": "name",
+        # "X": "x",
+        # "Y": "y",
+        # "Z": "z",
+        "Storey": "storey",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+    },
+    # currently xmi_file doesnt support xmi id for reference, will assume structural_point_connection's id and name
+    "XmiPoint3D": {
+        "Name": "name",
+        "X": "x",
+        "Y": "y",
+        "Z": "z",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+    },
+    "XmiStructuralCrossSection": {
+        "Name": "name",
+        "Material": "material",
+        "Parameters": "parameters",
+        "Shape": "shape",
+        "Ix": "second_moment_of_area_x_axis",
+        "Iy": "second_moment_of_area_y_axis",
+        "rx": "radius_of_gyration_x_axis",
+        "ry": "radius_of_gyration_y_axis",
+        "Ex": "elastic_modulus_x_axis",
+        "Ey": "elastic_modulus_y_axis",
+        "Zx": "plastic_modulus_x_axis",
+        "Zy": "plastic_modulus_y_axis",
+        "J": "torsional_constant",
+        "Area": "area",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+    },
+    "XmiStructuralCurveMember": {
+        "CrossSection": "cross_section",
+        "Storey": "storey",
+        "Type": "curve_member_type",
+        "Nodes": "nodes",
+        "Segments": "segments",
+        "SystemLine": "system_line",
+        "BeginNode": "begin_node",
+        "EndNode": "end_node",
+        "Length": "length",
+        "LocalAxisX": "local_axis_x",
+        "LocalAxisY": "local_axis_y",
+        "LocalAxisZ": "local_axis_z",
+        "BeginNodeXOffset": "begin_node_x_offset",
+        "EndNodeXOffset": "end_node_x_offset",
+        "BeginNodeYOffset": "begin_node_y_offset",
+        "EndNodeYOffset": "end_node_y_offset",
+        "BeginNodeZOffset": "begin_node_z_offset",
+        "EndNodeZOffset": "end_node_z_offset",
+        "EndFixityStart": "end_fixity_start",
+        "EndFixityEnd": "end_fixity_end",
+        "Name": "name",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+        # "CircularArcCentre": "circular_arc_centre", # NOT IN USE
+        # "CircularArcRadius": "circular_arc_radius", # NOT IN USE
+        # "StiffnessModifierArea": "stiffness_modifier_area",
+        # "StiffnessModifierAsy": "stiffness_modifier_shear_local_y_axis",
+        # "StiffnessModifierAsz": "stiffness_modifier_shear_local_z_axis",
+        # "StiffnessModifierTorsion": "stiffness_modifier_shear_torsion",
+        # "StiffnessModifierIyy": "stiffness_modifier_moment_local_y_axis",
+        # "StiffnessModifierIzz": "stiffness_modifier_moment_local_z_axis",
+        # "StiffnessModifierMass": "stiffness_modifier_moment_mass",
+        # "StiffnessModifierWeight": "stiffness_modifier_moment_weight",
+        # "EndFixityAxialStart": "end_fixity_axial_start",
+        # "EndFixityShearMajorStart": "end_fixity_shear_major_start",
+        # "EndFixityShearMinorStart": "end_fixity_shear_minor_start",
+        # "EndFixityTorsionStart": "end_fixity_torsion_start",
+        # "EndFixityMomentMajorStart": "end_fixity_moment_major_start",
+        # "EndFixityMomentMinorStart": "end_fixity_moment_minor_start",
+        # "EndFixityAxialEnd": "end_fixity_axial_end",
+        # "EndFixityShearMajorEnd": "end_fixity_shear_major_end",
+        # "EndFixityShearMinorEnd": "end_fixity_shear_minor_end",
+        # "EndFixityTorsionEnd": "end_fixity_torsion_end/",
+        # "EndFixityMomentMajorEnd": "begin_node_y_offset",
+        # "EndFixityMomentMinorEnd": "end_node_y_offset",
+        # "LateralRestrain": "begin_node",
+        # "LateralRestrainLocation": "end_node",
+        # "LengthEffectiveMajor": "length",
+        # "LengthEffectiveMinor": "local_axis_x",
+        # "SwayInMajor": "local_axis_y",
+        # "SwayInMinor": "local_axis_z",
+        # "BracedAbtMajor": "begin_node_y_offset",
+        # "BracedAbtMinor": "end_node_y_offset",
+    },
+    "XmiStructuralSurfaceMember": {
+        "Material": "material",
+        "Storey": "storey",
+        "Type": "surface_member_type",
+        "Thickness": "thickness",
+        "Edges": "edges",
+        "Nodes": "nodes",
+        "SystemPlane": "system_plane",
+        "Area": "area",
+        "LocalAxisX": "local_axis_x",
+        "LocalAxisY": "local_axis_y",
+        "LocalAxisZ": "local_axis_z",
+        "ZOffset": "z_offset",
+        "Height": "height",
+        "Name": "name",
+        "Description": "description",
+        "ID": "id",
+        "IFCGUID": "ifcguid",
+        # "StiffnessModifierFxx": "circular_arc_centre", # NOT IN USE
+        # "StiffnessModifierFyy": "circular_arc_radius", # NOT IN USE
+        # "StiffnessModifierFxy": "stiffness_modifier_area",
+        # "StiffnessModifierMxx": "stiffness_modifier_shear_local_y_axis",
+        # "StiffnessModifierMyy": "stiffness_modifier_shear_local_z_axis",
+        # "StiffnessModifierMxy": "stiffness_modifier_shear_torsion",
+        # "StiffnessModifierVxz": "stiffness_modifier_moment_local_y_axis",
+        # "StiffnessModifierVyz": "stiffness_modifier_moment_local_z_axis",
+        # "StiffnessModifierMass": "stiffness_modifier_moment_mass",
+        # "StiffnessModifierWeight": "stiffness_modifier_moment_weight",
+    },
+}
+
+
+def create_key_translator(key_mapping: dict[str, str],
+                          mapped_keys_only: bool = False):
+    """Build the function renaming the keys of one raw XMI object.
+
+    The returned function renames the keys in a single dict comprehension and
+    returns a new dictionary. Keys that are not in ``key_mapping`` are passed
+    through unchanged unless ``mapped_keys_only`` is set, in which case they
+    are dropped.
+    """
+    key_mapping_get = dict(key_mapping).get
+
+    if mapped_keys_only:
+        mapped_keys = frozenset(key_mapping.keys())
+
+        def translate(xmi_dict_obj: dict) -> dict:
+            return {key_mapping_get(key): value for key, value in xmi_dict_obj.items()
+                    if key in mapped_keys}
+    else:
+        def translate(xmi_dict_obj: dict) -> dict:
+            return {key_mapping_get(key, key): value
+                    for key, value in xmi_dict_obj.items()}
+
+    return translate
+
+
+def fill_missing_attributes(processed_data: dict, attributes_needed: list[str]) -> list[Exception]:
+    """Set every absent attribute of ``processed_data`` to None in place.
+
+    Returns one "Missing attribute" exception per attribute filled, in the
+    order of ``attributes_needed``.
+    """
+    error_logs = []
+    for attr in attributes_needed:
+        if attr not in processed_data:
+            error_logs.append(Exception(f"Missing attribute: {attr}"))
+            processed_data[attr] = None
+    return error_logs
+
+
+# marks an attribute absent from an XMI object while transposing a section
+_MISSING = object()
+
+
+def transpose_xmi_dict_objs(xmi_dict_objs: list[dict],
+                            key_mapping: dict[str, str],
+                            attributes_needed: list[str]) -> tuple[dict[str, list], list[list[Exception]]]:
+    """Transpose the objects of one XMI section into one column per attribute.
+
+    Only the attributes of ``attributes_needed`` that have a key in
+    ``key_mapping`` are read. Absent values are set to None and reported with
+    the same "Missing attribute" exception as fill_missing_attributes.
+
+    Returns
+    -------
+    tuple[dict[str, list], list[list[Exception]]]
+        The columns keyed by attribute name and one error log per object.
+    """
+    attribute_keys = {attr: key for key, attr in key_mapping.items()}
+    error_logs: list[list[Exception]] = [[] for _ in xmi_dict_objs]
+    columns: dict[str, list] = {}
+
+    for attr in attributes_needed:
+        key = attribute_keys.get(attr)
+        if key is None:
+            continue
+        column = [xmi_dict_obj.get(key, _MISSING)
+                  for xmi_dict_obj in xmi_dict_objs]
+        if _MISSING in column:
+            for index, value in enumerate(column):
+                if value is _MISSING:
+                    error_logs[index].append(
+                        Exception(f"Missing attribute: {attr}"))
+                    column[index] = None
+        columns[attr] = column
+
+    return columns, error_logs
+
+
+def check_number_column(column: list, attr: str, failed: set[int], error_logs: list[list[Exception]],
+                        optional: bool = True):
+    """Flag every index of ``column`` that does not hold an int or float.
+
+    None is accepted when ``optional`` is set. Flagged indices are added to
+    ``failed`` and get an XmiInconsistentDataTypeError in their error log.
+    """
+    for index, value in enumerate(column):
+        if isinstance(value, (int, float)) or (optional and value is None):
+            continue
+        failed.add(index)
+        error_logs[index].append(XmiInconsistentDataTypeError(
+            f"'{attr}' should be of type float or int{', or None' if optional else ''}", problem_data=value))
+
+
+def check_str_column(column: list, attr: str, failed: set[int], error_logs: list[list[Exception]],
+                     optional: bool = True):
+    """Flag every index of ``column`` that does not hold a str, see check_number_column."""
+    for index, value in enumerate(column):
+        if isinstance(value, str) or (optional and value is None):
+            continue
+        failed.add(index)
+        error_logs[index].append(XmiInconsistentDataTypeError(
+            f"'{attr}' should be of type str{', or None' if optional else ''}", problem_data=value))
+
+
+def convert_enum_column(column: list, enum_class: type[XmiEnum], failed: set[int],
+                        error_logs: list[list[Exception]]) -> list[XmiEnum | None]:
+    """Convert a column of enum values with one dictionary lookup per value.
+
+    Values without a matching member of ``enum_class`` become None, their
+    index is added to ``failed`` and gets the same message the single object
+    conversion reports.
+    """
+    members = {member.value: member for member in enum_class}
+    converted = []
+    for index, value in enumerate(column):
+        try:
+            member = members.get(value)
+        except TypeError:
+            member = None
+        if member is None:
+            failed.add(index)
+            error_logs[index].append(Exception(
+                "Cannot Identify {enum_name}: {data_value}".format(enum_name=enum_class.__name__, data_value=value)))
+        converted.append(member)
+    return converted
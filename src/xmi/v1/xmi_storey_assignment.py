@@ -0,0 +1,143 @@
+"""
+Assigns storeys to point connections and members from their node
+elevations, for exports that leave Storey empty or point it at storeys
+that do not exist.
+
+The storeys are the StructuralStorey entities of the model when there are
+any, otherwise they are inferred by clustering the sorted node Z values.
+Nodes go to the highest storey at or below them and members to the storey
+of their highest node, as analysis exports do. Every step is a sort, a
+searchsorted or a reduction over the coordinate arrays.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import numpy as np
+
+from .xmi_base import XmiBaseEntity
+from .entities.xmi_structural_storey import XmiStructuralStorey
+from .entities.xmi_structural_point_connection import XmiStructuralPointConnection
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+
+
+class XmiStoreyAssignment():
+    """The storey given to one entity by assign_xmi_storeys.
+
+    Parameters
+    ----------
+    entity : XmiBaseEntity
+        The point connection, curve member or surface member.
+    storey : XmiStructuralStorey
+        The storey assigned.
+    previous_storey : XmiStructuralStorey | str | None
+        The storey or storey name the entity held before, None if it had none.
+    """
+    __slots__ = ('entity', 'storey', 'previous_storey')
+
+    def __init__(self, entity: XmiBaseEntity, storey: XmiStructuralStorey,
+                 previous_storey: XmiStructuralStorey | str | None):
+        self.entity: XmiBaseEntity = entity
+        self.storey: XmiStructuralStorey = storey
+        self.previous_storey: XmiStructuralStorey | str | None = previous_storey
+
+    def __str__(self) -> str:
+        previous_storey = self.previous_storey
+        if isinstance(previous_storey, XmiStructuralStorey):
+            previous_storey = previous_storey.name
+        return f"{self.entity.name}: {previous_storey} -> {self.storey.name}"
+
+
+def _cluster_elevations(z: np.ndarray, cluster_tolerance: float, min_storey_nodes: int) -> np.ndarray:
+    """Lowest Z of every cluster of at least ``min_storey_nodes`` nodes, ascending.
+
+    Sorted values closer than ``cluster_tolerance`` to their neighbour
+    belong to the same cluster. The lowest cluster is always kept.
+    """
+    z = np.sort(z[~np.isnan(z)])
+    if len(z) == 0:
+        return z
+    starts = np.flatnonzero(np.diff(z, prepend=-np.inf) > cluster_tolerance)
+    counts = np.diff(np.append(starts, len(z)))
+    kept = counts >= min_storey_nodes
+    kept[0] = True
+    return z[starts[kept]]
+
+
+def _node_elevations(members: list, node_positions: dict[int, int], node_z: np.ndarray) -> np.ndarray:
+    """Highest node Z of every member, NaN for members without located nodes."""
+    offsets = np.zeros(len(members) + 1, dtype=np.intp)
+    positions = []
+    for index, member in enumerate(members):
+        member_positions = [node_positions.get(id(node), -1) for node in member.nodes]
+        positions.extend(member_positions)
+        offsets[index + 1] = offsets[index] + len(member_positions)
+    positions = np.array(positions, dtype=np.intp)
+    z = np.append(node_z, np.nan)[positions] if len(positions) else np.empty(0)
+
+    top = np.full(len(members), np.nan)
+    counts = np.diff(offsets)
+    has_nodes = counts > 0
+    if has_nodes.any():
+        # fmax ignores the NaN of nodes without a point
+        top[has_nodes] = np.fmax.reduceat(z, offsets[:-1][has_nodes])
+    return top
+
+
+def assign_xmi_storeys(entities: list[XmiBaseEntity], elevation_tolerance: float = 1.0,
+                       cluster_tolerance: float = 100.0, min_storey_nodes: int = 1,
+                       overwrite: bool = False) -> tuple[list[XmiStructuralStorey], list[XmiStoreyAssignment]]:
+    """Assign storeys to the entities of a model, see XmiModel.assign_storeys.
+
+    Returns
+    -------
+    tuple[list[XmiStructuralStorey], list[XmiStoreyAssignment]]
+        The storeys inferred, empty when ``entities`` has storeys, and one
+        assignment per entity whose storey changed.
+    """
+    point_connections = [entity for entity in entities
+                         if isinstance(entity, XmiStructuralPointConnection)]
+    node_z = np.array([point_connection.point.z if point_connection.point is not None else np.nan
+                       for point_connection in point_connections], dtype=np.float64)
+
+    storeys = [entity for entity in entities if isinstance(entity, XmiStructuralStorey)]
+    inferred_storeys: list[XmiStructuralStorey] = []
+    if storeys:
+        storeys = sorted(storeys, key=lambda storey: storey.storey_elevation)
+        # a node just below a storey still belongs to it
+        lower_bounds = np.array([storey.storey_elevation for storey in storeys],
+                                dtype=np.float64) - elevation_tolerance
+    else:
+        lower_bounds = _cluster_elevations(node_z, cluster_tolerance, min_storey_nodes)
+        inferred_storeys = [XmiStructuralStorey(storey_elevation=float(elevation),
+                                                name=f"Storey {elevation:g}",
+                                                description="Inferred from node elevations")
+                            for elevation in lower_bounds]
+        storeys = inferred_storeys
+    if not storeys:
+        return inferred_storeys, []
+
+    node_positions = {id(point_connection): position
+                      for position, point_connection in enumerate(point_connections)}
+    curve_members = [entity for entity in entities if isinstance(entity, XmiStructuralCurveMember)]
+    surface_members = [entity for entity in entities if isinstance(entity, XmiStructuralSurfaceMember)]
+
+    assignments = []
+    for group, elevations in ((point_connections, node_z),
+                              (curve_members, _node_elevations(curve_members, node_positions, node_z)),
+                              (surface_members, _node_elevations(surface_members, node_positions, node_z))):
+        # entities below the lowest storey, e.g. foundations, go to the lowest storey
+        storey_positions = np.maximum(np.searchsorted(
+            lower_bounds, elevations, side='right') - 1, 0)
+        for entity, elevation, storey_position in zip(group, elevations.tolist(), storey_positions.tolist()):
+            previous_storey = entity.storey
+            if np.isnan(elevation) or previous_storey is storeys[storey_position]:
+                continue
+            if not overwrite and isinstance(previous_storey, XmiStructuralStorey):
+                continue
+            entity.storey = storeys[storey_position]
+            assignments.append(XmiStoreyAssignment(
+                entity, storeys[storey_position], previous_storey))
+
+    return inferred_storeys, assignments
@@ -0,0 +1,78 @@
+"""
+Storeys of a model sorted by elevation, with the entities on every storey
+gathered into one bucket per storey.
+
+The buckets are filled in a single pass over the entities, after which a
+storey or an elevation range is answered with a binary search and the
+concatenation of the selected buckets, without rescanning the model.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import numpy as np
+
+from .xmi_base import XmiBaseEntity
+from .entities.xmi_structural_storey import XmiStructuralStorey
+
+
+class XmiStoreyIndex():
+    """The storeys of a model in ascending elevation and the entities on each.
+
+    Parameters
+    ----------
+    storeys : list[XmiStructuralStorey]
+        The storeys of the model in any order, storeys at equal elevation
+        keep their relative order.
+    """
+    __slots__ = ('storeys', 'elevations', '_positions', '_by_name', '_buckets')
+
+    def __init__(self, storeys: list[XmiStructuralStorey]):
+        self.storeys: list[XmiStructuralStorey] = sorted(
+            storeys, key=lambda storey: storey.storey_elevation)
+        self.elevations: np.ndarray = np.array(
+            [storey.storey_elevation for storey in self.storeys], dtype=np.float64)
+        # keyed by object identity, storeys are looked up for every entity added
+        self._positions: dict[int, int] = {
+            id(storey): position for position, storey in enumerate(self.storeys)}
+        self._by_name: dict[str, XmiStructuralStorey] = {}
+        for storey in self.storeys:
+            self._by_name.setdefault(storey.name, storey)
+        self._buckets: list[list[XmiBaseEntity]] = [[] for _ in self.storeys]
+
+    @classmethod
+    def from_entities(cls, entities: list[XmiBaseEntity]) -> XmiStoreyIndex:
+        """Index the storeys of ``entities`` and bucket every entity with a resolved storey."""
+        storey_index = cls([entity for entity in entities
+                            if isinstance(entity, XmiStructuralStorey)])
+        for entity in entities:
+            storey_index.add(entity)
+        return storey_index
+
+    def add(self, entity: XmiBaseEntity) -> bool:
+        """Add an entity to the bucket of its storey, False if it has no indexed storey."""
+        position = self._positions.get(id(getattr(entity, 'storey', None)))
+        if position is None:
+            return False
+        self._buckets[position].append(entity)
+        return True
+
+    def find(self, name: str) -> XmiStructuralStorey | None:
+        return self._by_name.get(name)
+
+    def storeys_between(self, lower: float, upper: float) -> list[XmiStructuralStorey]:
+        """Storeys with ``lower <= elevation <= upper``, in ascending elevation."""
+        start = int(np.searchsorted(self.elevations, lower, side='left'))
+        stop = int(np.searchsorted(self.elevations, upper, side='right'))
+        return self.storeys[start:stop]
+
+    def storey_at(self, elevation: float) -> XmiStructuralStorey | None:
+        """The highest storey at or below ``elevation``, None below the lowest storey."""
+        position = int(np.searchsorted(
+            self.elevations, elevation, side='right')) - 1
+        return self.storeys[position] if position >= 0 else None
+
+    def entities(self, storey: XmiStructuralStorey) -> list[XmiBaseEntity]:
+        """The entities on ``storey`` in the order they were added."""
+        position = self._positions.get(id(storey))
+        return list(self._buckets[position]) if position is not None else []
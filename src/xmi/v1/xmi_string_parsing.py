@@ -0,0 +1,159 @@
+"""
+Column parsers for the delimited string attributes of an XMI export, e.g.
+``Parameters`` ("600;600"), ``LocalAxisX`` ("0,0,1"), ``Nodes`` and
+``Segments``/``Edges`` ("N1;N2", "Line;Line").
+
+A whole section is parsed at once: the strings of a column are joined, split
+once and converted to floats by NumPy in a single call. Rows that fail are
+reported by index with the position of the offending value.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import numpy as np
+
+from .xmi_errors import XmiInconsistentDataTypeError, XmiMissingRequiredAttributeError
+
+
+class XmiRaggedArray():
+    """Values of a column with a varying number of values per row.
+
+    The values of row ``i`` are ``values[offsets[i]:offsets[i + 1]]``.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        Start of every row in ``values``, with one extra entry holding the
+        total number of values.
+    values : np.ndarray | list
+        The values of all rows, concatenated.
+    """
+    __slots__ = ('offsets', 'values')
+
+    def __init__(self, offsets: np.ndarray, values: np.ndarray | list):
+        self.offsets: np.ndarray = offsets
+        self.values: np.ndarray | list = values
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray | list:
+        offsets = self.offsets
+        return self.values[offsets[index]:offsets[index + 1]]
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+
+def split_string_column(strings: list, delimiter: str, attr: str) -> tuple[XmiRaggedArray, dict[int, Exception]]:
+    """Split every string of a column on ``delimiter`` in one pass.
+
+    Rows that are not strings have no values and an error in the returned
+    dictionary, keyed by row index.
+
+    Returns
+    -------
+    tuple[XmiRaggedArray, dict[int, Exception]]
+        The tokens of every row as a list-backed ragged array and the errors.
+    """
+    errors: dict[int, Exception] = {}
+    counts = np.zeros(len(strings), dtype=np.intp)
+    valid_strings = []
+    for index, string in enumerate(strings):
+        if isinstance(string, str):
+            counts[index] = string.count(delimiter) + 1
+            valid_strings.append(string)
+        else:
+            errors[index] = XmiMissingRequiredAttributeError(
+                f"'{attr}' should be a string of values separated by '{delimiter}'", problem_data=string)
+
+    offsets = np.zeros(len(strings) + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+    tokens = delimiter.join(valid_strings).split(
+        delimiter) if valid_strings else []
+
+    return XmiRaggedArray(offsets, tokens), errors
+
+
+def parse_float_column(strings: list, delimiter: str, attr: str,
+                       size: int | None = None,
+                       allow_empty: bool = False) -> tuple[np.ndarray | XmiRaggedArray, dict[int, Exception]]:
+    """Convert every delimited string of a column to floats in one pass.
+
+    Parameters
+    ----------
+    strings : list
+        One delimited string per row, e.g. the ``Parameters`` of every cross
+        section.
+    delimiter : str
+        The separator between values, e.g. ";" or ",".
+    attr : str
+        Attribute name used in the error messages.
+    size : int | None, optional
+        Number of values every row must hold, e.g. 3 for a local axis. When
+        given, the result is an array of shape ``(len(strings), size)`` and
+        failed rows are NaN. By default None, which returns a float backed
+        XmiRaggedArray.
+    allow_empty : bool, optional
+        Read empty values as NaN instead of reporting them, for columns
+        such as the ``Quantity`` of a reinforcement that leave unused
+        positions empty. By default False.
+
+    Returns
+    -------
+    tuple[np.ndarray | XmiRaggedArray, dict[int, Exception]]
+        The converted values and the errors keyed by row index. Only the
+        first error of every row is kept.
+    """
+    ragged, errors = split_string_column(strings, delimiter, attr)
+    offsets = ragged.offsets
+    tokens = ragged.values
+    if allow_empty:
+        tokens = [token if token.strip() else 'nan' for token in tokens]
+
+    try:
+        values = np.array(tokens, dtype=np.float64)
+    except ValueError:
+        # locate the offending tokens only when the fast conversion fails
+        values = np.empty(len(tokens), dtype=np.float64)
+        for position, token in enumerate(tokens):
+            try:
+                if not token.strip():
+                    raise ValueError(token)
+                values[position] = float(token)
+            except ValueError:
+                values[position] = np.nan
+                row = int(np.searchsorted(
+                    offsets, position, side='right')) - 1
+                if row not in errors:
+                    errors[row] = XmiInconsistentDataTypeError(
+                        f"The value [{token}] at position {position - offsets[row]} of '{attr}' should be convertible to float")
+
+    if size is None:
+        return XmiRaggedArray(offsets, values), errors
+
+    counts = ragged.counts
+    wrong_counts = np.flatnonzero(counts != size)
+    fixed = np.full((len(strings), size), np.nan)
+    rows = np.flatnonzero(counts == size)
+    if len(rows):
+        fixed[rows] = values[(offsets[rows, None] +
+                              np.arange(size)).ravel()].reshape(-1, size)
+    for row in wrong_counts.tolist():
+        if row not in errors:
+            errors[row] = XmiMissingRequiredAttributeError(
+                f"'{attr}' should have {size} values, found {counts[row]}")
+        fixed[row] = np.nan
+    for row in errors:
+        fixed[row] = np.nan
+
+    return fixed, errors
+
+
+def row_as_tuple(column: np.ndarray | XmiRaggedArray, errors: dict[int, Exception], index: int) -> tuple[float] | None:
+    """Return row ``index`` of a parse_float_column result as a tuple of floats, None if the row failed."""
+    if index in errors:
+        return None
+    return tuple(column[index].tolist())
@@ -0,0 +1,99 @@
+"""
+Boundary conditions of a model as two contiguous arrays, with one row per
+point, line or area support.
+
+The ``ux`` ... ``fiz`` conditions and ``uxStiffness`` ... ``fizStiffness``
+values of a support section are converted a column at a time, and every
+support entity keeps views of its rows, so analysis pre-processors can
+take all supports of a model as ``fixed`` and ``stiffnesses`` without
+walking the entities.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import numpy as np
+
+from .xmi_errors import XmiInconsistentDataTypeError
+from .enums.xmi_structural_support_enums import XmiSupportConditionEnum
+from .entities.xmi_structural_support import XmiStructuralSupport, XMI_SUPPORT_DOFS
+
+
+def parse_support_columns(xmi_dict_objs: list[dict]) -> tuple[np.ndarray, np.ndarray, list[list[Exception]]]:
+    """Convert the conditions and stiffnesses of a support section.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, list[list[Exception]]]
+        The ``(n, 6)`` bool array of fixed degrees of freedom, the
+        ``(n, 6)`` float array of stiffnesses and the errors of every
+        object. Missing or invalid conditions are read as free and missing
+        or invalid stiffnesses as NaN.
+    """
+    count = len(xmi_dict_objs)
+    fixed = np.zeros((count, len(XMI_SUPPORT_DOFS)), dtype=bool)
+    stiffnesses = np.full((count, len(XMI_SUPPORT_DOFS)), np.nan)
+    error_logs: list[list[Exception]] = [[] for _ in range(count)]
+    conditions = {member.value: member for member in XmiSupportConditionEnum}
+
+    for column, dof in enumerate(XMI_SUPPORT_DOFS):
+        stiffness_key = f"{dof}Stiffness"
+        for index, xmi_dict_obj in enumerate(xmi_dict_objs):
+            condition = xmi_dict_obj.get(dof)
+            if condition is not None:
+                condition = conditions.get(condition) if isinstance(
+                    condition, str) else None
+                if condition is None:
+                    error_logs[index].append(Exception(
+                        "Cannot Identify {enum_name}: {data_value}".format(
+                            enum_name=XmiSupportConditionEnum.__name__, data_value=xmi_dict_obj.get(dof))))
+                fixed[index, column] = condition is XmiSupportConditionEnum.FIXED
+
+            stiffness = xmi_dict_obj.get(stiffness_key)
+            if isinstance(stiffness, (int, float)) and not isinstance(stiffness, bool):
+                stiffnesses[index, column] = stiffness
+            elif stiffness is not None:
+                error_logs[index].append(XmiInconsistentDataTypeError(
+                    f"'{stiffness_key}' should be of type float or int, or None", problem_data=stiffness))
+
+    return fixed, stiffnesses, error_logs
+
+
+class XmiSupportTable():
+    """The fixed degrees of freedom and stiffnesses of all supports of a model.
+
+    Parameters
+    ----------
+    supports : list[XmiStructuralSupport]
+        The supports, row ``i`` of the arrays belongs to ``supports[i]``.
+    fixed : np.ndarray
+        ``(n, 6)`` bool array, columns in the order of XMI_SUPPORT_DOFS.
+    stiffnesses : np.ndarray
+        ``(n, 6)`` float array, NaN where the export gives no stiffness.
+    """
+    __slots__ = ('supports', 'fixed', 'stiffnesses')
+
+    def __init__(self, supports: list[XmiStructuralSupport], fixed: np.ndarray, stiffnesses: np.ndarray):
+        self.supports: list[XmiStructuralSupport] = supports
+        self.fixed: np.ndarray = fixed
+        self.stiffnesses: np.ndarray = stiffnesses
+
+    def __len__(self) -> int:
+        return len(self.supports)
+
+    @classmethod
+    def from_supports(cls, supports: list[XmiStructuralSupport]) -> XmiSupportTable:
+        """Copy the values of ``supports`` into contiguous arrays and point the supports at their rows."""
+        fixed = np.zeros((len(supports), len(XMI_SUPPORT_DOFS)), dtype=bool)
+        stiffnesses = np.full((len(supports), len(XMI_SUPPORT_DOFS)), np.nan)
+        for row, support in enumerate(supports):
+            fixed[row] = support.fixed
+            stiffnesses[row] = support.stiffnesses
+            support.fixed = fixed[row]
+            support.stiffnesses = stiffnesses[row]
+        return cls(supports, fixed, stiffnesses)
+
+    def rows(self, support_class: type[XmiStructuralSupport]) -> np.ndarray:
+        """Row indices of the supports of ``support_class``, e.g. XmiStructuralPointSupport."""
+        return np.array([row for row, support in enumerate(self.supports)
+                         if isinstance(support, support_class)], dtype=np.intp)
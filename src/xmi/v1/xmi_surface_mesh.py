@@ -0,0 +1,274 @@
+"""
+Triangle and quadrilateral meshes of the planes of surface members, for
+load distribution and analysis export.
+
+Outlines run straight from node to node. The outlines of a node count are
+gathered into one (g, k, 3) array. The convex ones, nearly every slab and
+wall, are fanned in one batch, and only the concave ones go through ear
+clipping, one polygon at a time. The quad mesher divides every four node
+outline into a structured grid near a target element size, in one batch
+per grid size.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import numpy as np
+
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+from .geometries.xmi_geometry_kernel import normalize_vectors
+
+
+def polygon_normals(points: np.ndarray) -> np.ndarray:
+    """Newell normals of (g, k, 3) outlines, following their node order, NaN for degenerate outlines."""
+    return normalize_vectors(np.cross(points, np.roll(points, -1, axis=1)).sum(axis=1))
+
+
+def convex_polygons(points: np.ndarray, normals: np.ndarray) -> np.ndarray:
+    """Whether every (g, k, 3) outline turns the same way as its normal at every node.
+
+    Outlines with a node in line with its neighbours are not counted as
+    convex, a fan through that node would have a zero area triangle.
+    """
+    edges = np.roll(points, -1, axis=1) - points
+    turns = np.einsum('gkj,gj->gk', np.cross(np.roll(edges, 1, axis=1), edges), normals)
+    scales = np.einsum('gkj,gkj->gk', edges, edges).max(axis=1, initial=0.0)
+    return np.all(turns > 1e-9 * scales[:, None], axis=1)
+
+
+def _plane_coordinates(points: np.ndarray, normal: np.ndarray) -> np.ndarray:
+    # any axis in the plane, with the second axis normal x first
+    seed = np.eye(3)[np.argmin(np.abs(normal))]
+    u = normalize_vectors(np.cross(normal, seed))
+    v = np.cross(normal, u)
+    relative = points - points[0]
+    return np.stack([relative @ u, relative @ v], axis=1)
+
+
+def _turns(a: np.ndarray, b: np.ndarray, points: np.ndarray) -> np.ndarray:
+    # twice the signed areas of the triangles a, b, points[i], positive when counterclockwise
+    return (b[0] - a[0]) * (points[:, 1] - a[1]) - (b[1] - a[1]) * (points[:, 0] - a[0])
+
+
+def triangulate_polygon(points: np.ndarray) -> np.ndarray:
+    """Triangulate a simple polygon by ear clipping.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        (k, 2) vertices in order, or (k, 3) vertices of a planar polygon.
+
+    Returns
+    -------
+    np.ndarray
+        (k - 2, 3) vertex indices, turning the same way as ``points``.
+        Convex and concave outlines are handled, self intersecting ones
+        give overlapping triangles rather than an error.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    count = len(points)
+    if count < 3:
+        return np.zeros((0, 3), dtype=np.intp)
+    if points.shape[1] == 3:
+        normal = polygon_normals(points[None])[0]
+        if np.isnan(normal).any():
+            return np.zeros((0, 3), dtype=np.intp)
+        points = _plane_coordinates(points, normal)
+
+    # clip counterclockwise, then give the triangles back in the input direction
+    signed_area = np.sum(points[:, 0] * np.roll(points[:, 1], -1) - np.roll(points[:, 0], -1) * points[:, 1])
+    clockwise = signed_area < 0.0
+    remaining = list(range(count))[::-1] if clockwise else list(range(count))
+    extent = np.ptp(points, axis=0).max()
+    tolerance = 1e-12 * extent * extent
+
+    def turn(a: int, b: int, c: int) -> float:
+        (ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+        return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+    triangles = []
+    while len(remaining) > 3:
+        remaining_points = points[remaining]
+        ear = None
+        for position in range(len(remaining)):
+            a, b, c = remaining[position - 1], remaining[position], remaining[(position + 1) % len(remaining)]
+            if turn(a, b, c) <= tolerance:
+                continue
+            # an ear holds no other remaining vertex, boundary included
+            inside = (_turns(points[a], points[b], remaining_points) >= -tolerance) \
+                & (_turns(points[b], points[c], remaining_points) >= -tolerance) \
+                & (_turns(points[c], points[a], remaining_points) >= -tolerance)
+            inside[[position - 1, position, (position + 1) % len(remaining)]] = False
+            if not inside.any():
+                ear = position
+                break
+        if ear is None:
+            # nothing but collinear or crossing nodes left, clip the sharpest convex corner
+            ear = max(range(len(remaining)), key=lambda position: turn(
+                remaining[position - 1], remaining[position], remaining[(position + 1) % len(remaining)]))
+        triangles.append((remaining[ear - 1], remaining[ear], remaining[(ear + 1) % len(remaining)]))
+        del remaining[ear]
+    triangles.append(tuple(remaining))
+
+    triangles = np.array(triangles, dtype=np.intp)
+    return triangles[:, ::-1] if clockwise else triangles
+
+
+def fan_triangles(count: int) -> np.ndarray:
+    """(count - 2, 3) triangles fanned from the first of ``count`` vertices."""
+    return np.stack([np.zeros(max(count - 2, 0), dtype=np.intp), np.arange(1, count - 1),
+                     np.arange(2, count)], axis=1)
+
+
+class XmiSurfaceMesh():
+    """A triangle or quadrilateral mesh of the planes of surface members.
+
+    Parameters
+    ----------
+    surface_members : list[XmiStructuralSurfaceMember]
+        The surface members given.
+    vertices : np.ndarray
+        (v, 3) vertex coordinates, the vertices of a surface member are
+        not shared with the others.
+    elements : np.ndarray
+        (e, 3) triangles or (e, 4) quadrilaterals, vertex indices turning
+        the same way as the nodes of their surface member.
+    element_entities : np.ndarray
+        (e,) index in ``surface_members`` of every element.
+    skipped : list[int]
+        Surface members without a mesh, for fewer than three nodes, a
+        missing point, a degenerate outline or, for quadrilaterals, not
+        having four nodes around a convex outline.
+    """
+    __slots__ = ('surface_members', 'vertices', 'elements', 'element_entities', 'skipped')
+
+    def __init__(self, surface_members: list[XmiStructuralSurfaceMember], vertices: np.ndarray,
+                 elements: np.ndarray, element_entities: np.ndarray, skipped: list[int]):
+        self.surface_members: list[XmiStructuralSurfaceMember] = surface_members
+        self.vertices: np.ndarray = vertices
+        self.elements: np.ndarray = elements
+        self.element_entities: np.ndarray = element_entities
+        self.skipped: list[int] = skipped
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    @property
+    def element_areas(self) -> np.ndarray:
+        """(e,) area of every element, quadrilaterals as two triangles."""
+        corners = self.vertices[self.elements]
+        doubled = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        if self.elements.shape[1] == 4:
+            doubled = doubled + np.cross(corners[:, 2] - corners[:, 0], corners[:, 3] - corners[:, 0])
+        return np.linalg.norm(doubled, axis=1) / 2.0
+
+
+def _outline_groups(surface_members: list[XmiStructuralSurfaceMember]) -> tuple[dict[int, list[int]], list[int]]:
+    groups: dict[int, list[int]] = {}
+    skipped = []
+    for index, surface_member in enumerate(surface_members):
+        nodes = surface_member.nodes or []
+        if len(nodes) >= 3 and all(node is not None and node.point is not None for node in nodes):
+            groups.setdefault(len(nodes), []).append(index)
+        else:
+            skipped.append(index)
+    return groups, skipped
+
+
+def _outline_points(surface_members: list[XmiStructuralSurfaceMember], indices: list[int]) -> np.ndarray:
+    return np.array([[(node.point.x, node.point.y, node.point.z) for node in surface_members[index].nodes]
+                     for index in indices], dtype=np.float64)
+
+
+def _mesh(surface_members: list[XmiStructuralSurfaceMember], vertex_batches: list[np.ndarray],
+          element_batches: list[np.ndarray], entity_batches: list[np.ndarray], corner_count: int,
+          skipped: list[int]) -> XmiSurfaceMesh:
+    return XmiSurfaceMesh(surface_members,
+                          np.concatenate(vertex_batches) if vertex_batches else np.zeros((0, 3)),
+                          np.concatenate(element_batches) if element_batches
+                          else np.zeros((0, corner_count), dtype=np.intp),
+                          np.concatenate(entity_batches) if entity_batches else np.zeros(0, dtype=np.intp),
+                          sorted(skipped))
+
+
+def triangulate_surface_members(surface_members: list[XmiStructuralSurfaceMember]) -> XmiSurfaceMesh:
+    """Triangulate the outline of every surface member.
+
+    Convex outlines are fanned a node count at a time, concave ones are
+    ear clipped. An outline of k nodes gives k - 2 triangles on its nodes.
+    """
+    groups, skipped = _outline_groups(surface_members)
+    vertex_batches, element_batches, entity_batches = [], [], []
+    vertex_offset = 0
+    for node_count, indices in groups.items():
+        points = _outline_points(surface_members, indices)
+        normals = polygon_normals(points)
+        valid = ~np.isnan(normals).any(axis=1)
+        skipped += [index for index, is_valid in zip(indices, valid) if not is_valid]
+        points, normals, indices = points[valid], normals[valid], np.array(indices)[valid]
+        convex = convex_polygons(points, normals)
+
+        fan = fan_triangles(node_count)
+        triangles = np.where(convex[:, None, None], fan[None], 0)
+        for position in np.flatnonzero(~convex):
+            triangles[position] = triangulate_polygon(points[position])
+        triangles = triangles + (vertex_offset + np.arange(len(indices)) * node_count)[:, None, None]
+        vertex_offset += len(indices) * node_count
+
+        vertex_batches.append(points.reshape(-1, 3))
+        element_batches.append(triangles.reshape(-1, 3))
+        entity_batches.append(np.repeat(indices, node_count - 2))
+    return _mesh(surface_members, vertex_batches, element_batches, entity_batches, 3, skipped)
+
+
+def grid_quadrilaterals(divisions_u: int, divisions_v: int) -> np.ndarray:
+    """(divisions_u * divisions_v, 4) quadrilaterals of a grid of (divisions_v + 1) rows of (divisions_u + 1) vertices."""
+    columns = divisions_u + 1
+    corners = (np.arange(divisions_v)[:, None] * columns + np.arange(divisions_u)[None, :]).reshape(-1)
+    return np.stack([corners, corners + 1, corners + 1 + columns, corners + columns], axis=1)
+
+
+def quad_mesh_surface_members(surface_members: list[XmiStructuralSurfaceMember],
+                              element_size: float) -> XmiSurfaceMesh:
+    """Divide every four node surface member into a structured grid of quadrilaterals.
+
+    Each outline is mapped bilinearly from its nodes, with as many
+    divisions along each pair of opposite edges as the longer of the two
+    needs to keep elements no longer than ``element_size``.
+    """
+    if element_size <= 0:
+        raise ValueError("'element_size' should be positive")
+    groups, skipped = _outline_groups(surface_members)
+    skipped += [index for node_count, indices in groups.items() if node_count != 4 for index in indices]
+    indices = np.array(groups.get(4, []), dtype=np.intp)
+    points = _outline_points(surface_members, indices).reshape(-1, 4, 3)
+    normals = polygon_normals(points)
+    valid = ~np.isnan(normals).any(axis=1)
+    valid[valid] = convex_polygons(points[valid], normals[valid])
+    skipped += indices[~valid].tolist()
+    points, indices = points[valid], indices[valid]
+
+    edge_lengths = np.linalg.norm(np.roll(points, -1, axis=1) - points, axis=2)
+    divisions = np.ceil(np.stack([np.maximum(edge_lengths[:, 0], edge_lengths[:, 2]),
+                                  np.maximum(edge_lengths[:, 1], edge_lengths[:, 3])], axis=1)
+                        / element_size).astype(np.intp)
+    divisions = np.maximum(divisions, 1)
+
+    vertex_batches, element_batches, entity_batches = [], [], []
+    vertex_offset = 0
+    grids, grid_members = np.unique(divisions, axis=0, return_inverse=True)
+    for grid_index, (divisions_u, divisions_v) in enumerate(grids.tolist()):
+        members = np.flatnonzero(grid_members.reshape(-1) == grid_index)
+        s, t = np.meshgrid(np.linspace(0.0, 1.0, divisions_u + 1), np.linspace(0.0, 1.0, divisions_v + 1))
+        s, t = s.reshape(-1), t.reshape(-1)
+        weights = np.stack([(1 - s) * (1 - t), s * (1 - t), s * t, (1 - s) * t], axis=1)
+        vertices = np.einsum('vc,gcj->gvj', weights, points[members])
+        quadrilaterals = grid_quadrilaterals(divisions_u, divisions_v)
+        vertex_count = len(weights)
+        elements = quadrilaterals[None] + (vertex_offset + np.arange(len(members)) * vertex_count)[:, None, None]
+        vertex_offset += len(members) * vertex_count
+
+        vertex_batches.append(vertices.reshape(-1, 3))
+        element_batches.append(elements.reshape(-1, 4))
+        entity_batches.append(np.repeat(indices[members], len(quadrilaterals)))
+    return _mesh(surface_members, vertex_batches, element_batches, entity_batches, 4, skipped)
@@ -0,0 +1,136 @@
+"""
+Rigid transformations of a whole model, e.g. to move a model onto the
+GlobalReferenceCoordinate of its StructuralModel header.
+
+All XmiPoint3D coordinates are gathered into one (n, 3) array and all
+member local axes into another, each is transformed with a single matrix
+product and written back. The previous values are kept on the returned
+XmiTransformation, so undoing restores them exactly instead of applying
+an inverse matrix with its rounding.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import numpy as np
+
+from .xmi_base import XmiBaseEntity
+from .geometries.xmi_point_3d import XmiPoint3D
+from .geometries.xmi_line_3d import XmiLine3D
+from .geometries.xmi_arc_3d import XmiArc3D
+from .entities.xmi_structural_storey import XmiStructuralStorey
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+
+XMI_LOCAL_AXIS_ATTRIBUTES = ("local_axis_x", "local_axis_y", "local_axis_z")
+
+
+class XmiTransformation():
+    """A transformation applied to the entities of a model, with their previous values.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        The (4, 4) homogeneous matrix applied.
+    points : list[XmiPoint3D]
+        The points moved, ``coordinates[i]`` held the previous coordinates of ``points[i]``.
+    coordinates : np.ndarray
+        (n, 3) coordinates before the transformation.
+    axis_owners : list[tuple[XmiBaseEntity, str]]
+        The members and local axis attributes turned, ``axes[i]`` held the previous axis.
+    axes : list[tuple]
+        The local axes before the transformation.
+    storeys : list[XmiStructuralStorey]
+        The storeys moved, empty unless the matrix keeps Z vertical.
+    elevations : list[float]
+        The StoreyElevation of ``storeys`` before the transformation.
+    """
+    __slots__ = ('matrix', 'points', 'coordinates', 'axis_owners',
+                 'axes', 'storeys', 'elevations', 'undone')
+
+    def __init__(self, matrix: np.ndarray, points: list[XmiPoint3D], coordinates: np.ndarray,
+                 axis_owners: list[tuple[XmiBaseEntity, str]], axes: list[tuple],
+                 storeys: list[XmiStructuralStorey], elevations: list[float]):
+        self.matrix: np.ndarray = matrix
+        self.points: list[XmiPoint3D] = points
+        self.coordinates: np.ndarray = coordinates
+        self.axis_owners: list[tuple[XmiBaseEntity, str]] = axis_owners
+        self.axes: list[tuple] = axes
+        self.storeys: list[XmiStructuralStorey] = storeys
+        self.elevations: list[float] = elevations
+        self.undone: bool = False
+
+    def undo(self):
+        """Put back the coordinates, local axes and elevations held before the transformation."""
+        if self.undone:
+            raise ValueError("The transformation has already been undone")
+        _set_coordinates(self.points, self.coordinates)
+        for (entity, attr), axis in zip(self.axis_owners, self.axes):
+            setattr(entity, attr, axis)
+        for storey, elevation in zip(self.storeys, self.elevations):
+            storey.storey_elevation = elevation
+        self.undone = True
+
+
+def _set_coordinates(points: list[XmiPoint3D], coordinates: np.ndarray):
+    for point, (x, y, z) in zip(points, coordinates.tolist()):
+        point.x, point.y, point.z = x, y, z
+
+
+def _check_matrix(matrix) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if matrix.shape != (4, 4):
+        raise ValueError(
+            f"matrix should be a 4x4 homogeneous matrix, found shape {matrix.shape}")
+    if not np.allclose(matrix[3], (0.0, 0.0, 0.0, 1.0)):
+        raise ValueError(
+            "The last row of matrix should be (0, 0, 0, 1), projections are not supported")
+    if abs(np.linalg.det(matrix[:3, :3])) < 1e-12:
+        raise ValueError("matrix should not be singular")
+    return matrix
+
+
+def transform_xmi_entities(entities: list[XmiBaseEntity], matrix) -> XmiTransformation:
+    """Apply a homogeneous ``matrix`` to the points, local axes and storeys of ``entities``.
+
+    Local axes are turned by the linear part of ``matrix`` and
+    normalised. Storey elevations follow the Z translation when the matrix
+    keeps Z vertical and are left as they are otherwise. The cached
+    geometry of every XmiLine3D and XmiArc3D is dropped.
+    """
+    matrix = _check_matrix(matrix)
+    linear, translation = matrix[:3, :3], matrix[:3, 3]
+
+    points = [entity for entity in entities if isinstance(entity, XmiPoint3D)]
+    coordinates = np.array([(point.x, point.y, point.z) for point in points],
+                           dtype=np.float64).reshape(-1, 3)
+    _set_coordinates(points, coordinates @ linear.T + translation)
+
+    axis_owners, axes = [], []
+    for entity in entities:
+        if not isinstance(entity, (XmiStructuralCurveMember, XmiStructuralSurfaceMember)):
+            continue
+        for attr in XMI_LOCAL_AXIS_ATTRIBUTES:
+            axis = getattr(entity, attr, None)
+            if isinstance(axis, tuple) and len(axis) == 3:
+                axis_owners.append((entity, attr))
+                axes.append(axis)
+    if axes:
+        turned = np.array(axes, dtype=np.float64) @ linear.T
+        norms = np.linalg.norm(turned, axis=1, keepdims=True)
+        turned = np.divide(turned, norms, out=turned, where=norms > 0.0)
+        for (entity, attr), axis in zip(axis_owners, turned.tolist()):
+            setattr(entity, attr, tuple(axis))
+
+    storeys, elevations = [], []
+    if np.allclose(matrix[2, :3], (0.0, 0.0, 1.0)):
+        storeys = [entity for entity in entities if isinstance(entity, XmiStructuralStorey)]
+        elevations = [storey.storey_elevation for storey in storeys]
+        for storey, elevation in zip(storeys, elevations):
+            storey.storey_elevation = elevation + float(translation[2])
+
+    for entity in entities:
+        if isinstance(entity, (XmiLine3D, XmiArc3D)):
+            entity._geometry_cache = None
+
+    return XmiTransformation(matrix, points, coordinates, axis_owners, axes, storeys, elevations)
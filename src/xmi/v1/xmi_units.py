@@ -0,0 +1,290 @@
+"""
+Unit conversion of a whole model, driven by its StructuralUnit table.
+
+Every unit of the table is parsed once into its scale to SI and its
+powers of length and force, e.g. "kN/m^2" is 1e3 N and m^-2, which gives
+the factor of its attribute in any target system. The factors are then
+applied with one array multiplication per attribute over all entities
+holding it, and in place on the support and reinforcement tables.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from .xmi_base import XmiBaseEntity
+from .xmi_schema import XMI_KEY_MAPPINGS
+from .enums.xmi_enums import XmiUnitEnum
+from .entities.xmi_structural_unit import XmiStructuralUnit
+from .entities.xmi_structural_support import XMI_SUPPORT_DOFS
+from .xmi_support_table import XmiSupportTable
+from .xmi_reinforcement import XmiReinforcementTable
+
+XMI_LENGTH_UNITS: dict[str, float] = {"mm": 1e-3, "cm": 1e-2, "m": 1.0}
+XMI_FORCE_UNITS: dict[str, float] = {"N": 1.0, "kN": 1e3, "MN": 1e6}
+# pressures with a symbol of their own, as scale to SI and powers of length and force
+XMI_STRESS_UNITS: dict[str, tuple[float, int, int]] = {
+    "Pa": (1.0, -2, 1),
+    "kPa": (1e3, -2, 1),
+    "MPa": (1e6, -2, 1),
+    "GPa": (1e9, -2, 1),
+}
+# symbols without length or force, e.g. the temperature of a thermal coefficient
+XMI_NEUTRAL_UNITS = frozenset(("", "1", "rad", "sec", "s", "C", "K"))
+
+# target systems of XmiModel.convert_units, as their length and force unit
+XMI_UNIT_SYSTEMS: dict[str, tuple[str, str]] = {
+    "m-kN": ("m", "kN"),
+    "m-N": ("m", "N"),
+    "mm-kN": ("mm", "kN"),
+    "mm-N": ("mm", "N"),
+}
+
+# lengths that BIM exports leave out of their StructuralUnit table, with their power of length;
+# they are taken to be in the most common length unit of the table
+XMI_DEFAULT_LENGTH_ATTRIBUTES: dict[tuple[str, str], int] = {
+    ("StructuralPointConnection", "X"): 1,
+    ("StructuralPointConnection", "Y"): 1,
+    ("StructuralPointConnection", "Z"): 1,
+    ("StructuralStorey", "StoreyElevation"): 1,
+    ("StructuralCrossSection", "Parameters"): 1,
+    ("StructuralCrossSection", "Area"): 2,
+    ("StructuralCurveMember", "Length"): 1,
+    ("StructuralCurveMember", "BeginNodeXOffset"): 1,
+    ("StructuralCurveMember", "EndNodeXOffset"): 1,
+    ("StructuralCurveMember", "BeginNodeYOffset"): 1,
+    ("StructuralCurveMember", "EndNodeYOffset"): 1,
+    ("StructuralCurveMember", "BeginNodeZOffset"): 1,
+    ("StructuralCurveMember", "EndNodeZOffset"): 1,
+    ("StructuralSurfaceMember", "Thickness"): 1,
+    ("StructuralSurfaceMember", "ZOffset"): 1,
+    ("StructuralSurfaceMember", "Height"): 1,
+    ("StructuralReinforcement", "Cover"): 1,
+    ("StructuralReinforcement", "Spacing"): 1,
+    ("StructuralReinforcement", "Size"): 1,
+}
+
+# per location reinforcement keys with their fields in XmiReinforcementTable.layers
+_XMI_REINFORCEMENT_UNIT_FIELDS: dict[str, tuple[str]] = {
+    "Spacing": ("spacing", "secondary_spacing"),
+    "Size": ("size",),
+    "AreaProvided": ("area_provided",),
+    "AreaRequired": ("area_required",),
+}
+
+_XMI_SUPPORT_SECTIONS = ("StructuralPointSupport",
+                         "StructuralLineSupport", "StructuralAreaSupport")
+
+_UNIT_TERM = re.compile(r"^([A-Za-z1]*)(?:\^(-?\d+))?$")
+
+
+class XmiUnitConversion():
+    """The conversion of one attribute of one section.
+
+    Parameters
+    ----------
+    section : str
+        The XMI section, e.g. "StructuralCrossSection".
+    attribute : str
+        The PascalCase attribute, e.g. "Ix".
+    source_unit : str
+        The unit the values are in.
+    target_unit : str
+        The unit they are converted to.
+    factor : float
+        Multiplier from ``source_unit`` to ``target_unit``.
+    unit : XmiStructuralUnit | None
+        The entry of the unit table, None for a length the table leaves out.
+    """
+    __slots__ = ('section', 'attribute', 'source_unit',
+                 'target_unit', 'factor', 'unit')
+
+    def __init__(self, section: str, attribute: str, source_unit: str, target_unit: str, factor: float,
+                 unit: XmiStructuralUnit | None = None):
+        self.section: str = section
+        self.attribute: str = attribute
+        self.source_unit: str = source_unit
+        self.target_unit: str = target_unit
+        self.factor: float = factor
+        self.unit: XmiStructuralUnit | None = unit
+
+    def __str__(self) -> str:
+        return f"{self.section}.{self.attribute}: {self.source_unit} -> {self.target_unit} (x{self.factor:g})"
+
+
+def _parse_unit_symbol(symbol: str) -> tuple[float, int, int] | None:
+    if symbol in XMI_NEUTRAL_UNITS:
+        return 1.0, 0, 0
+    if symbol in XMI_LENGTH_UNITS:
+        return XMI_LENGTH_UNITS[symbol], 1, 0
+    if symbol in XMI_FORCE_UNITS:
+        return XMI_FORCE_UNITS[symbol], 0, 1
+    if symbol in XMI_STRESS_UNITS:
+        return XMI_STRESS_UNITS[symbol]
+    # moments, e.g. "kNm" or "Nmm"
+    for force_symbol, force_scale in XMI_FORCE_UNITS.items():
+        length_symbol = symbol[len(force_symbol):]
+        if symbol.startswith(force_symbol) and length_symbol in XMI_LENGTH_UNITS:
+            return force_scale * XMI_LENGTH_UNITS[length_symbol], 1, 1
+    return None
+
+
+def parse_xmi_unit(unit: str) -> tuple[float, int, int] | None:
+    """Parse a unit such as "kN/m^2" into its scale to SI and its powers of length and force.
+
+    Returns None for units that cannot be parsed and for units giving
+    alternatives, e.g. "mm^2 or mm^2/m", whose values cannot be told apart.
+    """
+    if not isinstance(unit, str) or " or " in unit:
+        return None
+    scale, length, force = 1.0, 0, 0
+    for position, term in enumerate(unit.replace(" ", "").split("/")):
+        match = _UNIT_TERM.match(term)
+        if match is None:
+            return None
+        dimension = _parse_unit_symbol(match.group(1))
+        if dimension is None:
+            return None
+        power = int(match.group(2) or 1) * (1 if position == 0 else -1)
+        scale *= dimension[0] ** power
+        length += dimension[1] * power
+        force += dimension[2] * power
+    return scale, length, force
+
+
+def format_xmi_unit(length: int, force: int, length_unit: str, force_unit: str) -> str:
+    """Write powers of length and force as a unit, e.g. (-2, 1, "m", "kN") as "kN/m^2"."""
+    def term(power: int, symbol: str) -> str:
+        return symbol + (f"^{power}" if power != 1 else "")
+
+    numerator = (term(force, force_unit) if force > 0 else "") + \
+        (term(length, length_unit) if length > 0 else "")
+    denominator = (term(-force, force_unit) if force < 0 else "") + \
+        (term(-length, length_unit) if length < 0 else "")
+    if not denominator:
+        return numerator
+    return f"{numerator or '1'}/{denominator}"
+
+
+def _unit_section(entity: str) -> str:
+    # BIM exports write "StructuralMaterials"
+    if f"Xmi{entity}" not in XMI_KEY_MAPPINGS and f"Xmi{entity[:-1]}" in XMI_KEY_MAPPINGS:
+        return entity[:-1]
+    return entity
+
+
+def plan_xmi_unit_conversion(units: list[XmiStructuralUnit], target_system: str) -> list[XmiUnitConversion]:
+    """Work out the factor of every attribute of a unit table in ``target_system``.
+
+    Units that cannot be parsed are left out. The lengths of
+    XMI_DEFAULT_LENGTH_ATTRIBUTES missing from the table are added in the
+    most common length unit of the table.
+    """
+    if target_system not in XMI_UNIT_SYSTEMS:
+        raise ValueError(
+            f"'target_system' should be one of {tuple(XMI_UNIT_SYSTEMS)}, found {target_system}")
+    length_unit, force_unit = XMI_UNIT_SYSTEMS[target_system]
+    length_scale, force_scale = XMI_LENGTH_UNITS[length_unit], XMI_FORCE_UNITS[force_unit]
+
+    conversions: dict[tuple[str, str], XmiUnitConversion] = {}
+    length_units = Counter()
+    for unit in units:
+        source_unit = unit.Unit.value if isinstance(
+            unit.Unit, XmiUnitEnum) else unit.Unit
+        dimension = parse_xmi_unit(source_unit)
+        if dimension is None:
+            continue
+        scale, length, force = dimension
+        if (length, force) == (1, 0):
+            length_units[source_unit] += 1
+        target_unit = format_xmi_unit(length, force, length_unit, force_unit)
+        # keep what only names the kind of quantity, e.g. the "/rad" of a rotational stiffness
+        if source_unit.endswith("/rad"):
+            target_unit += "/rad"
+        elif (length, force) == (0, 0):
+            target_unit = source_unit
+        section = _unit_section(unit.Entity)
+        conversions[(section, unit.Attribute)] = XmiUnitConversion(
+            section, unit.Attribute, source_unit, target_unit,
+            scale / (length_scale ** length * force_scale ** force), unit)
+
+    if length_units:
+        base_length_unit = length_units.most_common(1)[0][0]
+        for (section, attribute), length in XMI_DEFAULT_LENGTH_ATTRIBUTES.items():
+            if (section, attribute) in conversions:
+                continue
+            conversions[(section, attribute)] = XmiUnitConversion(
+                section, attribute,
+                format_xmi_unit(length, 0, base_length_unit, force_unit),
+                format_xmi_unit(length, 0, length_unit, force_unit),
+                (XMI_LENGTH_UNITS[base_length_unit] / length_scale) ** length)
+    return list(conversions.values())
+
+
+def _scale_attribute(entities: list[XmiBaseEntity], attr: str, factor: float):
+    """Multiply ``attr`` of every entity holding a number or a tuple of numbers by ``factor``."""
+    scalar_entities, scalars = [], []
+    sequence_entities, sequences = [], []
+    for entity in entities:
+        value = getattr(entity, attr, None)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            scalar_entities.append(entity)
+            scalars.append(value)
+        elif isinstance(value, (list, tuple)) and value and all(
+                isinstance(item, (int, float)) and not isinstance(item, bool) for item in value):
+            sequence_entities.append(entity)
+            sequences.append(value)
+
+    for entity, value in zip(scalar_entities, (np.array(scalars, dtype=np.float64) * factor).tolist()):
+        setattr(entity, attr, value)
+
+    if not sequences:
+        return
+    splits = np.cumsum([len(sequence) for sequence in sequences])[:-1]
+    scaled = np.split(np.array([item for sequence in sequences for item in sequence],
+                               dtype=np.float64) * factor, splits)
+    for entity, sequence, values in zip(sequence_entities, sequences, scaled):
+        setattr(entity, attr, type(sequence)(values.tolist()))
+
+
+def apply_xmi_unit_conversions(conversions: list[XmiUnitConversion], entities: list[XmiBaseEntity],
+                               support_table: XmiSupportTable | None = None,
+                               reinforcement_table: XmiReinforcementTable | None = None):
+    """Rescale the values of ``entities`` and of the tables in place.
+
+    Coordinates are rescaled on every XmiPoint3D, which also moves the arc
+    centres and the end points of the segment geometries.
+    """
+    entities_by_type: dict[str, list[XmiBaseEntity]] = defaultdict(list)
+    for entity in entities:
+        entities_by_type[type(entity).__name__].append(entity)
+
+    for conversion in conversions:
+        section, attribute, factor = conversion.section, conversion.attribute, conversion.factor
+        if factor == 1.0:
+            continue
+
+        if section == "StructuralPointConnection" and attribute in ("X", "Y", "Z"):
+            _scale_attribute(
+                entities_by_type["XmiPoint3D"], attribute.lower(), factor)
+        elif section in _XMI_SUPPORT_SECTIONS and attribute.endswith("Stiffness"):
+            dof = attribute[:-len("Stiffness")]
+            if support_table is None or dof not in XMI_SUPPORT_DOFS:
+                continue
+            rows = np.array([row for row, support in enumerate(support_table.supports)
+                             if support.entity_type == f"Xmi{section}"], dtype=np.intp)
+            support_table.stiffnesses[rows, XMI_SUPPORT_DOFS.index(dof)] *= factor
+        elif section == "StructuralReinforcement" and attribute in _XMI_REINFORCEMENT_UNIT_FIELDS:
+            if reinforcement_table is None:
+                continue
+            for field in _XMI_REINFORCEMENT_UNIT_FIELDS[attribute]:
+                reinforcement_table.layers[field] *= factor
+        else:
+            attr = XMI_KEY_MAPPINGS.get(f"Xmi{section}", {}).get(attribute)
+            if attr is not None:
+                _scale_attribute(
+                    entities_by_type[f"Xmi{section}"], attr, factor)
@@ -0,0 +1,230 @@
+"""
+Reference integrity checks over a raw XMI dictionary, run before any entity
+is constructed.
+
+Every referenced section is reduced to a set of names once, after which each
+reference is a single set membership test. Large sections can be split into
+shards that are checked in separate processes.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+from .xmi_entity_index import XMI_REFERENCE_RESOLUTIONS
+from .xmi_model import ErrorLog
+
+
+class XmiReferenceRule():
+    """A reference from one attribute of a section to the names, or IDs, of other sections.
+
+    Parameters
+    ----------
+    section : str
+        Section holding the reference, e.g. "StructuralCurveMember".
+    key : str
+        Attribute holding the referenced name(s), e.g. "CrossSection".
+    target_sections : tuple[str]
+        Sections whose names the reference may resolve to.
+    delimiter : str | None, optional
+        Separator when the attribute holds several names, e.g. ";" for Nodes.
+        By default None.
+    required : bool, optional
+        Report objects without a value for the attribute. When False, the rule
+        is also skipped while none of the target sections are in the
+        dictionary. By default True.
+    """
+    __slots__ = ('section', 'key', 'target_sections', 'delimiter', 'required')
+
+    def __init__(self, section: str, key: str, target_sections: tuple[str], delimiter: str = None,
+                 required: bool = True):
+        self.section: str = section
+        self.key: str = key
+        self.target_sections: tuple[str] = tuple(target_sections)
+        self.delimiter: str | None = delimiter
+        self.required: bool = required
+
+
+XMI_REFERENCE_RULES: tuple[XmiReferenceRule] = (
+    XmiReferenceRule("StructuralPointConnection", "Storey",
+                     ("StructuralStorey",), required=False),
+    XmiReferenceRule("StructuralCrossSection", "Material",
+                     ("StructuralMaterial",)),
+    XmiReferenceRule("StructuralCurveMember", "CrossSection",
+                     ("StructuralCrossSection",)),
+    XmiReferenceRule("StructuralCurveMember", "Nodes",
+                     ("StructuralPointConnection",), delimiter=";"),
+    XmiReferenceRule("StructuralCurveMember", "BeginNode",
+                     ("StructuralPointConnection",)),
+    XmiReferenceRule("StructuralCurveMember", "EndNode",
+                     ("StructuralPointConnection",)),
+    XmiReferenceRule("StructuralCurveMember", "Storey",
+                     ("StructuralStorey",), required=False),
+    XmiReferenceRule("StructuralSurfaceMember", "Material",
+                     ("StructuralMaterial",)),
+    XmiReferenceRule("StructuralSurfaceMember", "Nodes",
+                     ("StructuralPointConnection",), delimiter=";"),
+    XmiReferenceRule("StructuralSurfaceMember", "Storey",
+                     ("StructuralStorey",), required=False),
+    XmiReferenceRule("StructuralReinforcement", "Member",
+                     ("StructuralCurveMember", "StructuralSurfaceMember")),
+    XmiReferenceRule("StructuralPointSupport", "Node",
+                     ("StructuralPointConnection",)),
+    XmiReferenceRule("StructuralLineSupport", "Line",
+                     ("StructuralCurveMember", "StructuralSurfaceMember")),
+)
+
+# objects per shard when checking in several processes
+DEFAULT_SHARD_SIZE = 20000
+
+_MISSING = object()
+
+# name, or ID, sets of the worker processes, set once by _initialize_shard_worker
+_shard_name_sets: dict[str, frozenset[str]] = {}
+_shard_rules: tuple[XmiReferenceRule] = ()
+
+
+def _section_objs(xmi_dict: dict, section: str) -> list:
+    # sections may be missing or null in an export
+    section_value = xmi_dict.get(section)
+    return section_value if isinstance(section_value, list) else []
+
+
+def _collect_name_sets(xmi_dict: dict, rules: tuple[XmiReferenceRule],
+                       resolve_by: str = "name") -> dict[str, frozenset[str]]:
+    # references hold IDs instead of names when the export is read with resolve_references_by="id"
+    key = 'Name' if resolve_by == "name" else 'ID'
+    target_sections = {
+        target_section for rule in rules for target_section in rule.target_sections}
+    return {target_section: frozenset(obj.get(key) for obj in _section_objs(xmi_dict, target_section)
+                                      if isinstance(obj, dict))
+            for target_section in target_sections if target_section in xmi_dict}
+
+
+def _check_objects(section: str, start: int, xmi_dict_objs: list, rules: tuple[XmiReferenceRule],
+                   name_sets: dict[str, frozenset[str]]) -> list[tuple[str, int, str, str]]:
+    """Check one section, or one shard of it, returning (section, index, error_code, message) tuples."""
+    problems = []
+    section_rules = []
+    for rule in rules:
+        if rule.section != section:
+            continue
+        present_targets = [name_sets[target_section]
+                           for target_section in rule.target_sections if target_section in name_sets]
+        if not present_targets and not rule.required:
+            continue
+        names = present_targets[0] if len(
+            present_targets) == 1 else frozenset().union(*present_targets)
+        section_rules.append((rule, names))
+    check_node_order = section == "StructuralCurveMember"
+
+    for offset, xmi_dict_obj in enumerate(xmi_dict_objs):
+        index = start + offset
+        if not isinstance(xmi_dict_obj, dict):
+            problems.append((section, index, "InvalidObject",
+                             f"{section} objects should be dictionaries"))
+            continue
+
+        for rule, names in section_rules:
+            value = xmi_dict_obj.get(rule.key, _MISSING)
+            if value is _MISSING or value is None or value == "":
+                if rule.required:
+                    problems.append((section, index, "MissingReference",
+                                     f"'{rule.key}' is missing"))
+                continue
+            if not isinstance(value, str):
+                problems.append((section, index, "InvalidReference",
+                                 f"'{rule.key}' should be a str, found {type(value).__name__}"))
+                continue
+
+            if rule.delimiter is None:
+                if value not in names:
+                    problems.append((section, index, "UnresolvedReference",
+                                     f"'{rule.key}' references '{value}' which is not found in {' or '.join(rule.target_sections)}"))
+                continue
+
+            for position, name in enumerate(value.split(rule.delimiter)):
+                if name not in names:
+                    problems.append((section, index, "UnresolvedReference",
+                                     f"'{rule.key}' references '{name}' at position {position} which is not found in {' or '.join(rule.target_sections)}"))
+
+        if check_node_order:
+            nodes = xmi_dict_obj.get('Nodes')
+            if isinstance(nodes, str) and nodes:
+                node_names = nodes.split(';')
+                for key, expected in (('BeginNode', node_names[0]), ('EndNode', node_names[-1])):
+                    value = xmi_dict_obj.get(key)
+                    if isinstance(value, str) and value and value != expected:
+                        problems.append((section, index, "InconsistentReference",
+                                         f"'{key}' is '{value}' but 'Nodes' {'starts' if key == 'BeginNode' else 'ends'} with '{expected}'"))
+
+    return problems
+
+
+def _initialize_shard_worker(name_sets: dict[str, frozenset[str]], rules: tuple[XmiReferenceRule]):
+    global _shard_name_sets, _shard_rules
+    _shard_name_sets = name_sets
+    _shard_rules = rules
+
+
+def _check_shard(section: str, start: int, xmi_dict_objs: list) -> list[tuple[str, int, str, str]]:
+    return _check_objects(section, start, xmi_dict_objs, _shard_rules, _shard_name_sets)
+
+
+def validate_xmi_references(xmi_dict: dict,
+                            rules: tuple[XmiReferenceRule] = XMI_REFERENCE_RULES,
+                            processes: int | None = None,
+                            shard_size: int = DEFAULT_SHARD_SIZE,
+                            resolve_by: str = "name") -> list[ErrorLog]:
+    """Check every reference of a raw XMI dictionary without constructing entities.
+
+    Parameters
+    ----------
+    xmi_dict : dict
+        The XMI export, keyed by section.
+    rules : tuple[XmiReferenceRule], optional
+        The references to check, by default XMI_REFERENCE_RULES.
+    processes : int | None, optional
+        Number of worker processes the sections are sharded across. By
+        default None, which checks everything in the calling process.
+    shard_size : int, optional
+        Objects per shard when ``processes`` is given, by default
+        DEFAULT_SHARD_SIZE.
+    resolve_by : str, optional
+        Whether references hold the "name" or the "id" of the referenced
+        objects, as for XmiManager.read_xmi_dict, by default "name".
+
+    Returns
+    -------
+    list[ErrorLog]
+        One ErrorLog per problem, ordered by section and index, with error
+        codes MissingReference, InvalidReference, UnresolvedReference,
+        InconsistentReference or InvalidObject.
+    """
+    if resolve_by not in XMI_REFERENCE_RESOLUTIONS:
+        raise ValueError(
+            f"'resolve_by' should be one of {XMI_REFERENCE_RESOLUTIONS}, found {resolve_by}")
+
+    name_sets = _collect_name_sets(xmi_dict, rules, resolve_by)
+    sections = [section for section in xmi_dict.keys()
+                if any(rule.section == section for rule in rules)]
+
+    if not processes or processes <= 1:
+        shard_problems = [_check_objects(section, 0, _section_objs(xmi_dict, section), rules, name_sets)
+                          for section in sections]
+    else:
+        # the process pool is only imported when it is used, XmiManager imports this module
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=processes, initializer=_initialize_shard_worker,
+                                 initargs=(name_sets, rules)) as executor:
+            futures = []
+            for section in sections:
+                xmi_dict_objs = _section_objs(xmi_dict, section)
+                for start in range(0, len(xmi_dict_objs), shard_size):
+                    futures.append(executor.submit(
+                        _check_shard, section, start, xmi_dict_objs[start:start + shard_size]))
+            shard_problems = [future.result() for future in futures]
+
+    return [ErrorLog(section, index, message=message, error_code=error_code)
+            for problems in shard_problems
+            for section, index, error_code, message in problems]
@@ -0,0 +1,337 @@
+"""
+Writes the entities of an XmiModel back to the PascalCase sections of an XMI
+export, using the inverse of XMI_KEY_MAPPINGS.
+
+References to other entities are written as their names, lists of nodes and
+segments as ";" separated strings and local axes as "x,y,z", which is what
+XmiManager.read_xmi_dict expects.
+
+Keys and sections of the export that are not modelled, e.g. the
+StiffnessModifier keys of the members or the load cases and results of an
+analysis export, are kept by XmiManager.read_xmi_dict on the XmiModel and
+written back unchanged, without unit conversion or transformation.
+"""
+
+# Optional, for forward declarations in Python 3.7+
+from __future__ import annotations
+
+import json
+from enum import Enum
+from typing import Iterator, TextIO
+
+from .xmi_base import XmiBaseEntity
+from .xmi_schema import XMI_KEY_MAPPINGS
+from .xmi_header import XMI_HEADER_SECTION
+from .entities.xmi_segment import XmiSegment
+from .geometries.xmi_arc_3d import XmiArc3D
+from .entities.xmi_structural_material import XmiStructuralMaterial
+from .entities.xmi_structural_unit import XmiStructuralUnit
+from .entities.xmi_structural_storey import XmiStructuralStorey
+from .entities.xmi_structural_point_connection import XmiStructuralPointConnection
+from .entities.xmi_structural_cross_section import XmiStructuralCrossSection
+from .entities.xmi_structural_curve_member import XmiStructuralCurveMember
+from .entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+from .entities.xmi_structural_reinforcement import XmiStructuralReinforcement
+from .entities.xmi_structural_support import XmiStructuralSupport, XMI_SUPPORT_DOFS
+from .entities.xmi_structural_point_support import XmiStructuralPointSupport
+from .entities.xmi_structural_line_support import XmiStructuralLineSupport
+from .entities.xmi_structural_area_support import XmiStructuralAreaSupport
+from .enums.xmi_structural_support_enums import XmiSupportConditionEnum
+
+# sections in the order they are written, which is also the order they are read
+XMI_WRITER_SECTIONS: tuple[tuple[str, type[XmiBaseEntity]]] = (
+    ("StructuralMaterial", XmiStructuralMaterial),
+    ("StructuralStorey", XmiStructuralStorey),
+    ("StructuralPointConnection", XmiStructuralPointConnection),
+    ("StructuralCrossSection", XmiStructuralCrossSection),
+    ("StructuralCurveMember", XmiStructuralCurveMember),
+    ("StructuralSurfaceMember", XmiStructuralSurfaceMember),
+    ("StructuralReinforcement", XmiStructuralReinforcement),
+    ("StructuralPointSupport", XmiStructuralPointSupport),
+    ("StructuralLineSupport", XmiStructuralLineSupport),
+    ("StructuralAreaSupport", XmiStructuralAreaSupport),
+    ("StructuralUnit", XmiStructuralUnit),
+)
+
+# per location keys of a reinforcement with their field in its layers, Spacing is written separately
+_XMI_REINFORCEMENT_LAYER_KEYS: tuple[tuple[str, str]] = (
+    ("Location", "location"),
+    ("Quantity", "quantity"),
+    ("RebarType", "rebar_type"),
+    ("Size", "size"),
+    ("Material", "material"),
+    ("Shape", "shape"),
+    ("AreaProvided", "area_provided"),
+    ("AreaRequired", "area_required"),
+    ("Description", "description"),
+)
+
+# keys written from other attributes than those of XMI_KEY_MAPPINGS, which are never kept as unmodelled
+_XMI_DERIVED_KEYS: dict[type[XmiBaseEntity], frozenset[str]] = {
+    XmiStructuralPointConnection: frozenset(("X", "Y", "Z")),
+    XmiStructuralReinforcement: frozenset(
+        key for key, _ in _XMI_REINFORCEMENT_LAYER_KEYS) | {"Spacing"},
+    XmiStructuralPointSupport: frozenset(XMI_SUPPORT_DOFS) | frozenset(f"{dof}Stiffness" for dof in XMI_SUPPORT_DOFS),
+    XmiStructuralLineSupport: frozenset(XMI_SUPPORT_DOFS) | frozenset(f"{dof}Stiffness" for dof in XMI_SUPPORT_DOFS),
+    XmiStructuralAreaSupport: frozenset(f"{dof}Stiffness" for dof in XMI_SUPPORT_DOFS if dof.startswith("u")),
+}
+
+# keys only written for arc members, the other members keep those of their XMI object
+_XMI_ARC_KEYS: frozenset[str] = frozenset(("CircularArcCentre", "CircularArcRadius"))
+
+# separator of the values of a list or tuple attribute, ";" for any key not listed
+_XMI_VALUE_DELIMITERS: dict[str, str] = {
+    "LocalAxisX": ",",
+    "LocalAxisY": ",",
+    "LocalAxisZ": ",",
+    "CircularArcCentre": ",",
+}
+
+# attributes that are not kept under their own name on the entity
+_XMI_ATTRIBUTE_ALIASES: dict[str, str] = {
+    "edges": "segments",
+}
+
+
+def _field_item(item):
+    if isinstance(item, XmiSegment):
+        return item.segment_type.value
+    if isinstance(item, XmiBaseEntity):
+        return item.name
+    return item
+
+
+def _field_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, XmiBaseEntity):
+        return value.name
+    if isinstance(value, (list, tuple)):
+        return tuple(_field_item(item) for item in value)
+    return value
+
+
+def _format_item(item) -> str:
+    if isinstance(item, float) and item.is_integer():
+        return str(int(item))
+    return str(item)
+
+
+def _create_field_reader(entity_class: type[XmiBaseEntity]):
+    key_attributes = [(key, _XMI_ATTRIBUTE_ALIASES.get(attr, attr))
+                      for key, attr in XMI_KEY_MAPPINGS[entity_class.__name__].items()]
+
+    def read_fields(entity: XmiBaseEntity) -> dict:
+        return {key: _field_value(getattr(entity, attr, None))
+                for key, attr in key_attributes}
+
+    if entity_class is XmiStructuralCurveMember:
+        return _add_arc_fields(read_fields)
+    if entity_class is XmiStructuralReinforcement:
+        return _add_reinforcement_layer_fields(read_fields)
+    if issubclass(entity_class, XmiStructuralSupport):
+        return _add_support_fields(read_fields, with_conditions=entity_class is not XmiStructuralAreaSupport)
+    if entity_class is not XmiStructuralPointConnection:
+        return read_fields
+
+    # the coordinates are kept on the XmiPoint3D of the point connection
+    def read_point_connection_fields(entity: XmiStructuralPointConnection) -> dict:
+        fields = read_fields(entity)
+        point = entity.point
+        fields["X"] = point.x if point is not None else None
+        fields["Y"] = point.y if point is not None else None
+        fields["Z"] = point.z if point is not None else None
+        return fields
+
+    return read_point_connection_fields
+
+
+def _add_arc_fields(read_fields):
+    # the centre of an arc member is kept on the XmiArc3D of its segment and only written for arcs
+    def read_curve_member_fields(entity: XmiStructuralCurveMember) -> dict:
+        fields = read_fields(entity)
+        for segment in entity.segments:
+            geometry = segment.geometry
+            if isinstance(geometry, XmiArc3D):
+                center_point = geometry.center_point
+                fields["CircularArcCentre"] = (
+                    center_point.x, center_point.y, center_point.z)
+                fields["CircularArcRadius"] = geometry.radius
+                break
+        return fields
+
+    return read_curve_member_fields
+
+
+def _layer_item(item):
+    # empty numbers are NaN in the layers and empty positions in the export
+    return '' if isinstance(item, float) and item != item else item
+
+
+def _add_reinforcement_layer_fields(read_fields):
+    # the per location values are kept as rows of the layers of the reinforcement
+    def read_reinforcement_fields(entity: XmiStructuralReinforcement) -> dict:
+        fields = read_fields(entity)
+        layers = entity.layers
+        if layers is None or len(layers) == 0:
+            return fields
+        for key, field in _XMI_REINFORCEMENT_LAYER_KEYS:
+            fields[key] = tuple(_layer_item(item)
+                                for item in layers[field].tolist())
+        fields["Spacing"] = tuple(
+            ",".join(_format_item(item) for item in (spacing, secondary_spacing) if item == item)
+            for spacing, secondary_spacing in zip(layers['spacing'].tolist(), layers['secondary_spacing'].tolist()))
+        return fields
+
+    return read_reinforcement_fields
+
+
+def _add_support_fields(read_fields, with_conditions: bool):
+    # area supports of an export only carry stiffnesses
+    def read_support_fields(entity: XmiStructuralSupport) -> dict:
+        fields = read_fields(entity)
+        for dof, fixed, stiffness in zip(XMI_SUPPORT_DOFS, entity.fixed.tolist(), entity.stiffnesses.tolist()):
+            if with_conditions:
+                fields[dof] = (XmiSupportConditionEnum.FIXED if fixed else XmiSupportConditionEnum.FREE).value
+            if with_conditions or dof.startswith("u"):
+                fields[f"{dof}Stiffness"] = stiffness if stiffness == stiffness else None
+        return fields
+
+    return read_support_fields
+
+
+_FIELD_READERS = {entity_class: _create_field_reader(entity_class)
+                  for _, entity_class in XMI_WRITER_SECTIONS}
+
+# XMI key of every attribute of XMI_KEY_MAPPINGS, by class
+_KEY_ATTRIBUTES = {entity_class: {key: _XMI_ATTRIBUTE_ALIASES.get(attr, attr)
+                                  for key, attr in XMI_KEY_MAPPINGS[entity_class.__name__].items()}
+                   for _, entity_class in XMI_WRITER_SECTIONS}
+
+_WRITER_SECTION_NAMES = frozenset(section for section, _ in XMI_WRITER_SECTIONS) | {XMI_HEADER_SECTION}
+
+
+def _has_arc_segment(entity: XmiBaseEntity) -> bool:
+    return isinstance(entity, XmiStructuralCurveMember) and any(
+        isinstance(segment.geometry, XmiArc3D) for segment in entity.segments)
+
+
+def unmodelled_fields(entity: XmiBaseEntity, xmi_dict_obj: dict) -> dict:
+    """Return the keys of ``xmi_dict_obj`` that ``entity`` does not write.
+
+    These are the keys outside XMI_KEY_MAPPINGS and the mapped keys whose
+    attribute was never set on the entity, e.g. the Height of surface
+    members.
+    """
+    entity_class = type(entity)
+    key_attributes = _KEY_ATTRIBUTES.get(entity_class)
+    if key_attributes is None:
+        return {}
+    derived_keys = _XMI_DERIVED_KEYS.get(entity_class, ())
+    arc_keys = _XMI_ARC_KEYS if _has_arc_segment(entity) else ()
+    fields = {}
+    for key, value in xmi_dict_obj.items():
+        if key in derived_keys or key in arc_keys:
+            continue
+        attr = key_attributes.get(key)
+        if attr is None or not hasattr(entity, attr):
+            fields[key] = value
+    return fields
+
+
+def unmodelled_sections(xmi_dict: dict) -> dict:
+    """Return the sections of ``xmi_dict`` that are not read into entities, in their order."""
+    return {section: objs for section, objs in xmi_dict.items()
+            if section not in _WRITER_SECTION_NAMES}
+
+
+def entity_to_field_values(entity: XmiBaseEntity) -> dict:
+    """Return the values of an entity under its PascalCase XMI keys.
+
+    References are replaced by names, enums by their values and lists by
+    tuples, but numbers are not formatted, which makes the result suitable
+    for comparisons.
+    """
+    return _FIELD_READERS[type(entity)](entity)
+
+
+def entity_to_xmi_dict_obj(entity: XmiBaseEntity, unmodelled: dict | None = None) -> dict:
+    """Convert one entity to the PascalCase dictionary of its XMI section.
+
+    The ``unmodelled`` fields of the entity, see unmodelled_fields, are
+    written as they are.
+    """
+    xmi_dict_obj = _FIELD_READERS[type(entity)](entity)
+    if unmodelled:
+        xmi_dict_obj.update(unmodelled)
+    for key, value in xmi_dict_obj.items():
+        if isinstance(value, tuple):
+            xmi_dict_obj[key] = _XMI_VALUE_DELIMITERS.get(
+                key, ";").join(_format_item(item) for item in value)
+    return xmi_dict_obj
+
+
+def _iter_xmi_dict_objs(entities: list[XmiBaseEntity], unmodelled: dict) -> Iterator[dict]:
+    for entity in entities:
+        yield entity_to_xmi_dict_obj(entity, unmodelled.get(entity))
+
+
+def iter_xmi_sections(entities: list[XmiBaseEntity], header: dict | None = None,
+                      unmodelled: dict | None = None,
+                      sections: dict | None = None) -> Iterator[tuple[str, Iterator[dict]]]:
+    """Yield every section name with a lazy iterator over its XMI objects.
+
+    The entities are grouped by section in one pass, each object is only
+    converted when the iterator reaches it. Sections without entities are
+    still yielded, with an empty iterator. A ``header`` is written first, as
+    the one object of StructuralModel.
+
+    Parameters
+    ----------
+    entities : list[XmiBaseEntity]
+        The entities, those of other types than XMI_WRITER_SECTIONS are skipped.
+    header : dict | None, optional
+        The StructuralModel object, by default None.
+    unmodelled : dict | None, optional
+        The unmodelled fields of each entity, see unmodelled_fields.
+    sections : dict | None, optional
+        Unmodelled sections yielded as they are after the others, see
+        unmodelled_sections.
+    """
+    section_entities: dict[type, list[XmiBaseEntity]] = {
+        entity_class: [] for _, entity_class in XMI_WRITER_SECTIONS}
+    for entity in entities:
+        section_list = section_entities.get(type(entity))
+        if section_list is not None:
+            section_list.append(entity)
+    if header is not None:
+        yield XMI_HEADER_SECTION, iter([header])
+    for section, entity_class in XMI_WRITER_SECTIONS:
+        yield section, _iter_xmi_dict_objs(section_entities[entity_class], unmodelled or {})
+    for section, xmi_dict_objs in (sections or {}).items():
+        yield section, iter(xmi_dict_objs or [])
+
+
+def write_xmi_sections(entities: list[XmiBaseEntity], file: TextIO, indent: int | None = None,
+                       header: dict | None = None, unmodelled: dict | None = None,
+                       sections: dict | None = None):
+    """Stream the XMI sections of ``entities`` as one JSON object to ``file``.
+
+    Objects are serialised and written one at a time, so memory use does
+    not grow with the size of the model.
+    """
+    separator = "\n" if indent is not None else ""
+    object_indent = " " * (2 * indent) if indent is not None else ""
+    file.write("{")
+    for section_position, (section, xmi_dict_objs) in enumerate(iter_xmi_sections(
+            entities, header=header, unmodelled=unmodelled, sections=sections)):
+        if section_position:
+            file.write(",")
+        file.write(f"{separator}{json.dumps(section)}: [")
+        for position, xmi_dict_obj in enumerate(xmi_dict_objs):
+            if position:
+                file.write(",")
+            file.write(separator + object_indent)
+            file.write(json.dumps(xmi_dict_obj))
+        file.write(f"{separator}]")
+    file.write(separator + "}")
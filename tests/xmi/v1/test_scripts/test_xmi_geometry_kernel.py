@@ -0,0 +1,101 @@
+import math
+
+import numpy as np
+
+from src.xmi.v1.geometries.xmi_point_3d import XmiPoint3D
+from src.xmi.v1.geometries.xmi_line_3d import XmiLine3D
+from src.xmi.v1.geometries.xmi_arc_3d import XmiArc3D
+from src.xmi.v1.geometries import xmi_geometry_kernel as kernel
+
+
+def test_xmi_line_3d_geometry():
+    xmi_line_3d = XmiLine3D(start_point=XmiPoint3D(0.0, 0.0, 0.0),
+                            end_point=XmiPoint3D(3.0, 4.0, 0.0))
+
+    assert xmi_line_3d.length == 5.0
+    assert xmi_line_3d.direction == (0.6, 0.8, 0.0)
+    assert xmi_line_3d.midpoint == (1.5, 2.0, 0.0)
+    assert xmi_line_3d.bounding_box == ((0.0, 0.0, 0.0), (3.0, 4.0, 0.0))
+    assert xmi_line_3d.parameter_at_point((3.0, 4.0, 10.0)) == 1.0
+
+    # moving a point invalidates the cached properties
+    xmi_line_3d.end_point.x = 0.0
+    assert xmi_line_3d.length == 4.0
+
+
+def test_xmi_arc_3d_geometry():
+    xmi_arc_3d, error_logs = XmiArc3D.from_dict({'start_point': XmiPoint3D(1.0, 0.0, 0.0),
+                                                 'end_point': XmiPoint3D(-1.0, 0.0, 1e-9),
+                                                 'center_point': XmiPoint3D(0.0, 0.0, 0.0)})
+    assert error_logs == []
+    assert math.isclose(xmi_arc_3d.radius, 1.0)
+    assert math.isclose(xmi_arc_3d.sweep_angle, math.pi, rel_tol=1e-6)
+    assert math.isclose(xmi_arc_3d.length, math.pi, rel_tol=1e-6)
+
+    xmi_arc_3d = XmiArc3D(start_point=XmiPoint3D(2.0, 0.0, 0.0),
+                          end_point=XmiPoint3D(0.0, 2.0, 0.0),
+                          center_point=XmiPoint3D(0.0, 0.0, 0.0))
+    np.testing.assert_allclose(
+        xmi_arc_3d.midpoint, (math.sqrt(2.0), math.sqrt(2.0), 0.0))
+    np.testing.assert_allclose(xmi_arc_3d.normal, (0.0, 0.0, 1.0))
+    assert math.isclose(xmi_arc_3d.parameter_at_point(
+        (0.0, 5.0, 0.0)), 1.0)
+    vertices = xmi_arc_3d.tessellate(segments=8)
+    assert len(vertices) == 9
+    np.testing.assert_allclose(np.linalg.norm(vertices, axis=1), 2.0)
+
+
+def test_xmi_arc_3d_half_turn():
+    # start, end and centre on one line give no plane without a plane normal
+    xmi_arc_3d = XmiArc3D(start_point=XmiPoint3D(1.0, 0.0, 0.0),
+                          end_point=XmiPoint3D(-1.0, 0.0, 0.0),
+                          center_point=XmiPoint3D(0.0, 0.0, 0.0))
+    assert all(math.isnan(component) for component in xmi_arc_3d.normal)
+    assert math.isnan(xmi_arc_3d.length)
+
+    # the plane normal is made perpendicular to the diameter
+    xmi_arc_3d.plane_normal = (1.0, 0.0, 1.0)
+    np.testing.assert_allclose(xmi_arc_3d.normal, (0.0, 0.0, 1.0))
+    assert math.isclose(xmi_arc_3d.sweep_angle, math.pi)
+    assert math.isclose(xmi_arc_3d.length, math.pi)
+    np.testing.assert_allclose(xmi_arc_3d.midpoint, (0.0, 1.0, 0.0), atol=1e-12)
+    np.testing.assert_allclose(xmi_arc_3d.bounding_box, ((-1.0, 0.0, 0.0), (1.0, 1.0, 0.0)), atol=1e-12)
+    np.testing.assert_allclose(xmi_arc_3d.tessellate(segments=2)[1], (0.0, 1.0, 0.0), atol=1e-12)
+
+    # arcs with a plane of their own keep it
+    xmi_arc_3d.end_point = XmiPoint3D(0.0, -1.0, 0.0)
+    np.testing.assert_allclose(xmi_arc_3d.normal, (0.0, 0.0, -1.0))
+    assert math.isclose(xmi_arc_3d.sweep_angle, math.pi / 2.0)
+
+    starts = np.array([[1.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+    ends = np.array([[-1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    centres = np.zeros((2, 3))
+    normals = kernel.arc_normals(starts, ends, centres, np.array([[0.0, 1.0, 0.0], [0.0, 1.0, 0.0]]))
+    np.testing.assert_allclose(normals, [[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+
+def test_xmi_geometry_kernel_batches():
+    starts = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 5.0]])
+    ends = np.array([[0.0, 1.0, 0.0], [0.0, -1.0, 5.0]])
+    centres = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 5.0]])
+
+    np.testing.assert_allclose(kernel.line_lengths(
+        starts, ends), [math.sqrt(2.0), 1.0])
+    unit_vectors = kernel.normalize_vectors(np.array([[[3.0, 4.0, 0.0], [0.0, 0.0, 0.0]]]))
+    np.testing.assert_allclose(unit_vectors[0, 0], [0.6, 0.8, 0.0])
+    assert np.isnan(unit_vectors[0, 1]).all()
+
+    # the second arc is the half turn from (1, 0) through (0, 1) to (-1, 0) in its own plane
+    normals = np.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0]])
+    starts[1], ends[1] = [0.0, 1.0, 5.0], [0.0, -1.0, 5.0]
+    np.testing.assert_allclose(kernel.arc_sweeps(
+        starts, ends, centres, normals), [math.pi / 2.0, math.pi])
+    bounding_boxes = kernel.arc_bounding_boxes(starts, ends, centres, normals)
+    np.testing.assert_allclose(
+        bounding_boxes[1], [[0.0, -1.0, 5.0], [0.0, 1.0, 6.0]], atol=1e-12)
+
+    vertices = kernel.arc_tessellations(
+        starts, ends, centres, segments=4, normals=normals)
+    assert vertices.shape == (2, 5, 3)
+    np.testing.assert_allclose(np.linalg.norm(
+        vertices - centres[:, None, :], axis=2), 1.0)
@@ -1,27 +1,67 @@
+import io
 import json
+import math
+import subprocess
+import sys
+
+import numpy as np
+
+import pytest
 
 from src.xmi.v1.xmi_manager import XmiManager
+from src.xmi.v1.xmi_error_handling import XmiJsonlErrorSink, XmiErrorCollector
+from src.xmi.v1.xmi_errors import XmiErrorLimitExceededError, XmiDuplicateEntityError
+from src.xmi.v1.xmi_validation import validate_xmi_references, XMI_REFERENCE_RULES
+from src.xmi.v1.xmi_geometry_checks import check_xmi_geometry
+from src.xmi.v1.xmi_surface_mesh import triangulate_polygon
+from src.xmi.v1.xmi_writer import entity_to_xmi_dict_obj
 from src.xmi.v1.entities.xmi_structural_material import XmiStructuralMaterial
 from src.xmi.v1.entities.xmi_structural_cross_section import XmiStructuralCrossSection
 from src.xmi.v1.entities.xmi_structural_point_connection import XmiStructuralPointConnection
 from src.xmi.v1.entities.xmi_structural_curve_member import XmiStructuralCurveMember
 from src.xmi.v1.entities.xmi_structural_surface_member import XmiStructuralSurfaceMember
+from src.xmi.v1.entities.xmi_structural_storey import XmiStructuralStorey
+from src.xmi.v1.entities.xmi_structural_reinforcement import XmiStructuralReinforcement
+from src.xmi.v1.entities.xmi_structural_point_support import XmiStructuralPointSupport
+from src.xmi.v1.entities.xmi_structural_line_support import XmiStructuralLineSupport
+from src.xmi.v1.entities.xmi_structural_area_support import XmiStructuralAreaSupport
 
 from src.xmi.v1.entities.xmi_segment import XmiSegment
 
 from src.xmi.v1.geometries.xmi_point_3d import XmiPoint3D
+from src.xmi.v1.enums.xmi_enums import XmiUnitEnum
 from src.xmi.v1.geometries.xmi_line_3d import XmiLine3D
+from src.xmi.v1.geometries.xmi_arc_3d import XmiArc3D
 
 from src.xmi.v1.relationships.xmi_has_structural_material import XmiHasStructuralMaterial
 from src.xmi.v1.relationships.xmi_has_structural_node import XmiHasStructuralNode
 from src.xmi.v1.relationships.xmi_has_structural_cross_section import XmiHasStructuralCrossSection
 from src.xmi.v1.relationships.xmi_has_segment import XmiHasSegment
 from src.xmi.v1.relationships.xmi_has_geometry import XmiHasGeometry
+from src.xmi.v1.relationships.xmi_has_structural_storey import XmiHasStructuralStorey
 
 TEST_INPUTS_DIRECTORY = "tests/xmi/v1/test_inputs/xmi_manager"
 
 
 # @pytest.mark.skip()
+@pytest.mark.parametrize("filename", ["xmi_manager.json", "xmi_structural_manager_test_1.json",
+                                      "xmi_structural_manager_test_2.json", "xmi_structural_manager_test_3.json",
+                                      "xmi_structural_manager_test_4.json"])
+def test_xmi_manager_clean_fixtures(filename):
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename=filename)
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    assert [str(error) for error in xmi_model.errors if error.severity == "error"] == []
+
+    # every surface member segment is related to its own geometry
+    for surface_member in xmi_model.entities:
+        if not isinstance(surface_member, XmiStructuralSurfaceMember):
+            continue
+        for segment in surface_member.segments:
+            assert [relationship.target for relationship in xmi_model.find_relationships_by_source(segment)
+                    if isinstance(relationship, XmiHasGeometry)] == [segment.geometry]
+
+
 def test_xmi_manager_1():
     # ERROR FOUND IN DATA as material values should not be 0.0
     FILENAME = "xmi_structural_manager_test_1.json"
@@ -307,6 +347,8 @@ def test_xmi_manager_4():
     # Line3D = 4
     # Point3D = 4
     # StructuralPointConnection = 4
+    # StructuralStorey = 1
+    # HasStructuralStorey = 5
 
     xmi_structural_materials_found = [
         obj for obj in xmi_model.entities if isinstance(obj, XmiStructuralMaterial)]
@@ -330,8 +372,8 @@ def test_xmi_manager_4():
     xmi_has_geometry_relationships_found = [
         obj for obj in xmi_model.relationships if isinstance(obj, XmiHasGeometry)]
 
-    assert len(xmi_model.entities) == 18
-    assert len(xmi_model.relationships) == 29
+    assert len(xmi_model.entities) == 19
+    assert len(xmi_model.relationships) == 38
 
     assert len(xmi_structural_materials_found) == 1
     assert len(xmi_structural_point_connections_found) == 4
@@ -341,6 +383,929 @@ def test_xmi_manager_4():
     assert len(xmi_structural_surface_members_found) == 1
 
     assert len(xmi_has_structural_material_relationships_found) == 1
-    assert len(xmi_has_geometry_relationships_found) == 12
+    # point connections to points, lines to their ends and segments to their lines
+    assert len(xmi_has_geometry_relationships_found) == 16
     assert len(xmi_has_segment_relationships_found) == 4
     assert len(xmi_has_structural_structural_nodes_relationships_found) == 12
+
+
+def test_xmi_manager_instrumentation():
+    FILENAME = "xmi_structural_manager_test_3.json"
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename=FILENAME)
+
+    xmi_manager = XmiManager()
+    with xmi_manager.instrument(trace_memory=True) as instrumentation:
+        xmi_model = xmi_manager.read_xmi_file(json_path)
+
+    report = instrumentation.report()
+
+    assert len(xmi_model.entities) == 9
+    assert report['phases']['json_decode']['calls'] == 1
+    assert report['sections']['StructuralMaterial']['calls'] == 1
+    assert report['sections']['StructuralPointConnection']['phases']['entity_construction']['calls'] == 1
+    assert report['sections']['StructuralCurveMember']['phases']['reference_lookup']['calls'] == 1
+    assert report['sections']['StructuralCurveMember']['peak_memory'] > 0
+    assert report['total_time'] > 0.0
+
+    # instrumentation is switched off again once the block exits
+    assert not xmi_manager.instrumentation.enabled
+
+
+def test_xmi_manager_error_limits(tmp_path):
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-bim1.json")
+
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    error_count = len(xmi_model.errors)
+    assert error_count > 5
+    assert xmi_model.error_count == error_count
+
+    error_sink_path = tmp_path / "errors.jsonl"
+    with XmiJsonlErrorSink(str(error_sink_path)) as error_sink:
+        xmi_model_capped = XmiManager().read_xmi_file(
+            json_path, max_errors=5, error_sink=error_sink)
+
+    assert len(xmi_model_capped.errors) == 5
+    assert xmi_model_capped.error_count == error_count
+    with open(error_sink_path, 'r') as f:
+        error_lines = [json.loads(line) for line in f]
+    assert len(error_lines) == error_count
+    assert error_lines[0]['section'] == xmi_model.errors[0].entity_type
+    assert error_lines[0]['error_code'] == xmi_model.errors[0].error_code
+
+    with pytest.raises(XmiErrorLimitExceededError) as exception_info:
+        XmiManager().read_xmi_file(json_path, max_errors=3, fail_fast=True)
+    assert len(exception_info.value.xmi_model.errors) == 3
+
+
+def test_xmi_manager_warnings_outside_error_limits():
+    errors = XmiErrorCollector([], max_errors=2, fail_fast=True)
+    errors.warn("StructuralAreaSupport", 0, "matched by name")
+    errors.add("StructuralCurveMember", 0, message="not found")
+    assert (errors.count, errors.warning_count, errors.dropped) == (1, 1, 0)
+    errors.warn("StructuralAreaSupport", 1, "matched by name")
+    with pytest.raises(XmiErrorLimitExceededError):
+        errors.add("StructuralCurveMember", 1, message="not found")
+    assert [error.severity for error in errors.errors] == ["warning", "error", "warning", "error"]
+
+    # the warnings of the area supports leave the error slots to the errors
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_manager.json")
+    xmi_model = XmiManager().read_xmi_file(json_path, max_errors=0, fail_fast=True)
+    assert (xmi_model.error_count, xmi_model.warning_count) == (0, 334)
+    assert len(xmi_model.errors) == 334
+
+
+def test_xmi_manager_import_leaves_out_numpy():
+    # NumPy is only imported once a dictionary is read
+    completed = subprocess.run(
+        [sys.executable, "-c", "import sys, src.xmi as xmi; xmi.XmiManager; print('numpy' in sys.modules)"],
+        capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "False"
+
+
+def test_xmi_manager_validate_references():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+
+    xmi_dict['StructuralCurveMember'][0]['BeginNode'] = "missing node"
+    problems = validate_xmi_references(xmi_dict)
+    problem_codes = [(problem.section, problem.index, problem.error_code)
+                     for problem in problems]
+    assert ('StructuralCurveMember', 0, 'UnresolvedReference') in problem_codes
+    assert ('StructuralCurveMember', 0, 'InconsistentReference') in problem_codes
+    assert ('StructuralCurveMember', 19, 'UnresolvedReference') in problem_codes
+
+    # sharded across processes, the problems and their order are unchanged
+    sharded_problems = validate_xmi_references(
+        xmi_dict, processes=2, shard_size=5)
+    assert [str(problem) for problem in sharded_problems] == [
+        str(problem) for problem in problems]
+
+    with pytest.raises(XmiErrorLimitExceededError) as exception_info:
+        XmiManager().read_xmi_dict(
+            xmi_dict, fail_fast=True, validate_references=True)
+    assert len(exception_info.value.xmi_model.entities) == 0
+
+
+def test_xmi_manager_validate_references_by_id():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_structural_manager_test_4.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+
+    # rewrite every reference from the name to the ID of the referenced object
+    for rule in XMI_REFERENCE_RULES:
+        ids = {obj['Name']: obj['ID'] for target_section in rule.target_sections
+               for obj in xmi_dict.get(target_section) or []}
+        for xmi_dict_obj in xmi_dict.get(rule.section) or []:
+            value = xmi_dict_obj.get(rule.key)
+            if not value:
+                continue
+            names = value.split(rule.delimiter) if rule.delimiter else [value]
+            ids_value = [ids.get(name, name) for name in names]
+            xmi_dict_obj[rule.key] = rule.delimiter.join(
+                ids_value) if rule.delimiter else ids_value[0]
+
+    assert validate_xmi_references(xmi_dict, resolve_by="id") == []
+    assert len(validate_xmi_references(xmi_dict)) > 0
+
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict, resolve_references_by="id")
+    xmi_model_validated = XmiManager().read_xmi_dict(
+        xmi_dict, resolve_references_by="id", validate_references=True)
+    assert len(xmi_model_validated.errors) == len(xmi_model.errors) == 0
+    assert len(xmi_model_validated.entities) == len(xmi_model.entities)
+
+    with pytest.raises(ValueError):
+        validate_xmi_references(xmi_dict, resolve_by="guid")
+
+
+def test_xmi_manager_duplicate_entities():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_structural_manager_test_3.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+
+    first_material_obj = xmi_dict['StructuralMaterial'][0]
+    xmi_dict['StructuralMaterial'].append(
+        dict(first_material_obj, ID="duplicate material"))
+    xmi_dict['StructuralMaterial'].append(
+        dict(first_material_obj, Name="duplicate id"))
+
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+    duplicate_errors = [(error.index, error.error_code) for error in xmi_model.errors
+                        if error.entity_type == "StructuralMaterial"]
+    assert duplicate_errors == [(1, "DuplicateName"), (2, "DuplicateId")]
+
+    # references resolve to the first material holding the name
+    xmi_structural_cross_section = xmi_model.entity_index.find(
+        XmiStructuralCrossSection, xmi_dict['StructuralCrossSection'][0]['Name'])
+    assert xmi_structural_cross_section.material.id == first_material_obj['ID']
+    assert xmi_model.entity_index.find_by_id(
+        XmiStructuralMaterial, "duplicate material").name == first_material_obj['Name']
+
+    # IDs shared by a cross section and its curve member, or by a member and its reinforcement or support,
+    # are not duplicates
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_manager.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    assert not any(isinstance(error.exception, XmiDuplicateEntityError)
+                   for error in xmi_model.errors)
+    assert all(isinstance(entity, (XmiStructuralCurveMember, XmiStructuralReinforcement, XmiStructuralAreaSupport))
+               and isinstance(owner, (XmiStructuralCrossSection, XmiStructuralCurveMember, XmiStructuralSurfaceMember))
+               for entity, owner in xmi_model.entity_index.shared_ids)
+    assert len(xmi_model.entity_index.shared_ids) > 0
+
+    with pytest.raises(ValueError):
+        XmiManager().read_xmi_dict(xmi_dict, resolve_references_by="guid")
+
+
+def test_xmi_manager_write_xmi_file_round_trip(tmp_path):
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_manager.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+
+    xmi_file_path = tmp_path / "xmi_manager_written.json"
+    xmi_model.write_xmi_file(str(xmi_file_path))
+    with open(xmi_file_path, 'r') as f:
+        written_xmi_dict = json.load(f)
+    assert written_xmi_dict == xmi_model.to_xmi_dict()
+
+    xmi_curve_member_obj = written_xmi_dict['StructuralCurveMember'][0]
+    assert xmi_curve_member_obj['Nodes'] == "{begin_node};{end_node}".format(
+        begin_node=xmi_curve_member_obj['BeginNode'], end_node=xmi_curve_member_obj['EndNode'])
+    assert xmi_curve_member_obj['Segments'] == "Line"
+    assert {'X', 'Y', 'Z'} <= written_xmi_dict['StructuralPointConnection'][0].keys()
+
+    xmi_model_read_back = XmiManager().read_xmi_file(str(xmi_file_path))
+    assert len(xmi_model_read_back.entities) == len(xmi_model.entities)
+    assert xmi_model_read_back.to_xmi_dict() == written_xmi_dict
+
+
+def test_xmi_manager_write_xmi_file_keeps_unmodelled_keys_and_sections():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    xmi_file = io.StringIO()
+    xmi_model.write_xmi_file(xmi_file)
+    written_xmi_dict = json.loads(xmi_file.getvalue())
+
+    # load cases, drifts and results are written back unchanged
+    for xmi_dict_key in ('StructuralModelDrift', 'StructuralCode', 'StructuralLoadCase',
+                         'StructuralLoadCombination', 'StructuralCurveResult'):
+        assert written_xmi_dict[xmi_dict_key] == xmi_dict[xmi_dict_key]
+
+    for xmi_dict_key in ('StructuralCurveMember', 'StructuralSurfaceMember'):
+        written_xmi_dict_objs = {obj['Name']: obj for obj in written_xmi_dict[xmi_dict_key]}
+        assert written_xmi_dict_objs
+        for xmi_dict_obj in xmi_dict[xmi_dict_key]:
+            written_xmi_dict_obj = written_xmi_dict_objs.get(xmi_dict_obj['Name'])
+            if written_xmi_dict_obj is None:
+                continue
+            assert xmi_dict_obj.keys() <= written_xmi_dict_obj.keys()
+            for key, value in xmi_dict_obj.items():
+                if key.startswith(('StiffnessModifier', 'EndFixity', 'LengthEffective')) or key in ('SpanType', 'Height'):
+                    assert written_xmi_dict_obj[key] == value
+
+
+def test_xmi_manager_diff_models():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_manager.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    xmi_dict['StructuralPointConnection'][0]['Z'] += 0.5
+    removed_curve_member_obj = xmi_dict['StructuralCurveMember'].pop()
+    for xmi_curve_member_obj in xmi_dict['StructuralCurveMember']:
+        xmi_curve_member_obj['Name'] += "_renamed"
+    curve_member_names = {xmi_curve_member_obj['Name'][:-len("_renamed")]
+                          for xmi_curve_member_obj in xmi_dict['StructuralCurveMember']}
+    for xmi_structural_reinforcement_obj in xmi_dict['StructuralReinforcement']:
+        if xmi_structural_reinforcement_obj['Member'] in curve_member_names:
+            xmi_structural_reinforcement_obj['Member'] += "_renamed"
+    other_xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    assert xmi_model.diff(xmi_model) == []
+
+    diff_records = xmi_model.diff(other_xmi_model, key="id")
+    modified_point_connections = [record for record in diff_records
+                                  if record.section == "StructuralPointConnection"]
+    assert len(modified_point_connections) == 1
+    assert modified_point_connections[0].change == "modified"
+    assert list(modified_point_connections[0].deltas) == ["Z"]
+
+    # curve members sharing an ID with their cross section are matched per type
+    removed_records = [
+        record for record in diff_records if record.change == "removed" and record.section == "StructuralCurveMember"]
+    assert [record.entity.name for record in removed_records] == [
+        removed_curve_member_obj['Name']]
+
+    assert not any(record.section == "StructuralPointConnection"
+                   for record in xmi_model.diff(other_xmi_model, key="id", tolerances={"Z": 1.0}))
+
+    # renamed members are new by name, but modified when matched on geometry
+    name_changes = {record.change for record in xmi_model.diff(other_xmi_model, key="name")
+                    if record.section == "StructuralCurveMember"}
+    assert name_changes == {"added", "removed"}
+    geometry_records = [record for record in xmi_model.diff(other_xmi_model, key="geometry", geometry_tolerance=0.1)
+                        if record.section == "StructuralCurveMember" and record.change == "modified"]
+    assert geometry_records and all(
+        "Name" in record.deltas for record in geometry_records)
+
+
+def test_xmi_manager_match_geometry():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_manager.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    # the other export names everything differently and is shifted by 3 along X
+    for section in ('StructuralPointConnection', 'StructuralCurveMember', 'StructuralSurfaceMember'):
+        for xmi_dict_obj in xmi_dict[section]:
+            for key in ('Name', 'Nodes', 'BeginNode', 'EndNode'):
+                if key in xmi_dict_obj:
+                    xmi_dict_obj[key] = ";".join(
+                        "other_" + name for name in xmi_dict_obj[key].split(";"))
+            if 'X' in xmi_dict_obj:
+                xmi_dict_obj['X'] += 3.0
+    other_xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    matches = xmi_model.match_geometry(other_xmi_model, tolerance=10.0)
+    members = [entity for entity in xmi_model.entities
+               if isinstance(entity, (XmiStructuralCurveMember, XmiStructuralSurfaceMember))]
+    assert len(matches) == len(members)
+    assert all(match.other_entity.name == "other_" + match.entity.name for match in matches)
+    assert all(abs(match.confidence - 0.7) < 1e-9 for match in matches)
+
+    assert xmi_model.match_geometry(other_xmi_model, tolerance=2.0) == []
+    assert xmi_model.match_geometry(
+        other_xmi_model, tolerance=10.0, min_confidence=0.8) == []
+
+
+def test_xmi_manager_reinforcement_of_unbuilt_member():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-bim1.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+
+    # the members exist in the export but failed to build, the error points at theirs
+    member_errors = {(error.section, error.index) for error in xmi_model.errors
+                     if error.section in ("StructuralCurveMember", "StructuralSurfaceMember")}
+    reinforcement_errors = [error for error in xmi_model.errors
+                            if error.section == "StructuralReinforcement"]
+    assert len(reinforcement_errors) == 13
+    for error in reinforcement_errors:
+        assert error.error_code == "ReferenceNotConstructed"
+        section, index = error.message.split()[1].rstrip(']').split('[')
+        assert (section, int(index)) in member_errors
+
+    # members missing from the export are reported as before
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    assert len([error for error in xmi_model.errors if error.message.startswith(
+        "Member should be a StructuralCurveMember or StructuralSurfaceMember")]) == 11
+
+
+def test_xmi_manager_check_geometry():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    assert check_xmi_geometry(XmiManager().read_xmi_dict(xmi_dict).entities) == []
+
+    xmi_dict['StructuralCurveMember'][0]['Length'] += 100.0
+    xmi_dict['StructuralSurfaceMember'][0]['Area'] *= 0.5
+    xmi_dict['StructuralSurfaceMember'][0]['LocalAxisZ'] = "0,0,2"
+    problems = check_xmi_geometry(XmiManager().read_xmi_dict(xmi_dict).entities)
+
+    problem_codes = {(problem.section, problem.index, problem.error_code)
+                     for problem in problems}
+    assert problem_codes == {
+        ("StructuralCurveMember", 0, "LengthMismatch"),
+        ("StructuralSurfaceMember", 0, "AreaMismatch"),
+        ("StructuralSurfaceMember", 0, "LocalAxisNotUnit"),
+    }
+
+    # members 19, 20 and 23 are not constructed, later members keep their index in the section
+    xmi_dict['StructuralCurveMember'][30]['Length'] += 100.0
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+    problems = check_xmi_geometry(
+        xmi_model.entities, section_indices=xmi_model.section_indices)
+    assert ("StructuralCurveMember", 30, "LengthMismatch") in {
+        (problem.section, problem.index, problem.error_code) for problem in problems}
+
+
+def test_xmi_manager_circular_arc_segments():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_structural_manager_test_3.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+
+    # bend the first column into an arc through a centre 500 beside its midpoint
+    xmi_curve_member_obj = xmi_dict['StructuralCurveMember'][0]
+    points = {obj['Name']: (obj['X'], obj['Y'], obj['Z'])
+              for obj in xmi_dict['StructuralPointConnection']}
+    begin_point = points[xmi_curve_member_obj['BeginNode']]
+    end_point = points[xmi_curve_member_obj['EndNode']]
+    centre = ((begin_point[0] + end_point[0]) / 2 + 500.0,
+              (begin_point[1] + end_point[1]) / 2,
+              (begin_point[2] + end_point[2]) / 2)
+    xmi_curve_member_obj['Segments'] = "Circular Arc"
+    xmi_curve_member_obj['CircularArcCentre'] = ",".join(str(value) for value in centre)
+    xmi_dict['StructuralCurveMember'].append(
+        dict(xmi_curve_member_obj, Name="arc without centre", ID="arc-without-centre", CircularArcCentre=""))
+
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    # the copy has no centre, which leaves it without segments
+    assert [(error.index, type(error.exception).__name__) for error in xmi_model.errors] == [
+        (1, "XmiMissingRequiredAttributeError"), (1, "XmiMissingRequiredAttributeError")]
+
+    xmi_arcs = [entity for entity in xmi_model.entities if isinstance(entity, XmiArc3D)]
+    assert len(xmi_arcs) == 1
+    xmi_arc = xmi_arcs[0]
+    assert (xmi_arc.center_point.x, xmi_arc.center_point.y, xmi_arc.center_point.z) == centre
+    assert xmi_arc.radius == pytest.approx(math.hypot(500.0, 500.0))
+    assert xmi_arc.sweep_angle == pytest.approx(math.pi / 2)
+    assert len([relationship for relationship in xmi_model.relationships
+                if isinstance(relationship, XmiHasGeometry) and relationship.source is xmi_arc]) == 3
+
+    arcs, vertices = xmi_model.tessellate_arcs(chord_tolerance=1.0)
+    assert arcs == [xmi_arc]
+    arc_vertices = vertices[0]
+    np.testing.assert_allclose(arc_vertices[0], begin_point)
+    np.testing.assert_allclose(arc_vertices[-1], end_point)
+    np.testing.assert_allclose(np.linalg.norm(arc_vertices - centre, axis=1), xmi_arc.radius)
+    chord_midpoints = (arc_vertices[1:] + arc_vertices[:-1]) / 2
+    sagittas = xmi_arc.radius - np.linalg.norm(chord_midpoints - centre, axis=1)
+    assert sagittas.max() <= 1.0
+    # one chord fewer would exceed the tolerance
+    assert xmi_arc.radius * (1 - math.cos(math.pi / 4 / (len(arc_vertices) - 2))) > 1.0
+
+    # the centre survives a round trip through the writer
+    xmi_model = XmiManager().read_xmi_dict(xmi_model.to_xmi_dict())
+    xmi_arcs = [entity for entity in xmi_model.entities if isinstance(entity, XmiArc3D)]
+    assert [(xmi_arc.center_point.x, xmi_arc.center_point.y, xmi_arc.center_point.z)
+            for xmi_arc in xmi_arcs] == [centre]
+
+
+def test_xmi_manager_half_turn_arc_segments():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_structural_manager_test_3.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+
+    # bend the first column into a half turn about its midpoint, LocalAxisZ gives the plane
+    xmi_curve_member_obj = xmi_dict['StructuralCurveMember'][0]
+    points = {obj['Name']: (obj['X'], obj['Y'], obj['Z'])
+              for obj in xmi_dict['StructuralPointConnection']}
+    begin_point = points[xmi_curve_member_obj['BeginNode']]
+    end_point = points[xmi_curve_member_obj['EndNode']]
+    centre = tuple((begin + end) / 2 for begin, end in zip(begin_point, end_point))
+    xmi_curve_member_obj['Segments'] = "Circular Arc"
+    xmi_curve_member_obj['CircularArcCentre'] = ",".join(str(value) for value in centre)
+    xmi_dict['StructuralCurveMember'].append(
+        dict(xmi_curve_member_obj, Name="arc without plane", ID="arc-without-plane",
+             LocalAxisY="0,0,-1", LocalAxisZ="0,0,1"))
+
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    # the copy has both local axes along its diameter, which leaves it without segments
+    assert [(error.index, type(error.exception).__name__) for error in xmi_model.errors][0] == (1, "XmiError")
+    assert all(error.index == 1 for error in xmi_model.errors)
+
+    xmi_arcs = [entity for entity in xmi_model.entities if isinstance(entity, XmiArc3D)]
+    assert len(xmi_arcs) == 1
+    xmi_arc = xmi_arcs[0]
+    np.testing.assert_allclose(xmi_arc.normal, (1.0, 0.0, 0.0), atol=1e-12)
+    assert xmi_arc.sweep_angle == pytest.approx(math.pi)
+    assert xmi_arc.length == pytest.approx(500.0 * math.pi)
+    assert np.linalg.norm(np.subtract(xmi_arc.midpoint, centre)) == pytest.approx(500.0)
+
+    mesh = xmi_model.mesh(chord_tolerance=1.0)
+    arc_member = next(entity for entity in xmi_model.entities if isinstance(entity, XmiStructuralCurveMember)
+                      and any(isinstance(segment.geometry, XmiArc3D) for segment in entity.segments))
+    assert arc_member in mesh.entities
+    arc_vertices = mesh.vertices[np.unique(mesh.triangles[mesh.triangle_entities == mesh.entities.index(arc_member)])]
+    assert np.isfinite(arc_vertices).all()
+
+
+def test_xmi_manager_storey_view():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    xmi_structural_storeys = xmi_model.storey_index.storeys
+    assert [xmi_structural_storey.storey_elevation for xmi_structural_storey in xmi_structural_storeys] == [
+        0.0, 3000.0, 6000.0, 8000.0]
+
+    # every storey name of the export resolved to its storey
+    for entity in xmi_model.entities:
+        if isinstance(entity, (XmiStructuralPointConnection, XmiStructuralCurveMember, XmiStructuralSurfaceMember)):
+            assert isinstance(entity.storey, XmiStructuralStorey)
+
+    first_storey = xmi_model.storey_view("St. 1 (1)")
+    assert first_storey == [entity for entity in xmi_model.entities
+                            if getattr(entity, 'storey', None) is xmi_structural_storeys[1]]
+    assert len(first_storey) == 34
+
+    upper_storeys = xmi_model.storey_view(elevation_range=(3000.0, 6000.0))
+    assert upper_storeys == first_storey + \
+        xmi_model.storey_view(xmi_structural_storeys[2])
+    assert xmi_model.storey_view(elevation_range=(100.0, 200.0)) == []
+    assert xmi_model.storey_index.storey_at(7999.0) is xmi_structural_storeys[2]
+
+    with pytest.raises(ValueError):
+        xmi_model.storey_view("St. 9 (9)")
+
+    # storeys are written back by name
+    xmi_dict_written = xmi_model.to_xmi_dict()
+    assert [obj['Name'] for obj in xmi_dict_written['StructuralStorey']] == [
+        obj['Name'] for obj in xmi_dict['StructuralStorey']]
+    assert xmi_dict_written['StructuralCurveMember'][0]['Storey'] == xmi_dict['StructuralCurveMember'][0]['Storey']
+
+
+def test_xmi_manager_assign_storeys():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    storey_elevations = {obj['Name']: obj['StoreyElevation']
+                         for obj in xmi_dict['StructuralStorey']}
+    expected_elevations = {}
+    for xmi_dict_key in ('StructuralPointConnection', 'StructuralCurveMember', 'StructuralSurfaceMember'):
+        for obj in xmi_dict[xmi_dict_key]:
+            expected_elevations[obj['Name']] = storey_elevations[obj['Storey']]
+
+    # the export agrees with the node elevations
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+    assert xmi_model.assign_storeys(overwrite=True) == []
+
+    # an unknown storey name is replaced, a resolved one is only replaced with overwrite
+    xmi_dict['StructuralPointConnection'][0]['Storey'] = "unknown"
+    xmi_dict['StructuralPointConnection'][1]['Storey'] = xmi_dict['StructuralStorey'][-1]['Name']
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict, assign_storeys=True)
+    first_node = xmi_model.entity_index.find(
+        XmiStructuralPointConnection, xmi_dict['StructuralPointConnection'][0]['Name'])
+    assert first_node.storey.storey_elevation == expected_elevations[first_node.name]
+    assert xmi_model.assign_storeys() == []
+    assignments = xmi_model.assign_storeys(overwrite=True)
+    assert [assignment.entity.name for assignment in assignments] == [
+        xmi_dict['StructuralPointConnection'][1]['Name']]
+    assert assignments[0].storey.storey_elevation == expected_elevations[assignments[0].entity.name]
+    assert len([relationship for relationship in xmi_model.relationships
+                if isinstance(relationship, XmiHasStructuralStorey) and relationship.source is assignments[0].entity]) == 1
+
+    # without storeys or Storey values they are inferred from the node elevations
+    for xmi_dict_key in ('StructuralPointConnection', 'StructuralCurveMember', 'StructuralSurfaceMember'):
+        for obj in xmi_dict[xmi_dict_key]:
+            obj['Storey'] = None
+    del xmi_dict['StructuralStorey']
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict, assign_storeys=True)
+
+    assert [xmi_structural_storey.storey_elevation for xmi_structural_storey in xmi_model.storey_index.storeys] == [
+        0.0, 3000.0, 6000.0, 8000.0]
+    assigned = [entity for entity in xmi_model.entities if entity.name in expected_elevations
+                and isinstance(entity, (XmiStructuralPointConnection, XmiStructuralCurveMember, XmiStructuralSurfaceMember))]
+    assert len(assigned) == 71
+    for entity in assigned:
+        assert entity.storey.storey_elevation == expected_elevations[entity.name]
+
+
+def test_xmi_manager_reinforcement():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-bim1.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    xmi_structural_reinforcement = xmi_model.entity_index.find(
+        XmiStructuralReinforcement, "RebarFor-352179")
+    assert isinstance(xmi_structural_reinforcement.member, XmiStructuralCurveMember)
+    assert xmi_structural_reinforcement.cover == (25.0, 25.0, 25.0)
+    assert xmi_structural_reinforcement.if_symmetrical is True
+
+    layers = xmi_structural_reinforcement.layers
+    assert layers['location'].tolist()[:2] == ["TopLeft", "TopMid"]
+    assert layers['quantity'].tolist()[:2] == [3.0, 3.0]
+    assert layers['size'].tolist()[:2] == [32.0, 25.0]
+    assert np.isnan(layers['spacing'][0]) and layers['spacing'][-1] == 250.0
+    assert layers['shape'][6] == "Close Link"
+    assert np.isnan(layers['area_required']).all()
+    assert len(xmi_model.reinforcement_table) == len(xmi_dict['StructuralReinforcement']) - 13
+
+    # reinforcement of curve members that failed to build has no host
+    assert len([error for error in xmi_model.errors
+                if error.entity_type == "StructuralReinforcement"]) == 13
+
+    # longitudinal bars run along the whole member
+    member_takeoffs = {takeoff.key.name: takeoff for takeoff in xmi_model.rebar_takeoff()}
+    takeoff = member_takeoffs[xmi_structural_reinforcement.member.name]
+    longitudinal = np.isnan(layers['spacing'])
+    bar_area = float(np.sum(layers['quantity'][longitudinal] * np.pi / 4.0 * layers['size'][longitudinal] ** 2))
+    assert takeoff.bar_area == pytest.approx(bar_area)
+    longitudinal_weight = bar_area * xmi_structural_reinforcement.member.length * 7.85e-6
+    assert takeoff.weight > longitudinal_weight
+
+    # the groupings share their totals
+    total_weight = sum(takeoff.weight for takeoff in member_takeoffs.values())
+    size_takeoffs = xmi_model.rebar_takeoff(by="size")
+    assert {takeoff.key for takeoff in size_takeoffs} >= {10.0, 25.0, 32.0}
+    assert sum(takeoff.weight for takeoff in size_takeoffs) == pytest.approx(total_weight)
+    assert sum(takeoff.weight for takeoff in xmi_model.rebar_takeoff(by="storey")) == pytest.approx(total_weight)
+    with pytest.raises(ValueError):
+        xmi_model.rebar_takeoff(by="material")
+
+    # layers are written back as the ";" separated strings of the export
+    xmi_structural_reinforcement_obj = next(obj for obj in xmi_dict['StructuralReinforcement']
+                                            if obj['Name'] == "RebarFor-352179")
+    written_obj = entity_to_xmi_dict_obj(xmi_structural_reinforcement)
+    for key in ('Location', 'Quantity', 'Size', 'Spacing', 'Shape', 'Description'):
+        assert written_obj[key] == xmi_structural_reinforcement_obj[key]
+
+
+def test_xmi_manager_supports():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+    assert not any("Support" in error.entity_type for error in xmi_model.errors)
+
+    support_table = xmi_model.support_table
+    assert len(support_table) == len(xmi_dict['StructuralPointSupport']) + len(xmi_dict['StructuralLineSupport'])
+    assert support_table.fixed.shape == support_table.stiffnesses.shape == (len(support_table), 6)
+
+    point_rows = support_table.rows(XmiStructuralPointSupport)
+    line_rows = support_table.rows(XmiStructuralLineSupport)
+    assert len(point_rows) == len(xmi_dict['StructuralPointSupport'])
+    xmi_structural_point_support = support_table.supports[point_rows[0]]
+    assert xmi_structural_point_support.node.name == xmi_dict['StructuralPointSupport'][0]['Node']
+    assert support_table.fixed[point_rows[0]].tolist() == [True, True, True, False, False, True]
+    xmi_structural_line_support = support_table.supports[line_rows[0]]
+    assert isinstance(xmi_structural_line_support.member, XmiStructuralSurfaceMember)
+    assert support_table.fixed[line_rows[0]].tolist() == [True, True, True, True, False, True]
+    assert (support_table.stiffnesses == 0.0).all()
+
+    # the supports hold views of the table rows
+    xmi_structural_point_support.stiffnesses[2] = 1.0e6
+    assert support_table.stiffnesses[point_rows[0], 2] == 1.0e6
+    assert len([relationship for relationship in xmi_model.relationships
+                if relationship.source is xmi_structural_line_support]) == 1
+
+    # area supports of BIM exports are found through the name of their surface member
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_manager.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    support_table = xmi_model.support_table
+    assert len(support_table.rows(XmiStructuralAreaSupport)) == len(support_table) == 334
+    assert all(support.surface_member.name == support.name for support in support_table.supports)
+    assert not support_table.fixed.any()
+    assert np.isnan(support_table.stiffnesses[:, 3:]).all()
+    assert (support_table.stiffnesses[:, :3] == 0.0).all()
+
+    # the fallback is reported and the Area of the export is written back
+    assert len(xmi_model.errors) == 334
+    assert {(error.severity, error.error_code) for error in xmi_model.errors} == {
+        ("warning", "SupportMatchedByName")}
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    assert [obj['Area'] for obj in xmi_model.to_xmi_dict()['StructuralAreaSupport']] == [
+        obj['Area'] for obj in xmi_dict['StructuralAreaSupport']]
+
+
+def test_xmi_manager_convert_units():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    assert len(xmi_model.units) == 204
+
+    xmi_structural_cross_section = next(entity for entity in xmi_model.entities
+                                        if isinstance(entity, XmiStructuralCrossSection))
+    xmi_structural_material = xmi_structural_cross_section.material
+    xmi_structural_point_connection = next(entity for entity in xmi_model.entities
+                                           if isinstance(entity, XmiStructuralPointConnection))
+    parameters = xmi_structural_cross_section.parameters
+    second_moment_of_area = xmi_structural_cross_section.second_moment_of_area_x_axis
+    e_modulus = xmi_structural_material.e_modulus
+    z = xmi_structural_point_connection.point.z
+    xmi_model.support_table.stiffnesses[0] = 100.0
+
+    conversions = {(conversion.section, conversion.attribute): conversion
+                   for conversion in xmi_model.convert_units("m-N")}
+    assert conversions[("StructuralCrossSection", "Ix")].target_unit == "m^4"
+    assert conversions[("StructuralMaterial", "EModulus")].target_unit == "N/m^2"
+    assert conversions[("StructuralPointSupport", "fixStiffness")].target_unit == "Nm/rad"
+    assert xmi_structural_cross_section.parameters == pytest.approx(
+        tuple(parameter / 1000.0 for parameter in parameters))
+    assert xmi_structural_cross_section.second_moment_of_area_x_axis == pytest.approx(
+        second_moment_of_area * 1e-12)
+    assert xmi_structural_material.e_modulus == pytest.approx(e_modulus * 1e6)
+    assert xmi_structural_point_connection.point.z == pytest.approx(z / 1000.0)
+    assert xmi_model.support_table.stiffnesses[0].tolist() == pytest.approx([1e5] * 6)
+    assert {unit.Unit for unit in xmi_model.units
+            if unit.Entity == "StructuralCrossSection" and unit.Attribute == "Ix"} == {XmiUnitEnum.METER4}
+
+    # the updated unit table converts back, units with alternatives are left alone
+    xmi_model.convert_units("mm-kN")
+    assert xmi_structural_cross_section.parameters == pytest.approx(parameters)
+    assert xmi_structural_material.e_modulus == pytest.approx(e_modulus / 1000.0)
+    assert xmi_structural_point_connection.point.z == pytest.approx(z)
+    assert ("StructuralReinforcement", "AreaProvided") not in conversions
+
+    with pytest.raises(ValueError):
+        xmi_model.convert_units("ft-kip")
+
+    # BIM exports leave the coordinates out of the table, they follow its length unit
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_manager.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    xmi_structural_point_connection = next(entity for entity in xmi_model.entities
+                                           if isinstance(entity, XmiStructuralPointConnection))
+    x = xmi_structural_point_connection.point.x
+    conversions = {(conversion.section, conversion.attribute): conversion
+                   for conversion in xmi_model.convert_units("m-kN")}
+    assert conversions[("StructuralPointConnection", "X")].source_unit == "mm"
+    assert xmi_structural_point_connection.point.x == pytest.approx(x / 1000.0)
+    assert conversions[("StructuralSurfaceMember", "Area")].factor == 1.0
+    assert {"Entity": "StructuralPointConnection", "Attribute": "X", "Unit": "m"} in xmi_model.to_xmi_dict()[
+        'StructuralUnit']
+
+
+def test_xmi_manager_transform():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    original_xmi_dict = xmi_model.to_xmi_dict()
+
+    xmi_structural_curve_member = next(entity for entity in xmi_model.entities
+                                       if isinstance(entity, XmiStructuralCurveMember))
+    begin_point = xmi_structural_curve_member.begin_node.point
+    x, y, z = begin_point.x, begin_point.y, begin_point.z
+    local_axis_x = xmi_structural_curve_member.local_axis_x
+    line = xmi_structural_curve_member.segments[0].geometry
+    length = line.length
+
+    # a quarter turn about Z, then a move up by 500
+    matrix = np.array([[0.0, -1.0, 0.0, 100.0],
+                       [1.0, 0.0, 0.0, 0.0],
+                       [0.0, 0.0, 1.0, 500.0],
+                       [0.0, 0.0, 0.0, 1.0]])
+    transformation = xmi_model.transform(matrix)
+    assert (begin_point.x, begin_point.y, begin_point.z) == pytest.approx((100.0 - y, x, z + 500.0))
+    assert xmi_structural_curve_member.local_axis_x == pytest.approx(
+        (-local_axis_x[1], local_axis_x[0], local_axis_x[2]))
+    assert line.length == pytest.approx(length)
+    assert transformation in xmi_model.histories
+    storey_elevations = sorted(storey.storey_elevation for storey in xmi_model.entities
+                               if isinstance(storey, XmiStructuralStorey))
+    assert storey_elevations[0] == pytest.approx(500.0)
+
+    # the geometry caches follow the coordinates
+    start_point, end_point = line.start_point, line.end_point
+    assert line.midpoint == pytest.approx(((start_point.x + end_point.x) / 2.0, (start_point.y + end_point.y) / 2.0,
+                                           (start_point.z + end_point.z) / 2.0))
+
+    assert xmi_model.undo_transform() is transformation
+    assert (begin_point.x, begin_point.y, begin_point.z) == (x, y, z)
+    assert xmi_model.to_xmi_dict() == original_xmi_dict
+    assert xmi_model.undo_transform() is None
+    with pytest.raises(ValueError):
+        transformation.undo()
+
+    with pytest.raises(ValueError):
+        xmi_model.transform(np.zeros((4, 4)))
+    with pytest.raises(ValueError):
+        xmi_model.transform(np.eye(3))
+
+
+def test_xmi_manager_header_and_probe():
+    xmi_manager = XmiManager()
+
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    with open(json_path, "r") as f:
+        xmi_model = xmi_manager.read_xmi_dict(json.load(f))
+    assert xmi_model.name == "Project B V9_Modified TSD Model.tsmd"
+    assert xmi_model.xmi_version == "1.0.0"
+    assert xmi_model.application_name == "Tekla Structural Designer"
+    assert xmi_model.application_version == "23.3.0.105 (ed)"
+
+    xmi_model.name = "Project B"
+    header = xmi_model.to_xmi_dict()["StructuralModel"][0]
+    assert header["Name"] == "Project B"
+    assert header["AnalyticalTool"] == "Tekla Structural Designer"
+    assert header["ModelAuthoringTool"] is None
+
+    bim_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-bim1.json")
+    probe = xmi_manager.probe(bim_path)
+    assert probe.name == "Test Structure B 2022 V2"
+    assert probe.application_name == "Autodesk Revit 2022"
+    assert probe.application_version == "2022"
+
+    with open(bim_path, "r") as f:
+        xmi_dict = json.load(f)
+    assert probe.section_counts == {section: len(value) if isinstance(value, list) else int(value is not None)
+                                    for section, value in xmi_dict.items()}
+    assert probe.section_counts["StructuralModel"] == 1
+
+
+def test_xmi_manager_member_axes():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    axes = xmi_model.member_axes()
+    curve_members = [entity for entity in xmi_model.entities
+                     if isinstance(entity, XmiStructuralCurveMember)]
+    assert axes.members == curve_members
+    assert axes.begins.shape == (len(curve_members), 3)
+
+    # a 800 x 300 beam along X hanging from its top right edge
+    index = next(index for index, member in enumerate(curve_members)
+                 if member.system_line.value == "TopRight" and member.cross_section.parameters == (800.0, 300.0)
+                 and member.local_axis_x == pytest.approx((1.0, 0.0, 0.0)))
+    node = curve_members[index].begin_node.point
+    assert axes.begins[index] == pytest.approx((node.x, node.y + 150.0, node.z - 400.0))
+    assert axes.bounding_boxes[index, 0, 2] == pytest.approx(node.z - 800.0)
+    assert axes.bounding_boxes[index, 1, 2] == pytest.approx(node.z)
+
+    # columns stay on their MiddleMiddle system line
+    columns = [index for index, member in enumerate(curve_members) if member.system_line.value == "MiddleMiddle"]
+    for index in columns:
+        begin_node, end_node = curve_members[index].begin_node.point, curve_members[index].end_node.point
+        assert axes.begins[index] == pytest.approx((begin_node.x, begin_node.y, begin_node.z))
+        assert axes.ends[index] == pytest.approx((end_node.x, end_node.y, end_node.z))
+    assert np.all(axes.bounding_boxes[:, 0] <= axes.bounding_boxes[:, 1])
+
+
+def _assert_closed_mesh(mesh):
+    # every edge is used once in each direction
+    triangles = mesh.triangles
+    edges = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+    edges, counts = np.unique(edges, axis=0, return_counts=True)
+    assert counts.max() == 1
+    reversed_edges = np.unique(edges[:, ::-1], axis=0)
+    assert np.array_equal(edges, reversed_edges)
+
+
+def test_xmi_manager_mesh(tmp_path):
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="test0-analysis1.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    mesh = xmi_model.mesh()
+    _assert_closed_mesh(mesh)
+    assert len(mesh.triangle_entities) == len(mesh.triangles)
+
+    # the solids hold the section area times the length of every member
+    corners = mesh.vertices[mesh.triangles]
+    volumes = np.bincount(mesh.triangle_entities, np.einsum('ij,ij->i', corners[:, 0], np.cross(
+        corners[:, 1], corners[:, 2])) / 6.0, minlength=len(mesh.entities))
+    for index, entity in enumerate(mesh.entities):
+        if isinstance(entity, XmiStructuralCurveMember) and entity.cross_section.shape.value == "I Shape":
+            d, b, flange, web, _ = entity.cross_section.parameters
+            area = 2 * b * flange + (d - 2 * flange) * web
+            length = math.dist(*[(node.point.x, node.point.y, node.point.z)
+                                 for node in (entity.begin_node, entity.end_node)])
+            assert volumes[index] == pytest.approx(area * length)
+        elif isinstance(entity, XmiStructuralSurfaceMember):
+            assert volumes[index] > 0
+
+    stl_path = tmp_path / "model.stl"
+    mesh.write_stl(str(stl_path))
+    with open(stl_path, 'rb') as f:
+        f.seek(80)
+        assert int.from_bytes(f.read(4), 'little') == len(mesh.triangles)
+    assert stl_path.stat().st_size == 84 + 50 * len(mesh.triangles)
+
+    glb_path = tmp_path / "model.glb"
+    mesh.write_glb(str(glb_path), scale=0.001)
+    with open(glb_path, 'rb') as f:
+        magic, version, length = np.frombuffer(f.read(12), dtype='<u4')
+        json_length = int(np.frombuffer(f.read(8), dtype='<u4')[0])
+        gltf = json.loads(f.read(json_length))
+    assert magic == int.from_bytes(b"glTF", 'little') and version == 2
+    assert length == glb_path.stat().st_size
+    assert gltf["accessors"][0]["count"] == len(mesh.vertices)
+    assert gltf["accessors"][1]["count"] == mesh.triangles.size
+
+
+def test_xmi_manager_mesh_arc_member():
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_structural_manager_test_3.json")
+    with open(json_path, 'r') as f:
+        xmi_dict = json.load(f)
+    xmi_curve_member_obj = xmi_dict['StructuralCurveMember'][0]
+    points = {obj['Name']: (obj['X'], obj['Y'], obj['Z'])
+              for obj in xmi_dict['StructuralPointConnection']}
+    begin_point = points[xmi_curve_member_obj['BeginNode']]
+    end_point = points[xmi_curve_member_obj['EndNode']]
+    centre = ((begin_point[0] + end_point[0]) / 2 + 500.0,
+              (begin_point[1] + end_point[1]) / 2,
+              (begin_point[2] + end_point[2]) / 2)
+    xmi_curve_member_obj['Segments'] = "Circular Arc"
+    xmi_curve_member_obj['CircularArcCentre'] = ",".join(str(value) for value in centre)
+    xmi_model = XmiManager().read_xmi_dict(xmi_dict)
+
+    mesh = xmi_model.mesh(chord_tolerance=1.0)
+    _assert_closed_mesh(mesh)
+    arc_member = next(entity for entity in xmi_model.entities if isinstance(entity, XmiStructuralCurveMember)
+                      and any(isinstance(segment.geometry, XmiArc3D) for segment in entity.segments))
+    arc_vertices = mesh.vertices[np.unique(mesh.triangles[mesh.triangle_entities == mesh.entities.index(arc_member)])]
+    # the swept section stays around the arc
+    radius = math.hypot(500.0, 500.0)
+    distances = np.linalg.norm(arc_vertices - centre, axis=1)
+    assert distances.max() < radius + max(arc_member.cross_section.parameters)
+    assert distances.min() > radius - max(arc_member.cross_section.parameters)
+
+
+def test_xmi_manager_surface_mesh():
+    # a clockwise L shaped outline and a comb with a node in line with its neighbours
+    l_shape = np.array([(0, 0), (0, 2), (1, 2), (1, 1), (2, 1), (2, 0)], dtype=np.float64)
+    comb = np.array([(0, 0), (5, 0), (10, 0), (10, 3)] + [
+        point for x in range(9, 0, -1) for point in [(x + 0.5, 3), (x + 0.5, 1), (x, 1), (x, 3)]] + [(0, 3)],
+        dtype=np.float64)
+    for outline, area in ((l_shape, -3.0), (comb, 21.0)):
+        triangles = triangulate_polygon(outline)
+        assert len(triangles) == len(outline) - 2
+        corners = outline[triangles]
+        first, second = corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+        areas = (first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0]) / 2.0
+        # every triangle turns with the outline and none has zero area
+        assert np.all(areas * np.sign(area) > 0)
+        assert areas.sum() == pytest.approx(area)
+
+    json_path = "{test_inputs_directory}/{filename}".format(
+        test_inputs_directory=TEST_INPUTS_DIRECTORY, filename="xmi_manager.json")
+    xmi_model = XmiManager().read_xmi_file(json_path)
+    surface_members = [entity for entity in xmi_model.entities
+                       if isinstance(entity, XmiStructuralSurfaceMember)]
+
+    triangle_mesh = xmi_model.surface_mesh()
+    assert triangle_mesh.skipped == []
+    assert triangle_mesh.elements.shape == (sum(len(member.nodes) - 2 for member in surface_members), 3)
+    areas = np.bincount(triangle_mesh.element_entities, triangle_mesh.element_areas,
+                        minlength=len(surface_members))
+
+    quad_mesh = xmi_model.surface_mesh(element_size=500.0)
+    assert quad_mesh.elements.shape[1] == 4
+    assert quad_mesh.skipped == [index for index, member in enumerate(surface_members) if len(member.nodes) != 4]
+    quad_areas = np.bincount(quad_mesh.element_entities, quad_mesh.element_areas,
+                             minlength=len(surface_members))
+    quad_members = np.unique(quad_mesh.element_entities)
+    np.testing.assert_allclose(quad_areas[quad_members], areas[quad_members])
+    corners = quad_mesh.vertices[quad_mesh.elements]
+    assert np.linalg.norm(corners - np.roll(corners, -1, axis=1), axis=2).max() <= 500.0 + 1e-6
+
+    with pytest.raises(ValueError):
+        xmi_model.surface_mesh(element_size=0.0)
@@ -5,6 +5,7 @@ from src.xmi.v1.enums.xmi_structural_material_enums import XmiStructuralMaterial
 from src.xmi.v1.shapes.xmi_shape import *
 from src.xmi.v1.enums.xmi_shape_enums import XmiShapeEnum
 from src.xmi.v1.xmi_errors import *
+from src.xmi.v1.xmi_string_parsing import parse_float_column, row_as_tuple
 import json
 
 
@@ -155,3 +156,17 @@ def test_xmi_structural_cross_section_fail():
             parameters=parameters
         )
         print(xmi_structural_cross_section)
+
+
+def test_xmi_structural_cross_section_parse_parameters_column():
+    parameter_strings = ["600;600", "300", "250;;10", None]
+
+    parameters_column, errors = parse_float_column(
+        parameter_strings, ';', 'parameters')
+
+    assert row_as_tuple(parameters_column, errors, 0) == XmiStructuralCrossSection.convert_parameter_string_to_tuple(
+        parameter_strings[0])
+    assert row_as_tuple(parameters_column, errors, 1) == (300.0,)
+    assert sorted(errors.keys()) == [2, 3]
+    assert "position 1" in str(errors[2])
+    assert row_as_tuple(parameters_column, errors, 2) is None
@@ -182,3 +182,34 @@ def test_xmi_structural_material_json_object_only_pass_missing_e_modulus():
     assert xmi_structural_material.g_modulus == g_modulus
     assert xmi_structural_material.poisson_ratio == poisson_ratio
     assert xmi_structural_material.thermal_coefficient == thermal_coefficient
+
+
+def test_xmi_structural_material_bulk_from_xmi_dicts():
+    json_path = "tests/xmi/v1/test_inputs/xmi_structural_material/xmi_parser_structural_material_only.json"
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+
+    unknown_type = dict(data, Type="Unknown")
+    missing_grade = {key: value for key,
+                     value in data.items() if key != 'Grade'}
+    string_modulus = dict(data, EModulus="32000")
+
+    xmi_structural_materials, error_logs = XmiStructuralMaterial.bulk_from_xmi_dicts(
+        [data, unknown_type, missing_grade, string_modulus])
+
+    assert len(xmi_structural_materials) == 4
+    assert len(error_logs) == 4
+
+    xmi_structural_material_single, error_logs_single = XmiStructuralMaterial.from_xmi_dict_obj(
+        data)
+    assert xmi_structural_materials[0].to_dict() == xmi_structural_material_single.to_dict()
+    assert error_logs[0] == []
+
+    assert xmi_structural_materials[1] is None
+    assert "Unknown" in str(error_logs[1][0])
+
+    assert xmi_structural_materials[2].grade is None
+    assert [str(e) for e in error_logs[2]] == ["Missing attribute: grade"]
+
+    assert xmi_structural_materials[3] is None
+    assert "e_modulus" in str(error_logs[3][0])